@@ -22,6 +22,7 @@ from conduit.core import (
     ConduitError,
     ConfigurationError,
     DatabaseError,
+    EmbeddingBackpressureError,
     ExecutionError,
     Query,
     QueryConstraints,
@@ -56,6 +57,7 @@ __all__ = [
     "ConfigurationError",
     "CircuitBreakerOpenError",
     "RateLimitError",
+    "EmbeddingBackpressureError",
     # Version
     "__version__",
 ]
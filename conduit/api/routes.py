@@ -12,6 +12,8 @@ from conduit.api.validation import (
     CompleteRequest,
     CompleteResponse,
     ErrorResponse,
+    FeedbackBatchRequest,
+    FeedbackBatchResponse,
     FeedbackRequest,
     FeedbackResponse,
     HealthResponse,
@@ -142,6 +144,39 @@ def create_routes(service: RoutingService) -> APIRouter:
                 detail="Internal server error",
             ) from e
 
+    # POST /v1/feedback/batch - Submit many feedback entries at once
+    @api_router.post(
+        "/v1/feedback/batch",
+        response_model=FeedbackBatchResponse,
+        status_code=status.HTTP_200_OK,
+        responses={400: {"model": ErrorResponse}},
+    )
+    async def feedback_batch(request: FeedbackBatchRequest) -> FeedbackBatchResponse:
+        """Submit feedback for many responses with one bandit update."""
+        try:
+            saved, missing = await service.submit_feedback_batch(
+                [item.model_dump() for item in request.items]
+            )
+
+            return FeedbackBatchResponse(
+                feedback_ids=[feedback.id for feedback in saved],
+                missing_response_ids=missing,
+                message=f"{len(saved)} feedback entries submitted successfully",
+            )
+
+        except ValueError as e:
+            logger.error(f"Feedback batch error: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+        except Exception as e:
+            logger.exception(f"Unexpected error in feedback batch: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error",
+            ) from e
+
     # GET /v1/stats - Analytics and metrics
     @api_router.get(
         "/v1/stats",
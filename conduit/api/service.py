@@ -12,6 +12,7 @@ from conduit.core.models import (
     Feedback,
     Query,
     QueryConstraints,
+    QueryFeatures,
     RoutingResult,
 )
 from conduit.engines.bandits.base import BanditFeedback
@@ -138,16 +139,16 @@ class RoutingService:
         if self.evaluator:
             asyncio.create_task(self.evaluator.evaluate_async(response, query))
 
-        # Update bandit with feedback using new BanditFeedback API
+        # Update bandit through the router (update actor + state persistence)
         # Until explicit/implicit feedback is wired in, use conservative estimates
-        feedback = BanditFeedback(
+        await self.router.update(
             model_id=routing.selected_model,
             cost=response.cost,
             quality_score=0.8,  # Conservative default until explicit feedback
             latency=response.latency,
-            success=True,
+            features=routing.features,
+            reward_weights=routing.metadata.get("reward_weights"),
         )
-        await self.router.hybrid_router.update(feedback, routing.features)
 
         # Return result
         return RoutingResult.from_response(response, routing)
@@ -172,6 +173,69 @@ class RoutingService:
         Returns:
             Feedback object
 
+        Raises:
+            ValueError: If response_id not found
+        """
+        feedback, update = await self._save_feedback(
+            response_id=response_id,
+            quality_score=quality_score,
+            met_expectations=met_expectations,
+            user_rating=user_rating,
+            comments=comments,
+        )
+        if update is not None:
+            # Same path as submit_feedback_batch(): keeps success=met_expectations
+            await self.router.update_batch([update])
+        return feedback
+
+    async def submit_feedback_batch(
+        self, items: list[dict[str, Any]]
+    ) -> tuple[list[Feedback], list[str]]:
+        """Submit feedback for many responses with one bandit update.
+
+        Each item is saved as in submit_feedback(); the bandit then learns
+        from all of them with a single Router.update_batch() call (one
+        batched update and one state write instead of one per item).
+
+        Args:
+            items: Keyword arguments for submit_feedback() (response_id,
+                quality_score, met_expectations, user_rating, comments)
+
+        Returns:
+            Tuple of (saved Feedback objects, response_ids not found)
+        """
+        saved: list[Feedback] = []
+        missing: list[str] = []
+        updates: list[tuple[BanditFeedback, QueryFeatures]] = []
+
+        for item in items:
+            try:
+                feedback, update = await self._save_feedback(**item)
+            except ValueError:
+                missing.append(item["response_id"])
+                continue
+            saved.append(feedback)
+            if update is not None:
+                updates.append(update)
+
+        if updates:
+            await self.router.update_batch(updates)
+        return saved, missing
+
+    async def _save_feedback(
+        self,
+        response_id: str,
+        quality_score: float,
+        met_expectations: bool,
+        user_rating: int | None = None,
+        comments: str | None = None,
+    ) -> tuple[Feedback, tuple[BanditFeedback, QueryFeatures] | None]:
+        """Save feedback and build the matching bandit update.
+
+        Returns:
+            Tuple of (Feedback, (BanditFeedback, features) or None if the
+            original query could not be found)
+
         Raises:
             ValueError: If response_id not found
         """
@@ -197,22 +261,21 @@ class RoutingService:
         # Update bandit with actual feedback using new BanditFeedback API
         # Need to regenerate features from original query for bandit update
         query_obj = await self.database.get_query_by_id(response.query_id)
-        if query_obj:
-            features = await self.router.analyzer.analyze(query_obj.text)
-            bandit_feedback = BanditFeedback(
-                model_id=response.model,
-                cost=response.cost,
-                quality_score=quality_score,  # Use actual user rating
-                latency=response.latency,
-                success=met_expectations,
-            )
-            await self.router.hybrid_router.update(bandit_feedback, features)
-        else:
+        if not query_obj:
             logger.warning(
                 f"Could not find query {response.query_id} for feedback update"
             )
+            return feedback, None
 
-        return feedback
+        features = await self.router.analyzer.analyze(query_obj.text)
+        bandit_feedback = BanditFeedback(
+            model_id=response.model,
+            cost=response.cost,
+            quality_score=quality_score,  # Use actual user rating
+            latency=response.latency,
+            success=met_expectations,
+        )
+        return feedback, (bandit_feedback, features)
 
     async def get_stats(self) -> dict[str, Any]:
         """Get routing statistics.
@@ -133,6 +133,17 @@ class FeedbackRequest(BaseModel):
     )
 
 
+class FeedbackBatchRequest(BaseModel):
+    """Request schema for POST /v1/feedback/batch."""
+
+    items: list[FeedbackRequest] = Field(
+        ...,
+        description="Feedback entries, applied to the bandit as one batch",
+        min_length=1,
+        max_length=1000,
+    )
+
+
 class FeedbackResponse(BaseModel):
     """Response schema for POST /v1/feedback."""
 
@@ -145,6 +156,16 @@ class FeedbackResponse(BaseModel):
     message: str = Field(..., description="Confirmation message")
 
 
+class FeedbackBatchResponse(BaseModel):
+    """Response schema for POST /v1/feedback/batch."""
+
+    feedback_ids: list[str] = Field(..., description="IDs of saved feedback")
+    missing_response_ids: list[str] = Field(
+        ..., description="Response IDs that were not found (skipped)"
+    )
+    message: str = Field(..., description="Confirmation message")
+
+
 class StatsResponse(BaseModel):
     """Response schema for GET /v1/stats."""
 
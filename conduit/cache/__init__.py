@@ -1,12 +1,13 @@
 """Caching layer for query feature extraction optimization.
 
-This module provides Redis-based caching for QueryFeatures to optimize
-the expensive embedding computation in query analysis. The cache is designed
-with fail-safe patterns to ensure the system works perfectly when Redis
-is unavailable.
+This module provides two-tier (in-process LRU + Redis) caching for
+QueryFeatures to optimize the expensive embedding computation in query
+analysis. The cache is designed with fail-safe patterns to ensure the system
+works perfectly when Redis is unavailable.
 
 Key Features:
-    - MessagePack serialization for compact storage
+    - In-process LRU tier for hot keys (survives Redis outages)
+    - Compact binary encoding (float32/float16/int8 embedding bytes)
     - Circuit breaker for automatic failure recovery
     - Graceful degradation (works without Redis)
     - 24-hour TTL with LRU eviction
@@ -26,6 +27,8 @@ Usage:
     >>>     await cache.set("What is 2+2?", features)
 """
 
+from conduit.cache.codec import decode_features, encode_features
+from conduit.cache.memory import LRUFeatureCache
 from conduit.cache.models import CacheConfig, CacheStats
 from conduit.cache.service import CacheCircuitBreaker, CacheService
 
@@ -34,4 +37,7 @@ __all__ = [
     "CacheConfig",
     "CacheStats",
     "CacheCircuitBreaker",
+    "LRUFeatureCache",
+    "decode_features",
+    "encode_features",
 ]
@@ -0,0 +1,151 @@
+"""In-process LRU tier (L1) for cached QueryFeatures.
+
+Sits in front of Redis (L2) in CacheService. An L1 hit returns the stored
+QueryFeatures instance directly: no network round trip, no msgpack decode and
+no pydantic validation. QueryFeatures is frozen and its embedding array is
+read-only, so sharing one instance between requests is safe.
+
+Bounds:
+    - max_entries: Entry count limit
+    - max_bytes: Approximate memory limit (embedding bytes + fixed overhead)
+    - ttl: Seconds an entry stays valid (independent of Redis TTL)
+
+Eviction is least-recently-used. Because L1 does not depend on Redis, hot keys
+keep hitting during a Redis outage or while the circuit breaker is open.
+"""
+
+import time
+from collections import OrderedDict
+
+from conduit.core.models import QueryFeatures
+
+# Approximate per-entry overhead beyond the embedding buffer (model object,
+# key string, dict slot, metadata fields)
+ENTRY_OVERHEAD_BYTES = 512
+
+
+class LRUFeatureCache:
+    """Bounded LRU cache of QueryFeatures with per-entry TTL.
+
+    Not thread-safe: intended for use from a single event loop (no awaits
+    happen while the structure is being modified).
+
+    Attributes:
+        max_entries: Maximum number of cached entries
+        max_bytes: Maximum approximate memory footprint
+        ttl: Entry lifetime in seconds
+        hits: L1 hits
+        misses: L1 misses (including expired entries)
+        evictions: Entries evicted to respect size/memory bounds
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        """Initialize empty cache.
+
+        Args:
+            max_entries: Maximum number of cached entries
+            max_bytes: Maximum approximate memory footprint in bytes
+            ttl: Entry lifetime in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # key -> (features, expires_at, size_bytes); order = recency
+        self._entries: OrderedDict[str, tuple[QueryFeatures, float, int]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> QueryFeatures | None:
+        """Return cached features and mark them most recently used.
+
+        Args:
+            key: Cache key (CacheService._generate_key)
+
+        Returns:
+            Cached QueryFeatures, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        features, expires_at, _ = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return features
+
+    def set(self, key: str, features: QueryFeatures) -> None:
+        """Insert or refresh an entry, evicting LRU entries to fit bounds.
+
+        Args:
+            key: Cache key
+            features: Features to cache
+        """
+        size = features.embedding_array.nbytes + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (features, time.monotonic() + self.ttl, size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def pop(self, key: str) -> QueryFeatures | None:
+        """Remove an entry and return its features (one-shot lookup).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached QueryFeatures, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        features, expires_at, _ = entry
+        self._remove(key)
+        if time.monotonic() >= expires_at:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return features
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its byte accounting."""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    @property
+    def size(self) -> int:
+        """Number of entries currently cached (including not-yet-purged expired)."""
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by cached entries."""
+        return self._bytes
@@ -1,5 +1,7 @@
 """Cache configuration and statistics models."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -14,6 +16,12 @@ class CacheConfig(BaseModel):
         timeout: Operation timeout in seconds
         circuit_breaker_threshold: Failures before opening circuit
         circuit_breaker_timeout: Seconds before attempting recovery
+        l1_enabled: Whether the in-process LRU tier (L1) is enabled
+        l1_max_entries: Maximum entries held in L1
+        l1_max_bytes: Approximate memory bound for L1
+        l1_ttl: L1 entry lifetime in seconds (capped at ttl)
+        encoding: Redis value encoding for embeddings (float32, float16,
+            int8 quantized, or legacy msgpack); reads accept any format
     """
 
     enabled: bool = Field(default=True, description="Enable/disable caching")
@@ -29,17 +37,42 @@ class CacheConfig(BaseModel):
     circuit_breaker_timeout: int = Field(
         default=300, description="Circuit breaker timeout (seconds)"
     )
+    l1_enabled: bool = Field(
+        default=True, description="Enable in-process LRU tier in front of Redis"
+    )
+    l1_max_entries: int = Field(
+        default=10_000, description="Max entries in the in-process tier", ge=0
+    )
+    l1_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Approximate memory bound for the in-process tier (bytes)",
+        ge=0,
+    )
+    l1_ttl: int = Field(
+        default=300, description="In-process tier entry TTL (seconds)", ge=1
+    )
+    encoding: Literal["float32", "float16", "int8", "msgpack"] = Field(
+        default="float32", description="Redis feature encoding"
+    )
 
 
 class CacheStats(BaseModel):
     """Cache performance statistics.
 
+    hits/misses/hit_rate cover both tiers (a request is a hit if either the
+    in-process L1 or Redis L2 served it); the l1_* fields break out L1.
+
     Attributes:
-        hits: Number of successful cache hits
-        misses: Number of cache misses
+        hits: Number of successful cache hits (L1 + L2)
+        misses: Number of cache misses (neither tier had the entry)
         errors: Number of cache operation errors
         hit_rate: Cache hit rate (hits / total requests)
         circuit_state: Current circuit breaker state
+        l1_hits: Requests served from the in-process tier
+        l1_misses: Requests that fell through to Redis (or missed entirely)
+        l1_hit_rate: L1 hit rate percentage
+        l1_size: Entries currently held in L1
+        l1_evictions: Entries evicted from L1 to respect size/memory bounds
     """
 
     hits: int = Field(default=0, description="Cache hits")
@@ -49,8 +82,15 @@ class CacheStats(BaseModel):
     circuit_state: str = Field(
         default="closed", description="Circuit breaker state (closed/open/half_open)"
     )
+    l1_hits: int = Field(default=0, description="In-process tier hits")
+    l1_misses: int = Field(default=0, description="In-process tier misses")
+    l1_hit_rate: float = Field(default=0.0, description="L1 hit rate percentage")
+    l1_size: int = Field(default=0, description="Entries in the in-process tier")
+    l1_evictions: int = Field(default=0, description="In-process tier evictions")
 
     def update_hit_rate(self) -> None:
-        """Recalculate hit rate based on current stats."""
+        """Recalculate hit rates based on current stats."""
         total = self.hits + self.misses
         self.hit_rate = (self.hits / total * 100) if total > 0 else 0.0
+        l1_total = self.l1_hits + self.l1_misses
+        self.l1_hit_rate = (self.l1_hits / l1_total * 100) if l1_total > 0 else 0.0
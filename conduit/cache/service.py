@@ -4,10 +4,11 @@ import hashlib
 import re
 import time
 
-import msgpack
 from redis.asyncio import Redis
 from redis.exceptions import ConnectionError, TimeoutError
 
+from conduit.cache.codec import decode_features, encode_features
+from conduit.cache.memory import LRUFeatureCache
 from conduit.cache.models import CacheConfig, CacheStats
 from conduit.core.models import QueryFeatures
 from conduit.observability.logging import LogEvents, get_logger
@@ -97,10 +98,13 @@ class CacheCircuitBreaker:
 
 
 class CacheService:
-    """Redis-based caching service with fail-safe design.
+    """Two-tier (in-process LRU + Redis) caching service with fail-safe design.
 
     Features:
-        - MessagePack serialization for compact storage
+        - In-process LRU tier (L1) serving hot keys without Redis round trips,
+          decode or validation, including during Redis outages
+        - Compact binary encoding (raw float32/float16/int8 embedding bytes),
+          still reading legacy MessagePack entries
         - Circuit breaker for automatic failure recovery
         - Graceful degradation when Redis unavailable
         - Performance statistics tracking
@@ -125,6 +129,15 @@ class CacheService:
         )
         self.stats = CacheStats()
 
+        # In-process tier (L1) in front of Redis (L2)
+        self.l1: LRUFeatureCache | None = None
+        if config.enabled and config.l1_enabled:
+            self.l1 = LRUFeatureCache(
+                max_entries=config.l1_max_entries,
+                max_bytes=config.l1_max_bytes,
+                ttl=min(config.l1_ttl, config.ttl),
+            )
+
         # Initialize Redis client if caching enabled
         if config.enabled:
             self.redis = Redis.from_url(
@@ -133,7 +146,7 @@ class CacheService:
                 socket_connect_timeout=config.timeout,
                 retry_on_timeout=True,
                 max_connections=10,
-                decode_responses=False,  # We handle bytes for msgpack
+                decode_responses=False,  # We handle bytes (binary feature encoding)
             )
             logger.info(
                 "cache_initialized",
@@ -155,17 +168,27 @@ class CacheService:
 
         Note:
             All errors are caught and logged. Returns None on any failure,
-            allowing caller to compute features normally.
+            allowing caller to compute features normally. The in-process tier
+            is consulted first and keeps serving while Redis is unavailable.
         """
         if not self.config.enabled or not self.redis:
             return None
 
+        cache_key = self._generate_key(query)
+
+        if self.l1 is not None:
+            features = self.l1.get(cache_key)
+            if features is not None:
+                self.stats.hits += 1
+                self._sync_l1_stats()
+                return features
+            self._sync_l1_stats()
+
         if not self.circuit_breaker.can_attempt():
             logger.debug("cache_skipped", reason="circuit_breaker_open")
             return None
 
         try:
-            cache_key = self._generate_key(query)
             data = await self.redis.get(cache_key)
 
             if data is None:
@@ -174,9 +197,13 @@ class CacheService:
                 self.circuit_breaker.on_success()  # Successful operation (miss is ok)
                 return None
 
-            # Deserialize from MessagePack
-            features_dict = msgpack.unpackb(data, raw=False)
-            features = QueryFeatures(**features_dict)
+            # Binary format (np.frombuffer view) or legacy MessagePack
+            features = decode_features(data)
+
+            # Promote to L1 so repeat lookups skip Redis and decoding
+            if self.l1 is not None:
+                self.l1.set(cache_key, features)
+                self._sync_l1_stats()
 
             self.stats.hits += 1
             self.stats.update_hit_rate()
@@ -221,6 +248,13 @@ class CacheService:
         if not self.config.enabled or not self.redis:
             return
 
+        cache_key = self._generate_key(query)
+
+        # L1 write is local and cannot fail, so do it even if Redis is down
+        if self.l1 is not None:
+            self.l1.set(cache_key, features)
+            self._sync_l1_stats()
+
         if not self.circuit_breaker.can_attempt():
             logger.debug(
                 "cache_skipped", reason="circuit_breaker_open", operation="set"
@@ -228,11 +262,7 @@ class CacheService:
             return
 
         try:
-            cache_key = self._generate_key(query)
-
-            # Serialize to MessagePack
-            features_dict = features.model_dump()
-            data = msgpack.packb(features_dict, use_bin_type=True)
+            data = encode_features(features, self.config.encoding)
 
             await self.redis.set(cache_key, data, ex=self.config.ttl)
             self.circuit_breaker.on_success()
@@ -258,6 +288,147 @@ class CacheService:
             )
             # Don't trigger circuit breaker for serialization errors
 
+    async def get_many(self, queries: list[str]) -> list[QueryFeatures | None]:
+        """Retrieve cached QueryFeatures for many queries in one round trip.
+
+        Checks L1 first, then fetches all remaining keys with a single Redis
+        MGET. Duplicate (normalized) queries are looked up once.
+
+        Args:
+            queries: User query texts
+
+        Returns:
+            List aligned with queries: cached QueryFeatures or None per query
+
+        Note:
+            Errors are caught and logged like get(): a failed MGET yields
+            None for every query not served by L1.
+        """
+        results: list[QueryFeatures | None] = [None] * len(queries)
+        if not queries or not self.config.enabled or not self.redis:
+            return results
+
+        keys = [self._generate_key(query) for query in queries]
+
+        # key -> positions in queries still needing a Redis lookup
+        pending: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            features = self.l1.get(key) if self.l1 is not None else None
+            if features is not None:
+                results[i] = features
+                self.stats.hits += 1
+            else:
+                pending.setdefault(key, []).append(i)
+        self._sync_l1_stats()
+
+        if not pending:
+            return results
+
+        if not self.circuit_breaker.can_attempt():
+            logger.debug("cache_skipped", reason="circuit_breaker_open")
+            return results
+
+        pending_keys = list(pending)
+        try:
+            values = await self.redis.mget(pending_keys)
+            self.circuit_breaker.on_success()
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning(
+                LogEvents.CACHE_ERROR,
+                operation="get_many",
+                error_type="connection",
+                error=str(e),
+            )
+            self.stats.errors += 1
+            self.circuit_breaker.on_failure()
+            return results
+
+        for key, data in zip(pending_keys, values, strict=True):
+            positions = pending[key]
+            if data is None:
+                self.stats.misses += len(positions)
+                continue
+
+            try:
+                features = decode_features(data)
+            except Exception as e:
+                logger.error(
+                    LogEvents.CACHE_ERROR,
+                    operation="get_many",
+                    error_type="unexpected",
+                    error=str(e),
+                )
+                self.stats.errors += 1
+                continue
+
+            if self.l1 is not None:
+                self.l1.set(key, features)
+            for i in positions:
+                results[i] = features
+            self.stats.hits += len(positions)
+
+        self._sync_l1_stats()
+        self.stats.update_hit_rate()
+        return results
+
+    async def set_many(self, items: list[tuple[str, QueryFeatures]]) -> None:
+        """Store many QueryFeatures with TTL in one pipelined round trip.
+
+        Args:
+            items: (query, features) pairs to cache
+
+        Note:
+            Best-effort like set(): failures are logged, never raised.
+        """
+        if not items or not self.config.enabled or not self.redis:
+            return
+
+        entries: dict[str, QueryFeatures] = {}
+        for query, features in items:
+            entries[self._generate_key(query)] = features
+
+        if self.l1 is not None:
+            for key, features in entries.items():
+                self.l1.set(key, features)
+            self._sync_l1_stats()
+
+        if not self.circuit_breaker.can_attempt():
+            logger.debug(
+                "cache_skipped", reason="circuit_breaker_open", operation="set_many"
+            )
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, features in entries.items():
+                    pipe.set(
+                        key,
+                        encode_features(features, self.config.encoding),
+                        ex=self.config.ttl,
+                    )
+                await pipe.execute()
+            self.circuit_breaker.on_success()
+            logger.debug(
+                "cache_set_many", entries=len(entries), ttl_seconds=self.config.ttl
+            )
+
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning(
+                LogEvents.CACHE_ERROR,
+                operation="set_many",
+                error_type="connection",
+                error=str(e),
+            )
+            self.circuit_breaker.on_failure()
+
+        except Exception as e:
+            logger.error(
+                LogEvents.CACHE_ERROR,
+                operation="set_many",
+                error_type="unexpected",
+                error=str(e),
+            )
+
     async def clear(self) -> None:
         """Clear all cache entries (admin operation).
 
@@ -268,6 +439,10 @@ class CacheService:
         if not self.config.enabled or not self.redis:
             return
 
+        if self.l1 is not None:
+            self.l1.clear()
+            self._sync_l1_stats()
+
         try:
             # Delete all keys matching our pattern
             cursor = 0
@@ -296,11 +471,22 @@ class CacheService:
         """Get current cache statistics.
 
         Returns:
-            CacheStats with hit/miss/error counts and circuit state
+            CacheStats with hit/miss/error counts, circuit state and L1 stats
         """
         self.stats.circuit_state = self.circuit_breaker.state
+        self._sync_l1_stats()
         return self.stats
 
+    def _sync_l1_stats(self) -> None:
+        """Copy in-process tier counters into stats."""
+        if self.l1 is None:
+            return
+        self.stats.l1_hits = self.l1.hits
+        self.stats.l1_misses = self.l1.misses
+        self.stats.l1_size = self.l1.size
+        self.stats.l1_evictions = self.l1.evictions
+        self.stats.update_hit_rate()
+
     def _generate_key(self, query: str) -> str:
         """Generate cache key from query text.
 
@@ -22,17 +22,20 @@ from conduit.core.exceptions import (
     ConduitError,
     ConfigurationError,
     DatabaseError,
+    EmbeddingBackpressureError,
     ExecutionError,
     RateLimitError,
     RoutingError,
     ValidationError,
 )
+from conduit.core.file_state_store import FileStateStore
 from conduit.core.lifecycle import (
     LifecycleManager,
     ShutdownPhase,
     ShutdownState,
     create_lifecycle_manager,
 )
+from conduit.core.memory_state_store import InMemoryStateStore
 from conduit.core.models import (
     MAX_QUERY_TEXT_BYTES,
     Feedback,
@@ -63,10 +66,23 @@ from conduit.core.reward_calculation import (
     normalize_quality,
     validate_weights,
 )
+from conduit.core.state_codec import (
+    decode_bandit_state,
+    decode_router_state,
+    encode_bandit_state,
+    encode_router_state,
+)
+from conduit.core.state_merge import (
+    apply_bandit_delta,
+    apply_router_delta,
+    diff_bandit_state,
+    diff_router_state,
+)
 from conduit.core.state_store import (
     BanditState,
     HybridRouterState,
     RouterPhase,
+    StateDelta,
     StateStore,
     StateStoreError,
     deserialize_bandit_matrices,
@@ -102,6 +118,7 @@ __all__ = [
     "ConfigurationError",
     "CircuitBreakerOpenError",
     "RateLimitError",
+    "EmbeddingBackpressureError",
     # Models
     "MAX_QUERY_TEXT_BYTES",
     "Query",
@@ -130,13 +147,24 @@ __all__ = [
     "StateStoreError",
     "StateVersionConflictError",
     "PostgresStateStore",
+    "InMemoryStateStore",
+    "FileStateStore",
     "BanditState",
     "HybridRouterState",
     "RouterPhase",
+    "StateDelta",
     "numpy_to_list",
     "list_to_numpy",
     "serialize_bandit_matrices",
     "deserialize_bandit_matrices",
+    "encode_bandit_state",
+    "decode_bandit_state",
+    "encode_router_state",
+    "decode_router_state",
+    "diff_bandit_state",
+    "apply_bandit_delta",
+    "diff_router_state",
+    "apply_router_delta",
     # Lifecycle Management
     "LifecycleManager",
     "ShutdownPhase",
@@ -0,0 +1,296 @@
+"""Bounded background batching for work moved off the request path.
+
+Several components hand work to the background instead of awaiting it:
+audit logging (AuditPipeline), implicit feedback (ImplicitFeedbackPipeline)
+and the LiteLLM feedback logger. BackgroundBatcher is the queue they share:
+    1. submit() puts an item on a bounded in-memory queue
+    2. A background task hands queued items to the handler in batches of up
+       to batch_size, once flush_interval seconds have passed or batch_size
+       items are waiting
+    3. The task exits when the queue is empty and restarts on the next submit
+    4. close() stops the task and handles everything still queued
+
+Overload:
+    When the queue holds queue_size items, overflow="drop" (default)
+    discards the new item and counts it, so the caller never waits on the
+    handler. overflow="block" makes submit() wait for space instead.
+
+A batch whose handler raises is logged, counted in failed and discarded
+rather than retried, so the queue stays bounded during an outage.
+
+Example:
+    >>> batcher = BackgroundBatcher(write_rows, batch_size=500, name="audit")
+    >>> await batcher.submit(row)       # enqueue only
+    >>> batcher.get_stats()["queue_depth"]
+    1
+    >>> await batcher.close()           # final flush
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, Literal, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["drop", "block"]
+
+
+class BackgroundBatcher(Generic[T]):
+    """Bounded queue drained in batches by a lazily started background task.
+
+    Not thread-safe: submit() must be called from the event loop that runs
+    the batch task.
+
+    Attributes:
+        queue_size: Maximum queued items before the overflow policy applies
+        batch_size: Maximum items per handler call
+        flush_interval: Longest time (seconds) an item waits for its batch
+        overflow: "drop" new items or "block" submit() when the queue is full
+        name: Label for log messages and validation errors
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[Any]],
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow: OverflowPolicy = "drop",
+        name: str = "batch",
+        on_queue_depth: Callable[[int], None] | None = None,
+        on_drop: Callable[[str], None] | None = None,
+        on_lag: Callable[[float], None] | None = None,
+    ):
+        """Initialize batcher.
+
+        Args:
+            handler: Coroutine function processing one batch; raising marks
+                the whole batch failed
+            queue_size: Maximum queued items
+            batch_size: Maximum items per handler call
+            flush_interval: Handle items at most this many seconds after
+                they are queued
+            overflow: Policy when the queue is full ("drop" or "block")
+            name: Label for log messages and validation errors
+            on_queue_depth: Called with +n / -n as items are queued / taken
+                (metrics hook)
+            on_drop: Called with the reason ("queue_full" or "closed") for
+                each dropped item (metrics hook)
+            on_lag: Called with each handled item's submit-to-handled time
+                in milliseconds (metrics hook)
+
+        Raises:
+            ValueError: If sizes are < 1, flush_interval <= 0, or overflow
+                is unknown
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be > 0, got {flush_interval}")
+        if overflow not in ("drop", "block"):
+            raise ValueError(
+                f"Unknown {name} overflow policy: {overflow}. Supported: drop, block"
+            )
+
+        self._handler = handler
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.name = name
+        self._on_queue_depth = on_queue_depth
+        self._on_drop = on_drop
+        self._on_lag = on_lag
+
+        # (item, monotonic enqueue time)
+        self._queue: asyncio.Queue[tuple[T, float]] = asyncio.Queue(maxsize=queue_size)
+        self._batch_ready = asyncio.Event()
+        # Serializes handler calls: at most one batch in flight
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._submitted = 0
+        self._handled = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._last_batch_ms = 0.0
+        self._last_batch_size = 0
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+        self._total_lag_ms = 0.0
+
+    async def submit(self, item: T) -> bool:
+        """Queue an item for the background task.
+
+        With overflow="drop" this never suspends; with "block" it waits
+        while the queue is full.
+
+        Args:
+            item: Item to handle
+
+        Returns:
+            True if queued, False if dropped (queue full or batcher closed)
+        """
+        if self.overflow == "block" and not self._closed:
+            await self._queue.put((item, time.monotonic()))
+            self._accepted()
+            return True
+        return self.submit_nowait(item)
+
+    def submit_nowait(self, item: T) -> bool:
+        """Queue an item without waiting, dropping it if the queue is full.
+
+        For callers that cannot await (the overflow policy is treated as
+        "drop").
+
+        Args:
+            item: Item to handle
+
+        Returns:
+            True if queued, False if dropped (queue full or batcher closed)
+        """
+        if self._closed:
+            self._drop("closed")
+            return False
+
+        try:
+            self._queue.put_nowait((item, time.monotonic()))
+        except asyncio.QueueFull:
+            self._drop("queue_full")
+            return False
+
+        self._accepted()
+        return True
+
+    def _accepted(self) -> None:
+        """Book-keep a queued item and make sure the task is running."""
+        self._submitted += 1
+        depth = self._queue.qsize()
+        self._max_queue_depth = max(self._max_queue_depth, depth)
+        if self._on_queue_depth is not None:
+            self._on_queue_depth(1)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if depth >= self.batch_size:
+            self._batch_ready.set()
+
+    def _drop(self, reason: str) -> None:
+        """Count a discarded item."""
+        self._dropped += 1
+        if self._on_drop is not None:
+            self._on_drop(reason)
+        if self._dropped == 1 or self._dropped % 1000 == 0:
+            logger.warning(
+                f"{self.name} items dropped ({reason}); total dropped: {self._dropped}"
+            )
+
+    async def _run(self) -> None:
+        """Background loop: handle on interval or full batch, exit when idle."""
+        while not self._closed and not self._queue.empty():
+            if self._queue.qsize() < self.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._batch_ready.wait(), timeout=self.flush_interval
+                    )
+                except TimeoutError:
+                    pass
+            self._batch_ready.clear()
+
+            if self._closed:
+                return
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Handle everything currently queued, in batches of batch_size.
+
+        Items queued before the call have been handled when it returns
+        (a batch already in flight is waited for).
+
+        Returns:
+            Number of items handled (failed batches are logged and counted
+            in failed, not raised)
+        """
+        handled = 0
+        async with self._lock:
+            while not self._queue.empty():
+                batch = [
+                    self._queue.get_nowait()
+                    for _ in range(min(self.batch_size, self._queue.qsize()))
+                ]
+                if self._on_queue_depth is not None:
+                    self._on_queue_depth(-len(batch))
+                handled += await self._handle(batch)
+        return handled
+
+    async def _handle(self, batch: list[tuple[T, float]]) -> int:
+        """Run the handler for one batch and record its outcome."""
+        start = time.monotonic()
+        try:
+            await self._handler([item for item, _ in batch])
+        except Exception as e:
+            self._failed += len(batch)
+            logger.error(f"{self.name} batch failed ({len(batch)} items): {e}")
+            return 0
+
+        end = time.monotonic()
+        self._last_batch_ms = (end - start) * 1000
+        self._last_batch_size = len(batch)
+        self._batches += 1
+        self._handled += len(batch)
+        for _, enqueued_at in batch:
+            lag_ms = (end - enqueued_at) * 1000
+            self._last_lag_ms = lag_ms
+            self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+            self._total_lag_ms += lag_ms
+            if self._on_lag is not None:
+                self._on_lag(lag_ms)
+        return len(batch)
+
+    async def close(self) -> None:
+        """Stop the background task and handle any queued items."""
+        self._closed = True
+        self._batch_ready.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return batcher statistics.
+
+        Returns:
+            Dictionary with:
+            - queue_depth / max_queue_depth: Items waiting now / at peak
+            - submitted: Items accepted by submit()
+            - handled: Items in successfully handled batches
+            - dropped: Items discarded by the overflow policy or after close
+            - failed: Items in batches whose handler raised
+            - batches: Successfully handled batches
+            - last_batch_ms / last_batch_size: Most recent handled batch
+            - last_lag_ms / avg_lag_ms / max_lag_ms: Time from submit until
+              the item's batch was handled
+        """
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self._max_queue_depth,
+            "submitted": self._submitted,
+            "handled": self._handled,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "batches": self._batches,
+            "last_batch_ms": self._last_batch_ms,
+            "last_batch_size": self._last_batch_size,
+            "last_lag_ms": self._last_lag_ms,
+            "avg_lag_ms": self._total_lag_ms / self._handled if self._handled else 0.0,
+            "max_lag_ms": self._max_lag_ms,
+        }
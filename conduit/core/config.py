@@ -32,6 +32,7 @@ from conduit.core.config import (
     load_quality_estimation_config,
     load_routing_config,
     parse_env_value,
+    reload_config,
     settings,
 )
 
@@ -52,6 +53,7 @@ __all__ = [
     "load_preference_weights",
     "load_quality_estimation_config",
     "load_routing_config",
+    "reload_config",
     # Utils
     "load_default_models",
     "load_embeddings_config",
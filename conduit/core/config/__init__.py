@@ -33,6 +33,9 @@ from conduit.core.config.models import (
 )
 from conduit.core.config.settings import Settings, settings
 
+# Config snapshot (memoized loaders)
+from conduit.core.config.snapshot import ConfigSnapshot, config_snapshot, reload_config
+
 # Utility functions
 from conduit.core.config.utils import (
     load_default_models,
@@ -57,6 +60,10 @@ __all__ = [
     "load_preference_weights",
     "load_quality_estimation_config",
     "load_routing_config",
+    # Snapshot
+    "ConfigSnapshot",
+    "config_snapshot",
+    "reload_config",
     # Utils
     "load_default_models",
     "load_embeddings_config",
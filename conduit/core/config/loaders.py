@@ -4,6 +4,10 @@ All functions follow a 3-tier fallback chain:
     1. YAML config (conduit.yaml)
     2. Environment variables
     3. Hardcoded defaults
+
+Hot-path loaders (preference weights, context priors, routing, algorithm and
+feature dimension config) are memoized in a process-wide snapshot; see
+conduit.core.config.snapshot for invalidation rules.
 """
 
 import os
@@ -12,9 +16,11 @@ from typing import Any, Literal
 
 import yaml
 
+from conduit.core.config.snapshot import cached_config_loader
 from conduit.core.config.utils import load_embeddings_config, parse_env_value
 
 
+@cached_config_loader
 def load_preference_weights(
     optimize_for: Literal["balanced", "quality", "cost", "speed"],
 ) -> dict[str, float]:
@@ -64,6 +70,7 @@ def load_preference_weights(
         return defaults[optimize_for]
 
 
+@cached_config_loader
 def load_context_priors(context: str) -> dict[str, tuple[float, float]]:
     """Load Bayesian priors for Thompson Sampling cold start optimization.
 
@@ -122,6 +129,7 @@ def load_context_priors(context: str) -> dict[str, tuple[float, float]]:
         return {}
 
 
+@cached_config_loader
 def load_routing_config() -> dict[str, Any]:
     """Load routing configuration from conduit.yaml.
 
@@ -190,6 +198,7 @@ def load_routing_config() -> dict[str, Any]:
     return defaults
 
 
+@cached_config_loader
 def load_algorithm_config(algorithm: str) -> dict[str, Any]:
     """Load algorithm hyperparameters from conduit.yaml.
 
@@ -257,6 +266,7 @@ def load_algorithm_config(algorithm: str) -> dict[str, Any]:
     return defaults
 
 
+@cached_config_loader
 def load_feature_dimensions(auto_detect: bool = True) -> dict[str, int | float]:
     """Load feature dimension configuration with auto-detection support.
 
@@ -457,6 +467,7 @@ def load_quality_estimation_config() -> dict[str, Any]:
     return defaults
 
 
+@cached_config_loader
 def load_feedback_config() -> dict[str, Any]:
     """Load implicit feedback detection configuration from conduit.yaml.
 
@@ -675,6 +686,13 @@ def load_cache_config() -> dict[str, Any]:
             "threshold": settings.redis_circuit_breaker_threshold,
             "timeout": settings.redis_circuit_breaker_timeout,
         },
+        "l1": {
+            "enabled": settings.cache_l1_enabled,
+            "max_entries": settings.cache_l1_max_entries,
+            "max_bytes": settings.cache_l1_max_bytes,
+            "ttl": settings.cache_l1_ttl,
+        },
+        "encoding": settings.cache_encoding,
         "history_ttl": 300,  # 5 minutes (from history.py default)
     }
 
@@ -688,7 +706,7 @@ def load_cache_config() -> dict[str, Any]:
                 if isinstance(config, dict):
                     cache_config = config.get("cache", {})
                     if isinstance(cache_config, dict) and cache_config:
-                        # Deep merge circuit_breaker
+                        # Deep merge nested sections (circuit_breaker, l1)
                         result = defaults.copy()
                         for key, value in cache_config.items():
                             existing = result.get(key)
@@ -4,6 +4,8 @@ Provides centralized configuration loading from environment variables
 with validation and type safety using Pydantic.
 """
 
+from typing import Literal
+
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,6 +24,62 @@ class Settings(BaseSettings):
     database_pool_size: int = Field(
         default=20, description="Connection pool size", ge=1, le=100
     )
+    state_write_behind: bool = Field(
+        default=True,
+        description="Persist router state in the background instead of per update",
+    )
+    state_flush_interval: float = Field(
+        default=1.0,
+        description="Max seconds unsaved router state waits for a flush",
+        gt=0.0,
+        le=300.0,
+    )
+    state_max_dirty_updates: int = Field(
+        default=100, description="Pending state updates that force a flush", ge=1
+    )
+    state_checkpoint_mode: Literal["full", "incremental"] = Field(
+        default="full",
+        description="Persist full snapshots, or per-feedback deltas plus compaction",
+    )
+    state_compact_every: int = Field(
+        default=1000,
+        description="Logged state deltas that trigger a full snapshot",
+        ge=1,
+    )
+    state_sync_mode: Literal["overwrite", "merge"] = Field(
+        default="overwrite",
+        description="Replicas sharing a router_id overwrite or merge learned state",
+    )
+    bandit_update_queue_size: int = Field(
+        default=10000,
+        description="Max queued bandit updates before Router.update() waits",
+        ge=1,
+    )
+    bandit_update_time_slice_ms: float = Field(
+        default=1.0,
+        description="Max milliseconds of back-to-back updates before routing runs",
+        ge=0.0,
+    )
+    audit_buffered: bool = Field(
+        default=True,
+        description="Write decision audit entries in background batches",
+    )
+    audit_queue_size: int = Field(
+        default=10_000, description="Max audit entries queued for writing", ge=1
+    )
+    audit_batch_size: int = Field(
+        default=500, description="Max audit entries per batch write", ge=1
+    )
+    audit_flush_interval: float = Field(
+        default=1.0,
+        description="Max seconds a queued audit entry waits for a write",
+        gt=0.0,
+        le=300.0,
+    )
+    audit_overflow: Literal["drop", "block"] = Field(
+        default="drop",
+        description="Drop new audit entries or block routing when the queue is full",
+    )
 
     # Redis Cache
     redis_url: str = Field(default="redis://localhost:6379", description="Redis URL")
@@ -46,6 +104,24 @@ class Settings(BaseSettings):
         ge=60,
         le=3600,
     )
+    cache_l1_enabled: bool = Field(
+        default=True, description="Enable in-process LRU tier in front of Redis"
+    )
+    cache_l1_max_entries: int = Field(
+        default=10_000, description="Max entries in the in-process tier", ge=0
+    )
+    cache_l1_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Approximate memory bound for the in-process tier (bytes)",
+        ge=0,
+    )
+    cache_l1_ttl: int = Field(
+        default=300, description="In-process tier entry TTL seconds", ge=1, le=86400
+    )
+    cache_encoding: Literal["float32", "float16", "int8", "msgpack"] = Field(
+        default="float32",
+        description="Redis feature encoding (float32, float16, int8, msgpack)",
+    )
 
     # LLM Provider API Keys (all providers supported by PydanticAI)
     openai_api_key: str = Field(default="", description="OpenAI API key")
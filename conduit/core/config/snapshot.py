@@ -0,0 +1,161 @@
+"""Process-wide snapshot cache for YAML configuration loaders.
+
+Loaders such as load_feature_dimensions() are called on hot paths (every bandit
+select and update). Without caching, each call re-opens and re-parses
+conduit.yaml, scans environment variables and, when nothing is configured,
+constructs an embedding provider for dimension auto-detection.
+
+The snapshot memoizes each loader's result per working directory and arguments.
+A cached result stays valid until:
+    1. conduit.yaml changes (mtime or size), checked at most once per
+       check_interval seconds so steady-state calls do no filesystem I/O
+    2. reload_config() is called explicitly (e.g. after changing env vars)
+
+Example:
+    >>> from conduit.core.config import load_feature_dimensions, reload_config
+    >>> load_feature_dimensions()  # Parses conduit.yaml once
+    >>> load_feature_dimensions()  # Served from snapshot
+    >>> reload_config()  # Force re-parse on next call
+"""
+
+import copy
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Seconds between conduit.yaml mtime checks for a given working directory
+DEFAULT_CHECK_INTERVAL = 1.0
+
+CONFIG_FILENAME = "conduit.yaml"
+
+
+class ConfigSnapshot:
+    """Memoized loader results, invalidated on config file change or reload.
+
+    Attributes:
+        check_interval: Minimum seconds between stat() calls on conduit.yaml
+            for the same working directory (0 = check on every call)
+        generation: Incremented on every invalidation (useful for diagnostics)
+    """
+
+    def __init__(self, check_interval: float = DEFAULT_CHECK_INTERVAL) -> None:
+        """Initialize empty snapshot.
+
+        Args:
+            check_interval: Minimum seconds between config file mtime checks
+        """
+        self.check_interval = check_interval
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._results: dict[tuple[Any, ...], Any] = {}
+        # cwd -> (mtime_ns, size) of conduit.yaml, or None if missing
+        self._file_signatures: dict[str, tuple[int, int] | None] = {}
+        self._last_checked: dict[str, float] = {}
+
+    @staticmethod
+    def _file_signature(path: str) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) for path, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _validate(self, cwd: str) -> None:
+        """Drop cached results for cwd if its conduit.yaml changed.
+
+        Must be called with self._lock held.
+        """
+        now = time.monotonic()
+        last_checked = self._last_checked.get(cwd)
+        if last_checked is not None and now - last_checked < self.check_interval:
+            return
+
+        signature = self._file_signature(os.path.join(cwd, CONFIG_FILENAME))
+        if cwd in self._file_signatures and self._file_signatures[cwd] != signature:
+            self._results = {
+                key: value for key, value in self._results.items() if key[0] != cwd
+            }
+            self.generation += 1
+
+        self._file_signatures[cwd] = signature
+        self._last_checked[cwd] = now
+
+    def get(self, key: tuple[Any, ...], compute: Callable[[], R]) -> R:
+        """Return the cached value for key, computing it on first use.
+
+        Returned values are deep copies so callers may mutate them freely.
+
+        Args:
+            key: Loader name and call arguments
+            compute: Function producing the value on a cache miss
+
+        Returns:
+            Cached (or freshly computed) loader result
+        """
+        cwd = os.getcwd()
+        full_key = (cwd, *key)
+
+        with self._lock:
+            self._validate(cwd)
+            if full_key in self._results:
+                return copy.deepcopy(self._results[full_key])  # type: ignore[no-any-return]
+
+        # Compute outside the lock: loaders may construct embedding providers
+        value = compute()
+
+        with self._lock:
+            self._results[full_key] = value
+
+        return copy.deepcopy(value)
+
+    def reload(self) -> None:
+        """Invalidate all cached results; next loader call re-parses config."""
+        with self._lock:
+            self._results.clear()
+            self._file_signatures.clear()
+            self._last_checked.clear()
+            self.generation += 1
+
+
+# Process-wide snapshot shared by all cached loaders
+config_snapshot = ConfigSnapshot()
+
+
+def cached_config_loader(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorate a config loader so its results are served from the snapshot.
+
+    Args:
+        func: Loader function with hashable arguments
+
+    Returns:
+        Wrapped loader sharing the process-wide config_snapshot
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return config_snapshot.get(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def reload_config() -> None:
+    """Invalidate the configuration snapshot.
+
+    Call after editing environment variables or to force an immediate re-read
+    of conduit.yaml without waiting for the mtime check interval.
+
+    Example:
+        >>> os.environ["ALGORITHM_LINUCB_ALPHA"] = "2.0"
+        >>> reload_config()
+        >>> load_algorithm_config("linucb")["alpha"]
+        2.0
+    """
+    config_snapshot.reload()
@@ -119,6 +119,13 @@ def load_embeddings_config() -> dict[str, Any]:
         - pca_components: Number of PCA components
         - pca_auto_retrain: Auto-retrain PCA on workload
         - pca_retrain_threshold: Minimum queries before auto-retraining
+        - executor_max_workers: Local embedding worker threads (None = CPU cores)
+        - executor_max_queue_size: Admitted local embedding jobs bound
+          (None = 4 * workers)
+        - executor_queue_timeout: Seconds to wait for a free slot before rejecting
+        - batching_enabled: Coalesce concurrent single-text embed calls
+        - batching_max_batch_size: Distinct texts per coalesced batch
+        - batching_max_wait_ms: Max time a call waits for its batch to fill
     """
     # Defaults (PCA disabled by default)
     defaults = {
@@ -128,6 +135,12 @@ def load_embeddings_config() -> dict[str, Any]:
         "pca_components": 128,
         "pca_auto_retrain": True,
         "pca_retrain_threshold": 150,
+        "executor_max_workers": None,
+        "executor_max_queue_size": None,
+        "executor_queue_timeout": 5.0,
+        "batching_enabled": True,
+        "batching_max_batch_size": 64,
+        "batching_max_wait_ms": 2.0,
     }
 
     # Search for conduit.yaml
@@ -171,6 +184,35 @@ def load_embeddings_config() -> dict[str, Any]:
                                         "retrain_threshold"
                                     ]
 
+                            # Local embedding executor settings (nested)
+                            executor_config = embeddings_config.get("executor", {})
+                            if isinstance(executor_config, dict):
+                                for key in ("max_workers", "max_queue_size"):
+                                    if executor_config.get(key) is not None:
+                                        result[f"executor_{key}"] = int(
+                                            executor_config[key]
+                                        )
+                                if "queue_timeout" in executor_config:
+                                    result["executor_queue_timeout"] = float(
+                                        executor_config["queue_timeout"]
+                                    )
+
+                            # Request coalescing settings (nested)
+                            batching_config = embeddings_config.get("batching", {})
+                            if isinstance(batching_config, dict):
+                                if "enabled" in batching_config:
+                                    result["batching_enabled"] = bool(
+                                        batching_config["enabled"]
+                                    )
+                                if "max_batch_size" in batching_config:
+                                    result["batching_max_batch_size"] = int(
+                                        batching_config["max_batch_size"]
+                                    )
+                                if "max_wait_ms" in batching_config:
+                                    result["batching_max_wait_ms"] = float(
+                                        batching_config["max_wait_ms"]
+                                    )
+
                             return result
             except Exception:
                 continue
@@ -187,5 +229,9 @@ def load_embeddings_config() -> dict[str, Any]:
         env_overrides["pca_enabled"] = os.getenv("USE_PCA", "false").lower() == "true"
     if os.getenv("PCA_COMPONENTS"):
         env_overrides["pca_components"] = int(os.getenv("PCA_COMPONENTS", "128"))
+    if os.getenv("EMBEDDING_MAX_WORKERS"):
+        env_overrides["executor_max_workers"] = int(
+            os.getenv("EMBEDDING_MAX_WORKERS", "1")
+        )
 
     return {**defaults, **env_overrides}
@@ -318,6 +318,15 @@ class CircuitBreakerConfig(BaseModel):
     timeout: int = Field(default=300, ge=1, le=3600)
 
 
+class L1CacheConfig(BaseModel):
+    """In-process LRU cache tier configuration."""
+
+    enabled: bool = Field(default=True)
+    max_entries: int = Field(default=10_000, ge=0, le=10_000_000)
+    max_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    ttl: int = Field(default=300, ge=1, le=86400)
+
+
 class CacheConfig(BaseModel):
     """Cache configuration."""
 
@@ -326,6 +335,10 @@ class CacheConfig(BaseModel):
     max_retries: int = Field(default=3, ge=0, le=10)
     timeout: int = Field(default=5, ge=1, le=60)
     circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+    l1: L1CacheConfig = Field(default_factory=L1CacheConfig)
+    encoding: Literal["float32", "float16", "int8", "msgpack"] = Field(
+        default="float32"
+    )
     history_ttl: int = Field(default=300, ge=60, le=3600)
 
 
@@ -54,6 +54,12 @@ class ConfigurationError(ConduitError):
     code: str = "CONFIGURATION_ERROR"
 
 
+class EmbeddingBackpressureError(ConduitError):
+    """Embedding executor queue is full, request rejected instead of queued."""
+
+    code: str = "EMBEDDING_BACKPRESSURE"
+
+
 class CircuitBreakerOpenError(ConduitError):
     """Circuit breaker is open, preventing execution."""
 
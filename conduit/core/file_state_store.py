@@ -0,0 +1,477 @@
+"""File-backed implementation of StateStore for single-node persistence.
+
+Writes one file per (router_id, bandit_id) in the binary state format
+(conduit.core.state_codec) behind a 16-byte header holding the record
+version. Saves go to a temp file in the same directory, are fsynced, and
+replace the old file with os.replace, so a reader or a crash only ever sees
+the complete old or the complete new file.
+
+Loads memory-map the file and decode arrays straight from the page cache:
+no read buffer, no JSON parsing, and no matrix inversion (the cached A_inv,
+Sigma_inv and Cholesky factors are stored), so restarting a large-d router
+costs roughly one copy of its matrices. With compression enabled the body
+has to be decompressed first, which gives up most of that advantage.
+
+Optimistic Locking:
+    Same semantics as PostgresStateStore. A save reads the current version,
+    writes the new file (the slow part) without holding a lock, then takes
+    the router's lock and renames only if the version is unchanged. On
+    conflict it retries with exponential backoff, raising
+    StateVersionConflictError after MAX_RETRIES.
+
+    The lock is fcntl.flock on <router dir>/.lock, so processes sharing the
+    directory (e.g. several workers on one host) are serialized too. Without
+    fcntl (Windows) only threads and coroutines of one process are.
+
+Directory Layout:
+    <directory>/<router_id>/<bandit_id>.state
+    Names are percent-encoded (including "."), HybridRouter state uses
+    bandit_id "hybrid_router", and temp files start with ".".
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TypeVar
+from urllib.parse import quote, unquote
+
+from conduit.core.postgres_state_store import (
+    BASE_DELAY_MS,
+    MAX_DELAY_MS,
+    MAX_RETRIES,
+    StateVersionConflictError,
+)
+from conduit.core.state_codec import (
+    StateArrayDtype,
+    StateCompression,
+    decode_bandit_state,
+    decode_router_state,
+    encode_bandit_state,
+    encode_router_state,
+)
+from conduit.core.state_store import (
+    BanditState,
+    HybridRouterState,
+    StateStore,
+    StateStoreError,
+)
+
+# fcntl is POSIX-only; without it locking is process-local
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+FILE_MAGIC = b"CSTF"
+FILE_FORMAT_VERSION = 1
+
+# magic, file format version, record version; 16 bytes keeps arrays aligned
+_FILE_HEADER = struct.Struct("<4sIQ")
+_STATE_SUFFIX = ".state"
+_LOCK_NAME = ".lock"
+_HYBRID_ROUTER_ID = "hybrid_router"
+
+_T = TypeVar("_T", BanditState, HybridRouterState)
+
+
+def _encode_name(name: str) -> str:
+    """Percent-encode an identifier into a safe, dot-free path component."""
+    if not name:
+        raise ValueError("State identifiers must be non-empty")
+    return quote(name, safe="").replace(".", "%2E")
+
+
+class FileStateStore(StateStore):
+    """Local-disk state store with atomic writes and optimistic locking.
+
+    Intended for single-node deployments, benchmarks and tests that need
+    persistence without Postgres. Incremental checkpoints are not supported
+    (use InMemoryStateStore or PostgresStateStore for those); merge sync is,
+    with the read-merge-write done under the router's lock.
+
+    Attributes:
+        directory: Root directory holding one subdirectory per router
+        array_dtype: Array storage type ("float64" exact, "float32")
+        compression: Body compression ("none", "zlib", "zstd")
+        fsync: Whether writes are fsynced before and after the rename
+        conflict_count: Counter for version conflicts (for monitoring)
+        bytes_written: Total serialized state bytes written (for monitoring)
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        array_dtype: StateArrayDtype = "float64",
+        compression: StateCompression = "none",
+        fsync: bool = True,
+    ) -> None:
+        """Initialize file state store, creating directory if needed.
+
+        Args:
+            directory: Root directory for state files
+            array_dtype: Binary array storage type ("float64" exact, "float32")
+            compression: Binary body compression ("none", "zlib", "zstd")
+            fsync: Flush files and directory entries to disk on every save
+                (disable for throwaway benchmark or test directories)
+        """
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.array_dtype: StateArrayDtype = array_dtype
+        self.compression: StateCompression = compression
+        self.fsync = fsync
+        self.conflict_count = 0
+        self.bytes_written = 0
+        self._thread_lock = threading.Lock()
+
+    def _state_path(self, router_id: str, bandit_id: str) -> Path:
+        """Return the state file path for a record."""
+        return (
+            self.directory
+            / _encode_name(router_id)
+            / f"{_encode_name(bandit_id)}{_STATE_SUFFIX}"
+        )
+
+    def _calculate_backoff_delay(self, attempt: int) -> float:
+        """Calculate exponential backoff delay with jitter (in seconds)."""
+        delay_ms: float = min(BASE_DELAY_MS * (2**attempt), MAX_DELAY_MS)
+        jitter_ms: float = random.uniform(0, delay_ms * 0.5)
+        return (delay_ms + jitter_ms) / 1000.0
+
+    @contextmanager
+    def _locked(self, router_dir: Path) -> Iterator[None]:
+        """Hold the router's lock (thread lock plus flock where available)."""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(router_dir / _LOCK_NAME, "a+b") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_version(path: Path) -> int | None:
+        """Read the record version from a state file header.
+
+        Returns:
+            Current version number, or None if the file doesn't exist
+
+        Raises:
+            ValueError: If the file is not a state file
+        """
+        try:
+            with open(path, "rb") as file:
+                header = file.read(_FILE_HEADER.size)
+        except FileNotFoundError:
+            return None
+        if len(header) < _FILE_HEADER.size:
+            raise ValueError(f"Truncated state file: {path}")
+        magic, file_format, version = _FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC:
+            raise ValueError(f"Not a state file (missing magic prefix): {path}")
+        if file_format != FILE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported state file version: {file_format}")
+        return int(version)
+
+    @staticmethod
+    def _read_state(path: Path, decode: Callable[[memoryview], _T]) -> _T | None:
+        """Memory-map a state file and decode its payload.
+
+        Returns:
+            Decoded state, or None if the file doesn't exist
+        """
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        with file:
+            if os.fstat(file.fileno()).st_size < _FILE_HEADER.size:
+                raise ValueError(f"Truncated state file: {path}")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, file_format, _ = _FILE_HEADER.unpack_from(mapped)
+            if magic != FILE_MAGIC:
+                raise ValueError(f"Not a state file (missing magic prefix): {path}")
+            if file_format != FILE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported state file version: {file_format}")
+            return decode(memoryview(mapped)[_FILE_HEADER.size :])
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # A view is still referenced (e.g. by a traceback); the
+                # mapping is released when it is garbage collected
+                pass
+
+    def _write_temp(self, path: Path, version: int, payload: bytes) -> Path:
+        """Write header and payload to a temp file next to path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_FILE_HEADER.pack(FILE_MAGIC, FILE_FORMAT_VERSION, version))
+                file.write(payload)
+                file.flush()
+                if self.fsync:
+                    os.fsync(file.fileno())
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return Path(tmp_name)
+
+    def _replace(self, tmp: Path, path: Path) -> None:
+        """Atomically move tmp over path and persist the directory entry."""
+        try:
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        if self.fsync and os.name == "posix":
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _commit(self, tmp: Path, path: Path, expected_version: int | None) -> bool:
+        """Rename tmp over path if the version is unchanged (under the lock).
+
+        Returns:
+            True if committed, False on version conflict (tmp is removed)
+        """
+        with self._locked(path.parent):
+            if self._read_version(path) != expected_version:
+                tmp.unlink(missing_ok=True)
+                return False
+            self._replace(tmp, path)
+            return True
+
+    async def _save(
+        self, router_id: str, bandit_id: str, state: BanditState | HybridRouterState
+    ) -> None:
+        """Save state with optimistic locking (shared by both save methods)."""
+        state.updated_at = datetime.now(timezone.utc)
+        path = self._state_path(router_id, bandit_id)
+        if isinstance(state, HybridRouterState):
+            payload = encode_router_state(state, self.array_dtype, self.compression)
+        else:
+            payload = encode_bandit_state(state, self.array_dtype, self.compression)
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                current_version = await asyncio.to_thread(self._read_version, path)
+                new_version = (current_version or 0) + 1
+                tmp = await asyncio.to_thread(
+                    self._write_temp, path, new_version, payload
+                )
+                committed = await asyncio.to_thread(
+                    self._commit, tmp, path, current_version
+                )
+            except Exception as e:
+                logger.error(f"Failed to save state for {router_id}/{bandit_id}: {e}")
+                raise StateStoreError(f"Failed to save state: {e}") from e
+
+            if committed:
+                logger.debug(
+                    f"Saved state for {router_id}/{bandit_id} "
+                    f"(version {current_version} -> {new_version})"
+                )
+                self.bytes_written += len(payload)
+                return
+
+            # Version conflict - another writer replaced the file
+            self.conflict_count += 1
+            if attempt < MAX_RETRIES:
+                delay = self._calculate_backoff_delay(attempt)
+                logger.warning(
+                    f"Version conflict for {router_id}/{bandit_id}, "
+                    f"retrying in {delay * 1000:.0f}ms "
+                    f"(attempt {attempt + 1}/{MAX_RETRIES})"
+                )
+                await asyncio.sleep(delay)
+
+        raise StateVersionConflictError(
+            f"Version conflict persisted after {MAX_RETRIES} retries "
+            f"for {router_id}/{bandit_id}. Total conflicts: {self.conflict_count}"
+        )
+
+    async def _load(
+        self, router_id: str, bandit_id: str, decode: Callable[[memoryview], _T]
+    ) -> _T | None:
+        """Load and decode a state file (None if missing)."""
+        path = self._state_path(router_id, bandit_id)
+        try:
+            state = await asyncio.to_thread(self._read_state, path, decode)
+        except Exception as e:
+            logger.error(f"Failed to load state for {router_id}/{bandit_id}: {e}")
+            raise StateStoreError(f"Failed to load state: {e}") from e
+        if state is None:
+            logger.debug(f"No state found for {router_id}/{bandit_id}")
+        return state
+
+    async def save_bandit_state(
+        self, router_id: str, bandit_id: str, state: BanditState
+    ) -> None:
+        """Save bandit algorithm state atomically with optimistic locking.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            bandit_id: Identifier for the specific bandit (e.g., "ucb1", "linucb")
+            state: Bandit state to persist
+
+        Raises:
+            StateStoreError: If save fails
+            StateVersionConflictError: If conflicts persist after MAX_RETRIES
+        """
+        await self._save(router_id, bandit_id, state)
+
+    async def load_bandit_state(
+        self, router_id: str, bandit_id: str
+    ) -> BanditState | None:
+        """Load bandit algorithm state from its memory-mapped file.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            bandit_id: Identifier for the specific bandit
+
+        Returns:
+            BanditState if found, None otherwise
+
+        Raises:
+            StateStoreError: If the file exists but can't be read or decoded
+        """
+        return await self._load(router_id, bandit_id, decode_bandit_state)
+
+    async def save_hybrid_router_state(
+        self, router_id: str, state: HybridRouterState
+    ) -> None:
+        """Save HybridRouter state atomically with optimistic locking.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            state: HybridRouter state to persist
+
+        Raises:
+            StateStoreError: If save fails
+            StateVersionConflictError: If conflicts persist after MAX_RETRIES
+        """
+        await self._save(router_id, _HYBRID_ROUTER_ID, state)
+
+    async def load_hybrid_router_state(
+        self, router_id: str
+    ) -> HybridRouterState | None:
+        """Load HybridRouter state from its memory-mapped file.
+
+        Args:
+            router_id: Unique identifier for the router instance
+
+        Returns:
+            HybridRouterState if found, None otherwise
+
+        Raises:
+            StateStoreError: If the file exists but can't be read or decoded
+        """
+        return await self._load(router_id, _HYBRID_ROUTER_ID, decode_router_state)
+
+    def _merge_locked(
+        self, path: Path, delta: HybridRouterState, base: HybridRouterState
+    ) -> tuple[HybridRouterState, int]:
+        """Read, merge and replace the router file while holding its lock."""
+        from conduit.core.state_merge import apply_router_delta
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(path.parent):
+            version = self._read_version(path)
+            shared = self._read_state(path, decode_router_state)
+            merged = apply_router_delta(shared if shared is not None else base, delta)
+            merged.updated_at = datetime.now(timezone.utc)
+            payload = encode_router_state(merged, self.array_dtype, self.compression)
+            tmp = self._write_temp(path, (version or 0) + 1, payload)
+            self._replace(tmp, path)
+        return merged, len(payload)
+
+    async def merge_hybrid_router_state(
+        self, router_id: str, delta: HybridRouterState, base: HybridRouterState
+    ) -> HybridRouterState:
+        """Add a replica's learning into the shared router state atomically.
+
+        Runs read-merge-write under the router's lock, so replicas in other
+        processes sharing the directory queue instead of overwriting.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            delta: diff_router_state(local, base) from the replica
+            base: State the delta was computed against (used if no file exists)
+
+        Returns:
+            Merged shared HybridRouterState
+
+        Raises:
+            ValueError: If the delta's algorithms or arms don't match
+            StateStoreError: If the merge fails
+        """
+        path = self._state_path(router_id, _HYBRID_ROUTER_ID)
+        try:
+            merged, size = await asyncio.to_thread(
+                self._merge_locked, path, delta, base
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to merge hybrid router state: {e}")
+            raise StateStoreError(f"Failed to merge state: {e}") from e
+
+        self.bytes_written += size
+        logger.debug(
+            f"Merged hybrid router state for {router_id} "
+            f"(query_count {merged.query_count})"
+        )
+        return merged
+
+    async def delete_state(self, router_id: str) -> None:
+        """Delete all state files for a router.
+
+        Args:
+            router_id: Unique identifier for the router instance
+
+        Raises:
+            StateStoreError: If deletion fails
+        """
+        router_dir = self.directory / _encode_name(router_id)
+        try:
+            await asyncio.to_thread(shutil.rmtree, router_dir)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Failed to delete state for {router_id}: {e}")
+            raise StateStoreError(f"Failed to delete state: {e}") from e
+        logger.info(f"Deleted state for {router_id}")
+
+    async def list_router_ids(self) -> list[str]:
+        """List all router IDs with at least one state file.
+
+        Returns:
+            Sorted list of router IDs
+        """
+        return sorted(
+            unquote(router_dir.name)
+            for router_dir in self.directory.iterdir()
+            if router_dir.is_dir()
+            and any(router_dir.glob(f"[!.]*{_STATE_SUFFIX}"))
+        )
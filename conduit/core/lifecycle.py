@@ -296,9 +296,13 @@ class LifecycleManager:
             return True
 
         try:
-            # Router.close() handles state persistence internally
             logger.info("Persisting bandit state to database")
-            await self.router.close()
+            try:
+                # Final synchronous flush (drains write-behind state). Unlike
+                # close(), flush_state() raises if the write fails.
+                await self.router.flush_state()
+            finally:
+                await self.router.close()
             logger.info("Bandit state persisted successfully")
             return True
 
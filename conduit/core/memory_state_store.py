@@ -0,0 +1,192 @@
+"""In-memory implementation of StateStore.
+
+Keeps state in process memory: nothing survives a restart, but saves and
+loads cost a deep copy instead of a database round trip. Use it for tests,
+benchmarks and single-process deployments that don't need persistence (see
+FileStateStore for local persistence).
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from conduit.core.state_store import (
+    BanditState,
+    HybridRouterState,
+    StateDelta,
+    StateStore,
+)
+
+logger = logging.getLogger(__name__)
+
+_HYBRID_ROUTER_ID = "hybrid_router"
+
+
+class InMemoryStateStore(StateStore):
+    """Process-local state store with versioning and a delta log.
+
+    Saves store deep copies, so later mutation of the saved object (or of a
+    loaded one) never leaks into the store. Each (router_id, bandit_id) keeps
+    a version that starts at 1 and increments on every save, like
+    PostgresStateStore. Saves complete without awaiting, so concurrent
+    coroutines can't interleave and no version conflicts occur.
+
+    Supports incremental checkpoints (append_state_deltas and friends) and
+    the default merge_hybrid_router_state, so every Router persistence mode
+    works without Postgres.
+
+    Attributes:
+        save_count: Number of successful saves (for monitoring)
+    """
+
+    supports_state_deltas = True
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        super().__init__()
+        self._states: dict[
+            tuple[str, str], tuple[int, BanditState | HybridRouterState]
+        ] = {}
+        self._deltas: dict[str, list[StateDelta]] = {}
+        self._delta_seq = 0
+        self.save_count = 0
+
+    def _save(
+        self, router_id: str, bandit_id: str, state: BanditState | HybridRouterState
+    ) -> None:
+        """Store a copy of state under the next version."""
+        state.updated_at = datetime.now(timezone.utc)
+        current = self._states.get((router_id, bandit_id))
+        version = current[0] + 1 if current is not None else 1
+        self._states[(router_id, bandit_id)] = (version, state.model_copy(deep=True))
+        self.save_count += 1
+        logger.debug(f"Saved state for {router_id}/{bandit_id} (version {version})")
+
+    def _get_current_version(self, router_id: str, bandit_id: str) -> int | None:
+        """Get current version for a state record (None if it doesn't exist)."""
+        current = self._states.get((router_id, bandit_id))
+        return current[0] if current is not None else None
+
+    async def save_bandit_state(
+        self, router_id: str, bandit_id: str, state: BanditState
+    ) -> None:
+        """Save a copy of bandit algorithm state.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            bandit_id: Identifier for the specific bandit (e.g., "ucb1", "linucb")
+            state: Bandit state to persist
+        """
+        self._save(router_id, bandit_id, state)
+
+    async def load_bandit_state(
+        self, router_id: str, bandit_id: str
+    ) -> BanditState | None:
+        """Load a copy of bandit algorithm state.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            bandit_id: Identifier for the specific bandit
+
+        Returns:
+            BanditState if found, None otherwise
+        """
+        current = self._states.get((router_id, bandit_id))
+        if current is None or not isinstance(current[1], BanditState):
+            return None
+        return current[1].model_copy(deep=True)
+
+    async def save_hybrid_router_state(
+        self, router_id: str, state: HybridRouterState
+    ) -> None:
+        """Save a copy of HybridRouter state.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            state: HybridRouter state to persist
+        """
+        self._save(router_id, _HYBRID_ROUTER_ID, state)
+
+    async def load_hybrid_router_state(
+        self, router_id: str
+    ) -> HybridRouterState | None:
+        """Load a copy of HybridRouter state.
+
+        Args:
+            router_id: Unique identifier for the router instance
+
+        Returns:
+            HybridRouterState if found, None otherwise
+        """
+        current = self._states.get((router_id, _HYBRID_ROUTER_ID))
+        if current is None or not isinstance(current[1], HybridRouterState):
+            return None
+        return current[1].model_copy(deep=True)
+
+    async def delete_state(self, router_id: str) -> None:
+        """Delete all state and logged deltas for a router.
+
+        Args:
+            router_id: Unique identifier for the router instance
+        """
+        for key in [key for key in self._states if key[0] == router_id]:
+            del self._states[key]
+        self._deltas.pop(router_id, None)
+
+    async def list_router_ids(self) -> list[str]:
+        """List all router IDs with saved state.
+
+        Returns:
+            Sorted list of router IDs
+        """
+        return sorted({router_id for router_id, _ in self._states})
+
+    async def append_state_deltas(
+        self, router_id: str, deltas: list[StateDelta]
+    ) -> int:
+        """Append feedback observations to the router's delta log.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            deltas: Observations in the order they were applied
+
+        Returns:
+            seq of the last appended delta (unchanged if deltas is empty)
+        """
+        log = self._deltas.setdefault(router_id, [])
+        for delta in deltas:
+            self._delta_seq += 1
+            log.append(delta.model_copy(update={"seq": self._delta_seq}, deep=True))
+        return self._delta_seq
+
+    async def load_state_deltas(
+        self, router_id: str, after_seq: int = 0
+    ) -> list[StateDelta]:
+        """Load logged observations newer than after_seq, oldest first.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            after_seq: Return only deltas with seq > after_seq
+
+        Returns:
+            Deltas ordered by seq
+        """
+        return [
+            delta.model_copy(deep=True)
+            for delta in self._deltas.get(router_id, [])
+            if delta.seq > after_seq
+        ]
+
+    async def compact_state_deltas(self, router_id: str, through_seq: int) -> int:
+        """Drop logged observations with seq <= through_seq.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            through_seq: Delete deltas with seq <= through_seq
+
+        Returns:
+            Number of deltas deleted
+        """
+        log = self._deltas.get(router_id, [])
+        kept = [delta for delta in log if delta.seq > through_seq]
+        self._deltas[router_id] = kept
+        return len(log) - len(kept)
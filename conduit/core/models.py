@@ -7,10 +7,23 @@ responses, feedback, and ML model state.
 import json
 import re
 from datetime import datetime, timezone
-from typing import Any, Literal
+from functools import cached_property
+from typing import Annotated, Any, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+import numpy as np
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+    computed_field,
+    field_validator,
+)
+
+from conduit.core.config import load_feature_dimensions
 
 # Input validation constants
 MAX_QUERY_TEXT_BYTES = 100_000  # 100KB max query text size
@@ -122,6 +135,46 @@ class Query(BaseModel):
         return f"Query({self.id[:8]!r}, {text_preview!r})"
 
 
+def _as_readonly_vector(value: Any) -> np.ndarray:
+    """Validate an embedding into a read-only 1-D float ndarray.
+
+    float32/float64 arrays are wrapped without copying (read-only view);
+    lists and other numeric sequences are converted to float64.
+
+    Args:
+        value: Embedding as ndarray, list, or other numeric sequence
+
+    Returns:
+        Read-only 1-D float32/float64 array
+
+    Raises:
+        ValueError: If value is not a 1-D numeric vector
+    """
+    try:
+        array = np.asarray(value)
+        if array.dtype not in (np.float32, np.float64):
+            array = array.astype(np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Embedding must be a numeric vector: {e}") from e
+
+    if array.ndim != 1:
+        raise ValueError(f"Embedding must be 1-D, got shape {array.shape}")
+
+    if array.flags.writeable:
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+# Embedding vector carried as a read-only ndarray; serialized as a list of floats
+EmbeddingVector = Annotated[
+    np.ndarray,
+    PlainValidator(_as_readonly_vector),
+    PlainSerializer(lambda array: array.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
 class QueryFeatures(BaseModel):
     """Immutable extracted feature vector from query for routing decisions.
 
@@ -136,12 +189,28 @@ class QueryFeatures(BaseModel):
     Failure Handling:
         If embedding generation fails, embedding_failed=True and embedding contains
         a zero vector. The router will fall back to non-contextual algorithms.
+
+    Vector Representation:
+        The embedding is stored as a read-only numpy array (embedding_array), so
+        provider/PCA output flows into bandits without list materialization.
+        Construct with embedding=<list or ndarray>; serialization (model_dump,
+        JSON) still emits "embedding" as a list of floats for cache and
+        persistence boundaries. The embedding property returns a list for
+        backward compatibility (materialized lazily on first access).
     """
 
-    model_config = {"frozen": True}
+    model_config = {
+        "frozen": True,
+        "validate_by_name": True,
+        "validate_by_alias": True,
+        "serialize_by_alias": True,
+    }
 
-    embedding: list[float] = Field(
-        ..., description="Semantic embedding vector (dimension depends on model)"
+    embedding_array: EmbeddingVector = Field(
+        ...,
+        validation_alias=AliasChoices("embedding", "embedding_array"),
+        serialization_alias="embedding",
+        description="Semantic embedding vector (dimension depends on model)",
     )
     token_count: int = Field(..., description="Approximate token count", ge=0)
     complexity_score: float = Field(
@@ -155,9 +224,46 @@ class QueryFeatures(BaseModel):
         description="True if embedding generation failed and zero vector fallback was used",
     )
 
+    @cached_property
+    def embedding(self) -> list[float]:
+        """Embedding as a list of floats (compatibility view of embedding_array)."""
+        return self.embedding_array.tolist()  # type: ignore[no-any-return]
+
+    @cached_property
+    def feature_vector(self) -> np.ndarray:
+        """Bandit feature vector: embedding + normalized metadata dims (cached).
+
+        Layout: [embedding..., token_count / token_count_normalization,
+        complexity_score], as a read-only 1-D float64 array computed once per
+        QueryFeatures instance.
+
+        Returns:
+            Read-only feature vector of length len(embedding) + 2
+        """
+        token_normalization = load_feature_dimensions()["token_count_normalization"]
+        vector = np.empty(self.embedding_array.shape[0] + 2, dtype=np.float64)
+        vector[:-2] = self.embedding_array
+        vector[-2] = self.token_count / token_normalization
+        vector[-1] = self.complexity_score
+        vector.flags.writeable = False
+        return vector
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field values, treating embeddings as arrays."""
+        if not isinstance(other, QueryFeatures):
+            return NotImplemented
+        return (
+            np.array_equal(self.embedding_array, other.embedding_array)
+            and self.token_count == other.token_count
+            and self.complexity_score == other.complexity_score
+            and self.query_text == other.query_text
+            and self.embedding_failed == other.embedding_failed
+        )
+
     def __repr__(self) -> str:
         """Return concise repr for debugging."""
-        return f"QueryFeatures(dims={len(self.embedding)}, tokens={self.token_count})"
+        dims = self.embedding_array.shape[0]
+        return f"QueryFeatures(dims={dims}, tokens={self.token_count})"
 
 
 class RoutingDecision(BaseModel):
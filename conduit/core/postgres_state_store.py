@@ -1,7 +1,9 @@
 """PostgreSQL implementation of StateStore for bandit state persistence.
 
-Uses JSONB columns for flexible state storage with efficient querying.
-Supports atomic updates and optimistic locking for safe concurrent access.
+Stores state either in the binary state format (BYTEA column, default) or as
+JSONB. Loads accept both, so existing JSONB rows keep working after switching
+formats. Supports atomic updates and optimistic locking for safe concurrent
+access.
 
 Optimistic Locking:
     When multiple replicas share the same router_id, they may attempt to update
@@ -18,15 +20,26 @@ import json
 import logging
 import random
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
 
 if TYPE_CHECKING:
     import asyncpg
     from asyncpg.pool import PoolConnectionProxy
 
+from conduit.core.state_codec import (
+    StateArrayDtype,
+    StateCompression,
+    decode_bandit_state,
+    decode_router_state,
+    encode_bandit_state,
+    encode_router_state,
+)
 from conduit.core.state_store import (
     BanditState,
     HybridRouterState,
+    StateDelta,
     StateStore,
     StateStoreError,
 )
@@ -52,7 +65,7 @@ class StateVersionConflictError(StateStoreError):
 class PostgresStateStore(StateStore):
     """PostgreSQL implementation of state persistence with optimistic locking.
 
-    Stores bandit state as JSONB in a dedicated table, supporting:
+    Stores bandit state in a dedicated table, supporting:
     - Atomic save/load operations
     - Optimistic locking for safe concurrent updates (multi-replica safe)
     - Automatic retry with exponential backoff on conflicts
@@ -71,13 +84,40 @@ class PostgresStateStore(StateStore):
             id SERIAL PRIMARY KEY,
             router_id VARCHAR(255) NOT NULL,
             bandit_id VARCHAR(255) NOT NULL,
-            state_json JSONB NOT NULL,
+            state_json JSONB,           -- JSON format (NULL for binary rows)
+            state_bytes BYTEA,          -- binary format (NULL for JSON rows)
             version INTEGER NOT NULL DEFAULT 1,
             created_at TIMESTAMP DEFAULT NOW(),
             updated_at TIMESTAMP DEFAULT NOW(),
             UNIQUE(router_id, bandit_id)
         );
 
+        CREATE TABLE IF NOT EXISTS bandit_state_delta (
+            seq BIGSERIAL PRIMARY KEY,
+            router_id VARCHAR(255) NOT NULL,
+            delta_json JSONB NOT NULL,  -- StateDelta scalars
+            features BYTEA,             -- float64 embedding (NULL in phase1)
+            created_at TIMESTAMP DEFAULT NOW()
+        );
+
+    Incremental Checkpoints:
+        append_state_deltas() logs one O(d) row per feedback observation
+        instead of rewriting the O(K·d²) snapshot. Load the snapshot, then
+        replay load_state_deltas(router_id, state.delta_seq) in seq order
+        (HybridRouter.load_state does this). After saving a new snapshot,
+        compact_state_deltas() deletes the rows it folded in.
+
+    Merge Sync:
+        merge_hybrid_router_state() adds a replica's sufficient-statistic delta
+        to the shared row under SELECT ... FOR UPDATE, so replicas sharing a
+        router_id combine their learning instead of last-writer-wins.
+
+    Storage Formats:
+        "binary" (default) writes conduit.core.state_codec payloads: raw
+        float64/float32 arrays plus cached A_inv/Cholesky factors, so restores
+        skip O(d³) inversion. "json" writes model_dump_json() as before.
+        Either format is read regardless of the configured one.
+
     pgBouncer Compatibility:
         When using pgBouncer in transaction pooling mode, create the asyncpg
         pool with statement_cache_size=0 to avoid prepared statement conflicts:
@@ -89,17 +129,36 @@ class PostgresStateStore(StateStore):
 
     Attributes:
         pool: asyncpg connection pool
+        storage_format: "binary" or "json" (format used for writes)
         conflict_count: Counter for version conflicts (for monitoring)
+        bytes_written: Total serialized state bytes written (for monitoring)
     """
 
-    def __init__(self, pool: "asyncpg.Pool[asyncpg.Record]") -> None:
+    def __init__(
+        self,
+        pool: "asyncpg.Pool[asyncpg.Record]",
+        storage_format: Literal["binary", "json"] = "binary",
+        array_dtype: StateArrayDtype = "float64",
+        compression: StateCompression = "none",
+    ) -> None:
         """Initialize PostgreSQL state store.
 
         Args:
             pool: asyncpg connection pool (from Database class)
+            storage_format: Write format ("binary" BYTEA or legacy "json" JSONB)
+            array_dtype: Binary array storage type ("float64" exact, "float32")
+            compression: Binary body compression ("none", "zlib", "zstd")
         """
+        super().__init__()
         self.pool: "asyncpg.Pool[asyncpg.Record]" = pool
+        self.storage_format = storage_format
+        self.array_dtype: StateArrayDtype = array_dtype
+        self.compression: StateCompression = compression
         self.conflict_count = 0  # Track conflicts for monitoring
+        self.bytes_written = 0  # Serialized state bytes successfully written
+        self._schema_ready = False  # Tables ensured once per store instance
+
+    supports_state_deltas = True
 
     async def _get_current_version(
         self,
@@ -139,14 +198,48 @@ class PostgresStateStore(StateStore):
         jitter_ms: float = random.uniform(0, delay_ms * 0.5)
         return (delay_ms + jitter_ms) / 1000.0
 
+    def _serialize(
+        self, state: BanditState | HybridRouterState
+    ) -> tuple[str | None, bytes | None]:
+        """Serialize state for the configured storage format.
+
+        Returns:
+            (state_json, state_bytes) with exactly one of them set
+        """
+        if self.storage_format == "json":
+            return state.model_dump_json(), None
+        if isinstance(state, HybridRouterState):
+            return None, encode_router_state(
+                state, self.array_dtype, self.compression
+            )
+        return None, encode_bandit_state(state, self.array_dtype, self.compression)
+
+    @staticmethod
+    def _decode_router_row(row: Any) -> HybridRouterState:
+        """Decode a hybrid_router row (binary column preferred over JSON)."""
+        # Binary rows take precedence; JSON rows predate the binary format
+        state_bytes = row.get("state_bytes")
+        if state_bytes is not None:
+            return decode_router_state(bytes(state_bytes))
+        return HybridRouterState(**json.loads(row["state_json"]))
+
     async def _ensure_table_exists(self) -> None:
-        """Create bandit_state table if it doesn't exist."""
+        """Create bandit_state tables if they don't exist.
+
+        Runs once per store instance; later calls return immediately so
+        reads and writes don't issue DDL. Upgrading an existing table (e.g.
+        adding state_bytes) is left to the alembic migrations.
+        """
+        if self._schema_ready:
+            return
+
         create_table_sql = """
         CREATE TABLE IF NOT EXISTS bandit_state (
             id SERIAL PRIMARY KEY,
             router_id VARCHAR(255) NOT NULL,
             bandit_id VARCHAR(255) NOT NULL,
-            state_json JSONB NOT NULL,
+            state_json JSONB,
+            state_bytes BYTEA,
             version INTEGER NOT NULL DEFAULT 1,
             created_at TIMESTAMP DEFAULT NOW(),
             updated_at TIMESTAMP DEFAULT NOW(),
@@ -155,6 +248,17 @@ class PostgresStateStore(StateStore):
 
         CREATE INDEX IF NOT EXISTS idx_bandit_state_router_id
         ON bandit_state(router_id);
+
+        CREATE TABLE IF NOT EXISTS bandit_state_delta (
+            seq BIGSERIAL PRIMARY KEY,
+            router_id VARCHAR(255) NOT NULL,
+            delta_json JSONB NOT NULL,
+            features BYTEA,
+            created_at TIMESTAMP DEFAULT NOW()
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_bandit_state_delta_router_seq
+        ON bandit_state_delta(router_id, seq);
         """
         try:
             async with self.pool.acquire() as conn:
@@ -162,6 +266,7 @@ class PostgresStateStore(StateStore):
         except Exception as e:
             logger.error(f"Failed to create bandit_state table: {e}")
             raise StateStoreError(f"Failed to create table: {e}") from e
+        self._schema_ready = True
 
     async def save_bandit_state(
         self, router_id: str, bandit_id: str, state: BanditState
@@ -186,8 +291,9 @@ class PostgresStateStore(StateStore):
         # Update timestamp
         state.updated_at = datetime.now(timezone.utc)
 
-        # Serialize to JSON
-        state_json = state.model_dump_json()
+        # Serialize (binary or JSON, per storage_format)
+        state_json, state_bytes = self._serialize(state)
+        size = len(state_bytes) if state_bytes is not None else len(state_json or "")
 
         for attempt in range(MAX_RETRIES + 1):
             try:
@@ -201,19 +307,21 @@ class PostgresStateStore(StateStore):
                         # New record - simple INSERT
                         insert_sql = """
                         INSERT INTO bandit_state
-                            (router_id, bandit_id, state_json, version, created_at, updated_at)
-                        VALUES ($1, $2, $3::jsonb, 1, NOW(), NOW())
+                            (router_id, bandit_id, state_json, state_bytes,
+                             version, created_at, updated_at)
+                        VALUES ($1, $2, $3::jsonb, $4, 1, NOW(), NOW())
                         ON CONFLICT (router_id, bandit_id) DO NOTHING
                         RETURNING version
                         """
                         result = await conn.fetchrow(
-                            insert_sql, router_id, bandit_id, state_json
+                            insert_sql, router_id, bandit_id, state_json, state_bytes
                         )
                         if result is not None:
                             # Insert succeeded
                             logger.debug(
                                 f"Inserted new state for {router_id}/{bandit_id}"
                             )
+                            self.bytes_written += size
                             return
                         # Another process inserted first, retry as update
                         continue
@@ -222,13 +330,19 @@ class PostgresStateStore(StateStore):
                     update_sql = """
                     UPDATE bandit_state
                     SET state_json = $3::jsonb,
+                        state_bytes = $4,
                         version = version + 1,
                         updated_at = NOW()
-                    WHERE router_id = $1 AND bandit_id = $2 AND version = $4
+                    WHERE router_id = $1 AND bandit_id = $2 AND version = $5
                     RETURNING version
                     """
                     result = await conn.fetchrow(
-                        update_sql, router_id, bandit_id, state_json, current_version
+                        update_sql,
+                        router_id,
+                        bandit_id,
+                        state_json,
+                        state_bytes,
+                        current_version,
                     )
 
                     if result is not None:
@@ -237,6 +351,7 @@ class PostgresStateStore(StateStore):
                             f"Saved state for {router_id}/{bandit_id} "
                             f"(version {current_version} -> {result['version']})"
                         )
+                        self.bytes_written += size
                         return
 
                     # Version conflict - another process updated the record
@@ -278,7 +393,7 @@ class PostgresStateStore(StateStore):
         await self._ensure_table_exists()
 
         select_sql = """
-        SELECT state_json FROM bandit_state
+        SELECT state_json, state_bytes FROM bandit_state
         WHERE router_id = $1 AND bandit_id = $2
         """
 
@@ -290,9 +405,12 @@ class PostgresStateStore(StateStore):
                 logger.debug(f"No state found for {router_id}/{bandit_id}")
                 return None
 
-            # Parse JSON and create BanditState
-            state_dict = json.loads(row["state_json"])
-            state = BanditState(**state_dict)
+            # Binary rows take precedence; JSON rows predate the binary format
+            state_bytes = row.get("state_bytes")
+            if state_bytes is not None:
+                state = decode_bandit_state(bytes(state_bytes))
+            else:
+                state = BanditState(**json.loads(row["state_json"]))
             logger.debug(f"Loaded state for {router_id}/{bandit_id}")
             return state
 
@@ -305,7 +423,8 @@ class PostgresStateStore(StateStore):
     ) -> None:
         """Save HybridRouter state with optimistic locking.
 
-        Stores as a single JSON document with ucb1_state and linucb_state nested.
+        Stores one document (binary or JSON, per storage_format) with the
+        embedded bandit states nested.
         Uses version checking to prevent race conditions in multi-replica deployments.
 
         Args:
@@ -321,8 +440,9 @@ class PostgresStateStore(StateStore):
         # Update timestamp
         state.updated_at = datetime.now(timezone.utc)
 
-        # Serialize to JSON
-        state_json = state.model_dump_json()
+        # Serialize (binary or JSON, per storage_format)
+        state_json, state_bytes = self._serialize(state)
+        size = len(state_bytes) if state_bytes is not None else len(state_json or "")
         bandit_id = "hybrid_router"
 
         for attempt in range(MAX_RETRIES + 1):
@@ -337,16 +457,20 @@ class PostgresStateStore(StateStore):
                         # New record - simple INSERT
                         insert_sql = """
                         INSERT INTO bandit_state
-                            (router_id, bandit_id, state_json, version, created_at, updated_at)
-                        VALUES ($1, 'hybrid_router', $2::jsonb, 1, NOW(), NOW())
+                            (router_id, bandit_id, state_json, state_bytes,
+                             version, created_at, updated_at)
+                        VALUES ($1, 'hybrid_router', $2::jsonb, $3, 1, NOW(), NOW())
                         ON CONFLICT (router_id, bandit_id) DO NOTHING
                         RETURNING version
                         """
-                        result = await conn.fetchrow(insert_sql, router_id, state_json)
+                        result = await conn.fetchrow(
+                            insert_sql, router_id, state_json, state_bytes
+                        )
                         if result is not None:
                             logger.debug(
                                 f"Inserted new hybrid router state for {router_id}"
                             )
+                            self.bytes_written += size
                             return
                         # Another process inserted first, retry as update
                         continue
@@ -355,13 +479,14 @@ class PostgresStateStore(StateStore):
                     update_sql = """
                     UPDATE bandit_state
                     SET state_json = $2::jsonb,
+                        state_bytes = $3,
                         version = version + 1,
                         updated_at = NOW()
-                    WHERE router_id = $1 AND bandit_id = 'hybrid_router' AND version = $3
+                    WHERE router_id = $1 AND bandit_id = 'hybrid_router' AND version = $4
                     RETURNING version
                     """
                     result = await conn.fetchrow(
-                        update_sql, router_id, state_json, current_version
+                        update_sql, router_id, state_json, state_bytes, current_version
                     )
 
                     if result is not None:
@@ -369,6 +494,7 @@ class PostgresStateStore(StateStore):
                             f"Saved hybrid router state for {router_id} "
                             f"(version {current_version} -> {result['version']})"
                         )
+                        self.bytes_written += size
                         return
 
                     # Version conflict
@@ -409,7 +535,7 @@ class PostgresStateStore(StateStore):
         await self._ensure_table_exists()
 
         select_sql = """
-        SELECT state_json FROM bandit_state
+        SELECT state_json, state_bytes FROM bandit_state
         WHERE router_id = $1 AND bandit_id = 'hybrid_router'
         """
 
@@ -421,9 +547,7 @@ class PostgresStateStore(StateStore):
                 logger.debug(f"No hybrid router state found for {router_id}")
                 return None
 
-            # Parse JSON and create HybridRouterState
-            state_dict = json.loads(row["state_json"])
-            state = HybridRouterState(**state_dict)
+            state = self._decode_router_row(row)
             logger.debug(f"Loaded hybrid router state for {router_id}")
             return state
 
@@ -431,8 +555,238 @@ class PostgresStateStore(StateStore):
             logger.error(f"Failed to load hybrid router state: {e}")
             raise StateStoreError(f"Failed to load state: {e}") from e
 
+    async def merge_hybrid_router_state(
+        self, router_id: str, delta: HybridRouterState, base: HybridRouterState
+    ) -> HybridRouterState:
+        """Add a replica's learning into the shared router state atomically.
+
+        Runs read-merge-write in one transaction holding the row lock
+        (SELECT ... FOR UPDATE), so concurrent replicas queue briefly instead
+        of failing version checks, and no replica's update is lost.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            delta: diff_router_state(local, base) from the replica
+            base: State the delta was computed against (used if no row exists)
+
+        Returns:
+            Merged shared HybridRouterState
+
+        Raises:
+            ValueError: If the delta's algorithms or arms don't match
+            StateStoreError: If the merge fails
+        """
+        from conduit.core.state_merge import apply_router_delta
+
+        await self._ensure_table_exists()
+
+        select_sql = """
+        SELECT state_json, state_bytes FROM bandit_state
+        WHERE router_id = $1 AND bandit_id = 'hybrid_router'
+        FOR UPDATE
+        """
+        insert_sql = """
+        INSERT INTO bandit_state
+            (router_id, bandit_id, state_json, state_bytes,
+             version, created_at, updated_at)
+        VALUES ($1, 'hybrid_router', $2::jsonb, $3, 1, NOW(), NOW())
+        ON CONFLICT (router_id, bandit_id) DO NOTHING
+        RETURNING version
+        """
+        update_sql = """
+        UPDATE bandit_state
+        SET state_json = $2::jsonb,
+            state_bytes = $3,
+            version = version + 1,
+            updated_at = NOW()
+        WHERE router_id = $1 AND bandit_id = 'hybrid_router'
+        """
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self.pool.acquire() as conn:
+                    async with conn.transaction():
+                        row = await conn.fetchrow(select_sql, router_id)
+                        shared = self._decode_router_row(row) if row else base
+                        # O(K·d³) factor refresh: keep it off the event loop
+                        merged = await asyncio.to_thread(
+                            apply_router_delta, shared, delta
+                        )
+                        merged.updated_at = datetime.now(timezone.utc)
+                        state_json, state_bytes = self._serialize(merged)
+
+                        if row is not None:
+                            await conn.execute(
+                                update_sql, router_id, state_json, state_bytes
+                            )
+                        elif (
+                            await conn.fetchrow(
+                                insert_sql, router_id, state_json, state_bytes
+                            )
+                            is None
+                        ):
+                            # Another replica created the row first; merge into it
+                            self.conflict_count += 1
+                            continue
+
+                self.bytes_written += (
+                    len(state_bytes)
+                    if state_bytes is not None
+                    else len(state_json or "")
+                )
+                logger.debug(
+                    f"Merged hybrid router state for {router_id} "
+                    f"(query_count {merged.query_count})"
+                )
+                return merged
+
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to merge hybrid router state: {e}")
+                raise StateStoreError(f"Failed to merge state: {e}") from e
+
+        raise StateStoreError(
+            f"Merge for {router_id}/hybrid_router kept racing row creation "
+            f"after {MAX_RETRIES} retries"
+        )
+
+    async def append_state_deltas(
+        self, router_id: str, deltas: list[StateDelta]
+    ) -> int:
+        """Append feedback observations to the delta log in one INSERT.
+
+        Scalars go to delta_json; the embedding is stored as raw float64
+        bytes, so each row costs O(d) regardless of arm count.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            deltas: Observations in the order they were applied (seq is
+                assigned on each delta in place)
+
+        Returns:
+            seq of the last appended delta
+
+        Raises:
+            ValueError: If deltas is empty
+            StateStoreError: If the insert fails
+        """
+        if not deltas:
+            raise ValueError("append_state_deltas requires at least one delta")
+
+        await self._ensure_table_exists()
+
+        delta_json = [
+            delta.model_dump_json(exclude={"seq", "embedding"}) for delta in deltas
+        ]
+        features = [
+            (
+                np.ascontiguousarray(delta.embedding, dtype="<f8").tobytes()
+                if delta.embedding is not None
+                else None
+            )
+            for delta in deltas
+        ]
+
+        # WITH ORDINALITY keeps BIGSERIAL order equal to list order
+        insert_sql = """
+        INSERT INTO bandit_state_delta (router_id, delta_json, features)
+        SELECT $1, d.delta_json::jsonb, d.features
+        FROM unnest($2::text[], $3::bytea[]) WITH ORDINALITY
+            AS d(delta_json, features, ord)
+        ORDER BY d.ord
+        RETURNING seq
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(insert_sql, router_id, delta_json, features)
+        except Exception as e:
+            logger.error(f"Failed to append state deltas: {e}")
+            raise StateStoreError(f"Failed to append state deltas: {e}") from e
+
+        for delta, seq in zip(deltas, sorted(row["seq"] for row in rows), strict=True):
+            delta.seq = seq
+        self.bytes_written += sum(len(text) for text in delta_json) + sum(
+            len(data) for data in features if data is not None
+        )
+        return deltas[-1].seq
+
+    async def load_state_deltas(
+        self, router_id: str, after_seq: int = 0
+    ) -> list[StateDelta]:
+        """Load logged observations with seq > after_seq, oldest first.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            after_seq: HybridRouterState.delta_seq of the loaded snapshot
+
+        Returns:
+            Deltas ordered by seq
+
+        Raises:
+            StateStoreError: If the load fails
+        """
+        await self._ensure_table_exists()
+
+        select_sql = """
+        SELECT seq, delta_json, features FROM bandit_state_delta
+        WHERE router_id = $1 AND seq > $2
+        ORDER BY seq
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(select_sql, router_id, after_seq)
+
+            deltas = []
+            for row in rows:
+                fields = json.loads(row["delta_json"])
+                if row["features"] is not None:
+                    fields["embedding"] = np.frombuffer(row["features"], dtype="<f8")
+                deltas.append(StateDelta(seq=row["seq"], **fields))
+            logger.debug(f"Loaded {len(deltas)} state deltas for {router_id}")
+            return deltas
+
+        except Exception as e:
+            logger.error(f"Failed to load state deltas: {e}")
+            raise StateStoreError(f"Failed to load state deltas: {e}") from e
+
+    async def compact_state_deltas(self, router_id: str, through_seq: int) -> int:
+        """Delete logged observations folded into a saved snapshot.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            through_seq: Delete deltas with seq <= through_seq
+
+        Returns:
+            Number of deltas deleted
+
+        Raises:
+            StateStoreError: If the delete fails
+        """
+        await self._ensure_table_exists()
+
+        delete_sql = """
+        DELETE FROM bandit_state_delta WHERE router_id = $1 AND seq <= $2
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                result = await conn.execute(delete_sql, router_id, through_seq)
+        except Exception as e:
+            logger.error(f"Failed to compact state deltas: {e}")
+            raise StateStoreError(f"Failed to compact state deltas: {e}") from e
+
+        # asyncpg returns the command tag, e.g. "DELETE 42"
+        deleted = int(result.split()[-1]) if isinstance(result, str) else 0
+        logger.debug(
+            f"Compacted {deleted} state deltas for {router_id} (seq <= {through_seq})"
+        )
+        return deleted
+
     async def delete_state(self, router_id: str) -> None:
-        """Delete all state for a router instance.
+        """Delete all state (snapshots and delta log) for a router instance.
 
         Args:
             router_id: Unique identifier for the router instance
@@ -442,10 +796,14 @@ class PostgresStateStore(StateStore):
         delete_sql = """
         DELETE FROM bandit_state WHERE router_id = $1
         """
+        delete_deltas_sql = """
+        DELETE FROM bandit_state_delta WHERE router_id = $1
+        """
 
         try:
             async with self.pool.acquire() as conn:
                 await conn.execute(delete_sql, router_id)
+                await conn.execute(delete_deltas_sql, router_id)
             logger.debug(f"Deleted all state for {router_id}")
         except Exception as e:
             logger.error(f"Failed to delete state: {e}")
@@ -0,0 +1,375 @@
+"""Merge protocol for router state shared by multiple replicas.
+
+Replicas that share a router_id used to overwrite each other: every save
+replaced the whole state (last writer wins) or lost a version check and
+retried. But the learned statistics are sums over observations, so replicas
+can exchange differences instead:
+
+    delta  = diff_router_state(local, base)      # what this replica learned
+    shared = apply_router_delta(shared, delta)   # done atomically by the store
+    local  = shared; base = shared               # pull everyone's learning
+
+Additive sufficient statistics per algorithm:
+    - All: arm_pulls, arm_successes, total_queries
+    - UCB1 / Epsilon-Greedy: sum_reward (mean_reward is re-derived)
+    - Thompson Sampling: alpha_params, beta_params
+    - LinUCB: A_matrices, b_vectors (A_inv is re-derived)
+    - Contextual Thompson Sampling: precision Sigma⁻¹ and Sigma⁻¹·mu, carried
+      in a delta as sigma_inv_matrices and b_vectors (Sigma, mu re-derived)
+    - Dueling: preference_counts; preference_weights deltas are summed too,
+      which approximates the gradient updates each replica applied
+
+Non-additive fields (hyperparameters, epsilon, observation/reward history for
+sliding windows) are taken from the replica that publishes the delta; sliding
+windows therefore remain per replica.
+
+Phase transition: the shared state transitions once the merged query_count
+reaches the threshold (or a replica publishes a phase2 delta), converting the
+merged phase1 state. A replica that transitioned locally publishes only its
+phase2 learning since its own warm start, so warm starts are never summed.
+
+Example:
+    >>> delta = diff_router_state(router.to_state(), base)
+    >>> merged = await store.merge_hybrid_router_state("router-1", delta, base)
+    >>> router.from_state(merged)
+"""
+
+from typing import Any
+
+import numpy as np
+
+from conduit.core.state_store import BanditState, HybridRouterState, RouterPhase
+
+# Per-arm scalar statistics that add across replicas
+_ADDITIVE_SCALARS = (
+    "arm_pulls",
+    "arm_successes",
+    "sum_reward",
+    "alpha_params",
+    "beta_params",
+    "preference_counts",
+)
+
+# Fields a delta carries from the publishing replica unchanged
+_LOCAL_FIELDS = (
+    "reward_history",
+    "observation_history",
+    "epsilon",
+    "alpha",
+    "window_size",
+    "exploration_weight",
+    "learning_rate",
+    "embedding_provider",
+    "embedding_dimensions",
+    "pca_enabled",
+    "pca_dimensions",
+)
+
+_CONTEXTUAL_THOMPSON = "contextual_thompson_sampling"
+
+# Feature dim fallback for phase1 → phase2 conversion (384 embedding + 2)
+_DEFAULT_FEATURE_DIM = 386
+
+
+def _check_compatible(a: BanditState, b: BanditState) -> None:
+    """Raise ValueError unless both states describe the same bandit."""
+    if a.algorithm != b.algorithm:
+        raise ValueError(f"Cannot merge {a.algorithm} state with {b.algorithm} state")
+    if set(a.arm_ids) != set(b.arm_ids):
+        raise ValueError(
+            f"Cannot merge states with different arms: {sorted(a.arm_ids)} "
+            f"vs {sorted(b.arm_ids)}"
+        )
+
+
+def _combine(a: dict[str, Any], b: dict[str, Any], sign: float) -> dict[str, Any]:
+    """Return a + sign·b per key (keys missing on either side count as 0)."""
+    result = {}
+    for key in a.keys() | b.keys():
+        left, right = a.get(key), b.get(key)
+        if left is None:
+            left = np.zeros_like(np.asarray(right, dtype=float))
+        if right is None:
+            right = np.zeros_like(np.asarray(left, dtype=float))
+        result[key] = np.asarray(left, dtype=float) + sign * np.asarray(
+            right, dtype=float
+        )
+    return result
+
+
+def _scalars(values: dict[str, Any], like: dict[str, Any]) -> dict[str, Any]:
+    """Convert combined 0-d arrays back to the scalar type of the source dict."""
+    is_int = any(isinstance(v, int) and not isinstance(v, bool) for v in like.values())
+    return {
+        key: int(round(float(value))) if is_int else float(value)
+        for key, value in values.items()
+    }
+
+
+def _precision_form(
+    state: BanditState,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Return (Sigma⁻¹, Sigma⁻¹·mu) per arm for a contextual Thompson state."""
+    precision = {}
+    weighted = {}
+    for arm_id, sigma in state.sigma_matrices.items():
+        sigma_inv = state.sigma_inv_matrices.get(arm_id)
+        if sigma_inv is None or sigma_inv.shape != sigma.shape:
+            sigma_inv = np.linalg.inv(sigma)
+        precision[arm_id] = sigma_inv
+        weighted[arm_id] = sigma_inv @ np.asarray(state.mu_vectors[arm_id])
+    return precision, weighted
+
+
+def _upper_cholesky(sigmas: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Return each arm's upper Cholesky factor, as ContextualThompsonSampling caches it.
+
+    Arms whose Sigma is not positive definite are left out, so from_state()
+    applies its fallback factor.
+    """
+    factors = {}
+    for arm_id, sigma in sigmas.items():
+        try:
+            factors[arm_id] = np.linalg.cholesky(sigma).T
+        except np.linalg.LinAlgError:
+            continue
+    return factors
+
+
+def diff_bandit_state(current: BanditState, base: BanditState) -> BanditState:
+    """Return the sufficient-statistic delta current − base.
+
+    Args:
+        current: Replica's current bandit state
+        base: State the replica last synchronized to
+
+    Returns:
+        Delta BanditState (additive fields hold differences; contextual
+        Thompson Sampling deltas use sigma_inv_matrices and b_vectors)
+
+    Raises:
+        ValueError: If algorithms or arms differ
+    """
+    _check_compatible(current, base)
+
+    fields: dict[str, Any] = {
+        "algorithm": current.algorithm,
+        "arm_ids": list(current.arm_ids),
+        "total_queries": current.total_queries - base.total_queries,
+        "feature_dim": current.feature_dim,
+        "explored_arms": list(current.explored_arms),
+    }
+    for name in _ADDITIVE_SCALARS:
+        ours = getattr(current, name)
+        fields[name] = _scalars(_combine(ours, getattr(base, name), -1.0), ours)
+    for name in _LOCAL_FIELDS:
+        fields[name] = getattr(current, name)
+
+    if current.algorithm == _CONTEXTUAL_THOMPSON:
+        current_precision, current_weighted = _precision_form(current)
+        base_precision, base_weighted = _precision_form(base)
+        fields["sigma_inv_matrices"] = _combine(
+            current_precision, base_precision, -1.0
+        )
+        fields["b_vectors"] = _combine(current_weighted, base_weighted, -1.0)
+    else:
+        fields["A_matrices"] = _combine(current.A_matrices, base.A_matrices, -1.0)
+        fields["b_vectors"] = _combine(current.b_vectors, base.b_vectors, -1.0)
+
+    if current.preference_weights or base.preference_weights:
+        fields["preference_weights"] = {
+            key: value.tolist()
+            for key, value in _combine(
+                current.preference_weights, base.preference_weights, -1.0
+            ).items()
+        }
+
+    return BanditState(**fields)
+
+
+def apply_bandit_delta(target: BanditState, delta: BanditState) -> BanditState:
+    """Return target + delta with derived fields recomputed.
+
+    Cached factors (A_inv, Cholesky) are refreshed here, once per merge, so
+    from_state() reuses them instead of re-deriving O(d³) per arm. Stores
+    call this off the event loop.
+
+    Args:
+        target: Shared (or local) bandit state
+        delta: Delta from diff_bandit_state()
+
+    Returns:
+        Merged BanditState
+
+    Raises:
+        ValueError: If algorithms or arms differ
+    """
+    _check_compatible(target, delta)
+
+    merged = target.model_copy(
+        update={name: getattr(delta, name) for name in _LOCAL_FIELDS}
+    )
+    merged.total_queries = target.total_queries + delta.total_queries
+    merged.explored_arms = sorted(set(target.explored_arms) | set(delta.explored_arms))
+    for name in _ADDITIVE_SCALARS:
+        ours = getattr(target, name)
+        combined = _combine(ours, getattr(delta, name), 1.0)
+        setattr(merged, name, _scalars(combined, ours or getattr(delta, name)))
+
+    # Derived means (UCB1 / Epsilon-Greedy)
+    if target.mean_reward:
+        merged.mean_reward = {
+            arm_id: (
+                merged.sum_reward.get(arm_id, 0.0) / pulls
+                if pulls > 0
+                else target.mean_reward.get(arm_id, 0.0)
+            )
+            for arm_id, pulls in merged.arm_pulls.items()
+        }
+
+    if target.algorithm == _CONTEXTUAL_THOMPSON:
+        precision, weighted = _precision_form(target)
+        precision = _combine(precision, delta.sigma_inv_matrices, 1.0)
+        weighted = _combine(weighted, delta.b_vectors, 1.0)
+        merged.sigma_matrices = {
+            arm_id: np.linalg.inv(matrix) for arm_id, matrix in precision.items()
+        }
+        merged.mu_vectors = {
+            arm_id: merged.sigma_matrices[arm_id] @ weighted[arm_id]
+            for arm_id in precision
+        }
+        merged.sigma_inv_matrices = precision
+        merged.sigma_cholesky = _upper_cholesky(merged.sigma_matrices)
+    elif target.A_matrices:
+        merged.A_matrices = _combine(target.A_matrices, delta.A_matrices, 1.0)
+        merged.b_vectors = _combine(target.b_vectors, delta.b_vectors, 1.0)
+        merged.A_inv_matrices = {
+            arm_id: np.linalg.inv(matrix)
+            for arm_id, matrix in merged.A_matrices.items()
+        }
+
+    if delta.preference_weights:
+        merged.preference_weights = {
+            key: value.tolist()
+            for key, value in _combine(
+                target.preference_weights, delta.preference_weights, 1.0
+            ).items()
+        }
+
+    return merged
+
+
+def _warm_start(state: HybridRouterState) -> BanditState:
+    """Convert a router's phase1 state into its phase2 warm start.
+
+    Raises:
+        ValueError: If the state has no phase1/phase2 bandit state
+    """
+    from conduit.engines.bandits.state_conversion import convert_bandit_state
+
+    if state.phase1_state is None or state.phase2_state is None:
+        raise ValueError("Router state has no phase1/phase2 bandit state to convert")
+    return convert_bandit_state(
+        state.phase1_state,
+        target_algorithm=state.phase2_state.algorithm,
+        feature_dim=state.phase2_state.feature_dim or _DEFAULT_FEATURE_DIM,
+    )
+
+
+def _bandit_states(state: HybridRouterState) -> tuple[BanditState, BanditState]:
+    """Return (phase1, phase2) states, accepting legacy ucb1/linucb fields."""
+    phase1 = state.phase1_state or state.ucb1_state
+    phase2 = state.phase2_state or state.linucb_state
+    if phase1 is None or phase2 is None:
+        raise ValueError("Router state has no phase1/phase2 bandit state to merge")
+    return phase1, phase2
+
+
+def diff_router_state(
+    current: HybridRouterState, base: HybridRouterState
+) -> HybridRouterState:
+    """Return the delta a replica publishes: current − base.
+
+    If the replica moved to phase2 since base, the phase2 delta is taken
+    against the warm start converted from its phase1 state, so only learning
+    after the transition is published.
+
+    Args:
+        current: Replica's current HybridRouter.to_state()
+        base: Shared state the replica last synchronized to
+
+    Returns:
+        Delta HybridRouterState (current_phase is the replica's phase)
+
+    Raises:
+        ValueError: If the bandit algorithms or arms differ
+    """
+    current_phase1, current_phase2 = _bandit_states(current)
+    base_phase1, base_phase2 = _bandit_states(base)
+
+    if (
+        current.current_phase == RouterPhase.LINUCB
+        and base.current_phase == RouterPhase.UCB1
+    ):
+        base_phase2 = _warm_start(current)
+
+    return HybridRouterState(
+        query_count=current.query_count - base.query_count,
+        current_phase=current.current_phase,
+        transition_threshold=current.transition_threshold,
+        phase1_algorithm=current.phase1_algorithm,
+        phase2_algorithm=current.phase2_algorithm,
+        phase1_state=diff_bandit_state(current_phase1, base_phase1),
+        phase2_state=diff_bandit_state(current_phase2, base_phase2),
+    )
+
+
+def apply_router_delta(
+    target: HybridRouterState, delta: HybridRouterState
+) -> HybridRouterState:
+    """Return target + delta, transitioning to phase2 on the merged counts.
+
+    Args:
+        target: Shared router state
+        delta: Delta from diff_router_state()
+
+    Returns:
+        Merged HybridRouterState
+
+    Raises:
+        ValueError: If the bandit algorithms or arms differ
+    """
+    target_phase1, target_phase2 = _bandit_states(target)
+    delta_phase1, delta_phase2 = _bandit_states(delta)
+
+    query_count = target.query_count + delta.query_count
+    phase1 = apply_bandit_delta(target_phase1, delta_phase1)
+    phase = target.current_phase
+    threshold = target.transition_threshold
+
+    if phase == RouterPhase.UCB1 and (
+        delta.current_phase == RouterPhase.LINUCB
+        # HybridRouter.route() checks the threshold after counting the query
+        or (threshold is not None and query_count >= max(threshold, 1))
+    ):
+        # First transition of the shared state: warm-start from merged phase1
+        phase = RouterPhase.LINUCB
+        target_phase2 = _warm_start(
+            target.model_copy(
+                update={"phase1_state": phase1, "phase2_state": target_phase2}
+            )
+        )
+
+    phase2 = apply_bandit_delta(target_phase2, delta_phase2)
+
+    return target.model_copy(
+        update={
+            "query_count": query_count,
+            "current_phase": phase,
+            "phase1_state": phase1,
+            "phase2_state": phase2,
+            # Backward compatibility mirrors (as in HybridRouter.to_state)
+            "ucb1_state": phase1,
+            "linucb_state": phase2,
+        }
+    )
@@ -0,0 +1,253 @@
+"""Write-behind persistence for Router state.
+
+Router.update() used to await a full HybridRouterState save after every
+feedback: serialize both bandits' matrices and observation history, then run a
+versioned Postgres UPDATE, all on the caller's coroutine. Feedback throughput
+was capped by database write latency.
+
+WriteBehindPersister moves that write off the request path:
+    1. update() calls mark_dirty(), which only bumps a counter (O(1), no I/O);
+       routing calls mark_stale(), which only sets a flag
+    2. A background task flushes once flush_interval seconds have passed or
+       max_dirty_updates notifications have accumulated, whichever is first
+    3. Any number of notifications between flushes coalesce into one write
+    4. At most one write is in flight; nothing is queued per update, so memory
+       stays bounded no matter how far the database falls behind
+    5. close() stops the background task and performs a final flush
+
+The state snapshot is taken when the flush starts (HybridRouter.to_state()
+runs synchronously before the first await), so updates that land while a write
+is in flight are marked dirty again and picked up by the next flush. A failed
+flush keeps its dirty count and is retried after flush_interval.
+
+Trade-off: a crash loses at most flush_interval seconds (or max_dirty_updates
+updates) of learning. Use Router(write_behind=False) for per-update writes.
+
+Example:
+    >>> persister = WriteBehindPersister(save_fn, flush_interval=1.0)
+    >>> persister.mark_dirty()          # cheap, called on every update
+    >>> persister.get_stats()["pending_updates"]
+    1
+    >>> await persister.close()         # final synchronous flush
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from conduit.observability.metrics import record_state_flush
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_DIRTY_UPDATES = 100
+
+
+class WriteBehindPersister:
+    """Coalesces dirty-state notifications into periodic background writes.
+
+    Not thread-safe: mark_dirty() must be called from the event loop that
+    runs the flush task.
+
+    Attributes:
+        flush_interval: Longest time (seconds) dirty state waits for a flush
+        max_dirty_updates: Pending notifications that trigger an early flush
+        name: Label for logs and metric attributes (e.g. router_id)
+    """
+
+    def __init__(
+        self,
+        save_fn: Callable[[], Awaitable[int | None]],
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_dirty_updates: int = DEFAULT_MAX_DIRTY_UPDATES,
+        name: str = "router",
+    ):
+        """Initialize persister.
+
+        Args:
+            save_fn: Coroutine function that snapshots and writes the state.
+                Returns bytes written (or None if unknown) and raises on failure.
+            flush_interval: Flush at most this many seconds after the first
+                pending notification
+            max_dirty_updates: Flush early once this many notifications pend
+            name: Label for logs and metric attributes
+
+        Raises:
+            ValueError: If flush_interval <= 0 or max_dirty_updates < 1
+        """
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be > 0, got {flush_interval}")
+        if max_dirty_updates < 1:
+            raise ValueError(
+                f"max_dirty_updates must be >= 1, got {max_dirty_updates}"
+            )
+
+        self._save_fn = save_fn
+        self.flush_interval = flush_interval
+        self.max_dirty_updates = max_dirty_updates
+        self.name = name
+
+        self._dirty = 0
+        # Changes not worth an early flush (routing's query_count)
+        self._stale = False
+        self._dirty_since: float | None = None
+        self._wake = asyncio.Event()
+        # Serializes writes: at most one flush in flight
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._notifications = 0
+        self._flushes = 0
+        self._failures = 0
+        self._bytes_written = 0
+        self._last_flush_lag_ms = 0.0
+        self._max_flush_lag_ms = 0.0
+        self._last_flush_ms = 0.0
+
+    def mark_dirty(self, updates: int = 1) -> None:
+        """Record a state change; the write happens later in the background.
+
+        Args:
+            updates: Bandit updates covered by this notification (a feedback
+                batch counts toward max_dirty_updates by its size)
+        """
+        self._dirty += updates
+        self._notifications += 1
+        self._schedule()
+        if not self._closed and self._dirty >= self.max_dirty_updates:
+            self._wake.set()
+
+    def mark_stale(self) -> None:
+        """Record a minor state change for the next interval flush.
+
+        Unlike mark_dirty(), this never counts toward max_dirty_updates, so
+        it cannot trigger an early flush on its own.
+        """
+        self._stale = True
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Note when state first became dirty and make sure the task runs."""
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+
+        if self._closed:
+            return
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Background loop: flush on interval or dirty threshold, exit when idle."""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+            if self._closed or not self._pending:
+                return
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed for {self.name}: {e}")
+                # Back off instead of retrying on every new notification
+                await asyncio.sleep(self.flush_interval)
+
+    async def flush(self, force: bool = False) -> bool:
+        """Write pending state now.
+
+        Args:
+            force: Write even if no notifications are pending
+
+        Returns:
+            True if a write happened, False if there was nothing to write
+
+        Raises:
+            Exception: Whatever save_fn raises (pending count is kept for retry)
+        """
+        async with self._lock:
+            if not self._pending and not force:
+                return False
+
+            dirty, stale, dirty_since = self._dirty, self._stale, self._dirty_since
+            self._dirty = 0
+            self._stale = False
+            self._dirty_since = None
+
+            start = time.monotonic()
+            try:
+                written = await self._save_fn()
+            except Exception:
+                # Restore so the next flush retries (keep the oldest timestamp)
+                self._dirty += dirty
+                self._stale = self._stale or stale
+                if dirty_since is not None:
+                    self._dirty_since = dirty_since
+                self._failures += 1
+                record_state_flush(0.0, 0, self.name, success=False)
+                raise
+
+            end = time.monotonic()
+            lag_ms = (end - dirty_since) * 1000 if dirty_since is not None else 0.0
+            self._flushes += 1
+            self._bytes_written += written or 0
+            self._last_flush_ms = (end - start) * 1000
+            self._last_flush_lag_ms = lag_ms
+            self._max_flush_lag_ms = max(self._max_flush_lag_ms, lag_ms)
+            record_state_flush(lag_ms, written or 0, self.name)
+            return True
+
+    @property
+    def _pending(self) -> bool:
+        """Whether any change awaits a write."""
+        return self._dirty > 0 or self._stale
+
+    async def close(self) -> None:
+        """Stop the background task and flush any pending state.
+
+        Raises:
+            Exception: Whatever the final save_fn call raises
+        """
+        self._closed = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return write-behind statistics.
+
+        Returns:
+            Dictionary with:
+            - pending_updates: Notifications not yet written
+            - dirty_age_ms: Age of the oldest unwritten notification
+            - notifications: Total mark_dirty() calls
+            - flushes: Successful writes
+            - failures: Failed writes
+            - bytes_written: Total bytes reported by save_fn
+            - last_flush_ms / last_flush_lag_ms / max_flush_lag_ms: Write
+              duration and first-notification-to-durable lag
+        """
+        dirty_age_ms = (
+            (time.monotonic() - self._dirty_since) * 1000
+            if self._dirty_since is not None
+            else 0.0
+        )
+        return {
+            "pending_updates": self._dirty,
+            "dirty_age_ms": dirty_age_ms,
+            "notifications": self._notifications,
+            "flushes": self._flushes,
+            "failures": self._failures,
+            "bytes_written": self._bytes_written,
+            "last_flush_ms": self._last_flush_ms,
+            "last_flush_lag_ms": self._last_flush_lag_ms,
+            "max_flush_lag_ms": self._max_flush_lag_ms,
+        }
@@ -1,17 +1,35 @@
 """State persistence interface for bandit algorithms.
 
 This module provides abstract interfaces and data structures for persisting
-bandit algorithm state across server restarts. Supports serialization of
-numpy arrays and complex state structures to JSON for PostgreSQL storage.
+bandit algorithm state across server restarts. Matrix state is carried as
+numpy arrays and serialized either to JSON (nested lists) or to the binary
+format in conduit.core.state_codec.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+
+def _as_float_array(value: Any) -> np.ndarray:
+    """Validate nested lists or arrays into an owned float64 array."""
+    if isinstance(value, np.ndarray | list | tuple):
+        return np.array(value, dtype=np.float64)
+    raise ValueError(f"Expected array or list of floats, got {type(value).__name__}")
+
+
+# Matrix/vector state carried as a float64 ndarray; serialized as nested lists
+StateArray = Annotated[
+    np.ndarray,
+    PlainValidator(_as_float_array),
+    PlainSerializer(lambda array: array.tolist(), return_type=list[Any]),
+    WithJsonSchema({"type": "array"}),
+]
 
 
 class RouterPhase(str, Enum):
@@ -24,8 +42,11 @@ class RouterPhase(str, Enum):
 class BanditState(BaseModel):
     """Serializable state for a bandit algorithm.
 
-    Supports numpy array serialization via custom encoders.
-    All numpy arrays are stored as nested lists for JSON compatibility.
+    Matrix fields hold float64 numpy arrays (nested lists are accepted on
+    input and emitted by model_dump/model_dump_json, so the JSON format is
+    unchanged). Cached factors (A_inv_matrices, sigma_inv_matrices,
+    sigma_cholesky) are excluded from JSON and only persisted by the binary
+    codec, which lets from_state() skip O(d³) re-factorization.
     """
 
     algorithm: str = Field(description="Algorithm type (ucb1, linucb, etc.)")
@@ -42,13 +63,18 @@ class BanditState(BaseModel):
     explored_arms: list[str] = Field(default_factory=list)
     reward_history: list[dict[str, Any]] = Field(default_factory=list)
 
-    # LinUCB-specific state (numpy arrays as nested lists)
-    A_matrices: dict[str, list[list[float]]] = Field(
+    # LinUCB-specific state
+    A_matrices: dict[str, StateArray] = Field(
         default_factory=dict, description="A matrices per arm (d x d)"
     )
-    b_vectors: dict[str, list[float]] = Field(
+    b_vectors: dict[str, StateArray] = Field(
         default_factory=dict, description="b vectors per arm (d x 1 flattened)"
     )
+    A_inv_matrices: dict[str, StateArray] = Field(
+        default_factory=dict,
+        exclude=True,
+        description="Cached A inverses per arm (binary format only)",
+    )
     observation_history: list[dict[str, Any]] = Field(default_factory=list)
 
     # Thompson Sampling state
@@ -60,12 +86,22 @@ class BanditState(BaseModel):
     )
 
     # Contextual Thompson Sampling state
-    mu_vectors: dict[str, list[float]] = Field(
+    mu_vectors: dict[str, StateArray] = Field(
         default_factory=dict, description="Mean vectors per arm"
     )
-    sigma_matrices: dict[str, list[list[float]]] = Field(
+    sigma_matrices: dict[str, StateArray] = Field(
         default_factory=dict, description="Covariance matrices per arm"
     )
+    sigma_inv_matrices: dict[str, StateArray] = Field(
+        default_factory=dict,
+        exclude=True,
+        description="Precision matrices per arm (binary format only)",
+    )
+    sigma_cholesky: dict[str, StateArray] = Field(
+        default_factory=dict,
+        exclude=True,
+        description="Upper Cholesky factors of Sigma per arm (binary format only)",
+    )
 
     # Epsilon-Greedy state
     epsilon: float | None = None
@@ -146,12 +182,49 @@ class HybridRouterState(BaseModel):
     ucb1_state: BanditState | None = None
     linucb_state: BanditState | None = None
 
+    # Incremental checkpoints: last StateDelta.seq already folded into this
+    # snapshot (deltas with a higher seq are replayed on load)
+    delta_seq: int = 0
+
     # Metadata
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     version: int = 2  # Increment version for new fields
 
 
+class StateDelta(BaseModel):
+    """One feedback observation for incremental checkpoints.
+
+    A full HybridRouterState snapshot is O(K·d²) (every arm's A / Sigma
+    matrices); a delta is the (x, r) observation that produced one rank-one
+    update, O(d). Replaying the deltas logged after a snapshot through
+    HybridRouter.update() reproduces the in-memory state exactly.
+
+    embedding is None for phase1 (non-contextual) updates, which ignore
+    features.
+    """
+
+    seq: int = Field(default=0, description="Log position (assigned on append)")
+    phase: RouterPhase = Field(description="Router phase the update applied to")
+    query_count: int = Field(description="Router query_count at update time")
+
+    # BanditFeedback fields
+    model_id: str
+    cost: float
+    quality_score: float
+    latency: float
+    success: bool = True
+    confidence: float = 1.0
+    reward_weights: dict[str, float] | None = None
+
+    # QueryFeatures fields (phase2 only)
+    embedding: StateArray | None = None
+    token_count: int = 0
+    complexity_score: float = 0.5
+
+    model_config = {"arbitrary_types_allowed": True}
+
+
 class StateStore(ABC):
     """Abstract interface for persisting bandit state.
 
@@ -185,7 +258,8 @@ class StateStore(ABC):
 
     Implementations:
         - PostgresStateStore: Production-grade with connection pooling
-        - InMemoryStateStore: Testing only (not persistent)
+        - FileStateStore: Single-node persistence (atomic files, mmap loads)
+        - InMemoryStateStore: Tests and benchmarks (not persistent)
 
     Example:
         >>> store = PostgresStateStore(pool)
@@ -199,6 +273,14 @@ class StateStore(ABC):
         >>> assert missing is None
     """
 
+    def __init__(self) -> None:
+        """Initialize shared store state.
+
+        Subclasses that rely on the default merge_hybrid_router_state() must
+        call super().__init__(), which creates the lock serializing merges.
+        """
+        self._merge_lock = asyncio.Lock()
+
     @abstractmethod
     async def save_bandit_state(
         self, router_id: str, bandit_id: str, state: BanditState
@@ -351,6 +433,110 @@ class StateStore(ABC):
         """
         pass
 
+    async def merge_hybrid_router_state(
+        self, router_id: str, delta: HybridRouterState, base: HybridRouterState
+    ) -> HybridRouterState:
+        """Add a replica's learning into the shared router state.
+
+        Used by Router(sync_mode="merge") so replicas sharing a router_id sum
+        their sufficient statistics instead of overwriting each other (see
+        conduit.core.state_merge).
+
+        Contract Guarantees:
+            - MUST apply concurrent merges one at a time (none are lost)
+            - MUST return the state as stored after this merge
+
+        The default implementation loads, applies and saves under the store's
+        _merge_lock, which is enough for replicas sharing one process; the
+        merge itself (including factor refresh) runs in a worker thread.
+        Stores shared across processes override it with an atomic
+        read-modify-write.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            delta: diff_router_state(local, base) from the replica
+            base: State the delta was computed against (starting point if no
+                shared state exists yet)
+
+        Returns:
+            Merged shared HybridRouterState
+
+        Raises:
+            ValueError: If the delta's algorithms or arms don't match
+            StateStoreError: If load or save fails
+        """
+        from conduit.core.state_merge import apply_router_delta
+
+        async with self._merge_lock:
+            shared = await self.load_hybrid_router_state(router_id)
+            merged = await asyncio.to_thread(
+                apply_router_delta, shared if shared is not None else base, delta
+            )
+            await self.save_hybrid_router_state(router_id, merged)
+            return merged
+
+    # Incremental checkpoints (optional; PostgresStateStore implements them)
+    supports_state_deltas: bool = False
+
+    async def append_state_deltas(
+        self, router_id: str, deltas: list[StateDelta]
+    ) -> int:
+        """Append feedback observations to the router's delta log.
+
+        Contract Guarantees:
+            - MUST assign increasing seq values in list order
+            - MUST be atomic (all deltas appended or none)
+
+        Args:
+            router_id: Unique identifier for the router instance
+            deltas: Observations in the order they were applied
+
+        Returns:
+            seq of the last appended delta
+
+        Raises:
+            NotImplementedError: If the store has no delta log
+            StateStoreError: If the append fails
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental checkpoints"
+        )
+
+    async def load_state_deltas(
+        self, router_id: str, after_seq: int = 0
+    ) -> list[StateDelta]:
+        """Load logged observations newer than a snapshot, oldest first.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            after_seq: Return only deltas with seq > after_seq
+                (HybridRouterState.delta_seq of the loaded snapshot)
+
+        Returns:
+            Deltas ordered by seq (empty if the store has no delta log)
+
+        Raises:
+            StateStoreError: If the load fails
+        """
+        return []
+
+    async def compact_state_deltas(self, router_id: str, through_seq: int) -> int:
+        """Drop logged observations already folded into a saved snapshot.
+
+        Call only after a snapshot with delta_seq >= through_seq was saved.
+
+        Args:
+            router_id: Unique identifier for the router instance
+            through_seq: Delete deltas with seq <= through_seq
+
+        Returns:
+            Number of deltas deleted
+
+        Raises:
+            StateStoreError: If the delete fails
+        """
+        return 0
+
 
 class StateStoreError(Exception):
     """Error during state persistence operations."""
@@ -9,11 +9,13 @@ from conduit.engines.executor import (
 )
 from conduit.engines.hybrid_router import HybridRouter
 from conduit.engines.router import Router
+from conduit.engines.update_actor import BanditUpdateActor
 
 __all__ = [
     "QueryAnalyzer",
     "Router",
     "HybridRouter",
+    "BanditUpdateActor",
     "ModelExecutor",
     "ExecutionResult",
     "AllModelsFailedError",
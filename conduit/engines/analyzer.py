@@ -6,10 +6,13 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import joblib
+import numpy as np
 
 from conduit.cache import CacheService
+from conduit.core.config import load_embeddings_config
 from conduit.core.models import QueryFeatures
 from conduit.engines.embeddings.base import EmbeddingProvider
+from conduit.engines.embeddings.batching import BatchingEmbeddingProvider
 from conduit.engines.embeddings.factory import create_embedding_provider
 
 if TYPE_CHECKING:
@@ -70,7 +73,9 @@ class QueryAnalyzer:
         """Initialize analyzer with embedding provider and optional cache.
 
         Args:
-            embedding_provider: Pre-configured embedding provider (optional)
+            embedding_provider: Pre-configured embedding provider (optional, used
+                as-is; providers created here are wrapped in a
+                BatchingEmbeddingProvider when embeddings.batching is enabled)
             embedding_provider_type: Provider type ("auto", "openai", "cohere", "fastembed", "sentence-transformers")
             embedding_model: Model identifier (provider-specific, optional)
             embedding_api_key: API key for providers that require it (optional)
@@ -107,6 +112,15 @@ class QueryAnalyzer:
                 api_key=embedding_api_key,
             )
 
+            # Coalesce concurrent cache-miss embeds into batched provider calls
+            embed_config = load_embeddings_config()
+            if embed_config["batching_enabled"]:
+                self.embedding_provider = BatchingEmbeddingProvider(
+                    self.embedding_provider,
+                    max_batch_size=embed_config["batching_max_batch_size"],
+                    max_wait_ms=embed_config["batching_max_wait_ms"],
+                )
+
         self.cache = cache_service
 
         # PCA configuration
@@ -180,10 +194,11 @@ class QueryAnalyzer:
                 return cached_features
 
         # Cache miss or no cache - compute features
-        # Generate embedding using provider with fallback on failure
+        # Generate embedding using provider with fallback on failure.
+        # Kept as an ndarray end to end (providers may return lists or arrays).
         embedding_failed = False
         try:
-            embedding_list = await self.embedding_provider.embed(query)
+            embedding = np.asarray(await self.embedding_provider.embed(query))
         except Exception as e:
             # Catch embedding failures (API errors, timeouts, rate limits, etc.)
             # Note: Exception (not BaseException) so KeyboardInterrupt/SystemExit propagate
@@ -191,43 +206,144 @@ class QueryAnalyzer:
             logger.warning(
                 f"Embedding generation failed, using zero vector fallback: {type(e).__name__}: {e}"
             )
-            embedding_list = [0.0] * self.embedding_provider.dimension
+            embedding = np.zeros(self.embedding_provider.dimension)
             embedding_failed = True
 
-        # Apply PCA if enabled
-        if self.use_pca and self.pca is not None:
-            # Check if PCA is fitted
-            if not hasattr(self.pca, "components_"):
+        # Apply PCA if enabled (PCA expects a 2-D batch)
+        embedding = self._apply_pca(embedding.reshape(1, -1))[0]
+
+        features = self._build_features(query, embedding, embedding_failed)
+
+        # Store in cache for future requests (skip if embedding failed)
+        if self.cache and not embedding_failed:
+            await self.cache.set(query, features)
+
+        return features
+
+    async def analyze_batch(self, queries: list[str]) -> list[QueryFeatures]:
+        """Extract features for many queries with batched I/O.
+
+        Bulk counterpart of analyze() for offline scoring, replays and
+        benchmarks. Instead of one cache GET, embed call and cache SET per
+        query it performs:
+            1. One pipelined cache lookup (L1, then a single Redis MGET)
+            2. One embed_batch() call for the distinct cache misses
+            3. One batched PCA transform (if enabled)
+            4. One pipelined cache write-back (SET with TTL)
+
+        Same contract as analyze(): never fails on embedding errors (misses
+        fall back to zero vectors with embedding_failed=True and are not
+        cached).
+
+        Args:
+            queries: User query texts
+
+        Returns:
+            QueryFeatures aligned with queries
+
+        Example:
+            >>> features = await analyzer.analyze_batch(["What is 2+2?", "Hi"])
+            >>> len(features)
+            2
+        """
+        if not queries:
+            return []
+
+        results: list[QueryFeatures | None] = [None] * len(queries)
+        if self.cache:
+            results = await self.cache.get_many(queries)
+
+        # Distinct texts still needing computation -> positions in queries
+        misses: dict[str, list[int]] = {}
+        for i, (query, cached) in enumerate(zip(queries, results, strict=True)):
+            if cached is None:
+                misses.setdefault(query, []).append(i)
+
+        if not misses:
+            return results  # type: ignore[return-value]
+
+        miss_texts = list(misses)
+        embedding_failed = False
+        try:
+            embeddings = np.asarray(
+                await self.embedding_provider.embed_batch(miss_texts), dtype=float
+            )
+            if embeddings.shape[0] != len(miss_texts):
                 raise RuntimeError(
-                    "PCA is enabled but not fitted. Call fit_pca() with training data first."
+                    f"Provider returned {embeddings.shape[0]} embeddings "
+                    f"for {len(miss_texts)} texts"
                 )
-            # Transform to reduced dimensions (PCA expects numpy array)
-            import numpy as np
+        except Exception as e:
+            logger.warning(
+                f"Batch embedding generation failed, using zero vector fallback "
+                f"for {len(miss_texts)} queries: {type(e).__name__}: {e}"
+            )
+            embeddings = np.zeros((len(miss_texts), self.embedding_provider.dimension))
+            embedding_failed = True
+
+        embeddings = self._apply_pca(embeddings)
+
+        computed: list[tuple[str, QueryFeatures]] = []
+        for query, embedding in zip(miss_texts, embeddings, strict=True):
+            features = self._build_features(query, embedding, embedding_failed)
+            computed.append((query, features))
+            for i in misses[query]:
+                results[i] = features
+
+        if self.cache and not embedding_failed:
+            await self.cache.set_many(computed)
+
+        return results  # type: ignore[return-value]
 
-            embedding_array = np.array(embedding_list)
-            embedding_array = self.pca.transform([embedding_array])[0]
-            embedding_list = embedding_array.tolist()
+    def _apply_pca(self, embeddings: np.ndarray) -> np.ndarray:
+        """Reduce a 2-D batch of embeddings with PCA (no-op if disabled).
+
+        Args:
+            embeddings: (n, embedding_dim) array
 
+        Returns:
+            (n, pca_dimensions) array if PCA enabled, else embeddings unchanged
+
+        Raises:
+            RuntimeError: If PCA is enabled but not fitted
+        """
+        if not self.use_pca or self.pca is None:
+            return embeddings
+
+        # Check if PCA is fitted
+        if not hasattr(self.pca, "components_"):
+            raise RuntimeError(
+                "PCA is enabled but not fitted. Call fit_pca() with training data first."
+            )
+        return self.pca.transform(embeddings)  # type: ignore[no-any-return]
+
+    def _build_features(
+        self, query: str, embedding: np.ndarray, embedding_failed: bool
+    ) -> QueryFeatures:
+        """Assemble QueryFeatures from an embedding and query heuristics.
+
+        Args:
+            query: User query text
+            embedding: Final (optionally PCA-reduced) embedding
+            embedding_failed: True if embedding is a zero-vector fallback
+
+        Returns:
+            QueryFeatures for the query
+        """
         # Estimate token count (rough approximation)
         token_count = self._estimate_tokens(query)
 
         # Compute complexity score (0.0-1.0)
         complexity_score = self._compute_complexity(query, token_count)
 
-        features = QueryFeatures(
-            embedding=embedding_list,
+        return QueryFeatures(
+            embedding=embedding,
             token_count=token_count,
             complexity_score=complexity_score,
             query_text=query,
             embedding_failed=embedding_failed,
         )
 
-        # Store in cache for future requests (skip if embedding failed)
-        if self.cache and not embedding_failed:
-            await self.cache.set(query, features)
-
-        return features
-
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count using word count heuristic.
 
@@ -329,8 +445,6 @@ class QueryAnalyzer:
         embeddings_list = await self.embedding_provider.embed_batch(queries)
 
         # Convert to numpy array for PCA
-        import numpy as np
-
         embeddings = np.array(embeddings_list)
 
         # Fit PCA
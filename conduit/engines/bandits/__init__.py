@@ -17,7 +17,7 @@ Available Algorithms:
 - AlwaysCheapestBaseline: Always use lowest cost model
 """
 
-from .base import BanditAlgorithm, BanditFeedback, ModelArm
+from .base import ArmSelection, BanditAlgorithm, BanditFeedback, ModelArm
 from .baselines import (
     AlwaysBestBaseline,
     AlwaysCheapestBaseline,
@@ -33,6 +33,7 @@ from .thompson_sampling import ThompsonSamplingBandit
 from .ucb import UCB1Bandit
 
 __all__ = [
+    "ArmSelection",
     "BanditAlgorithm",
     "BanditFeedback",
     "ModelArm",
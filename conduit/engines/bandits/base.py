@@ -5,12 +5,12 @@ for context, ensuring consistency across the routing system.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from pydantic import BaseModel, Field, computed_field
 
-from conduit.core.config import load_feature_dimensions
 from conduit.core.models import QueryFeatures
 from conduit.core.reward_calculation import calculate_composite_reward
 
@@ -52,6 +52,27 @@ class ModelArm(BaseModel):
         return f"ModelArm({self.model_id!r}, provider={self.provider!r})"
 
 
+@dataclass(frozen=True)
+class ArmSelection:
+    """Selected arm plus the scoring done to select it.
+
+    Returned by BanditAlgorithm.select_arm_with_scores() so confidence,
+    audit logging and decision metadata reuse the selection pass instead of
+    rescoring every arm.
+
+    Attributes:
+        arm: Selected model arm
+        scores: arm_id -> score components, as in compute_scores() (for
+            sampling algorithms, the values actually sampled). Empty if the
+            algorithm exposes no scores.
+        arm_pulls: Feedback count of the selected arm at selection time
+    """
+
+    arm: ModelArm
+    scores: dict[str, dict[str, float]] = field(default_factory=dict)
+    arm_pulls: int = 0
+
+
 class BanditFeedback(BaseModel):
     """Immutable feedback from executing a model selection.
 
@@ -64,6 +85,9 @@ class BanditFeedback(BaseModel):
         confidence: How confident we are in this feedback (0-1 scale).
             Used for weighted bandit updates. 1.0 = full weight,
             0.5 = half weight (softer update). Default: 1.0
+        reward_weights: Per-request quality/cost/latency weights (e.g. the
+            user preference preset recorded at routing time). When set they
+            override the bandit's reward_weights for this feedback only.
         metadata: Additional feedback data (token counts, etc.)
 
     Multi-Objective Reward Function (Phase 3):
@@ -86,6 +110,7 @@ class BanditFeedback(BaseModel):
     latency: float = Field(..., ge=0.0)
     success: bool = True
     confidence: float = Field(default=1.0, ge=0.0, le=1.0)
+    reward_weights: dict[str, float] | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
     def calculate_reward(
@@ -98,6 +123,8 @@ class BanditFeedback(BaseModel):
 
         Delegates to conduit.core.reward_calculation.calculate_composite_reward()
         for the actual calculation. See that module for implementation details.
+        If the feedback carries reward_weights, they take precedence over the
+        weight arguments (which bandits pass from their own reward_weights).
 
         Args:
             quality_weight: Weight for quality component (default: 0.70)
@@ -118,6 +145,11 @@ class BanditFeedback(BaseModel):
             >>> print(f"{reward:.3f}")  # ~0.90 (high quality dominates)
             0.903
         """
+        if self.reward_weights is not None:
+            quality_weight = self.reward_weights["quality"]
+            cost_weight = self.reward_weights["cost"]
+            latency_weight = self.reward_weights["latency"]
+
         return calculate_composite_reward(
             quality=self.quality_score,
             cost=self.cost,
@@ -219,6 +251,47 @@ class BanditAlgorithm(ABC):
         """
         pass
 
+    async def select_arm_with_scores(self, features: QueryFeatures) -> ArmSelection:
+        """Select an arm and return it with the scores used to select it.
+
+        Same selection (and state changes) as select_arm(). The default
+        implementation calls select_arm() then compute_scores(); algorithms
+        whose selection already scores every arm override it to return those
+        scores from the same pass.
+
+        Args:
+            features: Query features from QueryAnalyzer
+
+        Returns:
+            ArmSelection with the selected arm, per-arm scores and the
+            selected arm's pull count
+
+        Example:
+            >>> selection = await algorithm.select_arm_with_scores(features)
+            >>> selection.arm.model_id
+            "openai:gpt-4o-mini"
+            >>> selection.scores["openai:gpt-4o-mini"]["total"]
+            0.87
+        """
+        arm = await self.select_arm(features)
+        return ArmSelection(
+            arm=arm,
+            scores=self.compute_scores(features),
+            arm_pulls=self.get_arm_pulls(arm.model_id),
+        )
+
+    def get_arm_pulls(self, model_id: str) -> int:
+        """Return the feedback count for one arm.
+
+        Args:
+            model_id: Arm to look up
+
+        Returns:
+            Number of updates recorded for the arm (0 if not tracked)
+        """
+        arm_pulls: dict[str, int] = getattr(self, "arm_pulls", {})
+        return arm_pulls.get(model_id, 0)
+
     @abstractmethod
     async def update(self, feedback: BanditFeedback, features: QueryFeatures) -> None:
         """Update algorithm state with feedback from arm pull.
@@ -264,6 +337,50 @@ class BanditAlgorithm(ABC):
         """
         pass
 
+    async def update_batch(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures]]
+    ) -> None:
+        """Apply a batch of feedback in one call.
+
+        The resulting state matches calling update() for each pair in order.
+        The default implementation does exactly that; algorithms override it
+        with a native batched update (rank-k matrix updates, summed counts)
+        that amortizes per-observation work across the batch.
+
+        Every model_id is validated before any state changes, so a batch with
+        an unknown arm is rejected as a whole.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order
+
+        Raises:
+            ValueError: If any feedback.model_id is not in self.arms
+
+        Example:
+            >>> await algorithm.update_batch([(feedback1, f1), (feedback2, f2)])
+        """
+        self._group_batch_by_arm(batch)
+        for feedback, features in batch:
+            await self.update(feedback, features)
+
+    def _group_batch_by_arm(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures]]
+    ) -> dict[str, list[tuple[BanditFeedback, QueryFeatures]]]:
+        """Validate a batch and group it by arm, keeping arrival order per arm.
+
+        Raises:
+            ValueError: If any feedback.model_id is not in self.arms
+        """
+        grouped: dict[str, list[tuple[BanditFeedback, QueryFeatures]]] = {}
+        for feedback, features in batch:
+            if feedback.model_id not in self.arms:
+                raise ValueError(
+                    f"Model ID '{feedback.model_id}' not in arms. "
+                    f"Available: {list(self.arms.keys())}"
+                )
+            grouped.setdefault(feedback.model_id, []).append((feedback, features))
+        return grouped
+
     @abstractmethod
     def reset(self) -> None:
         """Reset algorithm to initial state.
@@ -425,11 +542,15 @@ class BanditAlgorithm(ABC):
         - embedding (384 dims)
         - token_count (1 dim, normalized by config token_count_normalization)
         - complexity_score (1 dim)
-                Args:
+
+        Returns a (d×1) view of the cached, read-only QueryFeatures.feature_vector,
+        so repeated calls (select, update, scoring) share one array with no copies.
+
+        Args:
             features: Query features object
 
         Returns:
-            Feature vector as (d×1) numpy array
+            Feature vector as (d×1) numpy array (read-only)
 
         Example:
             >>> features = QueryFeatures(
@@ -441,18 +562,5 @@ class BanditAlgorithm(ABC):
             >>> x.shape
             (386, 1)
         """
-        # Load feature config for normalization constant
-        feature_config = load_feature_dimensions()
-        token_normalization = feature_config["token_count_normalization"]
-
-        # Combine embedding with metadata
-        feature_vector = np.array(
-            features.embedding
-            + [
-                features.token_count / token_normalization,
-                features.complexity_score,
-            ]
-        )
-
-        # Reshape to column vector (d×1)
-        return feature_vector.reshape(-1, 1)
+        # Reshape to column vector (d×1); a view, not a copy
+        return features.feature_vector.reshape(-1, 1)
@@ -156,7 +156,7 @@ class OracleBaseline(BanditAlgorithm):
         Returns:
             Optimal model arm for this query
         """
-        query_hash = hash(tuple(features.embedding))
+        query_hash = hash(features.embedding_array.tobytes())
 
         # Check if we have oracle knowledge for this query
         best_reward = -float("inf")
@@ -190,7 +190,7 @@ class OracleBaseline(BanditAlgorithm):
             feedback: Feedback containing actual reward
             features: Query features from analyzer
         """
-        query_hash = hash(tuple(features.embedding))
+        query_hash = hash(features.embedding_array.tobytes())
         key = (query_hash, feedback.model_id)
         self.oracle_rewards[key] = feedback.quality_score
 
@@ -8,6 +8,16 @@ This combines the best of both worlds:
 - Thompson Sampling: Natural exploration via sampling from posterior
 - Contextual: Uses query features for smarter routing decisions
 
+Posterior maintenance mirrors LinUCB's A_inv handling: Sigma is updated with
+Sherman-Morrison rank-1 updates (and Woodbury downdates when a sliding window
+drops its oldest observation), so each update is O(d²) regardless of window
+size. A periodic full refactorization bounds floating point drift.
+
+Posterior sampling uses a cached Cholesky factor of each arm's Sigma, kept in
+sync with rank-1 cholupdate/downdate on every update, so select_arm() never
+factorizes on the request path: all arms are sampled from one (K, d) normal
+draw and a batched triangular matvec.
+
 Reference: Agrawal & Goyal (2013) "Thompson Sampling for Contextual Bandits with Linear Payoffs"
 Tutorial: http://proceedings.mlr.press/v28/agrawal13.pdf
 """
@@ -23,11 +33,52 @@ import numpy as np
 from conduit.core.config import load_algorithm_config, load_feature_dimensions
 from conduit.core.models import QueryFeatures
 
-from .base import BanditAlgorithm, BanditFeedback, ModelArm
+from .base import ArmSelection, BanditAlgorithm, BanditFeedback, ModelArm
 
 if TYPE_CHECKING:
     from conduit.core.state_store import BanditState
 
+# Incremental updates between full Sigma recomputations (drift guard)
+DEFAULT_REFACTOR_INTERVAL = 1000
+
+# Sampling noise scale used when Sigma is not positive definite (keeps exploration)
+FALLBACK_EXPLORATION_SCALE = 0.01
+
+
+def _cholesky_rank_one(U: np.ndarray, v: np.ndarray, sign: float) -> None:
+    """Update an upper-triangular Cholesky factor in place for a rank-1 change.
+
+    Given Sigma = U^T @ U, transforms U so that U^T @ U = Sigma + sign * v @ v^T
+    in O(d²) (Givens-style cholupdate/choldowndate). Operates on rows of U,
+    which are contiguous for C-ordered arrays.
+
+    Args:
+        U: Upper-triangular factor (d×d), modified in place
+        v: Update vector (d,), not modified
+        sign: +1.0 for an update, -1.0 for a downdate
+
+    Raises:
+        np.linalg.LinAlgError: If a downdate would make the matrix indefinite
+            (U is left partially modified; caller must refactorize)
+    """
+    v = v.astype(np.float64, copy=True)
+    n = v.shape[0]
+    for k in range(n):
+        diag = U[k, k]
+        r_squared = diag * diag + sign * v[k] * v[k]
+        if r_squared <= 0.0 or diag == 0.0:
+            raise np.linalg.LinAlgError("Cholesky downdate lost positive definiteness")
+        r = np.sqrt(r_squared)
+        c = r / diag
+        s = v[k] / diag
+        U[k, k] = r
+        if k + 1 < n:
+            row = U[k, k + 1 :]
+            row += sign * s * v[k + 1 :]
+            row /= c
+            v[k + 1 :] *= c
+            v[k + 1 :] -= s * row
+
 
 class ContextualThompsonSamplingBandit(BanditAlgorithm):
     """Contextual Thompson Sampling with Bayesian Linear Regression.
@@ -50,6 +101,9 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
     - Sigma_n = (Sigma_0^-1 + lambda * sum(x_i @ x_i^T))^-1
     - mu_n = Sigma_n @ (Sigma_0^-1 @ mu_0 + lambda * sum(r_i * x_i))
 
+    Sigma_n is maintained incrementally via Sherman-Morrison:
+    - Sigma_n = Sigma - lambda * (Sigma x)(Sigma x)^T / (1 + lambda * x^T Sigma x)
+
     Attributes:
         name: Algorithm identifier
         arms: Available model arms
@@ -57,6 +111,11 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         feature_dim: Dimensionality of context features
         mu: Posterior mean for each arm (d×1)
         Sigma: Posterior covariance for each arm (d×d)
+        Sigma_inv: Posterior precision for each arm (d×d), kept exact for refactorization
+        Sigma_chol: Cached upper Cholesky factor U of each arm's Sigma (Sigma = U^T @ U).
+            Values are views into a stacked (K, d, d) array used for batched sampling.
+        weighted_sum: lambda * sum(r_i * x_i) for each arm (d×1)
+        refactor_interval: Rank-1 updates per arm between full refactorizations
         arm_pulls: Number of times each arm was selected
     """
 
@@ -69,6 +128,7 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         reward_weights: dict[str, float] | None = None,
         window_size: int = 0,
         success_threshold: float | None = None,
+        refactor_interval: int = DEFAULT_REFACTOR_INTERVAL,
     ) -> None:
         """Initialize Contextual Thompson Sampling algorithm.
 
@@ -84,6 +144,9 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
                 0 = unlimited history (default), N = keep only last N observations per arm
             success_threshold: Reward threshold for counting successes (default: 0.85)
                 Only used for statistics, not algorithm decisions
+            refactor_interval: Number of incremental updates per arm before Sigma
+                is recomputed from scratch to discard accumulated floating point
+                drift (default: 1000). 0 disables periodic refactorization.
 
         Example:
             >>> arms = [
@@ -114,6 +177,7 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         self.feature_dim: int = feature_dim
         self.window_size = window_size
         self.success_threshold = success_threshold
+        self.refactor_interval = refactor_interval
 
         # Multi-objective reward weights (Phase 3)
         if reward_weights is None:
@@ -137,6 +201,19 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         self.mu = {arm.model_id: np.zeros((feature_dim, 1)) for arm in arms}
         self.Sigma = {arm.model_id: np.identity(feature_dim) for arm in arms}
 
+        # Sufficient statistics for incremental updates:
+        # Sigma_inv = I + lambda * sum(x_i @ x_i^T), weighted_sum = lambda * sum(r_i * x_i)
+        self.Sigma_inv = {arm.model_id: np.identity(feature_dim) for arm in arms}
+        self.weighted_sum = {arm.model_id: np.zeros((feature_dim, 1)) for arm in arms}
+        self._updates_since_refactor = {arm.model_id: 0 for arm in arms}
+
+        # Cached Cholesky factors (stacked K×d×d, upper-triangular) for sampling
+        self._arm_index = {arm.model_id: i for i, arm in enumerate(arms)}
+        self._chol_stack = np.tile(np.identity(feature_dim), (len(arms), 1, 1))
+        self.Sigma_chol = {
+            model_id: self._chol_stack[i] for model_id, i in self._arm_index.items()
+        }
+
         # Track arm pulls and successes
         self.arm_pulls = {arm.model_id: 0 for arm in arms}
         self.arm_successes = {arm.model_id: 0 for arm in arms}
@@ -152,6 +229,9 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         2. Compute expected reward: r_hat = theta_hat^T @ x
         3. Select arm with highest r_hat
 
+        Sampling uses the cached Cholesky factors (no factorization per request),
+        drawing all arms at once via sample_thetas().
+
         Args:
             features: Query features for context
 
@@ -170,40 +250,53 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         """
         x = self._extract_features(features)
 
-        sampled_rewards = {}
-        for model_id in self.arms:
-            # Sample theta from posterior: theta ~ N(mu, Sigma)
-            mu = self.mu[model_id]
-            sigma = self.Sigma[model_id]
+        # Sample theta_hat ~ N(mu, Sigma) for every arm and score: r = theta_hat^T @ x
+        theta_hat = self.sample_thetas()
+        sampled_rewards = theta_hat @ x.reshape(-1)
 
-            # Sample: theta_hat = mu + Sigma^(1/2) @ z, where z ~ N(0, I)
-            # Using Cholesky decomposition: Sigma = L @ L^T
-            try:
-                L = np.linalg.cholesky(sigma)
-                z = np.random.randn(self.feature_dim, 1)
-                theta_hat = mu + L @ z
-            except np.linalg.LinAlgError:
-                # If Sigma is not positive definite (rare numerical instability),
-                # preserve exploration by adding regularization noise instead of
-                # falling back to deterministic selection (which removes exploration entirely).
-                # Use mu plus small Gaussian noise scaled by exploration parameter.
-                exploration_scale = 0.01  # Small noise to maintain exploration
-                noise = exploration_scale * np.random.randn(self.feature_dim, 1)
-                theta_hat = mu + noise
-
-            # Compute expected reward: r = theta^T @ x
-            expected_reward = float((theta_hat.T @ x)[0, 0])
-            sampled_rewards[model_id] = expected_reward
-
-        # Select arm with highest sampled reward
-        selected_id = max(sampled_rewards, key=sampled_rewards.get)  # type: ignore[arg-type]  # dict.get returns Optional but all keys exist
-        selected_arm = self.arms[selected_id]
+        # Select arm with highest sampled reward (first index wins ties)
+        selected_arm = self.arm_list[int(np.argmax(sampled_rewards))]
 
         # Track queries
         self.total_queries += 1
 
         return selected_arm
 
+    async def select_arm_with_scores(self, features: QueryFeatures) -> ArmSelection:
+        """Select arm by posterior sampling and return the sampled rewards.
+
+        Scores per arm:
+            - "mean": posterior mean reward (mu^T @ x)
+            - "sample": sampled reward (theta_hat^T @ x) that decided selection
+            - "total": same as "sample"
+
+        Args:
+            features: Query features for context
+
+        Returns:
+            ArmSelection with the highest-sample arm and per-arm scores
+        """
+        x_flat = self._extract_features(features).reshape(-1)
+        sampled_rewards = self.sample_thetas() @ x_flat
+
+        selected_index = int(np.argmax(sampled_rewards))
+        selected_arm = self.arm_list[selected_index]
+        self.total_queries += 1
+
+        scores: dict[str, dict[str, float]] = {}
+        for arm, sample in zip(self.arm_list, sampled_rewards):
+            scores[arm.model_id] = {
+                "mean": float(self.mu[arm.model_id].reshape(-1) @ x_flat),
+                "sample": float(sample),
+                "total": float(sample),
+            }
+
+        return ArmSelection(
+            arm=selected_arm,
+            scores=scores,
+            arm_pulls=self.arm_pulls[selected_arm.model_id],
+        )
+
     async def update(self, feedback: BanditFeedback, features: QueryFeatures) -> None:
         """Update posterior distribution with feedback.
 
@@ -211,12 +304,16 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         - Sigma_n = (Sigma_0^-1 + lambda * sum(x_i @ x_i^T))^-1
         - mu_n = Sigma_n @ (Sigma_0^-1 @ mu_0 + lambda * sum(r_i * x_i))
 
+        Sigma is updated incrementally with Sherman-Morrison (O(d²) per update):
+        - Sigma -= lambda * (Sigma x)(Sigma x)^T / (1 + lambda * x^T Sigma x)
+        - mu = Sigma @ weighted_sum
+
         With sliding window (window_size > 0):
         - Stores observation (x, r) in history deque (automatically drops oldest when full)
-        - Recalculates mu and Sigma from all observations in current window
+        - Downdates Sigma with the dropped observation (Woodbury rank-1 downdate)
 
-        Without window (window_size = 0):
-        - Recalculates from all historical observations
+        Every refactor_interval updates (or on numerical instability), Sigma is
+        recomputed from the exact precision matrix to discard accumulated drift.
 
         Args:
             feedback: Feedback from model execution
@@ -249,31 +346,113 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
 
         x = self._extract_features(features)
 
-        # Add observation to history
-        self.observation_history[model_id].append((x, reward))
-
-        # Recalculate posterior from windowed history
-        # Prior: theta ~ N(0, I) (uninformative)
-        # Sigma_n = (I + lambda * sum(x_i @ x_i^T))^-1
-        # mu_n = Sigma_n @ (lambda * sum(r_i * x_i))
+        history = self.observation_history[model_id]
 
-        # Compute sufficient statistics from window
-        Sigma_inv = np.identity(self.feature_dim)  # Prior precision (I)
-        weighted_sum = np.zeros((self.feature_dim, 1))  # Weighted feature sum
+        # Sliding window full: downdate with the observation about to be dropped
+        stable = True
+        if self.window_size > 0 and len(history) == self.window_size:
+            oldest_x, oldest_r = history[0]
+            stable = self._rank_one_update(model_id, oldest_x, oldest_r, sign=-1.0)
 
-        for obs_x, obs_r in self.observation_history[model_id]:
-            Sigma_inv += self.lambda_reg * (obs_x @ obs_x.T)
-            weighted_sum += self.lambda_reg * obs_r * obs_x
+        # Add observation to history (deque automatically drops oldest if full)
+        history.append((x, reward))
+        stable = self._rank_one_update(model_id, x, reward, sign=1.0) and stable
 
-        # Update posterior
-        self.Sigma[model_id] = np.linalg.inv(Sigma_inv)  # type: ignore[assignment]
-        self.mu[model_id] = self.Sigma[model_id] @ weighted_sum
+        self._updates_since_refactor[model_id] += 1
+        if not stable or (
+            self.refactor_interval > 0
+            and self._updates_since_refactor[model_id] >= self.refactor_interval
+        ):
+            self._refactor(model_id)
+        else:
+            self.mu[model_id] = self.Sigma[model_id] @ self.weighted_sum[model_id]
 
         # Track statistics
         self.arm_pulls[model_id] += 1
         if reward >= self.success_threshold:
             self.arm_successes[model_id] += 1
 
+    async def update_batch(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures]]
+    ) -> None:
+        """Apply a batch of feedback with one block posterior update per arm.
+
+        Without window (window_size = 0), the k observations X (d×k) for an
+        arm update the posterior together:
+            Sigma_inv += lambda X X^T, weighted_sum += lambda X r
+            Sigma -= (Sigma X) (I_k / lambda + X^T Sigma X)^-1 (Sigma X)^T
+        then mu and the cached Cholesky factor are recomputed once, instead
+        of k Sherman-Morrison updates each followed by an O(d²) cholupdate.
+
+        With sliding window (window_size > 0), which observations drop out
+        depends on arrival order, so the batch is applied sequentially.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order
+
+        Raises:
+            ValueError: If any feedback.model_id is not in self.arms
+        """
+        grouped = self._group_batch_by_arm(batch)
+        if self.window_size > 0:
+            for feedback, features in batch:
+                await self.update(feedback, features)
+            return
+
+        for model_id, observations in grouped.items():
+            if len(observations) == 1:
+                # Rank-1 cholupdate is cheaper than refactoring the factor
+                await self.update(*observations[0])
+                continue
+
+            rewards = np.array(
+                [
+                    feedback.calculate_reward(
+                        quality_weight=self.reward_weights["quality"],
+                        cost_weight=self.reward_weights["cost"],
+                        latency_weight=self.reward_weights["latency"],
+                    )
+                    for feedback, _ in observations
+                ]
+            )
+            X = np.hstack(
+                [self._extract_features(features) for _, features in observations]
+            )  # d×k
+            k = X.shape[1]
+
+            self.Sigma_inv[model_id] += self.lambda_reg * (X @ X.T)
+            self.weighted_sum[model_id] += self.lambda_reg * (
+                X @ rewards.reshape(-1, 1)
+            )
+
+            self._updates_since_refactor[model_id] += k
+            sigma_x = self.Sigma[model_id] @ X  # d×k
+            capacitance = np.identity(k) / self.lambda_reg + X.T @ sigma_x
+            try:
+                Sigma = self.Sigma[model_id] - sigma_x @ np.linalg.solve(
+                    capacitance, sigma_x.T
+                )
+            except np.linalg.LinAlgError:
+                self._refactor(model_id)
+            else:
+                if (
+                    self.refactor_interval > 0
+                    and self._updates_since_refactor[model_id]
+                    >= self.refactor_interval
+                ):
+                    self._refactor(model_id)
+                else:
+                    self.Sigma[model_id] = (Sigma + Sigma.T) / 2.0
+                    self.mu[model_id] = (
+                        self.Sigma[model_id] @ self.weighted_sum[model_id]
+                    )
+                    self._refresh_cholesky(model_id)
+
+            self.arm_pulls[model_id] += k
+            self.arm_successes[model_id] += int(
+                np.count_nonzero(rewards >= self.success_threshold)
+            )
+
     def reset(self) -> None:
         """Reset algorithm to initial state.
 
@@ -291,6 +470,15 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         self.Sigma = {
             arm.model_id: np.identity(self.feature_dim) for arm in self.arm_list
         }
+        self.Sigma_inv = {
+            arm.model_id: np.identity(self.feature_dim) for arm in self.arm_list
+        }
+        self.weighted_sum = {
+            arm.model_id: np.zeros((self.feature_dim, 1)) for arm in self.arm_list
+        }
+        self._updates_since_refactor = {arm.model_id: 0 for arm in self.arm_list}
+        # Reset stacked factors in place so self.Sigma_chol views stay valid
+        self._chol_stack[:] = np.identity(self.feature_dim)
         self.arm_pulls = {arm.model_id: 0 for arm in self.arm_list}
         self.arm_successes = {arm.model_id: 0 for arm in self.arm_list}
 
@@ -300,6 +488,111 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
 
         self.total_queries = 0
 
+    def _rank_one_update(
+        self, model_id: str, x: np.ndarray, reward: float, sign: float
+    ) -> bool:
+        """Apply a rank-1 update (sign=+1) or downdate (sign=-1) to an arm's posterior.
+
+        Updates the exact sufficient statistics (Sigma_inv, weighted_sum) and
+        maintains Sigma with Sherman-Morrison / Woodbury:
+            (P ± lambda x x^T)^-1 = Sigma ∓ lambda (Sigma x)(Sigma x)^T / (1 ± lambda x^T Sigma x)
+
+        Args:
+            model_id: Arm to update
+            x: Feature vector (d×1)
+            reward: Observed reward
+            sign: +1.0 to add the observation, -1.0 to remove it
+
+        Returns:
+            False if the denominator was numerically unstable and Sigma was left
+            untouched (caller must refactor), True otherwise
+        """
+        scaled = sign * self.lambda_reg
+        self.Sigma_inv[model_id] += scaled * (x @ x.T)
+        self.weighted_sum[model_id] += scaled * reward * x
+
+        sigma_x = self.Sigma[model_id] @ x  # d×1 vector
+        denominator = 1.0 + scaled * float((x.T @ sigma_x)[0, 0])
+
+        # Denominator must stay positive for Sigma to remain positive definite
+        if denominator <= 1e-10:
+            return False
+
+        coefficient = scaled / denominator
+        self.Sigma[model_id] -= coefficient * (sigma_x @ sigma_x.T)
+
+        # Mirror the change on the cached factor: Sigma -= c * v v^T is a
+        # Cholesky downdate for c > 0 (new observation), update for c < 0
+        try:
+            _cholesky_rank_one(
+                self.Sigma_chol[model_id],
+                np.sqrt(abs(coefficient)) * sigma_x[:, 0],
+                sign=-1.0 if coefficient > 0 else 1.0,
+            )
+        except np.linalg.LinAlgError:
+            return False
+        return True
+
+    def _refactor(self, model_id: str) -> None:
+        """Recompute an arm's posterior from scratch to discard accumulated drift.
+
+        With a sliding window, the precision matrix is rebuilt from the window
+        (O(W·d²)); otherwise the incrementally maintained precision is exact up
+        to summation error. Sigma is then recomputed with one O(d³) inversion.
+
+        Args:
+            model_id: Arm to refactor
+        """
+        if self.window_size > 0:
+            Sigma_inv = np.identity(self.feature_dim)  # Prior precision (I)
+            weighted_sum = np.zeros((self.feature_dim, 1))
+            for obs_x, obs_r in self.observation_history[model_id]:
+                Sigma_inv += self.lambda_reg * (obs_x @ obs_x.T)
+                weighted_sum += self.lambda_reg * obs_r * obs_x
+            self.Sigma_inv[model_id] = Sigma_inv
+            self.weighted_sum[model_id] = weighted_sum
+
+        Sigma = np.linalg.inv(self.Sigma_inv[model_id])
+        # Symmetrize to remove asymmetric rounding (keeps Cholesky well-defined)
+        self.Sigma[model_id] = (Sigma + Sigma.T) / 2.0
+        self.mu[model_id] = self.Sigma[model_id] @ self.weighted_sum[model_id]
+        self._refresh_cholesky(model_id)
+        self._updates_since_refactor[model_id] = 0
+
+    def _refresh_cholesky(self, model_id: str) -> None:
+        """Recompute an arm's cached Cholesky factor from Sigma (O(d³)).
+
+        If Sigma is not positive definite (rare numerical instability), the
+        factor is replaced by a small scaled identity so sampling keeps
+        exploring around mu instead of becoming deterministic.
+
+        Args:
+            model_id: Arm whose factor is recomputed
+        """
+        i = self._arm_index[model_id]
+        try:
+            self._chol_stack[i] = np.linalg.cholesky(self.Sigma[model_id]).T
+        except np.linalg.LinAlgError:
+            self._chol_stack[i] = FALLBACK_EXPLORATION_SCALE * np.identity(
+                self.feature_dim
+            )
+
+    def sample_thetas(self) -> np.ndarray:
+        """Draw one posterior sample of theta for every arm.
+
+        Uses a single (K, d) standard normal draw and the cached Cholesky
+        factors: theta_hat_k = mu_k + U_k^T @ z_k, with Sigma_k = U_k^T @ U_k.
+
+        Returns:
+            Sampled thetas (K×d), ordered like self.arm_list
+        """
+        mu = np.concatenate(
+            [self.mu[arm.model_id] for arm in self.arm_list], axis=1
+        ).T
+        z = np.random.randn(self.n_arms, self.feature_dim)
+        # theta_k = mu_k + U_k^T z_k  (batched triangular matvec)
+        return mu + np.einsum("kij,ki->kj", self._chol_stack, z)
+
     def get_stats(self) -> dict[str, Any]:
         """Get algorithm statistics.
 
@@ -348,7 +641,9 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
     def to_state(self) -> BanditState:
         """Serialize Contextual Thompson Sampling state for persistence.
 
-        Converts numpy arrays to nested lists for JSON serialization.
+        Matrices are copied into the state as float64 arrays. The precision
+        matrices and Cholesky factors are included for the binary codec
+        (excluded from JSON, where they are recomputed on restore).
 
         Returns:
             BanditState object containing all CTS state
@@ -362,10 +657,6 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
         """
         from conduit.core.state_store import BanditState
 
-        # Serialize mu vectors and Sigma matrices
-        mu_vectors = {arm_id: vec.flatten().tolist() for arm_id, vec in self.mu.items()}
-        sigma_matrices = {arm_id: mat.tolist() for arm_id, mat in self.Sigma.items()}
-
         # Serialize observation history (feature vectors and rewards)
         observation_history_serialized = []
         for arm_id, observations in self.observation_history.items():
@@ -384,8 +675,10 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
             arm_pulls=self.arm_pulls.copy(),
             arm_successes=self.arm_successes.copy(),
             total_queries=self.total_queries,
-            mu_vectors=mu_vectors,
-            sigma_matrices=sigma_matrices,
+            mu_vectors={arm_id: vec.flatten() for arm_id, vec in self.mu.items()},
+            sigma_matrices=self.Sigma,
+            sigma_inv_matrices=self.Sigma_inv,
+            sigma_cholesky=self.Sigma_chol,
             observation_history=observation_history_serialized,
             feature_dim=self.feature_dim,
             window_size=self.window_size if self.window_size > 0 else None,
@@ -395,7 +688,9 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
     def from_state(self, state: BanditState) -> None:
         """Restore Contextual Thompson Sampling state from persisted data.
 
-        Deserializes numpy arrays from nested lists.
+        Restores the precision matrices and Cholesky factors used by incremental
+        updates from the state when present (binary format); otherwise
+        recomputes them from Sigma.
 
         Args:
             state: BanditState object with serialized state
@@ -440,6 +735,25 @@ class ContextualThompsonSamplingBandit(BanditAlgorithm):
             arm_id: np.array(mat) for arm_id, mat in state.sigma_matrices.items()
         }
 
+        # Rebuild sufficient statistics for incremental updates, reusing persisted
+        # factors when available (skips O(d³) inversion and factorization)
+        self.Sigma_inv = {}
+        for arm_id, sigma in self.Sigma.items():
+            sigma_inv = state.sigma_inv_matrices.get(arm_id)
+            if sigma_inv is None or sigma_inv.shape != sigma.shape:
+                sigma_inv = np.linalg.inv(sigma)
+            self.Sigma_inv[arm_id] = sigma_inv
+        self.weighted_sum = {
+            arm_id: self.Sigma_inv[arm_id] @ self.mu[arm_id] for arm_id in self.mu
+        }
+        self._updates_since_refactor = {arm_id: 0 for arm_id in self.arms}
+        for arm_id in self.arms:
+            chol = state.sigma_cholesky.get(arm_id)
+            if chol is not None and chol.shape == (self.feature_dim, self.feature_dim):
+                self._chol_stack[self._arm_index[arm_id]] = chol
+            else:
+                self._refresh_cholesky(arm_id)
+
         # Restore observation history
         for arm_id in self.arms:
             self.observation_history[arm_id].clear()
@@ -10,6 +10,11 @@ to adapt to model quality/cost changes over time. With sliding window, uses Wood
 identity for O(d²) incremental updates (downdate oldest + update newest) instead of
 O(W·d² + d³) full recalculation.
 
+Scoring is vectorized across arms: all A_inv matrices live in one contiguous
+(K, d, d) array and theta = A_inv @ b is cached per arm (invalidated only on
+update), so select_arm() scores every arm with a single batched matmul instead
+of a Python loop of per-arm d×d products.
+
 Reference: https://arxiv.org/abs/1003.0146 (Li et al. 2010)
 Tutorial: https://kfoofw.github.io/contextual-bandits-linear-ucb-disjoint/
 """
@@ -25,7 +30,7 @@ import numpy as np
 from conduit.core.config import load_algorithm_config, load_feature_dimensions
 from conduit.core.models import QueryFeatures
 
-from .base import BanditAlgorithm, BanditFeedback, ModelArm
+from .base import ArmSelection, BanditAlgorithm, BanditFeedback, ModelArm
 
 if TYPE_CHECKING:
     from conduit.core.state_store import BanditState
@@ -55,7 +60,8 @@ class LinUCBBandit(BanditAlgorithm):
         feature_dim: Dimensionality of context features
         A: Design matrix for each arm (d×d)
         b: Response vector for each arm (d×1)
-        A_inv: Cached inverse of A for each arm (updated incrementally via Sherman-Morrison)
+        A_inv: Cached inverse of A for each arm (updated incrementally via Sherman-Morrison).
+            Values are views into a stacked (K, d, d) array used for batched scoring.
         arm_pulls: Number of times each arm was selected
     """
 
@@ -133,8 +139,19 @@ class LinUCBBandit(BanditAlgorithm):
         # Initialize A as identity matrix and b as zero vector for each arm
         self.A = {arm.model_id: np.identity(feature_dim) for arm in arms}
         self.b = {arm.model_id: np.zeros((feature_dim, 1)) for arm in arms}
-        # Store A_inv for efficient computation (Sherman-Morrison incremental update)
-        self.A_inv = {arm.model_id: np.identity(feature_dim) for arm in arms}
+
+        # Stacked A_inv (K×d×d) for batched scoring. self.A_inv exposes per-arm
+        # views into the stack, so in-place Sherman-Morrison updates through the
+        # dict land directly in the contiguous array.
+        self._arm_index = {arm.model_id: i for i, arm in enumerate(arms)}
+        self._A_inv_stack = np.tile(np.identity(feature_dim), (len(arms), 1, 1))
+        self.A_inv = {
+            model_id: self._A_inv_stack[i] for model_id, i in self._arm_index.items()
+        }
+
+        # Cached theta = A_inv @ b per arm (K×d), recomputed lazily for stale arms
+        self._theta_stack = np.zeros((len(arms), feature_dim))
+        self._theta_stale = np.zeros(len(arms), dtype=bool)
 
         # Track arm pulls and successes
         self.arm_pulls = {arm.model_id: 0 for arm in arms}
@@ -169,29 +186,43 @@ class LinUCBBandit(BanditAlgorithm):
         """
         x = self._extract_features(features)
 
-        ucb_values = {}
-        for model_id in self.arms:
-            # Use cached A_inv (no inversion needed - Sherman-Morrison keeps it updated)
-            theta = self.A_inv[model_id] @ self.b[model_id]
-
-            # Compute UCB = theta^T @ x + alpha * sqrt(x^T @ A_inv @ x)
-            mean_reward = float((theta.T @ x)[0, 0])  # Expected reward
-            uncertainty = float(
-                np.sqrt((x.T @ self.A_inv[model_id] @ x)[0, 0])
-            )  # Confidence radius
-            ucb = mean_reward + self.alpha * uncertainty
+        # Score all arms in one batched pass (cached theta, stacked A_inv)
+        mean_rewards, uncertainties = self._score_arms(x)
+        ucb_values = mean_rewards + self.alpha * uncertainties
 
-            ucb_values[model_id] = float(ucb)
-
-        # Select arm with highest UCB
-        selected_id = max(ucb_values, key=ucb_values.get)  # type: ignore[arg-type]  # dict.get returns Optional but all keys exist
-        selected_arm = self.arms[selected_id]
+        # Select arm with highest UCB (first index wins ties, matching dict order)
+        selected_arm = self.arm_list[int(np.argmax(ucb_values))]
 
         # Track queries
         self.total_queries += 1
 
         return selected_arm
 
+    async def select_arm_with_scores(self, features: QueryFeatures) -> ArmSelection:
+        """Select arm using LinUCB policy and return the UCB breakdown.
+
+        Scores all arms once; the same means and uncertainties drive both the
+        selection and the returned scores (see compute_scores() for format).
+
+        Args:
+            features: Query features for context
+
+        Returns:
+            ArmSelection with the highest-UCB arm and per-arm scores
+        """
+        x = self._extract_features(features)
+        mean_rewards, uncertainties = self._score_arms(x)
+        ucb_values = mean_rewards + self.alpha * uncertainties
+
+        selected_arm = self.arm_list[int(np.argmax(ucb_values))]
+        self.total_queries += 1
+
+        return ArmSelection(
+            arm=selected_arm,
+            scores=self._scores_dict(mean_rewards, uncertainties),
+            arm_pulls=self.arm_pulls[selected_arm.model_id],
+        )
+
     async def update(self, feedback: BanditFeedback, features: QueryFeatures) -> None:
         """Update ridge regression parameters with feedback.
 
@@ -274,7 +305,7 @@ class LinUCBBandit(BanditAlgorithm):
                     for obs_x, obs_r in history:
                         self.A[model_id] += obs_x @ obs_x.T
                         self.b[model_id] += obs_r * obs_x
-                    self.A_inv[model_id] = np.linalg.inv(self.A[model_id])  # type: ignore[assignment]
+                    self._set_A_inv(model_id, np.linalg.inv(self.A[model_id]))
 
             # Add new observation to history (deque automatically drops oldest if full)
             history.append((x, reward))
@@ -298,7 +329,7 @@ class LinUCBBandit(BanditAlgorithm):
                 for obs_x, obs_r in history:
                     self.A[model_id] += obs_x @ obs_x.T
                     self.b[model_id] += obs_r * obs_x
-                self.A_inv[model_id] = np.linalg.inv(self.A[model_id])  # type: ignore[assignment]
+                self._set_A_inv(model_id, np.linalg.inv(self.A[model_id]))
         else:
             # No sliding window: Use Sherman-Morrison incremental update
             # Update A and b incrementally
@@ -315,13 +346,77 @@ class LinUCBBandit(BanditAlgorithm):
                 self.A_inv[model_id] -= (a_inv_x @ a_inv_x.T) / denominator
             else:
                 # Fallback to full inversion if numerical issues detected
-                self.A_inv[model_id] = np.linalg.inv(self.A[model_id])  # type: ignore[assignment]  # np.linalg.inv returns compatible dtype
+                self._set_A_inv(model_id, np.linalg.inv(self.A[model_id]))
+
+        # A_inv and b changed: cached theta for this arm is stale
+        self._theta_stale[self._arm_index[model_id]] = True
 
         # Track statistics
         self.arm_pulls[model_id] += 1
         if reward >= self.success_threshold:
             self.arm_successes[model_id] += 1
 
+    async def update_batch(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures]]
+    ) -> None:
+        """Apply a batch of feedback with one rank-k update per arm.
+
+        Without window (window_size = 0), the k observations X (d×k) for an
+        arm are folded in together:
+            A += X X^T, b += X r
+            A^-1 -= (A^-1 X) (I_k + X^T A^-1 X)^-1 (A^-1 X)^T   (Woodbury)
+        One O(d²k + k³) update replaces k Sherman-Morrison updates and their
+        per-observation Python overhead.
+
+        With sliding window (window_size > 0), which observations drop out
+        depends on arrival order, so the batch is applied sequentially.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order
+
+        Raises:
+            ValueError: If any feedback.model_id is not in self.arms
+        """
+        grouped = self._group_batch_by_arm(batch)
+        if self.window_size > 0:
+            for feedback, features in batch:
+                await self.update(feedback, features)
+            return
+
+        for model_id, observations in grouped.items():
+            rewards = np.array(
+                [
+                    feedback.calculate_reward(
+                        quality_weight=self.reward_weights["quality"],
+                        cost_weight=self.reward_weights["cost"],
+                        latency_weight=self.reward_weights["latency"],
+                    )
+                    for feedback, _ in observations
+                ]
+            )
+            X = np.hstack(
+                [self._extract_features(features) for _, features in observations]
+            )  # d×k
+
+            self.A[model_id] += X @ X.T
+            self.b[model_id] += X @ rewards.reshape(-1, 1)
+
+            a_inv_x = self.A_inv[model_id] @ X  # d×k
+            capacitance = np.identity(X.shape[1]) + X.T @ a_inv_x  # k×k, SPD
+            try:
+                self.A_inv[model_id] -= a_inv_x @ np.linalg.solve(
+                    capacitance, a_inv_x.T
+                )
+            except np.linalg.LinAlgError:
+                # Fallback to full inversion if numerical issues detected
+                self._set_A_inv(model_id, np.linalg.inv(self.A[model_id]))
+
+            self._theta_stale[self._arm_index[model_id]] = True
+            self.arm_pulls[model_id] += len(observations)
+            self.arm_successes[model_id] += int(
+                np.count_nonzero(rewards >= self.success_threshold)
+            )
+
     def reset(self) -> None:
         """Reset algorithm to initial state.
 
@@ -336,9 +431,10 @@ class LinUCBBandit(BanditAlgorithm):
         self.b = {
             arm.model_id: np.zeros((self.feature_dim, 1)) for arm in self.arm_list
         }
-        self.A_inv = {
-            arm.model_id: np.identity(self.feature_dim) for arm in self.arm_list
-        }
+        # Reset stacked A_inv in place so self.A_inv views stay valid
+        self._A_inv_stack[:] = np.identity(self.feature_dim)
+        self._theta_stack.fill(0.0)
+        self._theta_stale.fill(False)
         self.arm_pulls = {arm.model_id: 0 for arm in self.arm_list}
         self.arm_successes = {arm.model_id: 0 for arm in self.arm_list}
 
@@ -375,10 +471,11 @@ class LinUCBBandit(BanditAlgorithm):
                 success_rates[model_id] = 0.0
 
         # Calculate theta norms (model confidence)
-        theta_norms = {}
-        for model_id in self.arms:
-            theta = self.A_inv[model_id] @ self.b[model_id]
-            theta_norms[model_id] = float(np.linalg.norm(theta))
+        theta = self._get_theta_stack()
+        theta_norms = {
+            model_id: float(np.linalg.norm(theta[i]))
+            for model_id, i in self._arm_index.items()
+        }
 
         return {
             **base_stats,
@@ -416,27 +513,83 @@ class LinUCBBandit(BanditAlgorithm):
             {"mean": 0.72, "uncertainty": 0.15, "total": 0.87}
         """
         x = self._extract_features(features)
-        scores: dict[str, dict[str, float]] = {}
-
-        for model_id in self.arms:
-            theta = self.A_inv[model_id] @ self.b[model_id]
-            mean_reward = float((theta.T @ x)[0, 0])
-            uncertainty = float(np.sqrt((x.T @ self.A_inv[model_id] @ x)[0, 0]))
-            ucb = mean_reward + self.alpha * uncertainty
+        mean_rewards, uncertainties = self._score_arms(x)
+        return self._scores_dict(mean_rewards, uncertainties)
 
+    def _scores_dict(
+        self, mean_rewards: np.ndarray, uncertainties: np.ndarray
+    ) -> dict[str, dict[str, float]]:
+        """Convert batched score arrays to the compute_scores() mapping."""
+        scores: dict[str, dict[str, float]] = {}
+        for model_id, i in self._arm_index.items():
+            mean_reward = float(mean_rewards[i])
+            uncertainty = float(uncertainties[i])
             scores[model_id] = {
                 "mean": mean_reward,
                 "uncertainty": uncertainty,
-                "total": ucb,
+                "total": mean_reward + self.alpha * uncertainty,
             }
 
         return scores
 
+    def _score_arms(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute mean reward and uncertainty for every arm in one batched pass.
+
+        Uses the stacked A_inv (K×d×d) and cached theta (K×d):
+            mean_k = theta_k^T @ x
+            uncertainty_k = sqrt(x^T @ A_inv_k @ x)
+
+        Args:
+            x: Context feature vector (d×1)
+
+        Returns:
+            Tuple of (mean_rewards, uncertainties), each a length-K array
+            ordered like self.arm_list
+        """
+        x_flat = x.reshape(-1)
+        theta = self._get_theta_stack()
+
+        mean_rewards = theta @ x_flat
+        # (K,d,d) @ (d,) -> (K,d), then row-wise dot with x -> (K,)
+        quad_forms = np.einsum("kd,d->k", self._A_inv_stack @ x_flat, x_flat)
+        # Clamp tiny negative values from floating point error before sqrt
+        uncertainties = np.sqrt(np.maximum(quad_forms, 0.0))
+
+        return mean_rewards, uncertainties
+
+    def _get_theta_stack(self) -> np.ndarray:
+        """Return cached theta (K×d), recomputing only arms updated since last use.
+
+        Returns:
+            Stacked theta = A_inv @ b for all arms, ordered like self.arm_list
+        """
+        if self._theta_stale.any():
+            for i in np.flatnonzero(self._theta_stale):
+                model_id = self.arm_list[i].model_id
+                self._theta_stack[i] = (self._A_inv_stack[i] @ self.b[model_id])[:, 0]
+            self._theta_stale.fill(False)
+        return self._theta_stack
+
+    def _set_A_inv(self, model_id: str, A_inv: np.ndarray) -> None:
+        """Overwrite an arm's A_inv inside the stacked array.
+
+        Writes in place so the self.A_inv view for the arm stays valid, and
+        marks the arm's cached theta as stale.
+
+        Args:
+            model_id: Arm whose inverse is replaced
+            A_inv: New d×d inverse design matrix
+        """
+        i = self._arm_index[model_id]
+        self._A_inv_stack[i] = A_inv
+        self._theta_stale[i] = True
+
     def to_state(self) -> BanditState:
         """Serialize LinUCB state for persistence.
 
-        Converts numpy arrays to nested lists for JSON serialization.
-        A_inv is not persisted (recomputed from A on restore).
+        Matrices are copied into the state as float64 arrays. A_inv is
+        included for the binary codec (excluded from JSON, where it is
+        recomputed from A on restore).
 
         Returns:
             BanditState object containing all LinUCB state
@@ -448,10 +601,7 @@ class LinUCBBandit(BanditAlgorithm):
             >>> len(state.A_matrices)
             5
         """
-        from conduit.core.state_store import BanditState, serialize_bandit_matrices
-
-        # Serialize A matrices and b vectors
-        A_matrices, b_vectors = serialize_bandit_matrices(self.A, self.b)
+        from conduit.core.state_store import BanditState
 
         # Serialize observation history (feature vectors and rewards)
         observation_history_serialized = []
@@ -471,8 +621,9 @@ class LinUCBBandit(BanditAlgorithm):
             arm_pulls=self.arm_pulls.copy(),
             arm_successes=self.arm_successes.copy(),
             total_queries=self.total_queries,
-            A_matrices=A_matrices,
-            b_vectors=b_vectors,
+            A_matrices=self.A,
+            b_vectors={arm_id: vec.flatten() for arm_id, vec in self.b.items()},
+            A_inv_matrices=self.A_inv,
             observation_history=observation_history_serialized,
             alpha=self.alpha,
             feature_dim=self.feature_dim,
@@ -483,7 +634,8 @@ class LinUCBBandit(BanditAlgorithm):
     def from_state(self, state: BanditState) -> None:
         """Restore LinUCB state from persisted data.
 
-        Deserializes numpy arrays from nested lists and recomputes A_inv.
+        Uses the persisted A_inv when present (binary format); otherwise
+        recomputes it from A.
 
         Args:
             state: BanditState object with serialized state
@@ -540,12 +692,12 @@ class LinUCBBandit(BanditAlgorithm):
         # Restore A matrices and b vectors
         self.A, self.b = deserialize_bandit_matrices(state.A_matrices, state.b_vectors)
 
-        # Recompute A_inv from A (not stored to save space)
-        # numpy stubs dtype mismatch for np.linalg.inv - functionally correct
-        self.A_inv = {
-            arm_id: np.linalg.inv(A_mat)  # type: ignore[misc]
-            for arm_id, A_mat in self.A.items()
-        }
+        # Restore A_inv into the stack (persisted factor if present, else invert A)
+        for arm_id, A_mat in self.A.items():
+            A_inv = state.A_inv_matrices.get(arm_id)
+            if A_inv is None or A_inv.shape != A_mat.shape:
+                A_inv = np.linalg.inv(A_mat)
+            self._set_A_inv(arm_id, A_inv)
 
         # Restore observation history
         for arm_id in self.arms:
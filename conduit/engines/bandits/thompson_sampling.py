@@ -22,7 +22,7 @@ import numpy as np  # type: ignore[import-untyped,unused-ignore]
 
 from conduit.core.models import QueryFeatures
 
-from .base import BanditAlgorithm, BanditFeedback, ModelArm
+from .base import ArmSelection, BanditAlgorithm, BanditFeedback, ModelArm
 
 if TYPE_CHECKING:
     from conduit.core.state_store import BanditState
@@ -157,6 +157,39 @@ class ThompsonSamplingBandit(BanditAlgorithm):
 
         return selected_arm
 
+    async def select_arm_with_scores(self, features: QueryFeatures) -> ArmSelection:
+        """Select arm using Thompson Sampling and return the samples drawn.
+
+        Scores are compute_scores() plus "sample", the Beta draw that decided
+        the selection; "total" is the sample, so the selected arm always has
+        the highest total.
+
+        Args:
+            features: Query features (not used in basic Thompson Sampling)
+
+        Returns:
+            ArmSelection with the selected arm and per-arm distribution/sample
+        """
+        scores = self.compute_scores(features)
+        arm_ids = list(scores)
+        sample_array = np.random.beta(
+            [scores[mid]["alpha"] for mid in arm_ids],
+            [scores[mid]["beta"] for mid in arm_ids],
+        )
+
+        for model_id, sample in zip(arm_ids, sample_array):
+            scores[model_id]["sample"] = float(sample)
+            scores[model_id]["total"] = float(sample)
+
+        selected_arm = self.arms[arm_ids[int(np.argmax(sample_array))]]
+        self.total_queries += 1
+
+        return ArmSelection(
+            arm=selected_arm,
+            scores=scores,
+            arm_pulls=self.arm_pulls[selected_arm.model_id],
+        )
+
     async def update(self, feedback: BanditFeedback, features: QueryFeatures) -> None:
         """Update Beta distribution with feedback.
 
@@ -238,6 +271,54 @@ class ThompsonSamplingBandit(BanditAlgorithm):
         if reward >= self.success_threshold:
             self.arm_successes[model_id] += 1
 
+    async def update_batch(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures]]
+    ) -> None:
+        """Apply a batch of feedback with one Beta recalculation per arm.
+
+        All (reward, confidence) pairs for an arm are appended to its history
+        first (the window drops the oldest as usual), then α and β are
+        recalculated once from the window with vectorized sums, instead of
+        once per observation.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order
+
+        Raises:
+            ValueError: If any feedback.model_id is not in self.arms
+        """
+        grouped = self._group_batch_by_arm(batch)
+
+        for model_id, observations in grouped.items():
+            rewards = np.array(
+                [
+                    feedback.calculate_reward(
+                        quality_weight=self.reward_weights["quality"],
+                        cost_weight=self.reward_weights["cost"],
+                        latency_weight=self.reward_weights["latency"],
+                    )
+                    for feedback, _ in observations
+                ]
+            )
+            confidences = [feedback.confidence for feedback, _ in observations]
+            self.reward_history[model_id].extend(
+                zip(rewards.tolist(), confidences, strict=True)
+            )
+
+            window = np.array(self.reward_history[model_id]).reshape(-1, 2)
+            window_rewards, window_confidences = window[:, 0], window[:, 1]
+            self.alpha[model_id] = self.prior_alpha + float(
+                window_confidences @ window_rewards
+            )
+            self.beta[model_id] = self.prior_beta + float(
+                window_confidences @ (1.0 - window_rewards)
+            )
+
+            self.arm_pulls[model_id] += len(observations)
+            self.arm_successes[model_id] += int(
+                np.count_nonzero(rewards >= self.success_threshold)
+            )
+
     def reset(self) -> None:
         """Reset algorithm to initial state.
 
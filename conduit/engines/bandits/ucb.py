@@ -237,6 +237,45 @@ class UCB1Bandit(BanditAlgorithm):
         if reward >= self.success_threshold:
             self.arm_successes[model_id] += 1
 
+    async def update_batch(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures]]
+    ) -> None:
+        """Apply a batch of feedback with one mean recalculation per arm.
+
+        All rewards for an arm are appended to its history first (the window
+        drops the oldest as usual), then sum and mean are recalculated once
+        from the window, instead of once per observation.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order
+
+        Raises:
+            ValueError: If any feedback.model_id is not in self.arms
+        """
+        grouped = self._group_batch_by_arm(batch)
+
+        for model_id, observations in grouped.items():
+            rewards = np.array(
+                [
+                    feedback.calculate_reward(
+                        quality_weight=self.reward_weights["quality"],
+                        cost_weight=self.reward_weights["cost"],
+                        latency_weight=self.reward_weights["latency"],
+                    )
+                    for feedback, _ in observations
+                ]
+            )
+            history = self.reward_history[model_id]
+            history.extend(rewards.tolist())
+
+            self.sum_reward[model_id] = float(np.sum(np.fromiter(history, float)))
+            self.mean_reward[model_id] = self.sum_reward[model_id] / len(history)
+
+            self.arm_pulls[model_id] += len(observations)
+            self.arm_successes[model_id] += int(
+                np.count_nonzero(rewards >= self.success_threshold)
+            )
+
     def reset(self) -> None:
         """Reset algorithm to initial state.
 
@@ -7,10 +7,19 @@ Supports multiple embedding backends with automatic fallback:
 - FastEmbed (lightweight ONNX ~100MB, no API key)
 - Sentence-transformers (full PyTorch ~2GB, no API key)
 - HuggingFace API (legacy, requires API key)
+
+Local providers run inference on a shared bounded EmbeddingExecutor.
+BatchingEmbeddingProvider coalesces concurrent embed() calls into embed_batch().
 """
 
 from conduit.engines.embeddings.base import EmbeddingProvider
+from conduit.engines.embeddings.batching import BatchingEmbeddingProvider
 from conduit.engines.embeddings.cohere import CohereEmbeddingProvider
+from conduit.engines.embeddings.executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+    shutdown_embedding_executor,
+)
 from conduit.engines.embeddings.factory import create_embedding_provider
 from conduit.engines.embeddings.huggingface import HuggingFaceEmbeddingProvider
 from conduit.engines.embeddings.openai import OpenAIEmbeddingProvider
@@ -23,20 +32,28 @@ try:
 
     __all__ = [
         "EmbeddingProvider",
+        "BatchingEmbeddingProvider",
         "HuggingFaceEmbeddingProvider",
         "OpenAIEmbeddingProvider",
         "CohereEmbeddingProvider",
         "SentenceTransformersEmbeddingProvider",
         "FastEmbedProvider",
+        "EmbeddingExecutor",
         "create_embedding_provider",
+        "get_embedding_executor",
+        "shutdown_embedding_executor",
     ]
 except ImportError:
     # FastEmbed is optional
     __all__ = [
         "EmbeddingProvider",
+        "BatchingEmbeddingProvider",
         "HuggingFaceEmbeddingProvider",
         "OpenAIEmbeddingProvider",
         "CohereEmbeddingProvider",
         "SentenceTransformersEmbeddingProvider",
+        "EmbeddingExecutor",
         "create_embedding_provider",
+        "get_embedding_executor",
+        "shutdown_embedding_executor",
     ]
@@ -0,0 +1,206 @@
+"""Micro-batching coalescer for single-text embedding calls.
+
+QueryAnalyzer.analyze() embeds one query per cache miss. Under bursty load
+that becomes hundreds of concurrent embed() calls, each a separate API request
+or model invocation, even though every provider implements embed_batch().
+
+BatchingEmbeddingProvider wraps any EmbeddingProvider and coalesces concurrent
+embed() calls:
+    1. Calls arriving within max_wait_ms of the first pending call join one batch
+    2. The batch flushes early once it holds max_batch_size distinct texts
+    3. Identical texts within a batch are embedded once and fanned out
+    4. A batch with a single distinct text uses the provider's embed()
+
+If the underlying embed_batch() fails, every caller in that batch receives the
+same exception (QueryAnalyzer then applies its zero-vector fallback).
+
+Example:
+    >>> provider = BatchingEmbeddingProvider(create_embedding_provider("openai"))
+    >>> vectors = await asyncio.gather(*(provider.embed(q) for q in queries))
+    >>> provider.get_stats()["provider_calls"]  # far fewer than len(queries)
+    3
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Any
+
+from conduit.engines.embeddings.base import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 2.0
+
+
+class _PendingBatch:
+    """Texts collected for the next flush, with their waiting futures."""
+
+    def __init__(self) -> None:
+        self.waiters: dict[str, list[asyncio.Future[list[float]]]] = {}
+        self.timer: asyncio.TimerHandle | None = None
+        self.calls = 0
+
+
+class BatchingEmbeddingProvider(EmbeddingProvider):
+    """EmbeddingProvider wrapper that coalesces concurrent embed() calls.
+
+    Attributes:
+        provider: Wrapped embedding provider
+        max_batch_size: Distinct texts per embed_batch() call
+        max_wait_ms: Longest a call waits for other calls to join its batch
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        """Initialize coalescer.
+
+        Args:
+            provider: Embedding provider to wrap
+            max_batch_size: Flush once this many distinct texts are pending
+            max_wait_ms: Flush this long after the first pending call
+
+        Raises:
+            ValueError: If max_batch_size < 1 or max_wait_ms < 0
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {max_wait_ms}")
+
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        # One pending batch per event loop (futures are loop-bound)
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _PendingBatch
+        ] = weakref.WeakKeyDictionary()
+        # Strong references so in-flight flush tasks are not garbage collected
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+        self._calls = 0
+        self._batches = 0
+        self._texts_embedded = 0
+        self._deduplicated = 0
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed text, sharing a provider call with concurrent requests.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            Embedding vector as list of floats
+
+        Raises:
+            Exception: Whatever the wrapped provider raises for the batch
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[loop] = batch
+            batch.timer = loop.call_later(
+                self.max_wait_ms / 1000, self._schedule_flush, loop, batch
+            )
+
+        future: asyncio.Future[list[float]] = loop.create_future()
+        if text in batch.waiters:
+            self._deduplicated += 1
+            batch.waiters[text].append(future)
+        else:
+            batch.waiters[text] = [future]
+        batch.calls += 1
+        self._calls += 1
+
+        if len(batch.waiters) >= self.max_batch_size:
+            if batch.timer is not None:
+                batch.timer.cancel()
+            self._schedule_flush(loop, batch)
+
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    def _schedule_flush(
+        self, loop: asyncio.AbstractEventLoop, batch: _PendingBatch
+    ) -> None:
+        """Detach batch from the loop and start its flush task."""
+        if self._pending.get(loop) is batch:
+            del self._pending[loop]
+        task = loop.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: _PendingBatch) -> None:
+        """Embed a batch's distinct texts and resolve every waiter."""
+        texts = list(batch.waiters)
+        self._batches += 1
+        self._texts_embedded += len(texts)
+
+        try:
+            if len(texts) == 1:
+                embeddings = [await self.provider.embed(texts[0])]
+            else:
+                embeddings = await self.provider.embed_batch(texts)
+            if len(embeddings) != len(texts):
+                raise RuntimeError(
+                    f"{self.provider.provider_name} returned {len(embeddings)} "
+                    f"embeddings for {len(texts)} texts"
+                )
+        except Exception as e:
+            for futures in batch.waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for text, embedding in zip(texts, embeddings, strict=True):
+            for future in batch.waiters[text]:
+                if not future.done():
+                    future.set_result(embedding)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed an explicit batch directly (already batched, no coalescing).
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        return await self.provider.embed_batch(texts)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return coalescing statistics.
+
+        Returns:
+            Dictionary with:
+            - embed_calls: embed() calls received
+            - provider_calls: Batches flushed to the wrapped provider
+            - texts_embedded: Distinct texts sent to the wrapped provider
+            - deduplicated: Calls served by another caller's identical text
+            - avg_batch_size: Mean embed() calls served per provider call
+        """
+        return {
+            "embed_calls": self._calls,
+            "provider_calls": self._batches,
+            "texts_embedded": self._texts_embedded,
+            "deduplicated": self._deduplicated,
+            "avg_batch_size": self._calls / self._batches if self._batches else 0.0,
+        }
+
+    @property
+    def dimension(self) -> int:
+        """Get embedding dimension of the wrapped provider."""
+        return self.provider.dimension
+
+    @property
+    def provider_name(self) -> str:
+        """Get wrapped provider name."""
+        return self.provider.provider_name
@@ -0,0 +1,343 @@
+"""Bounded execution pool for local (CPU-bound) embedding models.
+
+FastEmbed and sentence-transformers run model inference synchronously. Calling
+them directly from an async route stalls the event loop for the full compute
+time, so one slow embedding delays every concurrent request.
+
+EmbeddingExecutor runs those calls on a dedicated, bounded thread pool:
+    - Workers: sized to CPU cores by default (ONNX Runtime and PyTorch release
+      the GIL during inference, so threads scale without pickling the model
+      into worker processes)
+    - Backpressure: at most max_queue_size jobs are admitted (running + queued).
+      Further callers wait up to queue_timeout seconds for a slot, then get
+      EmbeddingBackpressureError instead of growing an unbounded queue.
+    - Metrics: queue depth and compute time via get_stats() and OpenTelemetry
+      (conduit.embeddings.queue_depth, conduit.embeddings.compute_time)
+
+Local providers share one process-wide executor configured under
+embeddings.executor in conduit.yaml (see get_embedding_executor()).
+
+Example:
+    >>> executor = get_embedding_executor()
+    >>> vectors = await executor.run(model.encode, ["hello", "world"])
+    >>> executor.get_stats()["queue_depth"]
+    0
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from conduit.core.config import load_embeddings_config
+from conduit.core.exceptions import EmbeddingBackpressureError
+from conduit.observability.metrics import (
+    record_embedding_compute,
+    record_embedding_queue_depth,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Admitted jobs (running + queued) per worker when max_queue_size is not set
+DEFAULT_QUEUE_PER_WORKER = 4
+
+# Seconds a caller waits for a free slot before backpressure error
+DEFAULT_QUEUE_TIMEOUT = 5.0
+
+
+def default_max_workers() -> int:
+    """Return default worker count (one per available CPU core)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # pragma: no cover - non-Linux platforms
+        return max(1, os.cpu_count() or 1)
+
+
+class EmbeddingExecutor:
+    """Bounded thread pool with async backpressure for embedding inference.
+
+    Attributes:
+        name: Executor name (thread prefix and metrics attribute)
+        max_workers: Number of worker threads
+        max_queue_size: Maximum admitted jobs (running + waiting for a worker)
+        queue_timeout: Seconds to wait for a slot before rejecting (0 = reject
+            immediately when full)
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+        name: str = "embeddings",
+    ) -> None:
+        """Initialize executor (worker threads start lazily on first job).
+
+        Args:
+            max_workers: Worker threads (default: CPU cores)
+            max_queue_size: Admitted job bound (default: 4 per worker)
+            queue_timeout: Seconds to wait for a free slot when full
+            name: Executor name for thread names and metrics
+
+        Raises:
+            ValueError: If max_workers, max_queue_size or queue_timeout invalid
+        """
+        self.max_workers = max_workers or default_max_workers()
+        self.max_queue_size = (
+            max_queue_size
+            if max_queue_size is not None
+            else self.max_workers * DEFAULT_QUEUE_PER_WORKER
+        )
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+        if self.max_queue_size < self.max_workers:
+            raise ValueError(
+                f"max_queue_size ({self.max_queue_size}) must be >= "
+                f"max_workers ({self.max_workers})"
+            )
+        if queue_timeout < 0:
+            raise ValueError(f"queue_timeout must be >= 0, got {queue_timeout}")
+
+        self.queue_timeout = queue_timeout
+        self.name = name
+
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # Callers waiting for a slot: (their event loop, wake-up future)
+        self._waiters: deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = deque()
+
+        self._admitted = 0  # running + queued
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._compute_seconds = 0.0
+        self._max_compute_seconds = 0.0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the worker pool, creating it on first use."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"conduit-{self.name}",
+                )
+            return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) on a worker thread without blocking the event loop.
+
+        Args:
+            fn: Synchronous, CPU-bound callable (e.g. model.encode)
+            *args: Positional arguments for fn
+
+        Returns:
+            fn's return value
+
+        Raises:
+            EmbeddingBackpressureError: If no slot frees up within queue_timeout
+            Exception: Whatever fn raises
+        """
+        await self._acquire_slot()
+        try:
+            future = self._get_pool().submit(self._timed_call, fn, args)
+        except BaseException:
+            self._release_slot()
+            raise
+
+        # Slot is released when the job finishes (or is cancelled before
+        # starting), not when the awaiting caller gives up, so an abandoned
+        # job still counts against the bound while it occupies a worker.
+        future.add_done_callback(self._on_job_done)
+        return await asyncio.wrap_future(future)
+
+    def _timed_call(self, fn: Callable[..., T], args: tuple[Any, ...]) -> T:
+        """Execute fn on a worker thread, recording compute time."""
+        with self._lock:
+            self._running += 1
+        start = time.perf_counter()
+        success = False
+        try:
+            result = fn(*args)
+            success = True
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                self._compute_seconds += elapsed
+                self._max_compute_seconds = max(self._max_compute_seconds, elapsed)
+                if success:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+            record_embedding_compute(elapsed * 1000, self.name, success)
+
+    def _on_job_done(self, future: Future[Any]) -> None:
+        """Release the job's slot (runs on the worker or canceller thread)."""
+        self._release_slot()
+
+    async def _acquire_slot(self) -> None:
+        """Wait for an admission slot, raising on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.queue_timeout
+
+        while True:
+            with self._lock:
+                if self._admitted < self.max_queue_size:
+                    self._admitted += 1
+                    self._submitted += 1
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self._rejected += 1
+                    admitted = self._admitted
+                    waiter = None
+                else:
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+
+            if waiter is None:
+                raise EmbeddingBackpressureError(
+                    f"Embedding executor '{self.name}' is full "
+                    f"({admitted}/{self.max_queue_size} jobs admitted)",
+                    details={
+                        "executor": self.name,
+                        "max_queue_size": self.max_queue_size,
+                        "queue_timeout": self.queue_timeout,
+                    },
+                )
+
+            try:
+                await asyncio.wait_for(waiter, timeout=remaining)
+            except TimeoutError:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        pass
+            # Woken (or timed out): loop to retry admission / raise
+
+        record_embedding_queue_depth(1, self.name)
+
+    def _release_slot(self) -> None:
+        """Free an admission slot and wake the next waiting caller."""
+        with self._lock:
+            self._admitted -= 1
+        record_embedding_queue_depth(-1, self.name)
+        self._wake_next()
+
+    def _wake_next(self) -> None:
+        """Wake one waiter on its own event loop (thread-safe)."""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if loop.is_closed():
+                    continue
+                loop.call_soon_threadsafe(self._notify, waiter)
+                return
+
+    def _notify(self, waiter: asyncio.Future[None]) -> None:
+        """Resolve a waiter; pass the wake-up on if it already gave up."""
+        if waiter.done():
+            self._wake_next()
+        else:
+            waiter.set_result(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth and compute time statistics.
+
+        Returns:
+            Dictionary with:
+            - max_workers, max_queue_size: Configured bounds
+            - queue_depth: Admitted jobs not yet finished (running + queued)
+            - running: Jobs currently executing on a worker
+            - queued: Admitted jobs waiting for a worker
+            - waiting: Callers blocked on backpressure (not yet admitted)
+            - submitted, completed, failed, rejected: Lifetime counters
+            - avg_compute_ms, max_compute_ms: Model compute time (excl. waiting)
+        """
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "queue_depth": self._admitted,
+                "running": self._running,
+                "queued": max(0, self._admitted - self._running),
+                "waiting": len(self._waiters),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_compute_ms": (
+                    self._compute_seconds / finished * 1000 if finished else 0.0
+                ),
+                "max_compute_ms": self._max_compute_seconds * 1000,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop worker threads (a later run() starts a fresh pool).
+
+        Args:
+            wait: Block until running jobs finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Process-wide executor shared by local embedding providers
+_shared_executor: EmbeddingExecutor | None = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_embedding_executor() -> EmbeddingExecutor:
+    """Return the shared embedding executor, creating it from config.
+
+    Configured under embeddings.executor in conduit.yaml:
+        max_workers: null     # null = CPU cores
+        max_queue_size: null  # null = 4 * max_workers
+        queue_timeout: 5.0    # seconds to wait for a slot before rejecting
+
+    Returns:
+        Process-wide EmbeddingExecutor
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            config = load_embeddings_config()
+            _shared_executor = EmbeddingExecutor(
+                max_workers=config["executor_max_workers"],
+                max_queue_size=config["executor_max_queue_size"],
+                queue_timeout=config["executor_queue_timeout"],
+            )
+            logger.info(
+                f"Embedding executor started: {_shared_executor.max_workers} workers, "
+                f"queue bound {_shared_executor.max_queue_size}"
+            )
+        return _shared_executor
+
+
+def shutdown_embedding_executor(wait: bool = True) -> None:
+    """Shut down the shared executor (next get_embedding_executor() recreates it).
+
+    Args:
+        wait: Block until running jobs finish
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        executor, _shared_executor = _shared_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
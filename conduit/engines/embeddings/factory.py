@@ -55,7 +55,8 @@ def create_embedding_provider(
                  "sentence-transformers", "huggingface"). Default: "auto"
         model: Model identifier (provider-specific, optional)
         api_key: API key (if required by provider, optional)
-        **kwargs: Additional provider-specific arguments
+        **kwargs: Additional provider-specific arguments (e.g. executor for
+            local providers, defaults to the shared EmbeddingExecutor)
 
     Returns:
         EmbeddingProvider instance
@@ -162,11 +163,14 @@ def create_embedding_provider(
         return FastEmbedProvider(
             model=model,
             cache_dir=kwargs.get("cache_dir"),
+            executor=kwargs.get("executor"),
         )
 
     elif provider_lower in ("sentence-transformers", "sentence_transformers"):
         model = model or "all-MiniLM-L6-v2"
-        return SentenceTransformersEmbeddingProvider(model=model)
+        return SentenceTransformersEmbeddingProvider(
+            model=model, executor=kwargs.get("executor")
+        )
 
     else:
         raise ValueError(
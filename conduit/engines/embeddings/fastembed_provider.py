@@ -9,12 +9,19 @@ Advantages:
 - Serverless-friendly: Works in Lambda/containers
 - Same models: Supports bge-small, all-MiniLM, etc.
 
+Inference runs on the shared EmbeddingExecutor so it never blocks the event loop.
+
 Installation: pip install fastembed
 """
 
 import logging
 
+from conduit.core.exceptions import EmbeddingBackpressureError
 from conduit.engines.embeddings.base import EmbeddingProvider
+from conduit.engines.embeddings.executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,7 @@ class FastEmbedProvider(EmbeddingProvider):
         self,
         model: str = "BAAI/bge-small-en-v1.5",
         cache_dir: str | None = None,
+        executor: EmbeddingExecutor | None = None,
     ):
         """Initialize FastEmbed provider.
 
@@ -39,6 +47,7 @@ class FastEmbedProvider(EmbeddingProvider):
             model: FastEmbed model identifier
                    Options: "BAAI/bge-small-en-v1.5", "sentence-transformers/all-MiniLM-L6-v2"
             cache_dir: Optional cache directory for model files
+            executor: Execution pool for inference (default: shared executor)
 
         Raises:
             ImportError: If fastembed not installed
@@ -58,6 +67,7 @@ class FastEmbedProvider(EmbeddingProvider):
             ) from e
 
         self.model_name = model
+        self.executor = executor or get_embedding_executor()
         self._dimension = self._get_dimension_for_model(model)
 
         try:
@@ -122,6 +132,7 @@ class FastEmbedProvider(EmbeddingProvider):
             List of embedding vectors
 
         Raises:
+            EmbeddingBackpressureError: If the embedding executor is saturated
             RuntimeError: If embedding generation fails
 
         Note:
@@ -131,17 +142,20 @@ class FastEmbedProvider(EmbeddingProvider):
             return []
 
         try:
-            # FastEmbed returns generator of numpy arrays
-            # Convert to list of lists
-            embeddings_generator = self.model.embed(texts)
-            embeddings = [emb.tolist() for emb in embeddings_generator]
-
-            return embeddings
+            return await self.executor.run(self._embed_sync, texts)
 
+        except EmbeddingBackpressureError:
+            raise
         except Exception as e:
             logger.error(f"FastEmbed embedding failed: {e}")
             raise RuntimeError(f"FastEmbed embedding generation failed: {e}") from e
 
+    def _embed_sync(self, texts: list[str]) -> list[list[float]]:
+        """Run FastEmbed inference (blocking; called on executor thread)."""
+        # FastEmbed returns a lazy generator of numpy arrays, so consume it
+        # here rather than on the event loop
+        return [emb.tolist() for emb in self.model.embed(texts)]
+
     @property
     def dimension(self) -> int:
         """Get embedding dimension."""
@@ -1,9 +1,13 @@
 """Sentence-transformers embedding provider (optional, for offline use)."""
 
-import asyncio
 import logging
 
+from conduit.core.exceptions import EmbeddingBackpressureError
 from conduit.engines.embeddings.base import EmbeddingProvider
+from conduit.engines.embeddings.executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +31,13 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
     def __init__(
         self,
         model: str = "all-MiniLM-L6-v2",
+        executor: EmbeddingExecutor | None = None,
     ):
         """Initialize sentence-transformers embedding provider.
 
         Args:
             model: HuggingFace model identifier (default: all-MiniLM-L6-v2)
+            executor: Execution pool for inference (default: shared executor)
 
         Raises:
             ImportError: If sentence-transformers package not installed
@@ -49,6 +55,7 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
             )
 
         self.model = model
+        self.executor = executor or get_embedding_executor()
         self.embedder = SentenceTransformer(model)
 
         # Determine dimension based on model
@@ -91,14 +98,15 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
             List of embedding vectors
 
         Raises:
+            EmbeddingBackpressureError: If the embedding executor is saturated
             RuntimeError: If embedding generation fails
         """
         if not texts:
             return []
 
         try:
-            # Offload CPU work to thread pool to avoid blocking event loop
-            embeddings = await asyncio.to_thread(self.embedder.encode, texts)
+            # Offload CPU work to the bounded embedding pool
+            embeddings = await self.executor.run(self.embedder.encode, texts)
 
             # Convert numpy arrays to lists
             result: list[list[float]] = []
@@ -110,6 +118,8 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
 
             return result
 
+        except EmbeddingBackpressureError:
+            raise
         except Exception as e:
             logger.error(f"Sentence-transformers embedding error: {e}")
             raise RuntimeError(f"Sentence-transformers embedding failed: {e}") from e
@@ -17,7 +17,7 @@ import warnings
 from typing import TYPE_CHECKING, Any
 
 from conduit.core.models import Query, QueryFeatures, RoutingDecision
-from conduit.core.state_store import HybridRouterState, RouterPhase
+from conduit.core.state_store import HybridRouterState, RouterPhase, StateDelta
 from conduit.engines.analyzer import QueryAnalyzer
 from conduit.engines.bandits import (
     AlwaysBestBaseline,
@@ -150,6 +150,8 @@ class HybridRouter:
         self.models = models
         self.switch_threshold = switch_threshold
         self.query_count = 0
+        # Last delta log seq reflected in memory (incremental checkpoints)
+        self.delta_seq = 0
         self.phase1_algorithm = phase1_algorithm
         self.phase2_algorithm = phase2_algorithm
 
@@ -417,18 +419,23 @@ class HybridRouter:
                 complexity_score=0.5,
                 query_text=query.text,
             )
-            arm = await self.phase1_bandit.select_arm(dummy_features)
+            # One scoring pass serves selection, confidence and the audit trail
+            selection = await self.phase1_bandit.select_arm_with_scores(
+                dummy_features
+            )
+            arm, pulls = selection.arm, selection.arm_pulls
 
             # If selected arm not in available set, pick best available arm
             if arm.model_id not in available_arm_ids:
                 arm = self._select_best_available_arm(available_arms)
+                pulls = self.phase1_bandit.get_arm_pulls(arm.model_id)
                 logger.debug(
                     f"Bandit selection {arm.model_id} not in available arms, "
                     f"using best available: {arm.model_id}"
                 )
 
             # Calculate confidence based on pull count
-            confidence = self._calculate_phase1_confidence(arm.model_id)
+            confidence = self._calculate_phase1_confidence(pulls)
 
             return RoutingDecision(
                 query_id=query.id,
@@ -443,6 +450,7 @@ class HybridRouter:
                     "phase": self.phase1_algorithm,
                     "query_count": self.query_count,
                     "switch_threshold": self.switch_threshold,
+                    "arm_scores": selection.scores,
                 },
             )
         else:
@@ -453,13 +461,15 @@ class HybridRouter:
             # The analyzer already logged the warning and returned zero vector,
             # so we silently fall back to non-contextual routing
             if features.embedding_failed:
-                arm = await self.phase1_bandit.select_arm(features)
+                selection = await self.phase1_bandit.select_arm_with_scores(features)
+                arm, pulls = selection.arm, selection.arm_pulls
 
                 # If selected arm not in available set, pick best available arm
                 if arm.model_id not in available_arm_ids:
                     arm = self._select_best_available_arm(available_arms)
+                    pulls = self.phase1_bandit.get_arm_pulls(arm.model_id)
 
-                confidence = self._calculate_phase1_confidence(arm.model_id)
+                confidence = self._calculate_phase1_confidence(pulls)
 
                 return RoutingDecision(
                     query_id=query.id,
@@ -475,21 +485,24 @@ class HybridRouter:
                         "query_count": self.query_count,
                         "embedding_failed": True,
                         "fallback_reason": "embedding_generation_failed",
+                        "arm_scores": selection.scores,
                     },
                 )
 
-            arm = await self.phase2_bandit.select_arm(features)
+            selection = await self.phase2_bandit.select_arm_with_scores(features)
+            arm, pulls = selection.arm, selection.arm_pulls
 
             # If selected arm not in available set, pick best available arm
             if arm.model_id not in available_arm_ids:
                 arm = self._select_best_available_arm(available_arms)
+                pulls = self.phase2_bandit.get_arm_pulls(arm.model_id)
                 logger.debug(
                     f"Bandit selection not in available arms, "
                     f"using best available: {arm.model_id}"
                 )
 
             # Calculate confidence based on pull count
-            confidence = self._calculate_phase2_confidence(arm.model_id)
+            confidence = self._calculate_phase2_confidence(pulls)
 
             return RoutingDecision(
                 query_id=query.id,
@@ -505,6 +518,7 @@ class HybridRouter:
                     "query_count": self.query_count,
                     "queries_since_transition": self.query_count
                     - self.switch_threshold,
+                    "arm_scores": selection.scores,
                 },
             )
 
@@ -538,6 +552,113 @@ class HybridRouter:
                 raise ValueError(f"Features required for {algorithm_display} update")
             await self.phase2_bandit.update(feedback, features)
 
+    async def update_batch(
+        self, batch: list[tuple[BanditFeedback, QueryFeatures | None]]
+    ) -> None:
+        """Update current bandit with a batch of feedback in one call.
+
+        Equivalent to calling update() for each pair in order, but lets the
+        bandit apply the batch natively (see BanditAlgorithm.update_batch).
+
+        Args:
+            batch: (feedback, features) pairs in arrival order (features
+                required for phase2 contextual, ignored for phase1)
+
+        Raises:
+            ValueError: If in phase2 but any features are missing, or any
+                model_id is unknown (nothing is applied in either case)
+        """
+        if self.current_phase == self.phase1_algorithm:
+            # Phase 1 (non-contextual) doesn't use features
+            dummy_features = QueryFeatures(
+                embedding=[0.0] * 384,
+                token_count=0,
+                complexity_score=0.5,
+                query_text=None,
+            )
+            await self.phase1_bandit.update_batch(
+                [(feedback, dummy_features) for feedback, _ in batch]
+            )
+            return
+
+        # Phase 2 (contextual) requires features
+        contextual_batch: list[tuple[BanditFeedback, QueryFeatures]] = []
+        for feedback, features in batch:
+            if features is None:
+                algorithm_display = ALGORITHM_DISPLAY_NAMES.get(
+                    self.phase2_algorithm, self.phase2_algorithm
+                )
+                raise ValueError(f"Features required for {algorithm_display} update")
+            contextual_batch.append((feedback, features))
+        await self.phase2_bandit.update_batch(contextual_batch)
+
+    def to_state_delta(
+        self, feedback: BanditFeedback, features: QueryFeatures | None = None
+    ) -> StateDelta:
+        """Capture one update as an O(d) StateDelta for incremental checkpoints.
+
+        Call alongside update() with the same arguments. Phase1 deltas omit
+        the embedding (non-contextual bandits ignore features).
+
+        Args:
+            feedback: Feedback passed to update()
+            features: Query features passed to update()
+
+        Returns:
+            StateDelta replayable with apply_state_delta()
+        """
+        in_phase1 = self.current_phase == self.phase1_algorithm
+        contextual = not in_phase1 and features is not None
+        return StateDelta(
+            phase=RouterPhase.UCB1 if in_phase1 else RouterPhase.LINUCB,
+            query_count=self.query_count,
+            model_id=feedback.model_id,
+            cost=feedback.cost,
+            quality_score=feedback.quality_score,
+            latency=feedback.latency,
+            success=feedback.success,
+            confidence=feedback.confidence,
+            reward_weights=feedback.reward_weights,
+            embedding=features.embedding_array if contextual else None,
+            token_count=features.token_count if contextual else 0,
+            complexity_score=features.complexity_score if contextual else 0.5,
+        )
+
+    async def apply_state_delta(self, delta: StateDelta) -> None:
+        """Replay a logged StateDelta on top of a restored snapshot.
+
+        Restores query_count, performs the phase transition if the delta was
+        recorded after it, then re-runs the bandit update.
+
+        Args:
+            delta: Delta from StateStore.load_state_deltas()
+        """
+        self.query_count = max(self.query_count, delta.query_count)
+        if (
+            delta.phase == RouterPhase.LINUCB
+            and self.current_phase == self.phase1_algorithm
+        ):
+            await self._transition_to_phase2()
+
+        feedback = BanditFeedback(
+            model_id=delta.model_id,
+            cost=delta.cost,
+            quality_score=delta.quality_score,
+            latency=delta.latency,
+            success=delta.success,
+            confidence=delta.confidence,
+            reward_weights=delta.reward_weights,
+        )
+        features = None
+        if delta.embedding is not None:
+            features = QueryFeatures(
+                embedding=delta.embedding,
+                token_count=delta.token_count,
+                complexity_score=delta.complexity_score,
+            )
+        await self.update(feedback, features)
+        self.delta_seq = max(self.delta_seq, delta.seq)
+
     async def _transition_to_phase2(self) -> None:
         """Transition from phase1 to phase2 with optimistic state conversion.
 
@@ -585,18 +706,15 @@ class HybridRouter:
             f"(knowledge transferred for {len(self.models)} models)"
         )
 
-    def _calculate_phase1_confidence(self, model_id: str) -> float:
+    def _calculate_phase1_confidence(self, pulls: int) -> float:
         """Calculate confidence for phase1 selection based on pull count.
 
         Args:
-            model_id: Selected model ID
+            pulls: Feedback count of the selected arm
 
         Returns:
             Confidence score (0.0-1.0) based on number of pulls
         """
-        stats = self.phase1_bandit.get_stats()
-        pulls = stats["arm_pulls"].get(model_id, 0)
-
         # Calculate pull-based confidence
         if pulls == 0:
             return 0.1
@@ -605,18 +723,15 @@ class HybridRouter:
 
             return min(0.95, 0.1 + 0.25 * math.log10(pulls + 1))
 
-    def _calculate_phase2_confidence(self, model_id: str) -> float:
+    def _calculate_phase2_confidence(self, pulls: int) -> float:
         """Calculate confidence for phase2 selection based on pull count.
 
         Args:
-            model_id: Selected model ID
+            pulls: Feedback count of the selected arm
 
         Returns:
             Confidence score (0.0-1.0) based on number of pulls
         """
-        stats = self.phase2_bandit.get_stats()
-        pulls = stats["arm_pulls"].get(model_id, 0)
-
         # Calculate pull-based confidence
         # Converges slower (1000 pulls → 0.99) than phase1
         return min(0.99, pulls / 1000.0) if pulls > 0 else 0.1
@@ -753,6 +868,7 @@ class HybridRouter:
             # Backward compatibility: also populate old fields
             ucb1_state=phase1_bandit_state,
             linucb_state=phase2_bandit_state,
+            delta_seq=self.delta_seq,
         )
 
     def from_state(
@@ -790,6 +906,7 @@ class HybridRouter:
         from conduit.engines.bandits.state_conversion import convert_bandit_state
 
         self.query_count = state.query_count
+        self.delta_seq = state.delta_seq
 
         # Get saved algorithm identifiers (with backward compatibility)
         saved_phase1_algo = getattr(state, "phase1_algorithm", "ucb1")
@@ -944,6 +1061,9 @@ class HybridRouter:
     ) -> bool:
         """Load state from storage if available with optional conversion.
 
+        Restores the latest snapshot, then replays any StateDeltas the store
+        logged after it (incremental checkpoints).
+
         Args:
             store: StateStore implementation
             router_id: Unique identifier for this router instance
@@ -975,10 +1095,20 @@ class HybridRouter:
             ...     print("Starting fresh")
         """
         state = await store.load_hybrid_router_state(router_id)
-        if state is None:
+        if state is not None:
+            self.from_state(state, allow_conversion=allow_conversion)
+
+        # Replay incremental checkpoint deltas logged after the snapshot
+        deltas = await store.load_state_deltas(router_id, after_seq=self.delta_seq)
+        for delta in deltas:
+            await self.apply_state_delta(delta)
+
+        if state is None and not deltas:
             logger.info(f"No saved state found for {router_id}")
             return False
 
-        self.from_state(state, allow_conversion=allow_conversion)
-        logger.info(f"Loaded HybridRouter state for {router_id}")
+        logger.info(
+            f"Loaded HybridRouter state for {router_id} "
+            f"(replayed {len(deltas)} deltas)"
+        )
         return True
@@ -1,8 +1,9 @@
 """Routing engine for ML-powered model selection."""
 
+import asyncio
 import os
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from conduit.cache import CacheConfig, CacheService
 from conduit.core.config import (
@@ -15,13 +16,18 @@ from conduit.core.models import (
     QueryFeatures,
     RoutingDecision,
 )
+from conduit.core.state_persister import WriteBehindPersister
+from conduit.core.state_store import RouterPhase, StateStoreError
 from conduit.engines.analyzer import QueryAnalyzer
 from conduit.engines.cost_filter import CostFilter
 from conduit.engines.hybrid_router import HybridRouter
+from conduit.engines.update_actor import BanditUpdateActor
+from conduit.observability.audit_pipeline import AuditPipeline
 from conduit.observability.logging import LogEvents, get_logger
 
 if TYPE_CHECKING:
-    from conduit.core.state_store import StateStore
+    from conduit.core.state_store import HybridRouterState, StateDelta, StateStore
+    from conduit.engines.bandits.base import BanditFeedback
     from conduit.engines.executor import ExecutionResult
     from conduit.observability.audit import AuditStore
 
@@ -101,6 +107,13 @@ class Router:
         auto_persist: bool = True,
         checkpoint_interval: int = 100,
         audit_store: "AuditStore | None" = None,
+        write_behind: bool | None = None,
+        flush_interval: float | None = None,
+        max_dirty_updates: int | None = None,
+        checkpoint_mode: Literal["full", "incremental"] | None = None,
+        compact_every: int | None = None,
+        sync_mode: Literal["overwrite", "merge"] | None = None,
+        audit_buffered: bool | None = None,
     ):
         """Initialize router with default components.
 
@@ -138,6 +151,33 @@ class Router:
             audit_store: AuditStore for decision audit logging (PostgresAuditStore recommended).
                 If None, audit logging is disabled. Audit logs capture detailed decision
                 context for compliance, debugging, and analysis.
+            write_behind: If True, update() only marks state dirty and a background
+                WriteBehindPersister coalesces writes. If False, update() awaits a
+                full save. If None, uses settings.state_write_behind (True).
+            flush_interval: Max seconds dirty state waits for a background flush.
+                If None, uses settings.state_flush_interval (1.0).
+            max_dirty_updates: Pending updates that trigger an early flush.
+                If None, uses settings.state_max_dirty_updates (100).
+            checkpoint_mode: "full" rewrites the whole state on every write.
+                "incremental" appends one O(d) StateDelta per update() to the
+                store's delta log and writes a full snapshot every
+                compact_every deltas (and on close()). Requires a store with
+                supports_state_deltas (PostgresStateStore). If None, uses
+                settings.state_checkpoint_mode ("full").
+            compact_every: Logged deltas that trigger a full snapshot in
+                incremental mode. If None, uses settings.state_compact_every (1000).
+            sync_mode: "overwrite" saves this replica's full state (replicas
+                sharing a router_id replace each other's learning). "merge"
+                publishes the learning since the last sync and adopts the
+                merged result, so replicas pool their feedback (see
+                conduit.core.state_merge). If None, uses settings.state_sync_mode
+                ("overwrite"). Not combinable with checkpoint_mode="incremental".
+            audit_buffered: If True, route() only queues audit entries and a
+                background AuditPipeline writes them in batches (sized by the
+                audit_* settings; overflow drops or blocks per
+                settings.audit_overflow). If False, route() awaits
+                log_decision() per decision. If None, uses
+                settings.audit_buffered (True).
 
         Example with persistence:
             >>> from conduit.core.database import Database
@@ -154,7 +194,7 @@ class Router:
             ...     auto_persist=True,  # Auto-save after updates
             ... )
             >>> # Router auto-loads from saved state on initialization
-            >>> # Saves after every update() call
+            >>> # Flushes updates in the background (write-behind)
             >>> # Saves final state on close()
         """
         # Use default models if not specified (auto-detect from API keys)
@@ -175,6 +215,11 @@ class Router:
                 timeout=settings.redis_timeout,
                 circuit_breaker_threshold=settings.redis_circuit_breaker_threshold,
                 circuit_breaker_timeout=settings.redis_circuit_breaker_timeout,
+                l1_enabled=settings.cache_l1_enabled,
+                l1_max_entries=settings.cache_l1_max_entries,
+                l1_max_bytes=settings.cache_l1_max_bytes,
+                l1_ttl=settings.cache_l1_ttl,
+                encoding=settings.cache_encoding,
             )
             cache_service = CacheService(cache_config)
             logger.info("router_cache_enabled", redis_url=settings.redis_url)
@@ -326,6 +371,88 @@ class Router:
         self.checkpoint_interval = checkpoint_interval
         self._state_loaded = False
 
+        # Write-behind persistence: update() marks dirty, flushes run off-path
+        if write_behind is None:
+            write_behind = settings.state_write_behind
+        self._persister: WriteBehindPersister | None = None
+        if self.auto_persist and write_behind:
+            self._persister = WriteBehindPersister(
+                self._write_state,
+                flush_interval=(
+                    flush_interval
+                    if flush_interval is not None
+                    else settings.state_flush_interval
+                ),
+                max_dirty_updates=(
+                    max_dirty_updates
+                    if max_dirty_updates is not None
+                    else settings.state_max_dirty_updates
+                ),
+                name=router_id,
+            )
+
+        # Incremental checkpoints: log per-update deltas, snapshot periodically
+        if checkpoint_mode is None:
+            checkpoint_mode = settings.state_checkpoint_mode
+        if checkpoint_mode not in ("full", "incremental"):
+            raise ValueError(
+                f"Unknown checkpoint_mode: {checkpoint_mode}. "
+                "Supported: full, incremental"
+            )
+        if (
+            checkpoint_mode == "incremental"
+            and state_store is not None
+            and not state_store.supports_state_deltas
+        ):
+            raise ValueError(
+                f"{type(state_store).__name__} does not support incremental "
+                "checkpoints; use checkpoint_mode='full'"
+            )
+        self.checkpoint_mode = checkpoint_mode
+        if compact_every is None:
+            compact_every = settings.state_compact_every
+        if compact_every < 1:
+            raise ValueError(f"compact_every must be >= 1, got {compact_every}")
+        self.compact_every = compact_every
+        self._pending_deltas: list[StateDelta] = []
+        self._deltas_since_snapshot = 0
+        self._snapshot_requested = False
+        # Serializes delta appends, snapshots and merges
+        self._state_lock = asyncio.Lock()
+
+        # Multi-replica sync: merge learning deltas instead of overwriting
+        if sync_mode is None:
+            sync_mode = settings.state_sync_mode
+        if sync_mode not in ("overwrite", "merge"):
+            raise ValueError(
+                f"Unknown sync_mode: {sync_mode}. Supported: overwrite, merge"
+            )
+        if sync_mode == "merge" and checkpoint_mode == "incremental":
+            raise ValueError(
+                "sync_mode='merge' cannot be combined with "
+                "checkpoint_mode='incremental'"
+            )
+        self.sync_mode = sync_mode
+        # Shared state as of our last sync (fresh priors until the first one)
+        self._sync_base: HybridRouterState | None = (
+            self.hybrid_router.to_state() if sync_mode == "merge" else None
+        )
+        self._local_changes = 0
+        # Updates applied while a merge is in flight, replayed onto its result
+        self._merge_replay: (
+            list[tuple["BanditFeedback", QueryFeatures | None]] | None
+        ) = None
+
+        # Single writer for bandit state: updates are applied in order on the
+        # routing loop, each within one loop step, so selection never sees a
+        # partial update and a feedback burst cannot stall routing
+        self._update_actor = BanditUpdateActor(
+            self._apply_update,
+            max_pending=settings.bandit_update_queue_size,
+            time_slice_ms=settings.bandit_update_time_slice_ms,
+            name=self.router_id,
+        )
+
         # Auto-load saved state if available
         if self.state_store and self.auto_persist:
             # Schedule async state loading
@@ -334,6 +461,9 @@ class Router:
                 "state_persistence_enabled",
                 router_id=router_id,
                 checkpoint_interval=checkpoint_interval,
+                write_behind=self._persister is not None,
+                checkpoint_mode=checkpoint_mode,
+                sync_mode=sync_mode,
             )
 
         self.cache = cache_service
@@ -346,8 +476,19 @@ class Router:
 
         # Audit logging (optional)
         self.audit_store = audit_store
+        self._audit_pipeline: AuditPipeline | None = None
         if audit_store:
-            logger.info("audit_logging_enabled")
+            if audit_buffered is None:
+                audit_buffered = settings.audit_buffered
+            if audit_buffered:
+                self._audit_pipeline = AuditPipeline(
+                    audit_store,
+                    queue_size=settings.audit_queue_size,
+                    batch_size=settings.audit_batch_size,
+                    flush_interval=settings.audit_flush_interval,
+                    overflow=settings.audit_overflow,
+                )
+            logger.info("audit_logging_enabled", buffered=bool(audit_buffered))
 
         logger.info(
             LogEvents.ROUTER_INITIALIZED,
@@ -402,7 +543,8 @@ class Router:
             - MUST always return valid RoutingDecision (never None)
             - MUST select from available models only
             - MUST be thread-safe for concurrent calls
-            - MUST apply user preferences when provided
+            - MUST record user preferences in the decision (never mutates
+              the shared bandit reward weights)
 
         Performance:
             - Designed to be fast (typically completes quickly)
@@ -418,7 +560,9 @@ class Router:
         Routing Strategy:
             1. Cold start (queries < switch_threshold): UCB1 (fast, no context)
             2. Warm routing (queries >= switch_threshold): LinUCB (contextual)
-            3. User preferences: Applied as reward weight overrides
+            3. User preferences: The preset and its reward weights are stored
+               in decision.metadata ("preference", "reward_weights"); pass the
+               weights to update() so the feedback is scored with them
 
         Args:
             query: The query to route, including text and optional constraints.
@@ -439,12 +583,6 @@ class Router:
         if self.auto_persist and not self._state_loaded:
             await self._load_initial_state()
 
-        # Apply user preferences to reward weights
-        if query.preferences:
-            weights = load_preference_weights(query.preferences.optimize_for)
-            self.hybrid_router.ucb1.reward_weights = weights
-            self.hybrid_router.linucb.reward_weights = weights
-
         # Apply cost budget filtering if max_cost constraint is set
         available_arms = None
         constraints_relaxed = False
@@ -467,6 +605,15 @@ class Router:
         # Route query with filtered arms
         decision = await self.hybrid_router.route(query, available_arms=available_arms)
 
+        # Per-request reward context: recorded on the decision instead of
+        # written to the shared bandits, so concurrent requests cannot leak
+        # weights into each other's updates
+        if query.preferences:
+            decision.metadata["preference"] = query.preferences.optimize_for
+            decision.metadata["reward_weights"] = load_preference_weights(
+                query.preferences.optimize_for
+            )
+
         # Add cost constraint metadata to decision if constraints were applied
         if query.constraints and query.constraints.max_cost is not None:
             decision.metadata["max_cost_budget"] = query.constraints.max_cost
@@ -476,11 +623,16 @@ class Router:
                     "No models within budget, using cheapest available"
                 )
 
-        # Periodic checkpoint
-        if (
+        # Routing advances query_count; let the next interval flush pick it up
+        # (only bandit updates count toward an early flush)
+        self._local_changes += 1
+        if self._persister is not None:
+            self._persister.mark_stale()
+        elif (
             self.auto_persist
             and self.hybrid_router.query_count % self.checkpoint_interval == 0
         ):
+            # Periodic checkpoint without write-behind
             await self._save_state()
 
         # Audit logging (non-blocking, errors don't affect routing)
@@ -493,11 +645,14 @@ class Router:
         """Get cache performance statistics.
 
         Returns:
-            Dictionary with cache stats or None if caching disabled
+            Dictionary with cache stats or None if caching disabled.
+            hits/misses/hit_rate cover both tiers; l1_* keys report the
+            in-process tier separately.
 
         Example:
             >>> stats = router.get_cache_stats()
             >>> print(f"Hit rate: {stats['hit_rate']:.1f}%")
+            >>> print(f"L1 hit rate: {stats['l1_hit_rate']:.1f}%")
         """
         if not self.cache:
             return None
@@ -509,6 +664,11 @@ class Router:
             "errors": stats.errors,
             "hit_rate": stats.hit_rate,
             "circuit_state": stats.circuit_state,
+            "l1_hits": stats.l1_hits,
+            "l1_misses": stats.l1_misses,
+            "l1_hit_rate": stats.l1_hit_rate,
+            "l1_size": stats.l1_size,
+            "l1_evictions": stats.l1_evictions,
         }
 
     async def clear_cache(self) -> None:
@@ -529,17 +689,28 @@ class Router:
         latency: float,
         features: QueryFeatures,
         confidence: float = 1.0,
+        reward_weights: dict[str, float] | None = None,
     ) -> None:
         """Update bandit weights with feedback from model execution.
 
-        This method wraps HybridRouter.update() and adds automatic state persistence.
-        State is saved after every update when auto_persist=True (recommended).
-
-        Why save on every update?
-        - Updates are when weights actually change (A matrices, b vectors)
-        - Database write (~1-5ms) is negligible vs LLM call (~500ms+)
-        - Never lose more than 1 query of learning if crash occurs
-        - Async write doesn't block routing
+        This method wraps HybridRouter.update() and adds automatic state persistence
+        when auto_persist=True (recommended).
+
+        Updates go through a single-writer BanditUpdateActor: they are applied
+        in submission order on the router's event loop (calls from another
+        thread or loop are handed over to it) and this method returns once
+        the update has been applied.
+
+        Persistence modes:
+        - write_behind=True (default): the update only marks state dirty; a
+          background flush writes coalesced state every flush_interval seconds
+          or max_dirty_updates updates. Feedback throughput is not capped by
+          database write latency; a crash loses at most one flush window.
+        - write_behind=False: every update awaits a full state save. Never loses
+          more than 1 query of learning, at the cost of one write per feedback.
+        - checkpoint_mode="incremental": each write appends the updates'
+          O(d) observations to the delta log instead of the O(K·d²) state,
+          so write_behind=False (per-feedback durability) stays cheap.
 
         Confidence-Weighted Updates:
             The confidence parameter controls how strongly this feedback affects
@@ -559,6 +730,9 @@ class Router:
             features: Query features from the routing decision (required for contextual learning)
             confidence: Confidence in this feedback (0.0-1.0). Default: 1.0.
                 Lower values cause softer bandit updates.
+            reward_weights: Reward weights for this feedback only, normally
+                decision.metadata["reward_weights"] (the query's preference
+                preset). None uses the router's configured weights.
 
         Example:
             >>> decision = await router.route(query)
@@ -572,6 +746,7 @@ class Router:
             ...     latency=response.latency,
             ...     features=decision.features,
             ...     confidence=1.0,  # Explicit signal
+            ...     reward_weights=decision.metadata.get("reward_weights"),
             ... )
             >>>
             >>> # Implicit feedback (partial confidence)
@@ -593,20 +768,90 @@ class Router:
             quality_score=quality_score,
             latency=latency,
             confidence=confidence,
+            reward_weights=reward_weights,
         )
 
-        # Update hybrid router with real features (critical for contextual learning)
-        await self.hybrid_router.update(feedback, features)
+        # Applied by the update actor (the only writer of bandit state)
+        await self._update_actor.submit(feedback, features)
 
-        # Auto-save state after update (when weights change)
-        if self.auto_persist:
+        # Persist state after update (when weights change)
+        if self._persister is None and self.auto_persist:
             await self._save_state()
 
+    async def update_batch(
+        self, batch: list[tuple["BanditFeedback", QueryFeatures]]
+    ) -> None:
+        """Update bandit weights with a batch of feedback in one step.
+
+        Equivalent to calling update() for each pair in order, but the batch
+        is applied with one BanditAlgorithm.update_batch() call (rank-k
+        matrix updates, summed counts) and persisted with one write (or one
+        write-behind notification) instead of one per feedback. Use it for
+        delayed feedback that arrives in bulk.
+
+        The batch is validated as a whole: if any model_id is unknown, or
+        features are missing in phase2, nothing is applied.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order; each feedback
+                carries its own confidence and reward_weights
+
+        Raises:
+            ValueError: If any model_id is unknown or features are missing
+
+        Example:
+            >>> await router.update_batch(
+            ...     [
+            ...         (BanditFeedback(model_id=m1, ...), decision1.features),
+            ...         (BanditFeedback(model_id=m2, ...), decision2.features),
+            ...     ]
+            ... )
+        """
+        if not batch:
+            return
+
+        # Applied by the update actor (the only writer of bandit state)
+        await self._update_actor.submit_batch(list(batch))
+
+        if self._persister is None and self.auto_persist:
+            await self._save_state()
+
+    async def _apply_update(
+        self, batch: list[tuple["BanditFeedback", QueryFeatures | None]]
+    ) -> None:
+        """Apply a batch of updates to bandit state (runs on the update actor).
+
+        Must not suspend between the bandit update and the bookkeeping below,
+        so selection and snapshots see the batch entirely or not at all.
+
+        Args:
+            batch: (feedback, features) pairs to learn from
+        """
+        # Update hybrid router with real features (critical for contextual learning)
+        if len(batch) == 1:
+            await self.hybrid_router.update(*batch[0])
+        else:
+            await self.hybrid_router.update_batch(batch)
+        self._local_changes += len(batch)
+        if self._merge_replay is not None:
+            self._merge_replay.extend(batch)
+
+        # Incremental checkpoints persist the observations, not the matrices
+        if self.auto_persist and self.checkpoint_mode == "incremental":
+            self._pending_deltas.extend(
+                self.hybrid_router.to_state_delta(feedback, features)
+                for feedback, features in batch
+            )
+
+        if self._persister is not None:
+            self._persister.mark_dirty(len(batch))
+
     async def update_with_fallback_attribution(
         self,
         execution_result: "ExecutionResult",
         quality_score: float,
         features: QueryFeatures,
+        reward_weights: dict[str, float] | None = None,
     ) -> None:
         """Update bandit weights with proper attribution for fallback scenarios.
 
@@ -620,6 +865,7 @@ class Router:
             execution_result: Result from execute_with_fallback() with model tracking
             quality_score: Quality assessment of the response (0.0-1.0)
             features: Query features from the routing decision
+            reward_weights: Per-request reward weights, as in update()
 
         Example:
             >>> decision = await router.route(query)
@@ -642,6 +888,7 @@ class Router:
                 quality_score=0.0,  # Penalize unavailability
                 latency=0.0,  # No meaningful latency
                 features=features,
+                reward_weights=reward_weights,
             )
             logger.info("model_penalized", model_id=failed_model, quality_score=0.0)
 
@@ -652,6 +899,7 @@ class Router:
             quality_score=quality_score,
             latency=execution_result.response.latency,
             features=features,
+            reward_weights=reward_weights,
         )
 
         if execution_result.was_fallback:
@@ -676,6 +924,8 @@ class Router:
             )
 
             if loaded:
+                if self.sync_mode == "merge":
+                    self._sync_base = self.hybrid_router.to_state()
                 logger.info(
                     LogEvents.STATE_LOADED,
                     router_id=self.router_id,
@@ -700,13 +950,217 @@ class Router:
             )
             self._state_loaded = True  # Don't try again
 
+    def _require_state_store(self) -> "StateStore":
+        """Return the configured state store.
+
+        Raises:
+            StateStoreError: If the router has no state store
+        """
+        if self.state_store is None:
+            raise StateStoreError(
+                f"Router {self.router_id} has no state store configured"
+            )
+        return self.state_store
+
+    async def _write_state(self) -> int:
+        """Snapshot and write current state to the state store.
+
+        Returns:
+            Serialized bytes written, if the store reports them (else 0)
+
+        Raises:
+            StateStoreError: If no state store is configured
+            Exception: Whatever the state store raises
+        """
+        state_store = self._require_state_store()
+        before = getattr(state_store, "bytes_written", 0)
+        if self.sync_mode == "merge":
+            async with self._state_lock:
+                await self._write_merged()
+        elif self.checkpoint_mode == "incremental":
+            async with self._state_lock:
+                await self._write_incremental()
+        else:
+            await self.hybrid_router.save_state(state_store, self.router_id)
+        logger.debug(
+            LogEvents.STATE_PERSISTED,
+            router_id=self.router_id,
+            query_count=self.hybrid_router.query_count,
+        )
+        return int(getattr(state_store, "bytes_written", 0) - before)
+
+    async def _write_merged(self) -> None:
+        """Publish learning since the last sync and adopt the merged state.
+
+        Raises:
+            StateStoreError: If no state store is configured or the sync base
+                was never loaded
+            Exception: Whatever the state store raises (local state is kept,
+                so the next sync publishes the same learning again)
+        """
+        from conduit.core.state_merge import apply_router_delta, diff_router_state
+
+        state_store = self._require_state_store()
+        if self._sync_base is None:
+            raise StateStoreError(
+                f"Router {self.router_id} has no merge sync base (state not loaded)"
+            )
+        changes = self._local_changes
+        published = self.hybrid_router.to_state()
+        self._merge_replay = []
+        try:
+            merged = await state_store.merge_hybrid_router_state(
+                self.router_id,
+                diff_router_state(published, self._sync_base),
+                self._sync_base,
+            )
+        finally:
+            replay, self._merge_replay = self._merge_replay, None
+
+        # Keep updates and routes that landed while the merge was in flight
+        local_phase2 = (
+            self.hybrid_router.current_phase != self.hybrid_router.phase1_algorithm
+        )
+        if self._local_changes != changes and local_phase2 != (
+            merged.current_phase == RouterPhase.LINUCB
+        ):
+            # A phase transition during the merge: replayed updates would hit
+            # the wrong bandit, so merge the local delta instead (O(K·d³), rare)
+            self.hybrid_router.from_state(
+                apply_router_delta(
+                    merged,
+                    diff_router_state(self.hybrid_router.to_state(), published),
+                )
+            )
+        else:
+            # The store refreshed merged's factors, so this is O(K·d²), and
+            # each replayed update is an O(d²) rank-1 step
+            routed = self.hybrid_router.query_count - published.query_count
+            self.hybrid_router.from_state(merged)
+            self.hybrid_router.query_count += routed
+            if replay:
+                await self.hybrid_router.update_batch(replay)
+        self._sync_base = merged
+
+    async def _write_incremental(self) -> None:
+        """Append pending deltas, or write a snapshot once compaction is due.
+
+        Raises:
+            StateStoreError: If no state store is configured
+            Exception: Whatever the state store raises (deltas stay pending)
+        """
+        state_store = self._require_state_store()
+        logged = self._deltas_since_snapshot + len(self._pending_deltas)
+        if self._snapshot_requested or logged >= self.compact_every:
+            await self._write_snapshot()
+            return
+
+        if not self._pending_deltas:
+            return
+
+        deltas, self._pending_deltas = self._pending_deltas, []
+        try:
+            seq = await state_store.append_state_deltas(self.router_id, deltas)
+        except Exception:
+            self._pending_deltas[:0] = deltas
+            raise
+        self.hybrid_router.delta_seq = seq
+        self._deltas_since_snapshot += len(deltas)
+
+    async def _write_snapshot(self) -> None:
+        """Write a full snapshot and drop the delta log it covers.
+
+        Raises:
+            StateStoreError: If no state store is configured
+            Exception: If the snapshot save fails (deltas stay pending)
+        """
+        state_store = self._require_state_store()
+        # Taken together without an await: the snapshot already includes the
+        # pending (unlogged) deltas, so they must not be appended afterwards
+        state = self.hybrid_router.to_state()
+        deltas, self._pending_deltas = self._pending_deltas, []
+        try:
+            await state_store.save_hybrid_router_state(self.router_id, state)
+        except Exception:
+            self._pending_deltas[:0] = deltas
+            raise
+        self._deltas_since_snapshot = 0
+        self._snapshot_requested = False
+
+        if state.delta_seq:
+            try:
+                await state_store.compact_state_deltas(
+                    self.router_id, state.delta_seq
+                )
+            except Exception as e:
+                # Harmless: loads skip deltas with seq <= snapshot delta_seq
+                logger.warning(
+                    "state_delta_compaction_failed",
+                    router_id=self.router_id,
+                    error=str(e),
+                )
+
+    async def flush_state(self) -> None:
+        """Write current state now, waiting for any in-flight background flush.
+
+        Unlike the automatic saves, errors propagate to the caller. Used by
+        LifecycleManager for the final flush during graceful shutdown.
+
+        Raises:
+            Exception: If the state store write fails
+        """
+        if not self.state_store:
+            return
+
+        if self._persister is not None:
+            await self._persister.flush(force=True)
+        else:
+            await self._write_state()
+
+    def get_persistence_stats(self) -> dict[str, Any] | None:
+        """Get write-behind persistence statistics.
+
+        Returns:
+            WriteBehindPersister.get_stats() (pending_updates, flushes,
+            bytes_written, last_flush_lag_ms, ...), plus pending_deltas and
+            deltas_since_snapshot in incremental checkpoint mode, or None if
+            write-behind persistence is disabled.
+        """
+        if self._persister is None:
+            return None
+        stats = self._persister.get_stats()
+        if self.checkpoint_mode == "incremental":
+            stats["pending_deltas"] = len(self._pending_deltas)
+            stats["deltas_since_snapshot"] = self._deltas_since_snapshot
+        return stats
+
+    def get_update_stats(self) -> dict[str, Any]:
+        """Get bandit update actor statistics.
+
+        Returns:
+            BanditUpdateActor.get_stats() (queue_depth, applied, failed,
+            marshalled, max_apply_ms, ...)
+        """
+        return self._update_actor.get_stats()
+
+    def get_audit_stats(self) -> dict[str, Any] | None:
+        """Get buffered audit pipeline statistics.
+
+        Returns:
+            AuditPipeline.get_stats() (queue_depth, dropped, written,
+            batches, ...), or None if audit logging is disabled or unbuffered.
+        """
+        if self._audit_pipeline is None:
+            return None
+        return self._audit_pipeline.get_stats()
+
     async def _save_state(self) -> None:
         """Save current state to database.
 
         Called automatically:
-        - After every update() (when weights change)
-        - Periodically every N queries (checkpoint)
-        - On close() (graceful shutdown)
+        - After every update() when write_behind=False
+        - Periodically every N queries (checkpoint) when write_behind=False
+        - On close() when write_behind=False (graceful shutdown)
 
         Errors are logged but don't break routing.
         """
@@ -714,12 +1168,7 @@ class Router:
             return
 
         try:
-            await self.hybrid_router.save_state(self.state_store, self.router_id)
-            logger.debug(
-                LogEvents.STATE_PERSISTED,
-                router_id=self.router_id,
-                query_count=self.hybrid_router.query_count,
-            )
+            await self.flush_state()
 
         except Exception as e:
             logger.error(
@@ -735,6 +1184,7 @@ class Router:
         """Log routing decision to audit trail.
 
         Called automatically after every route() when audit_store is configured.
+        With buffered audit the entry is only queued for the AuditPipeline.
         Errors are logged but don't affect routing.
 
         Args:
@@ -748,14 +1198,18 @@ class Router:
         try:
             from conduit.observability.audit import create_audit_entry
 
-            # Get the active bandit to compute scores
-            if self.hybrid_router.current_phase == self.hybrid_router.phase1_algorithm:
-                active_bandit = self.hybrid_router.phase1_bandit
-            else:
-                active_bandit = self.hybrid_router.phase2_bandit
-
-            # Compute arm scores for audit context
-            arm_scores = active_bandit.compute_scores(decision.features)
+            # Reuse the scores computed during selection; rescore only for
+            # decisions that did not come from HybridRouter.route()
+            arm_scores = decision.metadata.get("arm_scores")
+            if arm_scores is None:
+                if (
+                    self.hybrid_router.current_phase
+                    == self.hybrid_router.phase1_algorithm
+                ):
+                    active_bandit = self.hybrid_router.phase1_bandit
+                else:
+                    active_bandit = self.hybrid_router.phase2_bandit
+                arm_scores = active_bandit.compute_scores(decision.features)
 
             # Build constraints metadata
             constraints_applied: dict[str, Any] = {}
@@ -776,8 +1230,11 @@ class Router:
                 constraints_applied=constraints_applied,
             )
 
-            await self.audit_store.log_decision(entry)
-            logger.debug("audit_entry_logged", decision_id=decision.id)
+            if self._audit_pipeline is not None:
+                await self._audit_pipeline.submit(entry)
+            else:
+                await self.audit_store.log_decision(entry)
+                logger.debug("audit_entry_logged", decision_id=decision.id)
 
         except Exception as e:
             logger.error(
@@ -790,13 +1247,42 @@ class Router:
     async def close(self) -> None:
         """Close resources gracefully (Redis connection, etc.).
 
-        Saves final state if persistence is enabled.
+        Saves final state if persistence is enabled and writes any queued
+        audit entries. With write-behind persistence, stops the background
+        flush task and writes any pending updates. In incremental checkpoint
+        mode the final write is a full snapshot, so the next start replays no
+        deltas.
         """
+        if self.checkpoint_mode == "incremental":
+            self._snapshot_requested = True
+
+        # Apply queued updates so the final save includes them
+        await self._update_actor.close()
+
         # Save final state before shutdown
-        if self.auto_persist:
+        if self._persister is not None:
+            logger.info("router_shutdown_saving_state", router_id=self.router_id)
+            try:
+                await self._persister.close()
+                if self._snapshot_requested:
+                    # Nothing was pending, so close() wrote nothing: still
+                    # snapshot to compact the delta log
+                    await self._persister.flush(force=True)
+            except Exception as e:
+                logger.error(
+                    LogEvents.PERSISTENCE_FAILED,
+                    router_id=self.router_id,
+                    error=str(e),
+                    action="shutdown_continues",
+                )
+        elif self.auto_persist:
             logger.info("router_shutdown_saving_state", router_id=self.router_id)
             await self._save_state()
 
+        # Write queued audit entries
+        if self._audit_pipeline is not None:
+            await self._audit_pipeline.close()
+
         # Close cache connection
         if self.cache:
             await self.cache.close()
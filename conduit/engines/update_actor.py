@@ -0,0 +1,249 @@
+"""Single-writer actor for bandit updates.
+
+Bandit state (LinUCB A_inv stacks, contextual Thompson Cholesky factors,
+Beta parameters) is mutated in place by update() and read by select_arm().
+Both are synchronous numpy code behind an async signature, so on one event
+loop an update can never interleave with a selection. The hazards are
+elsewhere:
+    - A burst of feedback applied by one coroutine (collector batches,
+      session propagation) runs back to back without yielding, so routing
+      stalls for the whole burst
+    - Feedback arriving from another thread or event loop (framework
+      callbacks, sync wrappers) mutates the matrices while the routing loop
+      reads them, and selection can see a half-applied Sherman-Morrison update
+
+BanditUpdateActor makes the router's event loop the only writer:
+    1. submit() queues (feedback, features) on a bounded FIFO queue and waits
+       for the result; a full queue applies backpressure, feedback is never
+       dropped. submit_batch() queues a whole list as one item, applied with
+       a single apply_fn call (bandits fold it in with update_batch())
+    2. One background task applies queued items in order, each in a single
+       loop step (so selection observes either none or all of it), and yields
+       to the loop once it has run for time_slice_ms (so selection waits at
+       most one time slice plus one item)
+    3. Submissions from a different event loop or thread are marshalled to
+       the owning loop with run_coroutine_threadsafe
+    4. close() applies everything still queued
+
+Errors raised by an update (unknown model_id, missing features) propagate to
+the submitting caller.
+
+Example:
+    >>> actor = BanditUpdateActor(apply_fn)
+    >>> await actor.submit(feedback, features)  # returns once applied
+    >>> actor.get_stats()["applied"]
+    1
+    >>> await actor.close()
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from conduit.core.models import QueryFeatures
+    from conduit.engines.bandits.base import BanditFeedback
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_TIME_SLICE_MS = 1.0
+
+UpdateBatch = list[tuple["BanditFeedback", "QueryFeatures | None"]]
+UpdateFn = Callable[[UpdateBatch], Awaitable[None]]
+# (batch, result future, enqueue time)
+_QueuedUpdate = tuple[UpdateBatch, "asyncio.Future[None]", float]
+
+
+class BanditUpdateActor:
+    """Applies bandit updates one batch at a time on the owning event loop.
+
+    The owning loop is the one running the first submit(); the router's
+    route() calls must run on that loop too.
+
+    Attributes:
+        max_pending: Queued submissions before submit() waits for space
+        time_slice_ms: Longest run of back-to-back updates before yielding
+        name: Label for logs (e.g. router_id)
+    """
+
+    def __init__(
+        self,
+        apply_fn: UpdateFn,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        time_slice_ms: float = DEFAULT_TIME_SLICE_MS,
+        name: str = "router",
+    ):
+        """Initialize actor.
+
+        Args:
+            apply_fn: Coroutine function applying one batch of
+                (feedback, features) pairs. Must not suspend while bandit
+                state is half-updated.
+            max_pending: Queued submissions before submit() waits for space
+            time_slice_ms: Yield to the loop after applying updates for this
+                long (0 yields after every submission)
+            name: Label for logs
+
+        Raises:
+            ValueError: If max_pending < 1 or time_slice_ms < 0
+        """
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+        if time_slice_ms < 0:
+            raise ValueError(f"time_slice_ms must be >= 0, got {time_slice_ms}")
+
+        self._apply_fn = apply_fn
+        self.max_pending = max_pending
+        self.time_slice_ms = time_slice_ms
+        self.name = name
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: "asyncio.Queue[_QueuedUpdate] | None" = None
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._submitted = 0
+        self._applied = 0
+        self._batches = 0
+        self._failed = 0
+        self._marshalled = 0
+        self._max_queue_depth = 0
+        self._last_apply_ms = 0.0
+        self._max_apply_ms = 0.0
+        self._last_queue_wait_ms = 0.0
+
+    async def submit(
+        self, feedback: "BanditFeedback", features: "QueryFeatures | None"
+    ) -> None:
+        """Queue an update and wait until it has been applied.
+
+        Args:
+            feedback: Feedback to apply
+            features: Query features for the update
+
+        Raises:
+            RuntimeError: If the actor is closed
+            Exception: Whatever apply_fn raises for this update
+        """
+        await self.submit_batch([(feedback, features)])
+
+    async def submit_batch(self, batch: UpdateBatch) -> None:
+        """Queue a batch of updates and wait until it has been applied.
+
+        The batch is applied with one apply_fn call, in one loop step.
+
+        Args:
+            batch: (feedback, features) pairs in arrival order
+
+        Raises:
+            RuntimeError: If the actor is closed
+            Exception: Whatever apply_fn raises for this batch (the whole
+                batch fails together)
+        """
+        if not batch:
+            return
+        running = asyncio.get_running_loop()
+        if self._loop is None or (
+            # Owning loop has stopped (e.g. a previous asyncio.run()): adopt
+            # the current one; nothing can be queued on a stopped loop
+            running is not self._loop and not self._loop.is_running()
+        ):
+            self._loop = running
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = None
+
+        if running is not self._loop:
+            # Another thread/loop: hand the update to the owning loop
+            self._marshalled += 1
+            future = asyncio.run_coroutine_threadsafe(
+                self._submit_local(batch), self._loop
+            )
+            await asyncio.wrap_future(future)
+            return
+
+        await self._submit_local(batch)
+
+    async def _submit_local(self, batch: UpdateBatch) -> None:
+        """Enqueue on the owning loop and await the update's result."""
+        if self._closed:
+            raise RuntimeError(f"Update actor for {self.name} is closed")
+        assert self._loop is not None and self._queue is not None
+
+        done: asyncio.Future[None] = self._loop.create_future()
+        await self._queue.put((batch, done, time.monotonic()))
+        self._submitted += len(batch)
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+        await done
+
+    async def _run(self) -> None:
+        """Background loop: apply queued batches in order, exit when idle."""
+        assert self._queue is not None
+        slice_start = time.monotonic()
+        while not self._queue.empty():
+            batch, done, enqueued_at = self._queue.get_nowait()
+            start = time.monotonic()
+            try:
+                await self._apply_fn(batch)
+            except Exception as e:
+                self._failed += len(batch)
+                if not done.done():
+                    done.set_exception(e)
+                else:
+                    logger.error(f"Bandit update failed for {self.name}: {e}")
+            else:
+                self._applied += len(batch)
+                self._batches += 1
+                if not done.done():
+                    done.set_result(None)
+
+            end = time.monotonic()
+            self._last_apply_ms = (end - start) * 1000
+            self._max_apply_ms = max(self._max_apply_ms, self._last_apply_ms)
+            self._last_queue_wait_ms = (start - enqueued_at) * 1000
+
+            # Let pending selections run once the time slice is used up
+            if (end - slice_start) * 1000 >= self.time_slice_ms:
+                await asyncio.sleep(0)
+                slice_start = time.monotonic()
+
+    async def drain(self) -> None:
+        """Wait until every queued update has been applied."""
+        if self._task is not None and self._loop is asyncio.get_running_loop():
+            await self._task
+
+    async def close(self) -> None:
+        """Reject new updates and apply everything still queued."""
+        self._closed = True
+        await self.drain()
+        self._task = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return actor statistics.
+
+        Returns:
+            Dictionary with:
+            - queue_depth / max_queue_depth: Submissions waiting now / at peak
+            - submitted / applied / failed: Update counts
+            - batches: Submissions applied successfully
+            - marshalled: Submissions handed over from another loop or thread
+            - last_apply_ms / max_apply_ms: Time to apply one submission
+            - last_queue_wait_ms: Time the latest submission spent queued
+        """
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self._max_queue_depth,
+            "submitted": self._submitted,
+            "applied": self._applied,
+            "batches": self._batches,
+            "failed": self._failed,
+            "marshalled": self._marshalled,
+            "last_apply_ms": self._last_apply_ms,
+            "max_apply_ms": self._max_apply_ms,
+            "last_queue_wait_ms": self._last_queue_wait_ms,
+        }
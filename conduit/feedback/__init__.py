@@ -103,6 +103,10 @@ from conduit.feedback.blending import (
 from conduit.feedback.collector import FeedbackCollector
 from conduit.feedback.detector import ImplicitFeedbackDetector
 from conduit.feedback.history import QueryHistoryEntry, QueryHistoryTracker
+from conduit.feedback.implicit_pipeline import (
+    ImplicitFeedbackPipeline,
+    ImplicitSignalEvent,
+)
 
 # Explicit feedback models
 from conduit.feedback.models import (
@@ -134,6 +138,8 @@ __all__ = [
     "load_blending_weights",
     # Implicit Feedback
     "ImplicitFeedbackDetector",
+    "ImplicitFeedbackPipeline",
+    "ImplicitSignalEvent",
     "QueryHistoryTracker",
     "QueryHistoryEntry",
     "RetrySignal",
@@ -54,6 +54,7 @@ from conduit.feedback.models import (
 from conduit.feedback.stores import FeedbackStore, InMemoryFeedbackStore
 
 if TYPE_CHECKING:
+    from conduit.engines.bandits.base import BanditFeedback
     from conduit.engines.router import Router
 
 logger = logging.getLogger(__name__)
@@ -210,6 +211,7 @@ class FeedbackCollector:
             latency=latency,
             ttl_seconds=ttl_seconds or self.default_ttl,
             session_id=session_id,
+            reward_weights=decision.metadata.get("reward_weights"),
         )
 
         await self.store.save_pending(pending)
@@ -246,8 +248,10 @@ class FeedbackCollector:
             - Router update failed
 
         Note:
-            Uses atomic get_and_delete to prevent race conditions when
-            multiple feedback events arrive for the same query.
+            Uses the store's atomic claim_pending() (idempotency check,
+            get-and-delete and processed marker in one round trip), so
+            concurrent duplicates are resolved by the store. If the router
+            update fails the marker is released again.
 
         Example:
             >>> event = FeedbackEvent(
@@ -259,20 +263,20 @@ class FeedbackCollector:
             >>> # Calling again is safe (idempotent)
             >>> success = await collector.record(event)  # Still returns True
         """
-        # Check idempotency
-        idempotency_key = event.get_idempotency_key()
-        if await self.store.was_processed(idempotency_key):
-            logger.debug(f"Duplicate feedback ignored: {idempotency_key}")
-            return True  # Idempotent success
-
         # Get adapter for signal type
         adapter = self._adapters.get(event.signal_type)
         if not adapter:
             logger.warning(f"No adapter for signal type: {event.signal_type}")
             return False
 
-        # Atomically get and delete pending query (prevents race conditions)
-        pending = await self.store.get_and_delete_pending(event.query_id)
+        # Check idempotency, get-and-delete and mark processed atomically
+        idempotency_key = event.get_idempotency_key()
+        duplicate, pending = await self.store.claim_pending(
+            event.query_id, idempotency_key, ttl_seconds=self.default_ttl
+        )
+        if duplicate:
+            logger.debug(f"Duplicate feedback ignored: {idempotency_key}")
+            return True  # Idempotent success
         if not pending:
             logger.warning(f"Unknown or expired query_id: {event.query_id}")
             return False
@@ -292,14 +296,13 @@ class FeedbackCollector:
                 latency=pending.latency,
                 features=features,
                 confidence=mapping.confidence,
+                reward_weights=pending.reward_weights,
             )
         except Exception as e:
             logger.error(f"Failed to update router: {e}")
+            await self.store.release_claim(idempotency_key)
             return False
 
-        # Mark as processed for idempotency
-        await self.store.mark_processed(idempotency_key, ttl_seconds=self.default_ttl)
-
         logger.info(
             f"Feedback recorded: query={event.query_id[:8]}..., "
             f"signal={event.signal_type}, reward={mapping.reward:.2f}, "
@@ -315,6 +318,7 @@ class FeedbackCollector:
         payload: dict[str, Any],
         cost: float = 0.0,
         latency: float = 0.0,
+        reward_weights: dict[str, float] | None = None,
     ) -> bool:
         """Record feedback immediately (no tracking required).
 
@@ -328,6 +332,8 @@ class FeedbackCollector:
             payload: Signal-specific data
             cost: Query cost
             latency: Response latency
+            reward_weights: Per-request reward weights, normally
+                decision.metadata["reward_weights"]
 
         Returns:
             True if feedback was recorded successfully
@@ -368,6 +374,7 @@ class FeedbackCollector:
                 latency=latency,
                 features=features,
                 confidence=mapping.confidence,
+                reward_weights=reward_weights,
             )
         except Exception as e:
             logger.error(f"Failed to update router: {e}")
@@ -381,7 +388,13 @@ class FeedbackCollector:
         return True
 
     async def record_batch(self, events: list[FeedbackEvent]) -> dict[str, bool]:
-        """Record multiple feedback events.
+        """Record multiple feedback events with one bandit update.
+
+        Each event is resolved as in record() (adapter, then an atomic
+        claim of the pending query), then all resolved
+        feedback is applied with a single Router.update_batch() call, so a
+        large backlog of delayed feedback costs one batched bandit update
+        and one state write instead of one per event.
 
         Args:
             events: List of FeedbackEvent objects
@@ -397,9 +410,100 @@ class FeedbackCollector:
             >>> results = await collector.record_batch(events)
             >>> print(results)  # {"q1": True, "q2": True}
         """
-        results = {}
+        from conduit.engines.bandits.base import BanditFeedback
+
+        results: dict[str, bool] = {}
+        # (query_id, idempotency_key, feedback, features) resolved for update
+        resolved: list[tuple[str, str, BanditFeedback, QueryFeatures]] = []
+
         for event in events:
-            results[event.query_id] = await self.record(event)
+            adapter = self._adapters.get(event.signal_type)
+            if not adapter:
+                logger.warning(f"No adapter for signal type: {event.signal_type}")
+                results[event.query_id] = False
+                continue
+
+            # Duplicates within this batch are caught by the claim marker too
+            idempotency_key = event.get_idempotency_key()
+            duplicate, pending = await self.store.claim_pending(
+                event.query_id, idempotency_key, ttl_seconds=self.default_ttl
+            )
+            if duplicate:
+                logger.debug(f"Duplicate feedback ignored: {idempotency_key}")
+                results[event.query_id] = True
+                continue
+            if not pending:
+                logger.warning(f"Unknown or expired query_id: {event.query_id}")
+                results[event.query_id] = False
+                continue
+
+            mapping = adapter.to_reward(event)
+            feedback = BanditFeedback(
+                model_id=pending.model_id,
+                cost=pending.cost,
+                quality_score=mapping.reward,
+                latency=pending.latency,
+                confidence=mapping.confidence,
+                reward_weights=pending.reward_weights,
+            )
+            resolved.append(
+                (
+                    event.query_id,
+                    idempotency_key,
+                    feedback,
+                    QueryFeatures(**pending.features),
+                )
+            )
+
+        # One router update (and one persistence write) for the whole batch
+        applied = await self._update_router_batch(
+            [(query_id, fb, features) for query_id, _, fb, features in resolved]
+        )
+        for query_id, idempotency_key, _, _ in resolved:
+            results[query_id] = applied[query_id]
+            if not applied[query_id]:
+                await self.store.release_claim(idempotency_key)
+
+        logger.info(
+            f"Feedback batch recorded: {sum(applied.values())}/{len(events)} "
+            f"events applied"
+        )
+        return results
+
+    async def _update_router_batch(
+        self, updates: list[tuple[str, "BanditFeedback", QueryFeatures]]
+    ) -> dict[str, bool]:
+        """Apply (query_id, feedback, features) updates with one router call.
+
+        Router.update_batch() rejects a batch as a whole (nothing applied) if
+        any entry is invalid, so on failure the updates are retried one at a
+        time and only the invalid entries fail.
+
+        Returns:
+            Dict mapping query_id to success status
+        """
+        if not updates:
+            return {}
+
+        try:
+            await self.router.update_batch(
+                [(feedback, features) for _, feedback, features in updates]
+            )
+            return {query_id: True for query_id, _, _ in updates}
+        except Exception as e:
+            if len(updates) == 1:
+                logger.error(f"Failed to update router: {e}")
+                return {updates[0][0]: False}
+            logger.warning(f"Batch router update failed, applying singly: {e}")
+
+        results = {}
+        for query_id, feedback, features in updates:
+            try:
+                await self.router.update_batch([(feedback, features)])
+                results[query_id] = True
+            except Exception as e:
+                logger.error(f"Failed to update router for query {query_id}: {e}")
+                results[query_id] = False
         return results
 
     async def record_aggregated(
@@ -455,17 +559,6 @@ class FeedbackCollector:
         signal_types_sorted = sorted({e.signal_type for e in events})
         idempotency_key = f"{query_id}:aggregated:{'+'.join(signal_types_sorted)}"
 
-        # Check idempotency
-        if await self.store.was_processed(idempotency_key):
-            logger.debug(f"Duplicate aggregated feedback ignored: {idempotency_key}")
-            return True  # Idempotent success
-
-        # Get pending query (peek without deleting)
-        pending = await self.store.get_pending(query_id)
-        if not pending:
-            logger.warning(f"Unknown or expired query_id: {query_id}")
-            return False
-
         # Convert all events to reward mappings
         mappings: list[RewardMapping] = []
         for event in events:
@@ -492,11 +585,15 @@ class FeedbackCollector:
         aggregated_reward = total_weighted_reward / total_confidence
         aggregated_confidence = total_confidence / len(mappings)
 
-        # Now atomically get and delete
-        pending = await self.store.get_and_delete_pending(query_id)
+        # Check idempotency, get-and-delete and mark processed atomically
+        duplicate, pending = await self.store.claim_pending(
+            query_id, idempotency_key, ttl_seconds=self.default_ttl
+        )
+        if duplicate:
+            logger.debug(f"Duplicate aggregated feedback ignored: {idempotency_key}")
+            return True  # Idempotent success
         if not pending:
-            # Race condition: another process got it first
-            logger.warning(f"Query already processed: {query_id}")
+            logger.warning(f"Unknown or expired query_id: {query_id}")
             return False
 
         # Reconstruct QueryFeatures
@@ -511,14 +608,13 @@ class FeedbackCollector:
                 latency=pending.latency,
                 features=features,
                 confidence=aggregated_confidence,
+                reward_weights=pending.reward_weights,
             )
         except Exception as e:
             logger.error(f"Failed to update router with aggregated feedback: {e}")
+            await self.store.release_claim(idempotency_key)
             return False
 
-        # Mark as processed for idempotency
-        await self.store.mark_processed(idempotency_key, ttl_seconds=self.default_ttl)
-
         signal_types = [
             e.signal_type for e in events if self._adapters.get(e.signal_type)
         ]
@@ -668,26 +764,26 @@ class FeedbackCollector:
         # Apply propagation weight to confidence
         propagated_confidence = mapping.confidence * propagation_weight
 
-        # Update router for each query in the session
-        results = {}
-        for pending in queries:
-            features = QueryFeatures(**pending.features)
-
-            try:
-                await self.router.update(
-                    model_id=pending.model_id,
-                    cost=pending.cost,
-                    quality_score=mapping.reward,
-                    latency=pending.latency,
-                    features=features,
-                    confidence=propagated_confidence,
-                )
-                results[pending.query_id] = True
-            except Exception as e:
-                logger.error(
-                    f"Failed to update router for query {pending.query_id}: {e}"
+        # Update router for every query in the session with one batch
+        from conduit.engines.bandits.base import BanditFeedback
+
+        results = await self._update_router_batch(
+            [
+                (
+                    pending.query_id,
+                    BanditFeedback(
+                        model_id=pending.model_id,
+                        cost=pending.cost,
+                        quality_score=mapping.reward,
+                        latency=pending.latency,
+                        confidence=propagated_confidence,
+                        reward_weights=pending.reward_weights,
+                    ),
+                    QueryFeatures(**pending.features),
                 )
-                results[pending.query_id] = False
+                for pending in queries
+            ]
+        )
 
         # Mark as processed for idempotency
         await self.store.mark_processed(idempotency_key, ttl_seconds=self.default_ttl)
@@ -12,6 +12,8 @@ produces ImplicitFeedback objects for Thompson Sampling updates.
 import logging
 import time
 
+import numpy as np
+
 from conduit.core.models import ImplicitFeedback, QueryFeatures
 from conduit.feedback.history import QueryHistoryTracker
 from conduit.feedback.signals import RetrySignal, SignalDetector
@@ -112,7 +114,7 @@ class ImplicitFeedbackDetector:
 
         # 3. Retry Signal Detection
         retry_signal = await self._detect_retry(
-            current_embedding=features.embedding,
+            current_embedding=features.embedding_array,
             user_id=user_id,
         )
 
@@ -151,7 +153,7 @@ class ImplicitFeedbackDetector:
 
     async def _detect_retry(
         self,
-        current_embedding: list[float],
+        current_embedding: list[float] | np.ndarray,
         user_id: str,
     ) -> RetrySignal:
         """Detect retry behavior via semantic similarity.
@@ -187,19 +189,24 @@ class ImplicitFeedbackDetector:
         current_time = time.time()
         time_delta = current_time - similar_query.timestamp
 
+        # Rounding (float32 history embeddings) can land just above 1.0
+        similarity = self._cosine_similarity(
+            current_embedding, similar_query.embedding_array
+        )
+
         return RetrySignal(
             detected=True,
             delay_seconds=time_delta,
-            similarity_score=self._cosine_similarity(
-                current_embedding, similar_query.embedding
-            ),
+            similarity_score=min(similarity, 1.0),
             original_query_id=similar_query.query_id,
         )
 
     @staticmethod
-    def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
+    def _cosine_similarity(
+        vec1: list[float] | np.ndarray, vec2: list[float] | np.ndarray
+    ) -> float:
         """Calculate cosine similarity (dot product for normalized vectors)."""
-        return float(sum(a * b for a, b in zip(vec1, vec2)))
+        return float(np.dot(np.asarray(vec1), np.asarray(vec2)))
 
     def _log_signals(self, feedback: ImplicitFeedback) -> None:
         """Log detected signals for monitoring and debugging.
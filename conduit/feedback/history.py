@@ -3,17 +3,51 @@
 Manages recent query history in Redis for semantic similarity-based
 retry detection. Stores query metadata (embeddings, timestamps, IDs)
 with automatic expiration for memory efficiency.
+
+Entries are stored in a compact binary format so that retry detection
+decodes each entry with one np.frombuffer view instead of JSON-parsing a
+float list. The recent window is fetched with a single MGET and scored
+with one matrix-vector product.
+
+Layout (version 1, little-endian):
+    magic        2s   b"QH"
+    version      B    format version (1)
+    reserved     B
+    dim          I    embedding dimensions
+    timestamp    d    Unix timestamp of the query
+    meta_len     I    UTF-8 byte length of the metadata JSON
+    embedding    dim * 4 bytes (float32)
+    metadata     JSON object with query_id, query_text, user_id, model_used
+
+Entries without the magic prefix are decoded as the legacy JSON format, so
+history written before the upgrade stays readable until it expires.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import struct
 import time
+from functools import cached_property
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import AliasChoices, BaseModel, Field, ValidationError
 from redis.asyncio import Redis
 from redis.exceptions import ConnectionError, TimeoutError
 
-from conduit.core.models import QueryFeatures
+from conduit.core.models import EmbeddingVector, QueryFeatures
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"QH"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<2sBBIdI")
+
+# Index ids read per wanted entry, covering entries that expired before their
+# index member was trimmed
+HISTORY_OVERFETCH_FACTOR = 2
 
 
 class QueryHistoryEntry(BaseModel):
@@ -22,19 +56,104 @@ class QueryHistoryEntry(BaseModel):
     Attributes:
         query_id: Unique query identifier
         query_text: Original query text
-        embedding: Query embedding vector
+        embedding_array: Query embedding as a read-only ndarray (construct
+            with embedding=<list or ndarray>)
         timestamp: Unix timestamp of query
         user_id: User identifier (API key or client ID)
         model_used: Which model was selected for this query
     """
 
+    model_config = {
+        "frozen": True,
+        "validate_by_name": True,
+        "validate_by_alias": True,
+        "serialize_by_alias": True,
+    }
+
     query_id: str = Field(..., description="Query identifier")
     query_text: str = Field(..., description="Original query")
-    embedding: list[float] = Field(..., description="Query embedding")
+    embedding_array: EmbeddingVector = Field(
+        ...,
+        validation_alias=AliasChoices("embedding", "embedding_array"),
+        serialization_alias="embedding",
+        description="Query embedding",
+    )
     timestamp: float = Field(..., description="Unix timestamp", ge=0.0)
     user_id: str = Field(..., description="User identifier")
     model_used: str | None = Field(None, description="Selected model")
 
+    @cached_property
+    def embedding(self) -> list[float]:
+        """Embedding as a list of floats (compatibility view of embedding_array)."""
+        return self.embedding_array.tolist()  # type: ignore[no-any-return]
+
+
+def encode_entry(entry: QueryHistoryEntry) -> bytes:
+    """Serialize a history entry in the binary format.
+
+    Args:
+        entry: Entry to encode
+
+    Returns:
+        Encoded bytes (float32 embedding behind a fixed header)
+    """
+    embedding = entry.embedding_array.astype("<f4", copy=False)
+    metadata = json.dumps(
+        {
+            "query_id": entry.query_id,
+            "query_text": entry.query_text,
+            "user_id": entry.user_id,
+            "model_used": entry.model_used,
+        }
+    ).encode()
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        embedding.shape[0],
+        entry.timestamp,
+        len(metadata),
+    )
+    return header + embedding.tobytes() + metadata
+
+
+def decode_entry(data: bytes) -> QueryHistoryEntry:
+    """Deserialize a history entry (binary or legacy JSON format).
+
+    The embedding is returned as a read-only float32 view over data.
+
+    Args:
+        data: Bytes previously produced by encode_entry or legacy JSON
+
+    Returns:
+        Decoded QueryHistoryEntry
+
+    Raises:
+        ValueError: If the entry is invalid or truncated
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        return QueryHistoryEntry.model_validate_json(data)
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Truncated history entry ({len(data)} bytes)")
+
+    _, version, _, dim, timestamp, meta_len = _HEADER.unpack_from(data)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported history entry version: {version}")
+
+    meta_offset = _HEADER.size + dim * 4
+    if len(data) != meta_offset + meta_len:
+        raise ValueError(
+            f"History entry size mismatch: expected {meta_offset + meta_len} "
+            f"bytes, got {len(data)}"
+        )
+
+    return QueryHistoryEntry(
+        embedding=np.frombuffer(data, dtype="<f4", count=dim, offset=_HEADER.size),
+        timestamp=timestamp,
+        **json.loads(data[meta_offset:]),
+    )
+
 
 class QueryHistoryTracker:
     """Redis-based query history tracker for retry detection.
@@ -99,6 +218,8 @@ class QueryHistoryTracker:
         Note:
             Automatically expires after TTL (5 minutes by default).
             Stores in Redis sorted set for efficient time-based retrieval.
+            The entry write and index update go out in one pipelined
+            round trip.
         """
         if not self.enabled or not self.redis:
             return False
@@ -110,24 +231,21 @@ class QueryHistoryTracker:
             entry = QueryHistoryEntry(
                 query_id=query_id,
                 query_text=query_text,
-                embedding=features.embedding,
+                embedding=features.embedding_array,
                 timestamp=timestamp,
                 user_id=user_id,
                 model_used=model_used,
             )
 
-            # Store entry with TTL
             entry_key = f"conduit:history:{user_id}:{query_id}"
-            await self.redis.setex(
-                entry_key,
-                self.ttl,
-                entry.model_dump_json(),
-            )
-
-            # Add to user's sorted set index (score = timestamp)
             index_key = f"conduit:history:{user_id}:index"
-            await self.redis.zadd(index_key, {query_id: timestamp})
-            await self.redis.expire(index_key, self.ttl)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                # Store entry with TTL (binary float32 embedding)
+                pipe.setex(entry_key, self.ttl, encode_entry(entry))
+                # Add to user's sorted set index (score = timestamp)
+                pipe.zadd(index_key, {query_id: timestamp})
+                pipe.expire(index_key, self.ttl)
+                await pipe.execute()
 
             return True
 
@@ -154,6 +272,7 @@ class QueryHistoryTracker:
         Note:
             Returns empty list on error or if tracking is disabled.
             Automatically filters expired entries based on time window.
+            Entries are fetched with MGET (usually one) after the index lookup.
         """
         if not self.enabled or not self.redis:
             return []
@@ -172,26 +291,40 @@ class QueryHistoryTracker:
                     withscores=False,
                 )
             else:
-                # Get all recent queries (up to limit)
+                # Get the newest ids, over-fetched in case some entries expired
                 query_ids = await self.redis.zrange(
                     index_key,
-                    -limit,  # Last N items
+                    -limit * HISTORY_OVERFETCH_FACTOR,  # Last N items
                     -1,  # Up to end
                     withscores=False,
                 )
 
-            # Retrieve full entries
+            # Most recent first. Entry keys can expire or be evicted before
+            # their index member, so each MGET over-fetches and further MGETs
+            # top the result up until `limit` live entries are found.
+            recent_ids = query_ids[::-1]
+            chunk_size = max(limit, 1) * HISTORY_OVERFETCH_FACTOR
             entries: list[QueryHistoryEntry] = []
-            for query_id in reversed(query_ids):  # Most recent first
-                entry_key = f"conduit:history:{user_id}:{query_id.decode()}"
-                entry_json = await self.redis.get(entry_key)
-
-                if entry_json:
-                    entry = QueryHistoryEntry.model_validate_json(entry_json)
-                    entries.append(entry)
 
+            for start in range(0, len(recent_ids), chunk_size):
                 if len(entries) >= limit:
                     break
+                values = await self.redis.mget(
+                    [
+                        f"conduit:history:{user_id}:{query_id.decode()}"
+                        for query_id in recent_ids[start : start + chunk_size]
+                    ]
+                )
+                for data in values:
+                    if not data:
+                        continue
+                    try:
+                        entries.append(decode_entry(data))
+                    except (ValueError, ValidationError) as e:
+                        logger.debug(f"Skipping unreadable history entry: {e}")
+                        continue
+                    if len(entries) >= limit:
+                        break
 
             return entries
 
@@ -200,7 +333,7 @@ class QueryHistoryTracker:
 
     async def find_similar_query(
         self,
-        current_embedding: list[float],
+        current_embedding: list[float] | np.ndarray,
         user_id: str,
         similarity_threshold: float = 0.85,
         time_window_seconds: float = 300.0,
@@ -218,7 +351,8 @@ class QueryHistoryTracker:
 
         Algorithm:
             1. Retrieve recent queries within time window
-            2. Calculate cosine similarity with current embedding
+            2. Score all of them with one matrix-vector product
+               (entries with a different embedding dimension are skipped)
             3. Return highest similarity above threshold
 
         Note:
@@ -237,20 +371,26 @@ class QueryHistoryTracker:
         if not recent_queries:
             return None
 
-        best_match: QueryHistoryEntry | None = None
-        best_similarity = similarity_threshold
-
-        for entry in recent_queries:
-            similarity = self._cosine_similarity(current_embedding, entry.embedding)
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = entry
+        query = np.asarray(current_embedding, dtype=np.float32)
+        candidates = [
+            entry
+            for entry in recent_queries
+            if entry.embedding_array.shape[0] == query.shape[0]
+        ]
+        if not candidates:
+            return None
 
-        return best_match
+        # Embeddings are normalized, so cosine similarity = dot product
+        similarities = np.stack([entry.embedding_array for entry in candidates]) @ query
+        best = int(np.argmax(similarities))  # First (most recent) on ties
+        if similarities[best] > similarity_threshold:
+            return candidates[best]
+        return None
 
     @staticmethod
-    def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
+    def _cosine_similarity(
+        vec1: list[float] | np.ndarray, vec2: list[float] | np.ndarray
+    ) -> float:
         """Calculate cosine similarity between two vectors.
 
         Args:
@@ -266,8 +406,7 @@ class QueryHistoryTracker:
         """
         # Embeddings from sentence-transformers are normalized
         # So cosine similarity = dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        return float(dot_product)
+        return float(np.dot(np.asarray(vec1), np.asarray(vec2)))
 
     async def clear_user_history(self, user_id: str) -> bool:
         """Clear all history for a user (admin operation).
@@ -0,0 +1,323 @@
+"""Background implicit feedback processing off the completion path.
+
+Running ImplicitFeedbackDetector.detect() inline after each completion adds
+a retry lookup, a history write, signal detection, blending and a bandit
+update to every response. ImplicitFeedbackPipeline instead queues a compact
+ImplicitSignalEvent on a BackgroundBatcher (conduit.core.batcher). For each
+batch, detection (retry lookup, pipelined history write, error and latency
+signals) runs concurrently for up to `workers` events, the signals are
+blended into rewards with conduit.feedback.blending, and the rewards reach
+the router in one Router.update_batch() call.
+
+Lag:
+    get_stats() reports the time from submit() until an event's reward was
+    applied (last, average, max) together with queue depth. A growing lag
+    means detection cannot keep up with the completion rate.
+
+A failed detection or batch update is counted in failed_events or
+failed_updates; the affected rewards are not retried.
+
+Example:
+    >>> pipeline = ImplicitFeedbackPipeline(detector, router, workers=4)
+    >>> await pipeline.submit(ImplicitSignalEvent(
+    ...     query_id=decision.query_id,
+    ...     query_text=query.text,
+    ...     features=decision.features,
+    ...     model_id=decision.selected_model,
+    ...     user_id="user_abc",
+    ...     request_start_time=start,
+    ...     response_complete_time=end,
+    ...     response_text=response.text,
+    ... ))                              # enqueue only
+    >>> await pipeline.close()          # drain and apply
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from conduit.core.batcher import BackgroundBatcher, OverflowPolicy
+from conduit.core.models import QueryFeatures
+from conduit.feedback.blending import (
+    blend_feedback,
+    compute_blended_confidence,
+    compute_implicit_score,
+    load_blending_weights,
+)
+from conduit.observability.metrics import (
+    record_implicit_dropped,
+    record_implicit_lag,
+    record_implicit_queue_depth,
+)
+
+if TYPE_CHECKING:
+    from conduit.engines.bandits.base import BanditFeedback
+    from conduit.engines.router import Router
+    from conduit.feedback.detector import ImplicitFeedbackDetector
+
+logger = logging.getLogger(__name__)
+
+ImplicitOverflowPolicy = OverflowPolicy
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+@dataclass(frozen=True)
+class ImplicitSignalEvent:
+    """Completion observed on the request path, queued for detection.
+
+    Carries only what detection and the bandit update need; features are
+    the routing decision's QueryFeatures (shared, not copied).
+
+    Attributes:
+        query_id: Query identifier from the routing decision
+        query_text: Original query text (stored in retry history)
+        features: QueryFeatures from the routing decision
+        model_id: Model that produced the response
+        user_id: User identifier for retry detection
+        request_start_time: Request timestamp (epoch seconds)
+        response_complete_time: Response timestamp (epoch seconds)
+        response_text: Response text (None if execution failed)
+        execution_status: "success" or "error"
+        execution_error: Error message if execution failed
+        cost: Actual query cost in dollars
+        explicit_score: Optional explicit quality score to blend with the
+            implicit score
+        explicit_confidence: Confidence of explicit_score
+        reward_weights: Per-request reward weights, normally
+            decision.metadata["reward_weights"]
+    """
+
+    query_id: str
+    query_text: str
+    features: QueryFeatures
+    model_id: str
+    user_id: str
+    request_start_time: float
+    response_complete_time: float
+    response_text: str | None = None
+    execution_status: str = "success"
+    execution_error: str | None = None
+    cost: float = 0.0
+    explicit_score: float | None = None
+    explicit_confidence: float | None = None
+    reward_weights: dict[str, float] | None = None
+
+
+class ImplicitFeedbackPipeline:
+    """Batched background detection and bandit updates for completions.
+
+    Not thread-safe: submit() must be called from the event loop that runs
+    the batch task.
+
+    Attributes:
+        detector: ImplicitFeedbackDetector running the signal detection
+        router: Router (or HybridRouter) receiving batched updates
+        workers: Maximum concurrent detections within a batch
+        queue_size: Maximum queued events before the overflow policy applies
+        batch_size: Events per batch (and per Router.update_batch() call)
+        flush_interval: Longest time (seconds) an event waits for its batch
+        overflow: "drop" new events or "block" submit() when the queue is full
+    """
+
+    def __init__(
+        self,
+        detector: "ImplicitFeedbackDetector",
+        router: "Router",
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: ImplicitOverflowPolicy = "drop",
+    ):
+        """Initialize pipeline.
+
+        Args:
+            detector: Detector for error, latency and retry signals
+            router: Router whose bandits learn from the rewards
+            workers: Maximum concurrent detections within a batch
+            queue_size: Maximum queued events
+            batch_size: Events per batch
+            flush_interval: Process events at most this many seconds after
+                they are queued
+            overflow: Policy when the queue is full ("drop" or "block")
+
+        Raises:
+            ValueError: If counts are < 1, flush_interval <= 0, or overflow
+                is unknown
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+
+        self.detector = detector
+        self.router = router
+        self._batcher: BackgroundBatcher[ImplicitSignalEvent] = BackgroundBatcher(
+            self._process_batch,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            overflow=overflow,
+            name="implicit feedback",
+            on_queue_depth=record_implicit_queue_depth,
+            on_drop=lambda reason: record_implicit_dropped(1, reason),
+            on_lag=record_implicit_lag,
+        )
+        self.workers = workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+
+        # Blending weights come from conduit.yaml; read once, not per event
+        self._explicit_weight, self._implicit_weight = load_blending_weights()
+        self._slots = asyncio.Semaphore(workers)
+        self._active = 0
+
+        self._processed = 0
+        self._failed_events = 0
+        self._applied = 0
+        self._failed_updates = 0
+        self._batches = 0
+        self._last_batch_size = 0
+
+    async def submit(self, event: ImplicitSignalEvent) -> bool:
+        """Queue a completion for background detection.
+
+        With overflow="drop" this never suspends; with "block" it waits
+        while the queue is full.
+
+        Args:
+            event: Completion to process
+
+        Returns:
+            True if queued, False if dropped (queue full or pipeline closed)
+        """
+        return await self._batcher.submit(event)
+
+    async def _process_batch(self, events: list[ImplicitSignalEvent]) -> None:
+        """Detect signals for a batch and apply the rewards in one update."""
+        results = await asyncio.gather(*(self._reward(event) for event in events))
+        batch = [reward for reward in results if reward is not None]
+        if not batch:
+            return
+
+        try:
+            await self.router.update_batch(batch)
+        except Exception as e:
+            self._failed_updates += len(batch)
+            logger.error(
+                f"Implicit feedback update failed ({len(batch)} rewards): {e}"
+            )
+            return
+
+        self._batches += 1
+        self._applied += len(batch)
+        self._last_batch_size = len(batch)
+
+    async def _reward(
+        self, event: ImplicitSignalEvent
+    ) -> "tuple[BanditFeedback, QueryFeatures] | None":
+        """Detect signals for one event and blend them into a reward."""
+        from conduit.engines.bandits.base import BanditFeedback
+
+        async with self._slots:
+            self._active += 1
+            try:
+                implicit = await self.detector.detect(
+                    query=event.query_text,
+                    query_id=event.query_id,
+                    features=event.features,
+                    response_text=event.response_text,
+                    model_id=event.model_id,
+                    execution_status=event.execution_status,
+                    execution_error=event.execution_error,
+                    request_start_time=event.request_start_time,
+                    response_complete_time=event.response_complete_time,
+                    user_id=event.user_id,
+                )
+            except Exception as e:
+                self._failed_events += 1
+                logger.error(f"Implicit feedback detection failed: {e}")
+                return None
+            finally:
+                self._active -= 1
+
+        implicit_score = compute_implicit_score(implicit)
+        quality = blend_feedback(
+            explicit_score=event.explicit_score,
+            implicit_score=implicit_score,
+            explicit_weight=self._explicit_weight,
+            implicit_weight=self._implicit_weight,
+        )
+        confidence = compute_blended_confidence(
+            explicit_confidence=(
+                event.explicit_confidence if event.explicit_score is not None else None
+            ),
+            has_implicit=True,
+            implicit_score=implicit_score,
+        )
+
+        self._processed += 1
+        return (
+            BanditFeedback(
+                model_id=event.model_id,
+                cost=event.cost,
+                quality_score=quality,
+                latency=implicit.latency_seconds,
+                confidence=confidence,
+                reward_weights=event.reward_weights,
+            ),
+            event.features,
+        )
+
+    async def flush(self) -> int:
+        """Process everything currently queued and apply the rewards.
+
+        Returns:
+            Number of events processed (failed detections and updates are
+            logged and counted, not raised)
+        """
+        return await self._batcher.flush()
+
+    async def close(self) -> None:
+        """Stop accepting events, drain the queue and apply the final batch."""
+        await self._batcher.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pipeline statistics.
+
+        Returns:
+            Dictionary with:
+            - queue_depth / max_queue_depth: Events waiting now / at peak
+            - active_workers: Detections currently running
+            - submitted: Events accepted by submit()
+            - processed: Events whose signals were detected
+            - dropped: Events discarded by the overflow policy or after close
+            - failed_events: Events whose detection raised
+            - applied: Rewards applied to the router
+            - failed_updates: Rewards lost to failed batch updates
+            - batches / last_batch_size: Successful batched updates
+            - last_lag_ms / avg_lag_ms / max_lag_ms: Time from submit()
+              until the event's batch was processed
+        """
+        stats = self._batcher.get_stats()
+        return {
+            "queue_depth": stats["queue_depth"],
+            "max_queue_depth": stats["max_queue_depth"],
+            "active_workers": self._active,
+            "submitted": stats["submitted"],
+            "processed": self._processed,
+            "dropped": stats["dropped"],
+            "failed_events": self._failed_events,
+            "applied": self._applied,
+            "failed_updates": self._failed_updates,
+            "batches": self._batches,
+            "last_batch_size": self._last_batch_size,
+            "last_lag_ms": stats["last_lag_ms"],
+            "avg_lag_ms": stats["avg_lag_ms"],
+            "max_lag_ms": stats["max_lag_ms"],
+        }
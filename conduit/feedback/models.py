@@ -145,6 +145,8 @@ class PendingQuery(BaseModel):
         created_at: When the query was tracked
         ttl_seconds: Time-to-live before expiry (default 1 hour)
         session_id: Optional session ID for multi-turn tracking
+        reward_weights: Reward weights of the query's preference preset, used
+            when the feedback updates the router
 
     Example:
         >>> pending = PendingQuery(
@@ -173,6 +175,10 @@ class PendingQuery(BaseModel):
     session_id: str | None = Field(
         default=None, description="Optional session ID for multi-turn tracking"
     )
+    reward_weights: dict[str, float] | None = Field(
+        default=None,
+        description="Per-request reward weights from the routing decision",
+    )
 
     def is_expired(self) -> bool:
         """Check if this pending query has expired.
@@ -11,6 +11,8 @@ Storage Options:
 
 Design Notes:
 - All stores implement atomic get_and_delete() to prevent race conditions
+- claim_pending() folds the idempotency check, get_and_delete and the
+  processed marker into one round trip (Lua script / CTE statement)
 - PostgreSQL store requires periodic cleanup_expired() calls (no native TTL)
 - Redis store uses native TTL for automatic expiry
 
@@ -26,6 +28,7 @@ Usage:
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
@@ -38,6 +41,78 @@ from conduit.feedback.models import PendingQuery
 
 logger = logging.getLogger(__name__)
 
+# Redis session index scripts. Each runs atomically on the server, so the
+# per-session sorted set never disagrees with the pending keys it indexes
+# (beyond members whose pending key has expired, pruned on read).
+
+# KEYS[1]=pending key, KEYS[2]=session index
+# ARGV[1]=payload, ARGV[2]=ttl, ARGV[3]=expires_at, ARGV[4]=query_id
+_REDIS_SAVE_PENDING_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[4])
+if redis.call('TTL', KEYS[2]) < tonumber(ARGV[2]) then
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return 1
+"""
+
+# KEYS[1]=pending key; ARGV[1]=session index prefix
+_REDIS_GETDEL_PENDING_SCRIPT = """
+local data = redis.call('GET', KEYS[1])
+if not data then
+    return false
+end
+redis.call('DEL', KEYS[1])
+local ok, pending = pcall(cjson.decode, data)
+if ok and type(pending) == 'table' and type(pending.session_id) == 'string' then
+    redis.call('ZREM', ARGV[1] .. ':' .. pending.session_id, pending.query_id)
+end
+return data
+"""
+
+# KEYS[1]=processed marker, KEYS[2]=pending key
+# ARGV[1]=session index prefix, ARGV[2]=marker ttl
+# Returns 1 for a duplicate, nil for an unknown query, else the pending payload
+_REDIS_CLAIM_PENDING_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 1
+end
+local data = redis.call('GET', KEYS[2])
+if not data then
+    return false
+end
+redis.call('DEL', KEYS[2])
+redis.call('SET', KEYS[1], '1', 'EX', ARGV[2])
+local ok, pending = pcall(cjson.decode, data)
+if ok and type(pending) == 'table' and type(pending.session_id) == 'string' then
+    redis.call('ZREM', ARGV[1] .. ':' .. pending.session_id, pending.query_id)
+end
+return data
+"""
+
+# KEYS[1]=session index; ARGV[1]=pending key prefix, ARGV[2]=now, ARGV[3]=delete
+_REDIS_SESSION_QUERIES_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+local ids = redis.call('ZRANGE', KEYS[1], 0, -1)
+local result = {}
+for _, id in ipairs(ids) do
+    local key = ARGV[1] .. ':' .. id
+    local data = redis.call('GET', key)
+    if data then
+        table.insert(result, data)
+        if ARGV[3] == '1' then
+            redis.call('DEL', key)
+        end
+    else
+        redis.call('ZREM', KEYS[1], id)
+    end
+end
+if ARGV[3] == '1' then
+    redis.call('DEL', KEYS[1])
+end
+return result
+"""
+
 
 class FeedbackStore(ABC):
     """Abstract base class for pending query storage.
@@ -187,6 +262,47 @@ class FeedbackStore(ABC):
         """
         pass
 
+    async def claim_pending(
+        self, query_id: str, idempotency_key: str, ttl_seconds: int = 3600
+    ) -> tuple[bool, PendingQuery | None]:
+        """Claim a pending query for one feedback event.
+
+        Combines was_processed(), get_and_delete_pending() and
+        mark_processed(): if the idempotency key was already processed
+        nothing changes, otherwise the pending query is deleted and, if it
+        existed, the key is marked processed. Backends override this to run
+        all three atomically in one round trip, so concurrent duplicates are
+        resolved by the store. This default makes three calls.
+
+        Args:
+            query_id: Query the feedback refers to
+            idempotency_key: Unique key for the feedback event
+            ttl_seconds: How long to remember this key (default 1 hour)
+
+        Returns:
+            Tuple of (duplicate, pending). duplicate is True if the key was
+            already processed. pending is the claimed query, or None for a
+            duplicate or an unknown/expired query.
+        """
+        if await self.was_processed(idempotency_key):
+            return True, None
+        pending = await self.get_and_delete_pending(query_id)
+        if pending is not None:
+            await self.mark_processed(idempotency_key, ttl_seconds=ttl_seconds)
+        return False, pending
+
+    async def release_claim(self, idempotency_key: str) -> None:
+        """Forget the processed marker set by claim_pending().
+
+        Called when claimed feedback could not be applied, so a retry is not
+        reported as a duplicate. The pending query stays deleted. The default
+        does nothing and the marker expires with its TTL.
+
+        Args:
+            idempotency_key: Unique key for the feedback event
+        """
+        return None
+
 
 class InMemoryFeedbackStore(FeedbackStore):
     """In-memory feedback store for development and testing.
@@ -348,6 +464,31 @@ class InMemoryFeedbackStore(FeedbackStore):
             self._processed[idempotency_key] = expires_at
             logger.debug(f"Marked feedback as processed: {idempotency_key}")
 
+    async def claim_pending(
+        self, query_id: str, idempotency_key: str, ttl_seconds: int = 3600
+    ) -> tuple[bool, PendingQuery | None]:
+        """Check, get-and-delete and mark processed under one lock."""
+        async with self._lock:
+            now = datetime.now(timezone.utc)
+            expires_at = self._processed.get(idempotency_key)
+            if expires_at is not None:
+                if now <= expires_at:
+                    return True, None
+                del self._processed[idempotency_key]
+
+            pending = self._pending.pop(query_id, None)
+            if pending is None or pending.is_expired():
+                return False, None
+
+            self._processed[idempotency_key] = now + timedelta(seconds=ttl_seconds)
+            logger.debug(f"Claimed pending query: {query_id} ({idempotency_key})")
+            return False, pending
+
+    async def release_claim(self, idempotency_key: str) -> None:
+        """Forget the processed marker set by claim_pending()."""
+        async with self._lock:
+            self._processed.pop(idempotency_key, None)
+
 
 class RedisFeedbackStore(FeedbackStore):
     """Redis-based feedback store for production.
@@ -356,11 +497,28 @@ class RedisFeedbackStore(FeedbackStore):
     Supports automatic TTL-based expiry via Redis SETEX.
 
     Atomicity:
-        Uses Redis GETDEL command (Redis 6.2+) for atomic get_and_delete.
-        Falls back to Lua script for older Redis versions.
+        get_and_delete_pending, delete_pending and get_and_delete_session run
+        as Lua scripts, so a pending query and its session index entry are
+        removed together in one round trip. claim_pending additionally checks
+        and sets the processed marker in the same script.
+
+    Session Index:
+        Queries tracked with a session_id are also added to a per-session
+        sorted set (member: query_id, score: expiry timestamp) in the same
+        script that writes the pending key. The set's TTL is extended to
+        cover its longest-lived member, and members whose pending key has
+        expired are pruned on read. Session lookups cost O(queries in
+        session) in one round trip instead of a SCAN over every pending key.
+        Queries saved before the index existed are not found by session
+        lookups; they expire with their TTL.
+
+        Scripts derive key names from the prefixes, so in Redis Cluster both
+        prefixes must share a hash tag (e.g. "{conduit}:feedback:pending"
+        and "{conduit}:feedback:session").
 
     Key Pattern:
         conduit:feedback:pending:{query_id}
+        conduit:feedback:session:{session_id}
     """
 
     def __init__(
@@ -368,6 +526,7 @@ class RedisFeedbackStore(FeedbackStore):
         redis: "Redis[bytes]",
         key_prefix: str = "conduit:feedback:pending",
         default_ttl: int = 3600,
+        session_key_prefix: str = "conduit:feedback:session",
     ):
         """Initialize Redis store.
 
@@ -375,25 +534,44 @@ class RedisFeedbackStore(FeedbackStore):
             redis: Redis async client instance
             key_prefix: Key prefix for pending queries
             default_ttl: Default TTL in seconds (default 1 hour)
+            session_key_prefix: Key prefix for per-session index sets (must
+                not fall under key_prefix, which count_pending scans)
         """
         self.redis: "Redis[bytes]" = redis
         self.key_prefix = key_prefix
         self.default_ttl = default_ttl
+        self.session_key_prefix = session_key_prefix
 
     def _key(self, query_id: str) -> str:
         """Generate Redis key for query ID."""
         return f"{self.key_prefix}:{query_id}"
 
+    def _session_key(self, session_id: str) -> str:
+        """Generate Redis key for a session's index set."""
+        return f"{self.session_key_prefix}:{session_id}"
+
     async def save_pending(self, pending: PendingQuery) -> None:
-        """Save pending query to Redis with TTL."""
+        """Save pending query to Redis with TTL (and index it by session)."""
         key = self._key(pending.query_id)
         ttl = pending.ttl_seconds or self.default_ttl
 
-        await self.redis.setex(
-            key,
-            ttl,
-            pending.model_dump_json(),
-        )
+        if pending.session_id is None:
+            await self.redis.setex(
+                key,
+                ttl,
+                pending.model_dump_json(),
+            )
+        else:
+            await self.redis.eval(
+                _REDIS_SAVE_PENDING_SCRIPT,
+                2,
+                key,
+                self._session_key(pending.session_id),
+                pending.model_dump_json(),
+                ttl,
+                time.time() + ttl,
+                pending.query_id,
+            )
         logger.debug(f"Saved pending query to Redis: {pending.query_id}")
 
     async def get_pending(self, query_id: str) -> PendingQuery | None:
@@ -410,19 +588,19 @@ class RedisFeedbackStore(FeedbackStore):
             logger.warning(f"Failed to parse pending query {query_id}: {e}")
             return None
 
-    async def get_and_delete_pending(self, query_id: str) -> PendingQuery | None:
-        """Atomically retrieve and delete pending query using GETDEL."""
-        key = self._key(query_id)
+    async def _getdel(self, query_id: str) -> bytes | None:
+        """Atomically get and delete a pending key and its session index entry."""
+        data: bytes | None = await self.redis.eval(
+            _REDIS_GETDEL_PENDING_SCRIPT,
+            1,
+            self._key(query_id),
+            self.session_key_prefix,
+        )
+        return data
 
-        # GETDEL is atomic (Redis 6.2+)
-        # Falls back to GET + DEL for older versions
-        try:
-            data = await self.redis.getdel(key)
-        except AttributeError:
-            # Fallback for older redis-py versions
-            data = await self.redis.get(key)
-            if data:
-                await self.redis.delete(key)
+    async def get_and_delete_pending(self, query_id: str) -> PendingQuery | None:
+        """Atomically retrieve and delete pending query (one Lua script)."""
+        data = await self._getdel(query_id)
 
         if data is None:
             return None
@@ -475,9 +653,8 @@ class RedisFeedbackStore(FeedbackStore):
         return True
 
     async def delete_pending(self, query_id: str) -> None:
-        """Delete pending query from Redis."""
-        key = self._key(query_id)
-        await self.redis.delete(key)
+        """Delete pending query (and its session index entry) from Redis."""
+        await self._getdel(query_id)
         logger.debug(f"Deleted pending query from Redis: {query_id}")
 
     async def cleanup_expired(self) -> int:
@@ -531,55 +708,44 @@ class RedisFeedbackStore(FeedbackStore):
         return count
 
     async def get_session_queries(self, session_id: str) -> list[PendingQuery]:
-        """Get all pending queries for a session.
+        """Get all pending queries for a session via the session index.
 
-        Note: Redis doesn't have native secondary indexes, so we scan all keys
-        and filter by session_id. For high-volume use, consider adding a
-        session index (e.g., Redis Set per session).
+        One round trip: the script prunes expired members and returns the
+        pending payloads of the rest.
         """
-        cursor = 0
-        queries = []
-        pattern = f"{self.key_prefix}:*"
-
-        while True:
-            cursor, keys = await self.redis.scan(
-                cursor=cursor,
-                match=pattern,
-                count=100,
-            )
-
-            for key in keys:
-                data = await self.redis.get(key)
-                if data:
-                    try:
-                        pending = PendingQuery.model_validate_json(data)
-                        if pending.session_id == session_id:
-                            queries.append(pending)
-                    except Exception as e:
-                        key_str = key.decode() if isinstance(key, bytes) else key
-                        logger.debug(
-                            f"Failed to parse pending query from {key_str}: {e}"
-                        )
-                        continue
-
-            if cursor == 0:
-                break
-
-        return queries
+        return await self._session_queries(session_id, delete=False)
 
     async def get_and_delete_session(self, session_id: str) -> list[PendingQuery]:
         """Atomically retrieve and delete all pending queries for a session."""
-        queries = await self.get_session_queries(session_id)
-
-        # Delete all found queries
-        for pending in queries:
-            await self.redis.delete(self._key(pending.query_id))
-
+        queries = await self._session_queries(session_id, delete=True)
         logger.debug(
             f"Retrieved and deleted {len(queries)} queries for session: {session_id}"
         )
         return queries
 
+    async def _session_queries(
+        self, session_id: str, delete: bool
+    ) -> list[PendingQuery]:
+        """Run the session index script and parse the returned payloads."""
+        payloads = await self.redis.eval(
+            _REDIS_SESSION_QUERIES_SCRIPT,
+            1,
+            self._session_key(session_id),
+            self.key_prefix,
+            time.time(),
+            "1" if delete else "0",
+        )
+
+        queries = []
+        for data in payloads:
+            try:
+                queries.append(PendingQuery.model_validate_json(data))
+            except Exception as e:
+                logger.debug(
+                    f"Failed to parse pending query in session {session_id}: {e}"
+                )
+        return queries
+
     def _processed_key(self, idempotency_key: str) -> str:
         """Generate Redis key for processed feedback marker."""
         return f"{self.key_prefix}:processed:{idempotency_key}"
@@ -599,6 +765,36 @@ class RedisFeedbackStore(FeedbackStore):
         await self.redis.setex(key, ttl_seconds, "1")
         logger.debug(f"Marked feedback as processed in Redis: {idempotency_key}")
 
+    async def claim_pending(
+        self, query_id: str, idempotency_key: str, ttl_seconds: int = 3600
+    ) -> tuple[bool, PendingQuery | None]:
+        """Check, get-and-delete and mark processed in one Lua script."""
+        result = await self.redis.eval(
+            _REDIS_CLAIM_PENDING_SCRIPT,
+            2,
+            self._processed_key(idempotency_key),
+            self._key(query_id),
+            self.session_key_prefix,
+            ttl_seconds,
+        )
+        if isinstance(result, int):
+            return True, None
+        if result is None:
+            return False, None
+
+        try:
+            pending = PendingQuery.model_validate_json(result)
+        except Exception as e:
+            logger.warning(f"Failed to parse pending query {query_id}: {e}")
+            await self.release_claim(idempotency_key)
+            return False, None
+        logger.debug(f"Claimed pending query from Redis: {query_id}")
+        return False, pending
+
+    async def release_claim(self, idempotency_key: str) -> None:
+        """Forget the processed marker set by claim_pending()."""
+        await self.redis.delete(self._processed_key(idempotency_key))
+
 
 class PostgresFeedbackStore(FeedbackStore):
     """PostgreSQL-based feedback store.
@@ -619,14 +815,16 @@ class PostgresFeedbackStore(FeedbackStore):
             cost DOUBLE PRECISION DEFAULT 0.0,
             latency DOUBLE PRECISION DEFAULT 0.0,
             created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-            expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+            expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            reward_weights JSONB
         );
 
         CREATE INDEX idx_pending_feedback_expires
         ON pending_feedback (expires_at);
 
     Atomicity:
-        Uses DELETE ... RETURNING for atomic get_and_delete.
+        Uses DELETE ... RETURNING for atomic get_and_delete, and a single
+        CTE statement for claim_pending.
     """
 
     def __init__(
@@ -657,14 +855,16 @@ class PostgresFeedbackStore(FeedbackStore):
             await conn.execute(
                 f"""
                 INSERT INTO {self.table_name}
-                (query_id, model_id, features, cost, latency, created_at, expires_at)
-                VALUES ($1, $2, $3, $4, $5, $6, to_timestamp($7))
+                (query_id, model_id, features, cost, latency, created_at, expires_at,
+                 reward_weights)
+                VALUES ($1, $2, $3, $4, $5, $6, to_timestamp($7), $8)
                 ON CONFLICT (query_id) DO UPDATE SET
                     model_id = EXCLUDED.model_id,
                     features = EXCLUDED.features,
                     cost = EXCLUDED.cost,
                     latency = EXCLUDED.latency,
-                    expires_at = EXCLUDED.expires_at
+                    expires_at = EXCLUDED.expires_at,
+                    reward_weights = EXCLUDED.reward_weights
                 """,
                 pending.query_id,
                 pending.model_id,
@@ -673,6 +873,11 @@ class PostgresFeedbackStore(FeedbackStore):
                 pending.latency,
                 pending.created_at,
                 expires_at,
+                (
+                    json.dumps(pending.reward_weights)
+                    if pending.reward_weights is not None
+                    else None
+                ),
             )
         logger.debug(f"Saved pending query to PostgreSQL: {pending.query_id}")
 
@@ -683,7 +888,8 @@ class PostgresFeedbackStore(FeedbackStore):
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
                 f"""
-                SELECT query_id, model_id, features, cost, latency, created_at, expires_at
+                SELECT query_id, model_id, features, cost, latency, created_at, expires_at,
+                       reward_weights
                 FROM {self.table_name}
                 WHERE query_id = $1 AND expires_at > NOW()
                 """,
@@ -703,6 +909,11 @@ class PostgresFeedbackStore(FeedbackStore):
             ),
             cost=row["cost"],
             latency=row["latency"],
+            reward_weights=(
+                json.loads(row["reward_weights"])
+                if isinstance(row["reward_weights"], str)
+                else row["reward_weights"]
+            ),
             created_at=row["created_at"],
             ttl_seconds=int(
                 (row["expires_at"] - datetime.now(timezone.utc)).total_seconds()
@@ -718,7 +929,8 @@ class PostgresFeedbackStore(FeedbackStore):
                 f"""
                 DELETE FROM {self.table_name}
                 WHERE query_id = $1 AND expires_at > NOW()
-                RETURNING query_id, model_id, features, cost, latency, created_at, expires_at
+                RETURNING query_id, model_id, features, cost, latency, created_at, expires_at,
+                          reward_weights
                 """,
                 query_id,
             )
@@ -737,6 +949,11 @@ class PostgresFeedbackStore(FeedbackStore):
             ),
             cost=row["cost"],
             latency=row["latency"],
+            reward_weights=(
+                json.loads(row["reward_weights"])
+                if isinstance(row["reward_weights"], str)
+                else row["reward_weights"]
+            ),
             created_at=row["created_at"],
             ttl_seconds=int(
                 (row["expires_at"] - datetime.now(timezone.utc)).total_seconds()
@@ -829,7 +1046,8 @@ class PostgresFeedbackStore(FeedbackStore):
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(
                 f"""
-                SELECT query_id, model_id, features, cost, latency, created_at, expires_at, session_id
+                SELECT query_id, model_id, features, cost, latency, created_at, expires_at,
+                       reward_weights, session_id
                 FROM {self.table_name}
                 WHERE session_id = $1 AND expires_at > NOW()
                 """,
@@ -849,6 +1067,11 @@ class PostgresFeedbackStore(FeedbackStore):
                     ),
                     cost=row["cost"],
                     latency=row["latency"],
+                    reward_weights=(
+                        json.loads(row["reward_weights"])
+                        if isinstance(row["reward_weights"], str)
+                        else row["reward_weights"]
+                    ),
                     created_at=row["created_at"],
                     ttl_seconds=int(
                         (row["expires_at"] - datetime.now(timezone.utc)).total_seconds()
@@ -868,7 +1091,8 @@ class PostgresFeedbackStore(FeedbackStore):
                 f"""
                 DELETE FROM {self.table_name}
                 WHERE session_id = $1 AND expires_at > NOW()
-                RETURNING query_id, model_id, features, cost, latency, created_at, expires_at, session_id
+                RETURNING query_id, model_id, features, cost, latency, created_at, expires_at,
+                          reward_weights, session_id
                 """,
                 session_id,
             )
@@ -886,6 +1110,11 @@ class PostgresFeedbackStore(FeedbackStore):
                     ),
                     cost=row["cost"],
                     latency=row["latency"],
+                    reward_weights=(
+                        json.loads(row["reward_weights"])
+                        if isinstance(row["reward_weights"], str)
+                        else row["reward_weights"]
+                    ),
                     created_at=row["created_at"],
                     ttl_seconds=int(
                         (row["expires_at"] - datetime.now(timezone.utc)).total_seconds()
@@ -938,3 +1167,95 @@ class PostgresFeedbackStore(FeedbackStore):
                 expires_at,
             )
         logger.debug(f"Marked feedback as processed in PostgreSQL: {idempotency_key}")
+
+    async def claim_pending(
+        self, query_id: str, idempotency_key: str, ttl_seconds: int = 3600
+    ) -> tuple[bool, PendingQuery | None]:
+        """Check, get-and-delete and mark processed in one CTE statement.
+
+        The DELETE only runs when the key is not yet processed, and the
+        marker is only inserted for a deleted row. Concurrent claims for the
+        same query serialize on the row lock, so exactly one of them gets it.
+
+        A claim that loses that race for the same idempotency key read the
+        processed marker before the winner committed. When nothing was
+        claimed, the marker is therefore re-checked in a fresh statement, so
+        the loser reports a duplicate, as the Redis and in-memory stores do.
+        """
+        import json
+
+        expires_at = datetime.now(timezone.utc).timestamp() + ttl_seconds
+
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                WITH processed AS (
+                    SELECT 1 FROM processed_feedback
+                    WHERE idempotency_key = $2 AND expires_at > NOW()
+                ),
+                claimed AS (
+                    DELETE FROM {self.table_name}
+                    WHERE query_id = $1 AND expires_at > NOW()
+                    AND NOT EXISTS (SELECT 1 FROM processed)
+                    RETURNING query_id, model_id, features, cost, latency, created_at, expires_at,
+                              reward_weights
+                ),
+                marked AS (
+                    INSERT INTO processed_feedback (idempotency_key, expires_at)
+                    SELECT $2, to_timestamp($3) FROM claimed
+                    ON CONFLICT (idempotency_key) DO UPDATE SET
+                        expires_at = EXCLUDED.expires_at
+                )
+                SELECT EXISTS (SELECT 1 FROM processed) AS duplicate, claimed.*
+                FROM (SELECT 1) AS one LEFT JOIN claimed ON TRUE
+                """,
+                query_id,
+                idempotency_key,
+                expires_at,
+            )
+            if not row["duplicate"] and row["query_id"] is None:
+                # Nothing claimed: a concurrent claim with this key may have
+                # committed after the CTE's snapshot (new statement sees it)
+                duplicate = await conn.fetchval(
+                    """
+                    SELECT EXISTS (
+                        SELECT 1 FROM processed_feedback
+                        WHERE idempotency_key = $1 AND expires_at > NOW()
+                    )
+                    """,
+                    idempotency_key,
+                )
+                return bool(duplicate), None
+
+        if row["duplicate"]:
+            return True, None
+
+        logger.debug(f"Claimed pending query from PostgreSQL: {query_id}")
+        return False, PendingQuery(
+            query_id=row["query_id"],
+            model_id=row["model_id"],
+            features=(
+                json.loads(row["features"])
+                if isinstance(row["features"], str)
+                else row["features"]
+            ),
+            cost=row["cost"],
+            latency=row["latency"],
+            reward_weights=(
+                json.loads(row["reward_weights"])
+                if isinstance(row["reward_weights"], str)
+                else row["reward_weights"]
+            ),
+            created_at=row["created_at"],
+            ttl_seconds=int(
+                (row["expires_at"] - datetime.now(timezone.utc)).total_seconds()
+            ),
+        )
+
+    async def release_claim(self, idempotency_key: str) -> None:
+        """Forget the processed marker set by claim_pending()."""
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                "DELETE FROM processed_feedback WHERE idempotency_key = $1",
+                idempotency_key,
+            )
@@ -22,6 +22,7 @@ from conduit.observability.audit import (
     PostgresAuditStore,
     create_audit_entry,
 )
+from conduit.observability.audit_pipeline import AuditPipeline
 from conduit.observability.logging import (
     LogEvents,
     bind_context,
@@ -48,6 +49,7 @@ __all__ = [
     "PostgresAuditStore",
     "InMemoryAuditStore",
     "create_audit_entry",
+    "AuditPipeline",
     # Structured logging
     "configure_logging",
     "get_logger",
@@ -89,7 +89,9 @@ class AuditStore(Protocol):
     """Protocol for audit log storage backends.
 
     Implementations must provide methods for logging and querying audit entries.
-    The default implementation is PostgresAuditStore.
+    The default implementation is PostgresAuditStore. Stores may also provide
+    log_decisions(entries) -> int for batched writes, which AuditPipeline
+    uses when present.
     """
 
     async def log_decision(self, entry: AuditEntry) -> int:
@@ -207,6 +209,64 @@ class PostgresAuditStore:
             )
             return int(row["id"])
 
+    async def log_decisions(self, entries: list[AuditEntry]) -> int:
+        """Log a batch of routing decisions with one COPY.
+
+        Used by AuditPipeline: one round trip per batch instead of one
+        INSERT per decision. Entry IDs are not returned.
+
+        Args:
+            entries: Audit entries to log
+
+        Returns:
+            Number of entries written
+        """
+        import json
+        from decimal import Decimal
+
+        if not entries:
+            return 0
+
+        records = [
+            (
+                entry.decision_id,
+                entry.query_id,
+                entry.selected_model,
+                entry.fallback_chain,
+                # NUMERIC(4,3) column; binary COPY needs a Decimal
+                Decimal(f"{entry.confidence:.3f}"),
+                entry.algorithm_phase,
+                entry.query_count,
+                json.dumps(entry.arm_scores),
+                json.dumps(entry.feature_vector) if entry.feature_vector else None,
+                json.dumps(entry.constraints_applied),
+                entry.reasoning,
+                entry.created_at,
+            )
+            for entry in entries
+        ]
+
+        async with self.pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "decision_audit",
+                records=records,
+                columns=[
+                    "decision_id",
+                    "query_id",
+                    "selected_model",
+                    "fallback_chain",
+                    "confidence",
+                    "algorithm_phase",
+                    "query_count",
+                    "arm_scores",
+                    "feature_vector",
+                    "constraints_applied",
+                    "reasoning",
+                    "created_at",
+                ],
+            )
+        return len(records)
+
     async def get_entry(self, entry_id: int) -> AuditEntry | None:
         """Get a specific audit entry by ID."""
         query = """
@@ -368,6 +428,12 @@ class InMemoryAuditStore:
         assert entry_copy.id is not None
         return entry_copy.id
 
+    async def log_decisions(self, entries: list[AuditEntry]) -> int:
+        """Log a batch of routing decisions."""
+        for entry in entries:
+            await self.log_decision(entry)
+        return len(entries)
+
     async def get_entry(self, entry_id: int) -> AuditEntry | None:
         """Get entry by ID."""
         for entry in self.entries:
@@ -454,12 +520,9 @@ def create_audit_entry(
     """
     # Extract feature vector if available (for contextual algorithms)
     feature_vector = None
-    if decision.features and decision.features.embedding:
-        # Include embedding + metadata features
-        feature_vector = decision.features.embedding + [
-            decision.features.token_count / 1000.0,
-            decision.features.complexity_score,
-        ]
+    if decision.features and decision.features.embedding_array.size:
+        # Include embedding + metadata features (serialized at the audit boundary)
+        feature_vector = decision.features.feature_vector.tolist()
 
     return AuditEntry(
         decision_id=decision.id,
@@ -0,0 +1,160 @@
+"""Buffered, batched audit logging off the routing path.
+
+Router.route() used to await AuditStore.log_decision() for every decision:
+one INSERT round trip added to routing latency. AuditPipeline queues entries
+on a BackgroundBatcher (conduit.core.batcher) instead, so routing only pays
+for an in-memory put. Batches go through the store's log_decisions() when it
+has one (PostgresAuditStore uses COPY), else one log_decision() per entry.
+
+With the default overflow="drop", a full queue discards new entries so
+routing never waits on the audit database; overflow="block" trades routing
+latency for a complete audit trail.
+
+Example:
+    >>> pipeline = AuditPipeline(audit_store, batch_size=500)
+    >>> await pipeline.submit(entry)    # enqueue only
+    >>> await pipeline.close()          # final flush
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from conduit.core.batcher import BackgroundBatcher, OverflowPolicy
+from conduit.observability.metrics import (
+    record_audit_dropped,
+    record_audit_flush,
+    record_audit_queue_depth,
+)
+
+if TYPE_CHECKING:
+    from conduit.observability.audit import AuditEntry, AuditStore
+
+logger = logging.getLogger(__name__)
+
+AuditOverflowPolicy = OverflowPolicy
+
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class AuditPipeline:
+    """Background batch writer for audit entries.
+
+    Not thread-safe: submit() must be called from the event loop that runs
+    the flush task.
+
+    Attributes:
+        store: AuditStore receiving the batches
+        queue_size: Maximum queued entries before the overflow policy applies
+        batch_size: Maximum entries per write
+        flush_interval: Longest time (seconds) an entry waits for a write
+        overflow: "drop" new entries or "block" submit() when the queue is full
+    """
+
+    def __init__(
+        self,
+        store: "AuditStore",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: AuditOverflowPolicy = "drop",
+    ):
+        """Initialize pipeline.
+
+        Args:
+            store: AuditStore to write to
+            queue_size: Maximum queued entries
+            batch_size: Maximum entries per write
+            flush_interval: Write at most this many seconds after an entry
+                is queued
+            overflow: Policy when the queue is full ("drop" or "block")
+
+        Raises:
+            ValueError: If sizes are < 1, flush_interval <= 0, or overflow
+                is unknown
+        """
+        self.store = store
+        self._batcher: BackgroundBatcher[AuditEntry] = BackgroundBatcher(
+            self._write_batch,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            overflow=overflow,
+            name="audit",
+            on_queue_depth=record_audit_queue_depth,
+            on_drop=lambda reason: record_audit_dropped(1, reason),
+        )
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+
+    async def submit(self, entry: "AuditEntry") -> bool:
+        """Queue an entry for the background writer.
+
+        With overflow="drop" this never suspends; with "block" it waits
+        while the queue is full.
+
+        Args:
+            entry: Audit entry to write
+
+        Returns:
+            True if queued, False if dropped (queue full or pipeline closed)
+        """
+        return await self._batcher.submit(entry)
+
+    async def flush(self) -> int:
+        """Write everything currently queued, in batches of batch_size.
+
+        Returns:
+            Number of entries written (failed batches are logged and counted
+            in failed_entries, not raised)
+        """
+        return await self._batcher.flush()
+
+    async def _write_batch(self, batch: list["AuditEntry"]) -> None:
+        """Write one batch, using the store's bulk method when available."""
+        start = time.monotonic()
+        try:
+            log_decisions = getattr(self.store, "log_decisions", None)
+            if log_decisions is not None:
+                await log_decisions(batch)
+            else:
+                for entry in batch:
+                    await self.store.log_decision(entry)
+        except Exception:
+            record_audit_flush(0.0, success=False)
+            raise
+        record_audit_flush((time.monotonic() - start) * 1000)
+
+    async def close(self) -> None:
+        """Stop the background task and write any queued entries."""
+        await self._batcher.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pipeline statistics.
+
+        Returns:
+            Dictionary with:
+            - queue_depth / max_queue_depth: Entries waiting now / at peak
+            - submitted: Entries accepted by submit()
+            - written: Entries written successfully
+            - dropped: Entries discarded by the overflow policy or after close
+            - failed_entries: Entries lost to failed batch writes
+            - batches: Successful batch writes
+            - last_flush_ms / last_batch_size: Most recent batch write
+        """
+        stats = self._batcher.get_stats()
+        return {
+            "queue_depth": stats["queue_depth"],
+            "max_queue_depth": stats["max_queue_depth"],
+            "submitted": stats["submitted"],
+            "written": stats["handled"],
+            "dropped": stats["dropped"],
+            "failed_entries": stats["failed"],
+            "batches": stats["batches"],
+            "last_flush_ms": stats["last_batch_ms"],
+            "last_batch_size": stats["last_batch_size"],
+        }
@@ -11,6 +11,8 @@ Metrics:
     - conduit.cache.hits: Counter of cache hits
     - conduit.cache.misses: Counter of cache misses
     - conduit.feedback.submissions: Counter of feedback by type
+    - conduit.embeddings.queue_depth: UpDownCounter of pending local embedding jobs
+    - conduit.embeddings.compute_time: Histogram of local embedding compute time
 """
 
 import logging
@@ -34,6 +36,16 @@ _routing_confidence_histogram: metrics.Histogram | None = None
 _cache_hits_counter: metrics.Counter | None = None
 _cache_misses_counter: metrics.Counter | None = None
 _feedback_submissions_counter: metrics.Counter | None = None
+_embedding_queue_depth_counter: metrics.UpDownCounter | None = None
+_embedding_compute_histogram: metrics.Histogram | None = None
+_state_flush_lag_histogram: metrics.Histogram | None = None
+_state_bytes_written_counter: metrics.Counter | None = None
+_audit_queue_depth_counter: metrics.UpDownCounter | None = None
+_audit_dropped_counter: metrics.Counter | None = None
+_audit_flush_histogram: metrics.Histogram | None = None
+_implicit_queue_depth_counter: metrics.UpDownCounter | None = None
+_implicit_dropped_counter: metrics.Counter | None = None
+_implicit_lag_histogram: metrics.Histogram | None = None
 
 
 def get_meter(name: str = "conduit") -> metrics.Meter:
@@ -63,6 +75,16 @@ def _ensure_instruments() -> None:
     global _cache_hits_counter
     global _cache_misses_counter
     global _feedback_submissions_counter
+    global _embedding_queue_depth_counter
+    global _embedding_compute_histogram
+    global _state_flush_lag_histogram
+    global _state_bytes_written_counter
+    global _audit_queue_depth_counter
+    global _audit_dropped_counter
+    global _audit_flush_histogram
+    global _implicit_queue_depth_counter
+    global _implicit_dropped_counter
+    global _implicit_lag_histogram
 
     meter = get_meter()
 
@@ -115,6 +137,76 @@ def _ensure_instruments() -> None:
             unit="1",
         )
 
+    if _embedding_queue_depth_counter is None:
+        _embedding_queue_depth_counter = meter.create_up_down_counter(
+            name="conduit.embeddings.queue_depth",
+            description="Local embedding jobs admitted but not yet finished",
+            unit="1",
+        )
+
+    if _embedding_compute_histogram is None:
+        _embedding_compute_histogram = meter.create_histogram(
+            name="conduit.embeddings.compute_time",
+            description="Local embedding model compute time",
+            unit="ms",
+        )
+
+    if _state_flush_lag_histogram is None:
+        _state_flush_lag_histogram = meter.create_histogram(
+            name="conduit.state.flush_lag",
+            description="Time from first unsaved state change to durable write",
+            unit="ms",
+        )
+
+    if _state_bytes_written_counter is None:
+        _state_bytes_written_counter = meter.create_counter(
+            name="conduit.state.bytes_written",
+            description="Bytes of router state written to the state store",
+            unit="By",
+        )
+
+    if _audit_queue_depth_counter is None:
+        _audit_queue_depth_counter = meter.create_up_down_counter(
+            name="conduit.audit.queue_depth",
+            description="Audit entries queued but not yet written",
+            unit="1",
+        )
+
+    if _audit_dropped_counter is None:
+        _audit_dropped_counter = meter.create_counter(
+            name="conduit.audit.dropped",
+            description="Audit entries discarded because the queue was full",
+            unit="1",
+        )
+
+    if _audit_flush_histogram is None:
+        _audit_flush_histogram = meter.create_histogram(
+            name="conduit.audit.flush_time",
+            description="Time to write one batch of audit entries",
+            unit="ms",
+        )
+
+    if _implicit_queue_depth_counter is None:
+        _implicit_queue_depth_counter = meter.create_up_down_counter(
+            name="conduit.implicit_feedback.queue_depth",
+            description="Completion events queued for implicit feedback detection",
+            unit="1",
+        )
+
+    if _implicit_dropped_counter is None:
+        _implicit_dropped_counter = meter.create_counter(
+            name="conduit.implicit_feedback.dropped",
+            description="Completion events discarded because the queue was full",
+            unit="1",
+        )
+
+    if _implicit_lag_histogram is None:
+        _implicit_lag_histogram = meter.create_histogram(
+            name="conduit.implicit_feedback.lag",
+            description="Time from completion enqueue to implicit feedback applied",
+            unit="ms",
+        )
+
 
 def record_routing_decision(
     decision: RoutingDecision,
@@ -197,6 +289,161 @@ def record_feedback_submission(feedback_type: str, explicit: bool = True) -> Non
         _feedback_submissions_counter.add(1, attributes)
 
 
+def record_embedding_queue_depth(delta: int, executor: str = "embeddings") -> None:
+    """Record a change in the local embedding executor queue depth.
+
+    Args:
+        delta: +1 when a job is admitted, -1 when it finishes
+        executor: Executor name (attribute for multi-pool deployments)
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _embedding_queue_depth_counter:
+        _embedding_queue_depth_counter.add(delta, {"executor": executor})
+
+
+def record_embedding_compute(
+    duration_ms: float, executor: str = "embeddings", success: bool = True
+) -> None:
+    """Record local embedding compute time.
+
+    Args:
+        duration_ms: Time spent inside the embedding model (excludes queue wait)
+        executor: Executor name (attribute for multi-pool deployments)
+        success: False if the embedding call raised
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _embedding_compute_histogram:
+        attributes = {"executor": executor, "success": success}
+        _embedding_compute_histogram.record(duration_ms, attributes)
+
+
+def record_state_flush(
+    lag_ms: float,
+    bytes_written: int,
+    router_id: str,
+    success: bool = True,
+) -> None:
+    """Record a write-behind state flush.
+
+    Args:
+        lag_ms: Time from the first pending state change to write completion
+        bytes_written: Serialized state size written (0 if unknown or failed)
+        router_id: Router whose state was flushed
+        success: False if the write raised
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    attributes = {"router_id": router_id, "success": success}
+    if _state_flush_lag_histogram and success:
+        _state_flush_lag_histogram.record(lag_ms, attributes)
+    if _state_bytes_written_counter and bytes_written:
+        _state_bytes_written_counter.add(bytes_written, {"router_id": router_id})
+
+
+def record_audit_queue_depth(delta: int) -> None:
+    """Record a change in the audit pipeline queue depth.
+
+    Args:
+        delta: +1 when an entry is queued, -n when a batch is taken
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _audit_queue_depth_counter:
+        _audit_queue_depth_counter.add(delta)
+
+
+def record_audit_dropped(count: int, reason: str) -> None:
+    """Record audit entries discarded by the pipeline.
+
+    Args:
+        count: Number of entries dropped
+        reason: Why ("queue_full" or "closed")
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _audit_dropped_counter:
+        _audit_dropped_counter.add(count, {"reason": reason})
+
+
+def record_audit_flush(duration_ms: float, success: bool = True) -> None:
+    """Record an audit batch write.
+
+    Args:
+        duration_ms: Write duration (0 if the write failed)
+        success: False if the write raised
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _audit_flush_histogram and success:
+        _audit_flush_histogram.record(duration_ms)
+
+
+def record_implicit_queue_depth(delta: int) -> None:
+    """Record a change in the implicit feedback queue depth.
+
+    Args:
+        delta: +1 when an event is queued, -1 when a worker takes it
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _implicit_queue_depth_counter:
+        _implicit_queue_depth_counter.add(delta)
+
+
+def record_implicit_dropped(count: int, reason: str) -> None:
+    """Record completion events discarded by the implicit feedback pipeline.
+
+    Args:
+        count: Number of events dropped
+        reason: Why ("queue_full" or "closed")
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _implicit_dropped_counter:
+        _implicit_dropped_counter.add(count, {"reason": reason})
+
+
+def record_implicit_lag(lag_ms: float) -> None:
+    """Record how long an event took to reach the bandit in the background.
+
+    Args:
+        lag_ms: Time from enqueue until the event's batch was processed
+    """
+    if not settings.otel_enabled or not settings.otel_metrics_enabled:
+        return
+
+    _ensure_instruments()
+
+    if _implicit_lag_histogram:
+        _implicit_lag_histogram.record(lag_ms)
+
+
 def get_metrics_summary() -> dict[str, Any]:
     """Get current metrics summary for debugging.
 
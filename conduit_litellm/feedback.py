@@ -3,16 +3,28 @@
 This module implements CustomLogger callback to capture LiteLLM response
 metadata (cost, latency) and feed it back to Conduit's bandit algorithms,
 enabling ML-based learning from actual usage.
+
+LiteLLM awaits its callbacks, so the callback only extracts cost, latency and
+response text and queues a job on a BackgroundBatcher (conduit.core.batcher).
+Each batch resolves the models, estimates quality and reaches the bandit in
+one Router.update_batch() call. Query features come from the routing decision
+when ConduitRoutingStrategy stashed them under the request's litellm_call_id;
+the query is only re-analyzed when that lookup misses (request routed
+elsewhere, or the entry expired).
 """
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any
 from uuid import uuid4
 
+from conduit.cache.memory import LRUFeatureCache
+from conduit.core.batcher import BackgroundBatcher
 from conduit.core.config import load_quality_estimation_config
-from conduit.core.models import Query, Response
+from conduit.core.models import Query, QueryFeatures, Response
 from conduit.engines.bandits.base import BanditFeedback
+from conduit.engines.router import Router
 from conduit_litellm.model_registry import ModelRegistry, ResolveResult
 from conduit_litellm.utils import extract_query_text
 
@@ -35,14 +47,38 @@ except ImportError:
         pass
 
 
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+
+@dataclass(frozen=True)
+class _FeedbackJob:
+    """Completion data captured in the LiteLLM callback, processed later."""
+
+    query_text: str
+    litellm_model_id: str
+    cost: float
+    latency: float
+    success: bool
+    features: QueryFeatures | None = None
+    response_text: str = ""
+    response_id: str | None = None
+    tokens: int = 0
+    error: str | None = None
+
+
 class ConduitFeedbackLogger(CustomLogger):
     """Captures LiteLLM responses and updates Conduit bandit algorithms.
 
     This logger integrates with LiteLLM's callback system to:
-    1. Extract cost/latency from completed requests
-    2. Reconstruct query features from request messages
+    1. Extract cost/latency from completed requests (in the callback)
+    2. Reuse routing-time query features, or re-analyze on a miss
     3. Create BanditFeedback with quality estimation
-    4. Update Conduit's bandit algorithm for learning
+    4. Update Conduit's bandit algorithm in batches
+
+    Steps 2-4 run on a background task; use flush() to wait for them and
+    close() to drain the queue on shutdown.
 
     The feedback loop enables Conduit to learn which models perform best
     for different query types, optimizing for quality, cost, and latency.
@@ -60,6 +96,10 @@ class ConduitFeedbackLogger(CustomLogger):
         evaluator: Any | None = None,
         litellm_to_conduit_map: dict[str, str] | None = None,
         model_registry: ModelRegistry | None = None,
+        routed_features: LRUFeatureCache | None = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ):
         """Initialize feedback logger with Conduit router reference.
 
@@ -69,13 +109,40 @@ class ConduitFeedbackLogger(CustomLogger):
             litellm_to_conduit_map: Mapping from LiteLLM model names to Conduit model IDs
             model_registry: Optional ModelRegistry for robust alias resolution.
                 If not provided, creates a per-instance registry.
+            routed_features: Routing-time features keyed by litellm_call_id
+                (filled by ConduitRoutingStrategy). Entries are consumed on
+                lookup; without it every completion is re-analyzed.
+            queue_size: Completions that may wait for processing; further
+                completions are dropped (and counted) until the queue drains
+            batch_size: Most completions applied in one bandit update
+            flush_interval: Process completions at most this many seconds
+                after they are queued
+
+        Raises:
+            ValueError: If queue_size or batch_size < 1, or flush_interval <= 0
         """
+        self._batcher: BackgroundBatcher[_FeedbackJob] = BackgroundBatcher(
+            self._process_batch,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            name="LiteLLM feedback",
+        )
+
         super().__init__()
         self.router = conduit_router
         self.evaluator = evaluator
         self._litellm_to_conduit_map = litellm_to_conduit_map or {}
         # Per-instance registry (avoids global state pollution)
         self._model_registry = model_registry or ModelRegistry()
+        self._routed_features = routed_features
+        self.batch_size = batch_size
+
+        self._skipped = 0
+        self._applied = 0
+        self._batches = 0
+        self._reused_features = 0
+        self._analyzed_features = 0
 
         # Register explicit mappings with the registry
         for litellm_name, conduit_id in self._litellm_to_conduit_map.items():
@@ -95,10 +162,11 @@ class ConduitFeedbackLogger(CustomLogger):
         start_time: float,
         end_time: float,
     ) -> None:
-        """Log successful LiteLLM completion and update bandit.
+        """Queue feedback for a successful LiteLLM completion.
 
-        Called by LiteLLM after successful completion. Extracts cost/latency
-        from response, reconstructs query features, and updates bandit algorithm.
+        Called by LiteLLM after successful completion. Extracts cost, latency
+        and response text, then returns; the bandit is updated by the
+        background task.
 
         Args:
             kwargs: LiteLLM request parameters (model, messages, etc.)
@@ -115,8 +183,8 @@ class ConduitFeedbackLogger(CustomLogger):
                 logger.warning("No query text found in LiteLLM request, skipping feedback")
                 return
 
-            # Generate features using router's analyzer
-            features = await self.router.analyzer.analyze(query_text)
+            # Consume the stashed features even if feedback is skipped below
+            features = self._take_routed_features(kwargs)
 
             # Extract cost from LiteLLM response metadata
             cost = self._extract_cost(response_obj)
@@ -127,93 +195,30 @@ class ConduitFeedbackLogger(CustomLogger):
                 )
                 return
 
-            # Calculate latency in seconds
-            # LiteLLM may pass floats (time.time()) or datetime objects
-            latency_raw = end_time - start_time
-            if hasattr(latency_raw, "total_seconds"):
-                latency = latency_raw.total_seconds()
-            else:
-                latency = float(latency_raw)
-
             # Get model ID from LiteLLM response (e.g., "gpt-4o-mini-2024-07-18")
             litellm_model_id = kwargs.get("model", "unknown")
             if litellm_model_id == "unknown":
                 logger.warning("No model ID in LiteLLM response, skipping feedback")
                 return
 
-            # Map LiteLLM model ID to Conduit format using new ResolveResult API
-            resolve_result = self._resolve_model_id(litellm_model_id)
-
-            # Check if resolution succeeded (ResolveResult has __bool__ = success)
-            if not resolve_result:
-                # Resolution failed - log with full context and skip feedback
-                logger.warning(
-                    f"Model resolution failed - skipping feedback. "
-                    f"Input: '{litellm_model_id}', "
-                    f"Fallback: '{resolve_result.model_id}', "
-                    f"Source: {resolve_result.source.value}, "
-                    f"Confidence: {resolve_result.confidence:.2f}. "
-                    f"Available: {self._get_available_model_ids()[:5]}. "
-                    f"Registry stats: {self._model_registry.get_mapping_state().get('stats', {})}"
-                )
-                return
-
-            model_id = resolve_result.model_id
-
-            # Extract response text for quality estimation
-            response_text = self._extract_response_text(response_obj)
-
-            # Estimate quality from response content
-            quality_score = self._estimate_quality(query_text, response_text)
-
-            # Create feedback with estimated quality
-            feedback = BanditFeedback(
-                model_id=model_id,
-                cost=cost,
-                quality_score=quality_score,
-                latency=latency,
-                success=True,
-                metadata={
-                    "source": "litellm",
-                    "response_id": getattr(response_obj, "id", None),
-                },
-            )
-
-            # Update appropriate router component
-            await self._update_bandit(feedback, features)
-
-            # Fire-and-forget Arbiter evaluation (if enabled)
-            if self.evaluator:
-                # Create Query and Response objects for Arbiter
-                query_obj = Query(
-                    id=str(uuid4()),
-                    text=query_text,
-                )
+            # Extract token count from response (LiteLLM includes usage data)
+            tokens = 0
+            usage = getattr(response_obj, "usage", None)
+            if usage is not None:
+                tokens = getattr(usage, "total_tokens", 0)
 
-                # Extract token count from response (LiteLLM includes usage data)
-                tokens = 0
-                usage = getattr(response_obj, 'usage', None)
-                if usage is not None:
-                    tokens = getattr(usage, 'total_tokens', 0)
-
-                response_obj_conduit = Response(
-                    id=getattr(response_obj, "id", str(uuid4())),
-                    query_id=query_obj.id,
-                    text=response_text,
-                    model=model_id,
+            self._batcher.submit_nowait(
+                _FeedbackJob(
+                    query_text=query_text,
+                    litellm_model_id=litellm_model_id,
                     cost=cost,
-                    latency=latency,
+                    latency=self._latency_seconds(start_time, end_time),
+                    success=True,
+                    features=features,
+                    response_text=self._extract_response_text(response_obj),
+                    response_id=getattr(response_obj, "id", None),
                     tokens=tokens,
                 )
-                # Non-blocking evaluation
-                asyncio.create_task(
-                    self.evaluator.evaluate_async(response_obj_conduit, query_obj)
-                )
-
-            logger.debug(
-                f"Feedback recorded: model={model_id}, cost=${cost:.6f}, "
-                f"latency={latency:.2f}s, quality={quality_score:.2f}"
-                f"{', arbiter=queued' if self.evaluator else ''}"
             )
 
         except Exception as e:
@@ -226,10 +231,10 @@ class ConduitFeedbackLogger(CustomLogger):
         start_time: float,
         end_time: float,
     ) -> None:
-        """Log failed LiteLLM completion and update bandit.
+        """Queue feedback for a failed LiteLLM completion.
 
-        Called by LiteLLM when completion fails. Records low quality score
-        to teach bandit to avoid failing models.
+        Called by LiteLLM when completion fails. The background task records
+        a low quality score to teach the bandit to avoid failing models.
 
         Args:
             kwargs: LiteLLM request parameters
@@ -246,8 +251,8 @@ class ConduitFeedbackLogger(CustomLogger):
                 logger.warning("No query text found in failed request, skipping feedback")
                 return
 
-            # Generate features
-            features = await self.router.analyzer.analyze(query_text)
+            # A retry is routed again and stashes its features anew
+            features = self._take_routed_features(kwargs)
 
             # Extract cost (may be None for failures)
             cost = self._extract_cost(response_obj)
@@ -255,56 +260,205 @@ class ConduitFeedbackLogger(CustomLogger):
             if cost is None:
                 cost = 0.0
 
-            # Calculate latency in seconds
-            # LiteLLM may pass floats (time.time()) or datetime objects
-            latency_raw = end_time - start_time
-            if hasattr(latency_raw, "total_seconds"):
-                latency = latency_raw.total_seconds()
-            else:
-                latency = float(latency_raw)
-
             # Get model ID from LiteLLM response (e.g., "gpt-4o-mini-2024-07-18")
             litellm_model_id = kwargs.get("model", "unknown")
             if litellm_model_id == "unknown":
                 logger.warning("No model ID in failed request, skipping feedback")
                 return
 
-            # Map LiteLLM model ID to Conduit format using new ResolveResult API
-            resolve_result = self._resolve_model_id(litellm_model_id)
+            self._batcher.submit_nowait(
+                _FeedbackJob(
+                    query_text=query_text,
+                    litellm_model_id=litellm_model_id,
+                    cost=cost,
+                    latency=self._latency_seconds(start_time, end_time),
+                    success=False,
+                    features=features,
+                    error=str(response_obj),
+                )
+            )
+
+        except Exception as e:
+            logger.error(f"Error recording failure feedback: {e}", exc_info=True)
+
+    @staticmethod
+    def _latency_seconds(start_time: Any, end_time: Any) -> float:
+        """Request latency in seconds.
 
-            # Check if resolution succeeded
-            if not resolve_result:
-                logger.warning(
-                    f"Model resolution failed - skipping failure feedback. "
-                    f"Input: '{litellm_model_id}', Source: {resolve_result.source.value}"
+        LiteLLM may pass floats (time.time()) or datetime objects.
+        """
+        latency_raw = end_time - start_time
+        if hasattr(latency_raw, "total_seconds"):
+            return float(latency_raw.total_seconds())
+        return float(latency_raw)
+
+    def _take_routed_features(self, kwargs: dict[str, Any]) -> QueryFeatures | None:
+        """Pop the features the routing strategy stashed for this request.
+
+        Args:
+            kwargs: LiteLLM request parameters (carry litellm_call_id)
+
+        Returns:
+            Routing-time QueryFeatures, or None if none were stashed
+        """
+        call_id = kwargs.get("litellm_call_id")
+        if self._routed_features is None or not call_id:
+            return None
+        return self._routed_features.pop(call_id)
+
+    async def _process_batch(self, jobs: list[_FeedbackJob]) -> None:
+        """Turn queued jobs into feedback and apply them together.
+
+        Args:
+            jobs: Jobs taken from the queue
+        """
+        batch: list[tuple[BanditFeedback, Any]] = []
+        for job in jobs:
+            try:
+                item = await self._build_feedback(job)
+            except Exception as e:
+                logger.error(
+                    f"Error building feedback for {job.litellm_model_id}: {e}",
+                    exc_info=True,
                 )
-                return
+                item = None
+            if item is None:
+                self._skipped += 1
+            else:
+                batch.append(item)
+
+        if batch:
+            await self._apply_updates(batch)
+            self._applied += len(batch)
+            self._batches += 1
+
+    async def _build_feedback(
+        self, job: _FeedbackJob
+    ) -> tuple[BanditFeedback, Any] | None:
+        """Resolve the model, score the response and pair it with features.
+
+        Args:
+            job: Queued completion data
 
-            model_id = resolve_result.model_id
-
-            # Create feedback with low quality (failure = poor response)
-            feedback = BanditFeedback(
-                model_id=model_id,
-                cost=cost,
-                quality_score=load_quality_estimation_config()["failure_quality"],
-                latency=latency,
-                success=False,
-                metadata={
-                    "source": "litellm",
-                    "error": str(response_obj),
-                },
+        Returns:
+            (feedback, features), or None if the model cannot be resolved
+        """
+        # Map LiteLLM model ID to Conduit format using new ResolveResult API
+        resolve_result = self._resolve_model_id(job.litellm_model_id)
+
+        # Check if resolution succeeded (ResolveResult has __bool__ = success)
+        if not resolve_result:
+            # Resolution failed - log with full context and skip feedback
+            logger.warning(
+                f"Model resolution failed - skipping "
+                f"{'feedback' if job.success else 'failure feedback'}. "
+                f"Input: '{job.litellm_model_id}', "
+                f"Fallback: '{resolve_result.model_id}', "
+                f"Source: {resolve_result.source.value}, "
+                f"Confidence: {resolve_result.confidence:.2f}. "
+                f"Available: {self._get_available_model_ids()[:5]}. "
+                f"Registry stats: {self._model_registry.get_mapping_state().get('stats', {})}"
             )
+            return None
+
+        model_id = resolve_result.model_id
 
-            # Update bandit
-            await self._update_bandit(feedback, features)
+        features = job.features
+        if features is None:
+            # Not routed by the strategy (or stash entry expired): re-analyze
+            features = await self.router.analyzer.analyze(job.query_text)
+            self._analyzed_features += 1
+        else:
+            self._reused_features += 1
+
+        if job.success:
+            # Estimate quality from response content
+            quality_score = self._estimate_quality(job.query_text, job.response_text)
+            metadata = {"source": "litellm", "response_id": job.response_id}
+        else:
+            # Failure = poor response
+            quality_score = load_quality_estimation_config()["failure_quality"]
+            metadata = {"source": "litellm", "error": job.error}
+
+        feedback = BanditFeedback(
+            model_id=model_id,
+            cost=job.cost,
+            quality_score=quality_score,
+            latency=job.latency,
+            success=job.success,
+            metadata=metadata,
+        )
 
-            logger.debug(
-                f"Failure feedback recorded: model={model_id}, latency={latency:.2f}s, "
-                f"quality=0.1"
+        # Fire-and-forget Arbiter evaluation (if enabled)
+        if self.evaluator and job.success:
+            # Create Query and Response objects for Arbiter
+            query_obj = Query(
+                id=str(uuid4()),
+                text=job.query_text,
+            )
+            response_obj_conduit = Response(
+                id=job.response_id or str(uuid4()),
+                query_id=query_obj.id,
+                text=job.response_text,
+                model=model_id,
+                cost=job.cost,
+                latency=job.latency,
+                tokens=job.tokens,
+            )
+            # Non-blocking evaluation
+            asyncio.create_task(
+                self.evaluator.evaluate_async(response_obj_conduit, query_obj)
             )
 
-        except Exception as e:
-            logger.error(f"Error recording failure feedback: {e}", exc_info=True)
+        logger.debug(
+            f"Feedback recorded: model={model_id}, cost=${job.cost:.6f}, "
+            f"latency={job.latency:.2f}s, quality={quality_score:.2f}"
+            f"{', arbiter=queued' if self.evaluator and job.success else ''}"
+        )
+        return feedback, features
+
+    async def flush(self) -> None:
+        """Wait until every queued completion has been applied to the bandit."""
+        await self._batcher.flush()
+
+    async def close(self) -> None:
+        """Stop accepting completions and apply everything still queued.
+
+        Completions logged afterwards are dropped (and counted).
+        """
+        await self._batcher.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return background feedback statistics.
+
+        Returns:
+            Dictionary with:
+            - queue_depth: Completions waiting to be processed
+            - submitted: Completions queued by the callbacks
+            - dropped: Completions discarded (queue full or logger closed)
+            - skipped: Completions not applied (unresolvable model, errors)
+            - failed: Completions lost to failed bandit updates
+            - applied: Feedback events applied to the bandit
+            - batches: Bandit updates performed
+            - reused_features: Completions that used routing-time features
+            - analyzed_features: Completions that had to be re-analyzed
+            - last_lag_ms / avg_lag_ms / max_lag_ms: Enqueue-to-applied delay
+        """
+        stats = self._batcher.get_stats()
+        return {
+            "queue_depth": stats["queue_depth"],
+            "submitted": stats["submitted"],
+            "dropped": stats["dropped"],
+            "skipped": self._skipped,
+            "failed": stats["failed"],
+            "applied": self._applied,
+            "batches": self._batches,
+            "reused_features": self._reused_features,
+            "analyzed_features": self._analyzed_features,
+            "last_lag_ms": stats["last_lag_ms"],
+            "avg_lag_ms": stats["avg_lag_ms"],
+            "max_lag_ms": stats["max_lag_ms"],
+        }
 
     def _extract_cost(self, response_obj: Any) -> float | None:
         """Extract cost from LiteLLM response object.
@@ -390,23 +544,30 @@ class ConduitFeedbackLogger(CustomLogger):
 
         return []
 
-    async def _update_bandit(self, feedback: BanditFeedback, features: Any) -> None:
-        """Update appropriate bandit algorithm (hybrid or standard).
+    async def _apply_updates(self, batch: list[tuple[BanditFeedback, Any]]) -> None:
+        """Update the bandit, through the Router when one is attached.
+
+        Router.update_batch() keeps the update on the router's single-writer
+        actor and marks state dirty for persistence. Router-like objects
+        without it get the HybridRouter or standard bandit updated directly.
 
         Args:
-            feedback: Bandit feedback to record
-            features: Query features for contextual learning
+            batch: (feedback, features) pairs to record
         """
+        if isinstance(self.router, Router):
+            await self._update_router(batch)
+            return
+
         # Hybrid mode: Update HybridRouter
         if hasattr(self.router, "hybrid_router") and self.router.hybrid_router is not None:
-            await self.router.hybrid_router.update(feedback, features)
-            logger.debug("Updated HybridRouter with feedback")
+            await self._update_hybrid(batch)
             return
 
         # Standard mode: Update ContextualBandit
         if hasattr(self.router, "bandit") and self.router.bandit is not None:
-            await self.router.bandit.update(feedback, features)
-            logger.debug("Updated ContextualBandit with feedback")
+            for feedback, features in batch:
+                await self.router.bandit.update(feedback, features)
+            logger.debug(f"Updated ContextualBandit with {len(batch)} feedback events")
             return
 
         # No bandit available (shouldn't happen)
@@ -415,6 +576,62 @@ class ConduitFeedbackLogger(CustomLogger):
             "(neither hybrid_router nor bandit found)"
         )
 
+    async def _update_router(self, batch: list[tuple[BanditFeedback, Any]]) -> None:
+        """Apply feedback with Router.update_batch().
+
+        If the batch is rejected as a whole, events are applied singly so one
+        bad event cannot discard the rest.
+
+        Args:
+            batch: (feedback, features) pairs to record
+        """
+        try:
+            await self.router.update_batch(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                raise
+            logger.warning(f"Batched feedback update failed, applying singly: {e}")
+            for item in batch:
+                try:
+                    await self.router.update_batch([item])
+                except Exception as item_error:
+                    logger.error(
+                        f"Error updating Router for {item[0].model_id}: {item_error}"
+                    )
+        logger.debug(f"Updated Router with {len(batch)} feedback events")
+
+    async def _update_hybrid(self, batch: list[tuple[BanditFeedback, Any]]) -> None:
+        """Update HybridRouter with one update_batch() call.
+
+        A lone event uses HybridRouter.update(). If the batch is rejected as
+        a whole, events are applied singly so one bad event cannot discard
+        the rest.
+
+        Args:
+            batch: (feedback, features) pairs to record
+        """
+        hybrid_router = self.router.hybrid_router
+
+        if len(batch) == 1:
+            await hybrid_router.update(*batch[0])
+            logger.debug("Updated HybridRouter with feedback")
+            return
+
+        try:
+            await hybrid_router.update_batch(batch)
+        except Exception as e:
+            # Batch rejected as a whole (e.g. one unknown model): apply singly
+            logger.warning(f"Batched feedback update failed, applying singly: {e}")
+            for item_feedback, item_features in batch:
+                try:
+                    await hybrid_router.update(item_feedback, item_features)
+                except Exception as item_error:
+                    logger.error(
+                        f"Error updating HybridRouter for "
+                        f"{item_feedback.model_id}: {item_error}"
+                    )
+        logger.debug(f"Updated HybridRouter with {len(batch)} feedback events")
+
     def _extract_response_text(self, response_obj: Any) -> str:
         """Extract response text from LiteLLM response object.
 
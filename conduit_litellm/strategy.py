@@ -1,9 +1,12 @@
 """LiteLLM routing strategy using Conduit's ML-powered model selection."""
 
+import asyncio
 import logging
 from typing import Any, cast
+from uuid import uuid4
 
-from conduit.core.models import Query
+from conduit.cache.memory import LRUFeatureCache
+from conduit.core.models import Query, QueryFeatures
 from conduit.engines.router import Router
 from conduit_litellm.feedback import ConduitFeedbackLogger
 from conduit_litellm.model_registry import ModelRegistry
@@ -33,6 +36,14 @@ except ImportError:
         pass
 
 
+# Routing-time features kept for the feedback logger, keyed by litellm_call_id.
+# Entries are consumed when the completion is logged; the bounds only matter
+# for requests whose callback never fires.
+DEFAULT_ROUTED_FEATURES_SIZE = 10_000
+DEFAULT_ROUTED_FEATURES_TTL = 300.0
+ROUTED_FEATURES_MAX_BYTES = 64 * 1024 * 1024
+
+
 class ConduitRoutingStrategy(CustomRoutingStrategyBase):
     """ML-powered routing strategy for LiteLLM using Conduit's contextual bandits.
 
@@ -78,6 +89,10 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
                 - cache_enabled (bool): Enable Redis caching (default: False)
                 - redis_url (str): Redis connection URL (if cache_enabled=True)
                 - evaluator (ArbiterEvaluator): Optional LLM-as-judge evaluator for quality assessment
+                - routed_features_size (int): Routing-time features kept for
+                  feedback (default: 10000)
+                - routed_features_ttl (float): Seconds routing-time features
+                  are kept for feedback (default: 300)
 
         Note:
             Router always uses hybrid routing (UCB1→LinUCB warm start) by default.
@@ -96,11 +111,21 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
         self.conduit_router = conduit_router
         # Extract evaluator before passing config to Router
         self.evaluator = conduit_config.pop('evaluator', None)
+        # Features computed at routing time, reused by the feedback logger
+        self._routed_features = LRUFeatureCache(
+            max_entries=conduit_config.pop(
+                "routed_features_size", DEFAULT_ROUTED_FEATURES_SIZE
+            ),
+            max_bytes=ROUTED_FEATURES_MAX_BYTES,
+            ttl=conduit_config.pop("routed_features_ttl", DEFAULT_ROUTED_FEATURES_TTL),
+        )
         self.conduit_config = conduit_config
         self._initialized = False
         self._router: Any | None = None  # LiteLLM router reference
         self.feedback_logger: ConduitFeedbackLogger | None = None  # Feedback integration
         self._feedback_registered = False  # Track if feedback logger is registered
+        # Drain of queued feedback started by a sync cleanup()
+        self._feedback_close_task: asyncio.Task[None] | None = None
         # Mapping from LiteLLM model names to Conduit model IDs
         self._litellm_to_conduit_map: dict[str, str] = {}
         # Per-instance model registry (avoids global state pollution)
@@ -269,6 +294,7 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
             f"Conduit selected {decision.selected_model} "
             f"(confidence: {decision.confidence:.2f})"
         )
+        self._stash_features(request_kwargs, decision.features)
 
         # Find matching deployment in LiteLLM's model_list
         if self._router is None:
@@ -295,6 +321,24 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
         )
         return cast(dict[str, Any], self._router.model_list[0])
 
+    def _stash_features(
+        self, request_kwargs: dict[str, Any] | None, features: QueryFeatures
+    ) -> None:
+        """Keep routing-time features for the feedback logger.
+
+        LiteLLM passes the request kwargs on to the completion call and keeps
+        an existing litellm_call_id, so the id set here is the one the
+        feedback callback receives.
+
+        Args:
+            request_kwargs: LiteLLM request parameters (None: nothing to key on)
+            features: Features computed while routing
+        """
+        if request_kwargs is None:
+            return
+        call_id = request_kwargs.setdefault("litellm_call_id", str(uuid4()))
+        self._routed_features.set(call_id, features)
+
     def get_available_deployment(
         self,
         model: str,
@@ -381,6 +425,7 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
                 evaluator=self.evaluator,
                 litellm_to_conduit_map=self._litellm_to_conduit_map,
                 model_registry=self._model_registry,
+                routed_features=self._routed_features,
             )
 
             # Register with LiteLLM's callback system
@@ -426,11 +471,56 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
         except Exception as e:
             logger.warning(f"Failed to unregister feedback logger: {e}")
 
+    async def acleanup(self) -> None:
+        """Apply queued feedback, then clean up resources and callbacks.
+
+        Preferred over cleanup() in async code: returns only once every
+        completion logged so far has reached the bandit.
+
+        Example:
+            >>> strategy = ConduitRoutingStrategy()
+            >>> ConduitRoutingStrategy.setup_strategy(router, strategy)
+            >>> try:
+            ...     await router.acompletion(...)
+            ... finally:
+            ...     await strategy.acleanup()
+        """
+        if self.feedback_logger is not None:
+            await self.feedback_logger.close()
+        self.cleanup()
+
+    def _close_feedback_logger(self) -> None:
+        """Start draining the feedback logger's queue without blocking.
+
+        The queue belongs to the event loop the callbacks ran on, so the
+        drain can only be scheduled there; without a running loop queued
+        completions cannot be applied and are reported as lost.
+        """
+        if self.feedback_logger is None:
+            return
+        pending = self.feedback_logger.get_stats()["queue_depth"]
+        if not pending:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(
+                f"Discarding {pending} queued feedback events: cleanup() "
+                f"called without a running event loop (use acleanup())"
+            )
+            return
+
+        if self._feedback_close_task is None or self._feedback_close_task.done():
+            self._feedback_close_task = loop.create_task(self.feedback_logger.close())
+
     def cleanup(self) -> None:
         """Clean up resources and unregister callbacks.
 
         Call this method when done using the strategy to properly release resources
         and remove the feedback logger from LiteLLM's global callback list.
+        Queued feedback is drained first: inside a running event loop the
+        drain is scheduled on it (use acleanup() to wait for it).
 
         Example:
             >>> strategy = ConduitRoutingStrategy()
@@ -441,9 +531,11 @@ class ConduitRoutingStrategy(CustomRoutingStrategyBase):
             ... finally:
             ...     strategy.cleanup()
         """
+        self._close_feedback_logger()
         self._unregister_feedback_logger()
         # Clear model registry to prevent stale mappings affecting future strategies
         self._model_registry.clear()
+        self._routed_features.clear()
         self._initialized = False
         logger.info("ConduitRoutingStrategy cleaned up")
 
@@ -17,12 +17,11 @@ import asyncio
 import hashlib
 import os
 import time
-from datetime import UTC, datetime
 from typing import Any
 
 from conduit.core.config import settings
+from conduit.core.memory_state_store import InMemoryStateStore
 from conduit.core.models import Query
-from conduit.core.state_store import BanditState, HybridRouterState, StateStore
 from conduit.engines.analyzer import QueryAnalyzer
 from conduit.engines.bandits.base import BanditFeedback
 from conduit.engines.embeddings.base import EmbeddingProvider
@@ -184,46 +183,6 @@ class MockEmbeddingProvider(EmbeddingProvider):
         return "mock"
 
 
-class InMemoryStateStore(StateStore):
-    """In-memory state store for demos (use PostgresStateStore in production)."""
-
-    def __init__(self) -> None:
-        self._bandit_states: dict[str, dict[str, BanditState]] = {}
-        self._hybrid_states: dict[str, HybridRouterState] = {}
-
-    async def save_bandit_state(
-        self, router_id: str, bandit_id: str, state: BanditState
-    ) -> None:
-        if router_id not in self._bandit_states:
-            self._bandit_states[router_id] = {}
-        state.updated_at = datetime.now(UTC)
-        self._bandit_states[router_id][bandit_id] = state
-
-    async def load_bandit_state(
-        self, router_id: str, bandit_id: str
-    ) -> BanditState | None:
-        return self._bandit_states.get(router_id, {}).get(bandit_id)
-
-    async def save_hybrid_router_state(
-        self, router_id: str, state: HybridRouterState
-    ) -> None:
-        state.updated_at = datetime.now(UTC)
-        self._hybrid_states[router_id] = state
-
-    async def load_hybrid_router_state(
-        self, router_id: str
-    ) -> HybridRouterState | None:
-        return self._hybrid_states.get(router_id)
-
-    async def delete_state(self, router_id: str) -> None:
-        self._bandit_states.pop(router_id, None)
-        self._hybrid_states.pop(router_id, None)
-
-    async def list_router_ids(self) -> list[str]:
-        ids = set(self._bandit_states.keys()) | set(self._hybrid_states.keys())
-        return sorted(ids)
-
-
 async def demo_persistence() -> None:
     """Demonstrate state persistence across restarts."""
     print("\n" + "=" * 70)
@@ -309,6 +268,9 @@ async def demo_persistence() -> None:
     print("  Replace InMemoryStateStore with PostgresStateStore:")
     print("    from conduit.core.postgres_state_store import PostgresStateStore")
     print("    store = PostgresStateStore(pool)")
+    print("  Or, on a single node, with FileStateStore:")
+    print("    from conduit.core.file_state_store import FileStateStore")
+    print('    store = FileStateStore("/var/lib/conduit/state")')
 
 
 # =============================================================================
@@ -300,15 +300,15 @@ async def main() -> None:
     # Each demo creates its own strategy with isolated model registry
     strategy1 = await demo_basic_usage()
     if strategy1:
-        strategy1.cleanup()
+        await strategy1.acleanup()
 
     strategy2 = await demo_multi_provider()
     if strategy2:
-        strategy2.cleanup()
+        await strategy2.acleanup()
 
     strategy3 = await demo_custom_config()
     if strategy3:
-        strategy3.cleanup()
+        await strategy3.acleanup()
 
     print("\n" + "=" * 70)
     print("SUMMARY - LiteLLM Integration")
@@ -0,0 +1,38 @@
+"""add_bandit_state_bytes_column
+
+Revision ID: 5e1f0c2a9b47
+Revises: 16742edc4c01
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1f0c2a9b47'
+down_revision: Union[str, Sequence[str], None] = '16742edc4c01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add BYTEA column for binary bandit state; allow rows without JSON."""
+    op.execute("""
+        ALTER TABLE bandit_state ADD COLUMN IF NOT EXISTS state_bytes BYTEA;
+        ALTER TABLE bandit_state ALTER COLUMN state_json DROP NOT NULL;
+
+        COMMENT ON COLUMN bandit_state.state_bytes IS 'Binary BanditState or HybridRouterState (conduit.core.state_codec); NULL for JSON rows';
+        COMMENT ON COLUMN bandit_state.state_json IS 'JSONB serialized BanditState or HybridRouterState; NULL for binary rows';
+    """)
+
+
+def downgrade() -> None:
+    """Drop binary state column (binary-only rows are removed first)."""
+    op.execute("""
+        DELETE FROM bandit_state WHERE state_json IS NULL;
+        ALTER TABLE bandit_state ALTER COLUMN state_json SET NOT NULL;
+        ALTER TABLE bandit_state DROP COLUMN IF EXISTS state_bytes;
+    """)
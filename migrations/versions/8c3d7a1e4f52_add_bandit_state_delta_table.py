@@ -0,0 +1,46 @@
+"""add_bandit_state_delta_table
+
+Revision ID: 8c3d7a1e4f52
+Revises: 5e1f0c2a9b47
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3d7a1e4f52'
+down_revision: Union[str, Sequence[str], None] = '5e1f0c2a9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add delta log table for incremental bandit state checkpoints."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS bandit_state_delta (
+            seq BIGSERIAL PRIMARY KEY,
+            router_id VARCHAR(255) NOT NULL,
+            delta_json JSONB NOT NULL,
+            features BYTEA,
+            created_at TIMESTAMP DEFAULT NOW()
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_bandit_state_delta_router_seq
+        ON bandit_state_delta(router_id, seq);
+
+        COMMENT ON TABLE bandit_state_delta IS 'Per-feedback observations logged since the last bandit_state snapshot (incremental checkpoints)';
+        COMMENT ON COLUMN bandit_state_delta.delta_json IS 'StateDelta scalars (phase, query_count, feedback fields)';
+        COMMENT ON COLUMN bandit_state_delta.features IS 'Little-endian float64 embedding; NULL for phase1 (non-contextual) updates';
+    """)
+
+
+def downgrade() -> None:
+    """Drop delta log table (unreplayed deltas are lost)."""
+    op.execute("""
+        DROP INDEX IF EXISTS idx_bandit_state_delta_router_seq;
+        DROP TABLE IF EXISTS bandit_state_delta;
+    """)
@@ -0,0 +1,40 @@
+"""add_pending_feedback_reward_weights
+
+Revision ID: b7e2d4f61a93
+Revises: 8c3d7a1e4f52
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4f61a93'
+down_revision: Union[str, Sequence[str], None] = '8c3d7a1e4f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-query reward weights to PostgresFeedbackStore's pending table."""
+    op.execute("""
+        ALTER TABLE IF EXISTS pending_feedback
+            ADD COLUMN IF NOT EXISTS reward_weights JSONB;
+
+        DO $$
+        BEGIN
+            IF to_regclass('pending_feedback') IS NOT NULL THEN
+                COMMENT ON COLUMN pending_feedback.reward_weights IS 'Reward weights of the query''s preference preset; NULL uses the router defaults';
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    """Drop the pending reward weights column."""
+    op.execute("""
+        ALTER TABLE IF EXISTS pending_feedback DROP COLUMN IF EXISTS reward_weights;
+    """)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for concurrent route + update mixes.
+
+Runs routing clients and a feedback producer against one Router on one event
+loop. The producer delivers feedback in bursts (as a collector batch or
+session propagation does), applied either:
+    - inline: each burst calls HybridRouter.update() back to back, the
+      pre-actor behaviour (the loop is held for the whole burst)
+    - actor: each burst goes through Router.update() and the single-writer
+      BanditUpdateActor, which yields to routing between updates
+    - batch: each burst is one Router.update_batch() call, applied by the
+      actor as a single rank-k update
+
+Reports route and update throughput plus route latency p50/p99 for several
+route:update mixes. Uses LinUCB (phase2) so updates do real O(d²) work;
+query analysis is replaced by precomputed features to isolate the engine.
+
+Usage:
+    python scripts/benchmark_concurrent_routing.py
+    python scripts/benchmark_concurrent_routing.py --seconds 5 --burst 200
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from conduit.core.models import Query, QueryFeatures
+from conduit.engines.bandits import BanditFeedback
+from conduit.engines.router import Router
+
+MODELS = ["gpt-4o-mini", "gpt-4o", "claude-3-5-sonnet", "claude-3-haiku"]
+
+
+class StaticAnalyzer:
+    """Analyzer stand-in returning precomputed features."""
+
+    def __init__(self, features: list[QueryFeatures]):
+        self.features = features
+        self.calls = 0
+
+    async def analyze(self, text: str) -> QueryFeatures:
+        self.calls += 1
+        return self.features[self.calls % len(self.features)]
+
+
+def make_router(features: list[QueryFeatures]) -> Router:
+    """Create a LinUCB router with analysis replaced by fixed features."""
+    router = Router(
+        models=MODELS,
+        algorithm="linucb",
+        embedding_provider_type="huggingface",  # never called
+        cache_enabled=False,
+        auto_persist=False,
+    )
+    router.hybrid_router.analyzer = StaticAnalyzer(features)  # type: ignore[assignment]
+    return router
+
+
+async def run_mix(
+    mode: str,
+    routers: int,
+    updates_per_route: float,
+    burst: int,
+    seconds: float,
+    features: list[QueryFeatures],
+) -> dict[str, float]:
+    """Run one route:update mix and return throughput and latency figures."""
+    router = make_router(features)
+    deadline = time.perf_counter() + seconds
+    latencies: list[float] = []
+    routed = 0
+    updated = 0
+
+    async def route_client(client: int) -> None:
+        nonlocal routed
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await router.route(Query(text=f"client {client}"))
+            latencies.append(time.perf_counter() - start)
+            routed += 1
+            await asyncio.sleep(0)
+
+    async def feedback_producer() -> None:
+        nonlocal updated
+        rng = np.random.default_rng(1)
+        while time.perf_counter() < deadline:
+            # Keep the requested ratio of updates to routes
+            if updated >= routed * updates_per_route:
+                await asyncio.sleep(0.001)
+                continue
+            batch = [
+                (
+                    BanditFeedback(
+                        model_id=MODELS[int(rng.integers(len(MODELS)))],
+                        cost=0.001,
+                        quality_score=float(rng.random()),
+                        latency=0.5,
+                    ),
+                    features[int(rng.integers(len(features)))],
+                )
+                for _ in range(burst)
+            ]
+            if mode == "inline":
+                for feedback, feats in batch:
+                    await router.hybrid_router.update(feedback, feats)
+            elif mode == "batch":
+                await router.update_batch(batch)
+            else:
+                await asyncio.gather(
+                    *(
+                        router.update(
+                            model_id=feedback.model_id,
+                            cost=feedback.cost,
+                            quality_score=feedback.quality_score,
+                            latency=feedback.latency,
+                            features=feats,
+                        )
+                        for feedback, feats in batch
+                    )
+                )
+            updated += burst
+
+    await asyncio.gather(
+        *(route_client(i) for i in range(routers)), feedback_producer()
+    )
+    await router.close()
+
+    latency_ms = np.array(latencies) * 1000
+    return {
+        "routes_per_s": routed / seconds,
+        "updates_per_s": updated / seconds,
+        "p50_ms": float(np.percentile(latency_ms, 50)),
+        "p99_ms": float(np.percentile(latency_ms, 99)),
+        "max_ms": float(latency_ms.max()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="Seconds per run")
+    parser.add_argument("--routers", type=int, default=8, help="Routing clients")
+    parser.add_argument("--burst", type=int, default=100, help="Updates per burst")
+    parser.add_argument(
+        "--mixes",
+        type=float,
+        nargs="+",
+        default=[0.1, 0.5, 1.0],
+        help="Updates per route",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    features = [
+        QueryFeatures(
+            embedding=(rng.standard_normal(384) * 0.1).tolist(),
+            token_count=int(rng.integers(10, 500)),
+            complexity_score=float(rng.random()),
+        )
+        for _ in range(64)
+    ]
+
+    print(
+        f"{'mix':>5} {'mode':>7} {'routes/s':>10} {'updates/s':>10} "
+        f"{'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}"
+    )
+    print("-" * 66)
+    for mix in args.mixes:
+        for mode in ("inline", "actor", "batch"):
+            result = asyncio.run(
+                run_mix(mode, args.routers, mix, args.burst, args.seconds, features)
+            )
+            print(
+                f"{mix:>5} {mode:>7} {result['routes_per_s']:>10.0f} "
+                f"{result['updates_per_s']:>10.0f} {result['p50_ms']:>9.2f} "
+                f"{result['p99_ms']:>9.2f} {result['max_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from conduit.core.config import reload_config
 from conduit.engines.bandits.base import ModelArm
 from conduit.core.models import QueryFeatures
 
@@ -30,6 +31,18 @@ except ImportError:
 # Tests that need sklearn will import it normally
 
 
+@pytest.fixture(autouse=True)
+def fresh_config_snapshot():
+    """Invalidate memoized config loaders around each test.
+
+    Tests change cwd, env vars and embedding mocks; each test must see config
+    derived from its own environment rather than a previous test's snapshot.
+    """
+    reload_config()
+    yield
+    reload_config()
+
+
 @pytest.fixture(autouse=True)
 def mock_huggingface_embeddings(monkeypatch, request):
     """Mock HuggingFace embedding provider to avoid real API calls in tests.
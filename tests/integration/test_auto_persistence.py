@@ -106,6 +106,7 @@ async def test_save_after_every_update(state_store):
         state_store=state_store,
         router_id=router_id,
         auto_persist=True,
+        write_behind=False,  # Per-update writes
     )
 
     # Route and update
@@ -257,6 +258,7 @@ async def test_crash_recovery_simulation(state_store):
         state_store=state_store,
         router_id=router_id,
         auto_persist=True,
+        write_behind=False,  # Per-update writes
     )
 
     for i in range(10):
@@ -84,6 +84,7 @@ class TestShutdownWithMockedDependencies:
             phases_executed.append("router_close")
 
         mock_router.close = mock_close
+        mock_router.flush_state = AsyncMock()
 
         mock_database = MagicMock()
 
@@ -122,6 +123,7 @@ class TestShutdownWithMockedDependencies:
         """Test shutdown continues even if router.close() fails."""
         mock_router = MagicMock()
         mock_router.close = AsyncMock(side_effect=Exception("Router close failed"))
+        mock_router.flush_state = AsyncMock()
 
         mock_database = MagicMock()
         mock_database.disconnect = AsyncMock()
@@ -145,6 +147,7 @@ class TestShutdownWithMockedDependencies:
         """Test shutdown completes even if database.disconnect() fails."""
         mock_router = MagicMock()
         mock_router.close = AsyncMock()
+        mock_router.flush_state = AsyncMock()
 
         mock_database = MagicMock()
         mock_database.disconnect = AsyncMock(
@@ -186,6 +189,7 @@ class TestShutdownCallbacks:
             execution_order.append("router_close")
 
         mock_router.close = mock_close
+        mock_router.flush_state = AsyncMock()
 
         manager = LifecycleManager(
             router=mock_router,
@@ -211,6 +215,7 @@ class TestShutdownCallbacks:
 
         mock_router = MagicMock()
         mock_router.close = AsyncMock()
+        mock_router.flush_state = AsyncMock()
 
         manager = LifecycleManager(
             router=mock_router,
@@ -256,6 +261,7 @@ class TestConcurrentShutdownOperations:
             await asyncio.sleep(0.01)
 
         mock_router.close = counting_close
+        mock_router.flush_state = AsyncMock()
 
         manager = LifecycleManager(router=mock_router)
 
@@ -324,6 +330,7 @@ class TestShutdownTiming:
             await asyncio.sleep(0.1)
 
         mock_router.close = slow_close
+        mock_router.flush_state = AsyncMock()
 
         manager = LifecycleManager(router=mock_router)
 
@@ -344,6 +351,7 @@ class TestSignalHandlerIntegration:
 
         mock_router = MagicMock()
         mock_router.close = AsyncMock()
+        mock_router.flush_state = AsyncMock()
 
         manager = LifecycleManager(router=mock_router)
 
@@ -392,6 +400,9 @@ class TestShutdownWithRealAsyncOperations:
         class MockRouterLike:
             """Mock that simulates real router state save."""
 
+            async def flush_state(self):
+                operations_log.append("flush")
+
             async def close(self):
                 operations_log.append("close_start")
                 # Simulate state serialization and DB write
@@ -407,6 +418,7 @@ class TestShutdownWithRealAsyncOperations:
 
         assert state.phase == ShutdownPhase.COMPLETE
         assert operations_log == [
+            "flush",
             "close_start",
             "close_complete",
             "disconnect_start",
@@ -175,3 +175,74 @@ class TestQueryAnalyzer:
 
         # Should have high complexity due to requirements
         assert result.complexity_score >= 0.6
+
+
+class TestAnalyzeBatch:
+    """Tests for QueryAnalyzer.analyze_batch."""
+
+    @pytest.fixture
+    def provider(self):
+        """Embedding provider mock returning one 4-dim vector per text."""
+        from unittest.mock import AsyncMock
+
+        provider = Mock()
+        provider.dimension = 4
+        provider.embed_batch = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] * 4 for t in texts]
+        )
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_single_embed_batch_for_misses(self, provider):
+        """Test distinct misses are embedded in one call, duplicates shared."""
+        analyzer = QueryAnalyzer(embedding_provider=provider)
+
+        results = await analyzer.analyze_batch(["a", "bb", "a"])
+
+        provider.embed_batch.assert_awaited_once_with(["a", "bb"])
+        assert [r.embedding[0] for r in results] == [1.0, 2.0, 1.0]
+        assert results[0] is results[2]
+        assert all(r.query_text in ("a", "bb") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_uses_cache_get_many_and_set_many(self, provider):
+        """Test cached entries are reused and new entries written in one call."""
+        from unittest.mock import AsyncMock
+
+        cached = QueryFeatures(embedding=[9.0] * 4, token_count=1, complexity_score=0.1)
+        cache = Mock()
+        cache.get_many = AsyncMock(return_value=[cached, None])
+        cache.set_many = AsyncMock()
+        analyzer = QueryAnalyzer(embedding_provider=provider, cache_service=cache)
+
+        results = await analyzer.analyze_batch(["hit", "miss"])
+
+        assert results[0] is cached
+        provider.embed_batch.assert_awaited_once_with(["miss"])
+        cache.set_many.assert_awaited_once()
+        (written,) = cache.set_many.await_args.args
+        assert [query for query, _ in written] == ["miss"]
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_falls_back(self, provider):
+        """Test batch embedding errors yield zero vectors and skip caching."""
+        from unittest.mock import AsyncMock
+
+        provider.embed_batch = AsyncMock(side_effect=RuntimeError("API down"))
+        cache = Mock()
+        cache.get_many = AsyncMock(return_value=[None, None])
+        cache.set_many = AsyncMock()
+        analyzer = QueryAnalyzer(embedding_provider=provider, cache_service=cache)
+
+        results = await analyzer.analyze_batch(["x", "y"])
+
+        assert all(r.embedding_failed for r in results)
+        assert all(r.embedding == [0.0] * 4 for r in results)
+        cache.set_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, provider):
+        """Test empty input returns empty list without provider calls."""
+        analyzer = QueryAnalyzer(embedding_provider=provider)
+        assert await analyzer.analyze_batch([]) == []
+        provider.embed_batch.assert_not_awaited()
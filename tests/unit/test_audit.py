@@ -561,6 +561,40 @@ class TestPostgresAuditStore:
         assert result == 42
         mock_conn.fetchrow.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_log_decisions_copies_batch(self, store, mock_pool):
+        """Test log_decisions writes a batch with one COPY."""
+        mock_conn = AsyncMock()
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_pool.acquire.return_value.__aexit__ = AsyncMock()
+        entries = [
+            AuditEntry(
+                decision_id=f"decision-{i}",
+                query_id=f"query-{i}",
+                selected_model="gpt-4o-mini",
+                confidence=0.9554,
+                algorithm_phase="thompson_sampling",
+                query_count=i,
+                arm_scores={"gpt-4o-mini": {"total": 0.8}},
+            )
+            for i in range(3)
+        ]
+
+        assert await store.log_decisions(entries) == 3
+        assert await store.log_decisions([]) == 0
+
+        mock_conn.copy_records_to_table.assert_awaited_once()
+        args, kwargs = mock_conn.copy_records_to_table.call_args
+        assert args == ("decision_audit",)
+        assert [record[0] for record in kwargs["records"]] == [
+            "decision-0",
+            "decision-1",
+            "decision-2",
+        ]
+        assert str(kwargs["records"][0][4]) == "0.955"
+        assert kwargs["columns"][0] == "decision_id"
+        mock_conn.fetchrow.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_apply_retention_policy_disabled(self, mock_pool):
         """Test retention policy does nothing when days = 0."""
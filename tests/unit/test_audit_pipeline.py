@@ -0,0 +1,164 @@
+"""Tests for the buffered audit logging pipeline."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from conduit.core.models import Query
+from conduit.engines.router import Router
+from conduit.observability.audit import AuditEntry, InMemoryAuditStore
+from conduit.observability.audit_pipeline import AuditPipeline
+
+
+def _entry(i: int) -> AuditEntry:
+    """Create a minimal audit entry."""
+    return AuditEntry(
+        decision_id=f"decision-{i}",
+        query_id=f"query-{i}",
+        selected_model="gpt-4o-mini",
+        confidence=0.9,
+        algorithm_phase="thompson_sampling",
+        query_count=i,
+        arm_scores={"gpt-4o-mini": {"total": 0.8}},
+    )
+
+
+class BatchRecordingStore(InMemoryAuditStore):
+    """In-memory store that records batch sizes and can stall or fail."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        super().__init__()
+        self.delay = delay
+        self.fail = fail
+        self.batches: list[int] = []
+
+    async def log_decisions(self, entries: list[AuditEntry]) -> int:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("database down")
+        self.batches.append(len(entries))
+        return await super().log_decisions(entries)
+
+
+class TestAuditPipeline:
+    """Tests for AuditPipeline."""
+
+    async def test_entries_written_in_batches(self):
+        """Test a full batch flushes early and the rest flush on interval."""
+        store = BatchRecordingStore()
+        pipeline = AuditPipeline(store, batch_size=4, flush_interval=0.05)
+
+        for i in range(6):
+            assert await pipeline.submit(_entry(i)) is True
+        assert store.entries == []
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0.1)
+
+        assert store.batches == [4, 2]
+        assert [e.decision_id for e in store.entries][-1] == "decision-5"
+        stats = pipeline.get_stats()
+        assert stats["written"] == 6
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 6
+        await pipeline.close()
+
+    async def test_drop_policy_counts_overflow(self):
+        """Test a full queue drops new entries without waiting on the store."""
+        store = BatchRecordingStore(delay=1.0)
+        pipeline = AuditPipeline(store, queue_size=3, flush_interval=10.0)
+
+        results = [await pipeline.submit(_entry(i)) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert pipeline.get_stats()["dropped"] == 2
+        store.delay = 0.0
+        await pipeline.close()
+        assert len(store.entries) == 3
+        assert await pipeline.submit(_entry(9)) is False
+
+    async def test_block_policy_waits_for_space(self):
+        """Test overflow="block" keeps every entry."""
+        store = BatchRecordingStore()
+        pipeline = AuditPipeline(
+            store, queue_size=2, batch_size=2, flush_interval=0.01, overflow="block"
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(*(pipeline.submit(_entry(i)) for i in range(10))),
+            timeout=2.0,
+        )
+        await pipeline.close()
+
+        assert len(store.entries) == 10
+        assert pipeline.get_stats()["dropped"] == 0
+
+    async def test_failed_batch_is_counted_not_raised(self):
+        """Test write failures are logged and counted without retry."""
+        store = BatchRecordingStore(fail=True)
+        pipeline = AuditPipeline(store, flush_interval=0.01)
+
+        await pipeline.submit(_entry(0))
+        await pipeline.close()
+
+        assert pipeline.get_stats()["failed_entries"] == 1
+        assert pipeline.get_stats()["written"] == 0
+
+    def test_invalid_configuration(self):
+        """Test invalid sizes and policies are rejected."""
+        store = InMemoryAuditStore()
+        with pytest.raises(ValueError, match="batch_size"):
+            AuditPipeline(store, batch_size=0)
+        with pytest.raises(ValueError, match="overflow"):
+            AuditPipeline(store, overflow="spill")  # type: ignore[arg-type]
+
+
+class TestRouterAuditPipeline:
+    """Tests for buffered audit logging in Router.route()."""
+
+    async def test_route_only_enqueues(self):
+        """Test route() never awaits the store; close() writes the entries."""
+        store = BatchRecordingStore(delay=1.0)
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            audit_store=store,
+            auto_persist=False,
+            cache_enabled=False,
+        )
+
+        with patch.object(store, "log_decision") as log_decision:
+            for i in range(3):
+                await asyncio.wait_for(
+                    router.route(Query(text=f"query {i}")), timeout=0.5
+                )
+            log_decision.assert_not_called()
+
+        assert router.get_audit_stats()["submitted"] == 3
+        store.delay = 0.0
+        await router.close()
+        assert len(store.entries) == 3
+
+    async def test_unbuffered_audit_writes_inline(self):
+        """Test audit_buffered=False logs each decision before route returns."""
+        store = InMemoryAuditStore()
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            audit_store=store,
+            auto_persist=False,
+            cache_enabled=False,
+            audit_buffered=False,
+        )
+
+        phase1_bandit = router.hybrid_router.phase1_bandit
+        with patch.object(
+            phase1_bandit, "compute_scores", wraps=phase1_bandit.compute_scores
+        ) as compute_scores:
+            decision = await router.route(Query(text="hello"))
+
+        # Selection scored the arms once; audit reused those scores
+        assert compute_scores.call_count == 1
+        assert store.entries[0].decision_id == decision.id
+        assert store.entries[0].arm_scores == decision.metadata["arm_scores"]
+        assert router.get_audit_stats() is None
+        await router.close()
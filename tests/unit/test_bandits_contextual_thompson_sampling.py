@@ -68,6 +68,21 @@ class TestContextualThompsonSamplingBandit:
         assert arm.model_id in ["o4-mini", "gpt-5.1", "claude-haiku-4-5"]
         assert bandit.total_queries == 1
 
+    @pytest.mark.asyncio
+    async def test_select_arm_with_scores_matches_select_arm(self, test_arms, test_features):
+        """Test scored selection draws the same sample as select_arm."""
+        bandit = ContextualThompsonSamplingBandit(test_arms, feature_dim=386, random_seed=42)
+        arm = await bandit.select_arm(test_features)
+
+        np.random.seed(42)
+        selection = await bandit.select_arm_with_scores(test_features)
+
+        scores = selection.scores
+        assert selection.arm.model_id == arm.model_id
+        assert arm.model_id == max(scores, key=lambda k: scores[k]["sample"])
+        assert all(s["mean"] == 0.0 for s in scores.values())  # zero prior mean
+        assert bandit.total_queries == 2
+
     @pytest.mark.asyncio
     async def test_random_seed_initialization(self, test_arms, test_features):
         """Test that random seed is properly initialized."""
@@ -525,3 +540,167 @@ class TestContextualThompsonSamplingBandit:
         stats = bandit.get_stats()
         # Due to composite reward calculation, need to check actual behavior
         assert "arm_success_rates" in stats
+
+
+class TestContextualThompsonIncrementalUpdates:
+    """Tests for Sherman-Morrison posterior maintenance."""
+
+    @staticmethod
+    def _direct_posterior(bandit, model_id):
+        """Recompute (mu, Sigma) from the observation window by direct inversion."""
+        Sigma_inv = np.identity(bandit.feature_dim)
+        weighted_sum = np.zeros((bandit.feature_dim, 1))
+        for obs_x, obs_r in bandit.observation_history[model_id]:
+            Sigma_inv += bandit.lambda_reg * (obs_x @ obs_x.T)
+            weighted_sum += bandit.lambda_reg * obs_r * obs_x
+        Sigma = np.linalg.inv(Sigma_inv)
+        return Sigma @ weighted_sum, Sigma
+
+    @staticmethod
+    def _random_features(rng):
+        return QueryFeatures(
+            embedding=(rng.random(384) * 0.1).tolist(),
+            token_count=int(rng.integers(10, 200)),
+            complexity_score=float(rng.random()),
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("window_size", [0, 4])
+    async def test_incremental_matches_direct_inversion(self, test_arms, window_size):
+        """Test incremental Sigma/mu equal direct recomputation, with and without window."""
+        bandit = ContextualThompsonSamplingBandit(
+            test_arms, feature_dim=386, lambda_reg=0.5, window_size=window_size
+        )
+        rng = np.random.default_rng(7)
+        model_id = test_arms[0].model_id
+
+        for _ in range(10):
+            feedback = BanditFeedback(
+                model_id=model_id,
+                cost=0.001,
+                quality_score=float(rng.random()),
+                latency=1.0,
+            )
+            await bandit.update(feedback, self._random_features(rng))
+
+        expected_mu, expected_Sigma = self._direct_posterior(bandit, model_id)
+        assert np.allclose(bandit.Sigma[model_id], expected_Sigma, atol=1e-8)
+        assert np.allclose(bandit.mu[model_id], expected_mu, atol=1e-8)
+
+    @pytest.mark.asyncio
+    async def test_periodic_refactorization(self, test_arms, test_features):
+        """Test Sigma is recomputed from precision every refactor_interval updates."""
+        bandit = ContextualThompsonSamplingBandit(
+            test_arms, feature_dim=386, refactor_interval=3
+        )
+        model_id = test_arms[0].model_id
+        feedback = BanditFeedback(
+            model_id=model_id, cost=0.001, quality_score=0.9, latency=1.0
+        )
+
+        for _ in range(2):
+            await bandit.update(feedback, test_features)
+        assert bandit._updates_since_refactor[model_id] == 2
+
+        await bandit.update(feedback, test_features)
+        assert bandit._updates_since_refactor[model_id] == 0
+        assert np.allclose(
+            bandit.Sigma[model_id], np.linalg.inv(bandit.Sigma_inv[model_id])
+        )
+
+    @pytest.mark.asyncio
+    async def test_from_state_rebuilds_sufficient_statistics(
+        self, test_arms, test_features
+    ):
+        """Test restored bandit continues incremental updates from the same posterior."""
+        bandit = ContextualThompsonSamplingBandit(test_arms, feature_dim=386)
+        feedback = BanditFeedback(
+            model_id=test_arms[0].model_id, cost=0.001, quality_score=0.9, latency=1.0
+        )
+        await bandit.update(feedback, test_features)
+
+        restored = ContextualThompsonSamplingBandit(test_arms, feature_dim=386)
+        restored.from_state(bandit.to_state())
+
+        await bandit.update(feedback, test_features)
+        await restored.update(feedback, test_features)
+
+        model_id = test_arms[0].model_id
+        assert np.allclose(restored.Sigma[model_id], bandit.Sigma[model_id], atol=1e-8)
+        assert np.allclose(restored.mu[model_id], bandit.mu[model_id], atol=1e-8)
+
+
+class TestContextualThompsonCachedCholesky:
+    """Tests for cached Cholesky factors and batched posterior sampling."""
+
+    def test_cholesky_rank_one_update_and_downdate(self):
+        """Test in-place cholupdate/downdate matches refactorizing."""
+        from conduit.engines.bandits.contextual_thompson_sampling import (
+            _cholesky_rank_one,
+        )
+
+        rng = np.random.default_rng(1)
+        M = rng.random((12, 12))
+        Sigma = M @ M.T + np.identity(12)
+        U = np.linalg.cholesky(Sigma).T.copy()
+        v = rng.random(12)
+
+        _cholesky_rank_one(U, v, sign=1.0)
+        assert np.allclose(U.T @ U, Sigma + np.outer(v, v))
+
+        _cholesky_rank_one(U, v, sign=-1.0)
+        assert np.allclose(U.T @ U, Sigma)
+        assert np.allclose(U, np.triu(U))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("window_size", [0, 3])
+    async def test_cached_factor_tracks_sigma(self, test_arms, window_size):
+        """Test cached factor stays consistent with Sigma through updates."""
+        bandit = ContextualThompsonSamplingBandit(
+            test_arms, feature_dim=386, window_size=window_size
+        )
+        rng = np.random.default_rng(3)
+        model_id = test_arms[1].model_id
+
+        for _ in range(6):
+            features = QueryFeatures(
+                embedding=(rng.random(384) * 0.1).tolist(),
+                token_count=20,
+                complexity_score=0.4,
+            )
+            feedback = BanditFeedback(
+                model_id=model_id, cost=0.001, quality_score=0.8, latency=1.0
+            )
+            await bandit.update(feedback, features)
+
+        U = bandit.Sigma_chol[model_id]
+        assert np.allclose(U.T @ U, bandit.Sigma[model_id], atol=1e-8)
+        assert np.shares_memory(U, bandit._chol_stack)
+
+    @pytest.mark.asyncio
+    async def test_select_arm_does_not_factorize(self, test_arms, test_features, mocker):
+        """Test select_arm uses cached factors instead of np.linalg.cholesky."""
+        bandit = ContextualThompsonSamplingBandit(test_arms, feature_dim=386)
+        feedback = BanditFeedback(
+            model_id=test_arms[0].model_id, cost=0.001, quality_score=0.9, latency=1.0
+        )
+        await bandit.update(feedback, test_features)
+
+        spy = mocker.spy(np.linalg, "cholesky")
+        for _ in range(5):
+            await bandit.select_arm(test_features)
+
+        assert spy.call_count == 0
+
+    def test_sample_thetas_batched_shape_and_distribution(self, test_arms):
+        """Test batched sampling draws one theta per arm from N(mu, Sigma)."""
+        bandit = ContextualThompsonSamplingBandit(
+            test_arms, feature_dim=4, random_seed=0
+        )
+        bandit.mu[test_arms[0].model_id] = np.full((4, 1), 2.0)
+
+        samples = np.stack([bandit.sample_thetas() for _ in range(4000)])
+
+        assert samples.shape == (4000, 3, 4)
+        assert np.allclose(samples[:, 0].mean(axis=0), 2.0, atol=0.1)
+        assert np.allclose(samples[:, 1].std(axis=0), 1.0, atol=0.1)
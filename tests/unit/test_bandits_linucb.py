@@ -3,6 +3,8 @@
 Uses shared fixtures from tests/conftest.py: test_arms, test_features
 """
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
@@ -506,6 +508,118 @@ class TestLinUCBBandit:
         assert bandit1.feature_dim == bandit2.feature_dim
 
 
+class TestLinUCBVectorizedScoring:
+    """Tests for batched scoring over stacked A_inv and cached theta."""
+
+    @pytest.mark.asyncio
+    async def test_compute_scores_matches_per_arm_reference(self, test_arms):
+        """Test batched scores equal the per-arm theta^T x + alpha * sqrt(x^T A_inv x)."""
+        bandit = LinUCBBandit(test_arms, feature_dim=386, alpha=1.5, window_size=5)
+        rng = np.random.default_rng(0)
+
+        for i in range(12):
+            features = QueryFeatures(
+                embedding=rng.random(384).tolist(),
+                token_count=10 + i,
+                complexity_score=0.5,
+            )
+            feedback = BanditFeedback(
+                model_id=test_arms[i % 3].model_id,
+                cost=0.001,
+                quality_score=float(rng.random()),
+                latency=1.0,
+            )
+            await bandit.update(feedback, features)
+
+        x = bandit._extract_features(features)
+        scores = bandit.compute_scores(features)
+
+        for model_id in bandit.arms:
+            A_inv = np.linalg.inv(bandit.A[model_id])
+            theta = A_inv @ bandit.b[model_id]
+            mean = (theta.T @ x)[0, 0]
+            uncertainty = np.sqrt((x.T @ A_inv @ x)[0, 0])
+            assert np.isclose(scores[model_id]["mean"], mean)
+            assert np.isclose(scores[model_id]["uncertainty"], uncertainty)
+            assert np.isclose(
+                scores[model_id]["total"], mean + bandit.alpha * uncertainty
+            )
+
+    @pytest.mark.asyncio
+    async def test_select_arm_picks_highest_batched_score(self, test_arms, test_features):
+        """Test select_arm agrees with compute_scores argmax."""
+        bandit = LinUCBBandit(test_arms, feature_dim=386)
+        feedback = BanditFeedback(
+            model_id="gpt-5.1", cost=0.001, quality_score=1.0, latency=0.1
+        )
+        await bandit.update(feedback, test_features)
+
+        scores = bandit.compute_scores(test_features)
+        arm = await bandit.select_arm(test_features)
+
+        assert arm.model_id == max(scores, key=lambda k: scores[k]["total"])
+
+    @pytest.mark.asyncio
+    async def test_select_arm_with_scores_single_pass(self, test_arms, test_features):
+        """Test select_arm_with_scores returns the selection's own UCB scores."""
+        bandit = LinUCBBandit(test_arms, feature_dim=386)
+        feedback = BanditFeedback(
+            model_id="gpt-5.1", cost=0.001, quality_score=1.0, latency=0.1
+        )
+        await bandit.update(feedback, test_features)
+        expected = bandit.compute_scores(test_features)
+
+        with patch.object(bandit, "compute_scores") as compute_scores:
+            selection = await bandit.select_arm_with_scores(test_features)
+            compute_scores.assert_not_called()
+
+        assert selection.scores == expected
+        assert selection.arm.model_id == max(
+            expected, key=lambda k: expected[k]["total"]
+        )
+        assert selection.arm_pulls == bandit.arm_pulls[selection.arm.model_id]
+        assert bandit.total_queries == 1
+
+    @pytest.mark.asyncio
+    async def test_theta_cache_invalidated_on_update(self, test_arms, test_features):
+        """Test cached theta is refreshed only after an arm is updated."""
+        bandit = LinUCBBandit(test_arms, feature_dim=386)
+        before = bandit.compute_scores(test_features)
+
+        feedback = BanditFeedback(
+            model_id="o4-mini", cost=0.001, quality_score=0.9, latency=1.0
+        )
+        await bandit.update(feedback, test_features)
+        after = bandit.compute_scores(test_features)
+
+        assert after["o4-mini"]["mean"] != before["o4-mini"]["mean"]
+        assert after["gpt-5.1"]["mean"] == before["gpt-5.1"]["mean"]
+        assert not bandit._theta_stale.any()
+
+    @pytest.mark.asyncio
+    async def test_a_inv_views_share_stacked_storage(self, test_arms, test_features):
+        """Test A_inv dict entries stay views into the stack across update/reset/restore."""
+        bandit = LinUCBBandit(test_arms, feature_dim=386)
+        feedback = BanditFeedback(
+            model_id="o4-mini", cost=0.001, quality_score=0.9, latency=1.0
+        )
+        await bandit.update(feedback, test_features)
+
+        for model_id in bandit.arms:
+            assert np.shares_memory(bandit.A_inv[model_id], bandit._A_inv_stack)
+
+        state = bandit.to_state()
+        bandit.reset()
+        assert np.allclose(bandit._A_inv_stack[0], np.identity(386))
+
+        bandit.from_state(state)
+        for model_id in bandit.arms:
+            assert np.shares_memory(bandit.A_inv[model_id], bandit._A_inv_stack)
+            assert np.allclose(
+                bandit.A_inv[model_id], np.linalg.inv(bandit.A[model_id])
+            )
+
+
 class TestLinUCBStatePersistence:
     """Tests for LinUCB state persistence with observation history."""
 
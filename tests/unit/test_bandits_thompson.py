@@ -52,6 +52,38 @@ class TestThompsonSamplingBandit:
         await bandit.select_arm(test_features)
         assert bandit.total_queries == 2
 
+    @pytest.mark.asyncio
+    async def test_select_arm_with_scores_reports_samples(
+        self, test_arms, test_features
+    ):
+        """Test the selected arm is the one with the highest recorded sample."""
+        bandit = ThompsonSamplingBandit(test_arms, random_seed=7)
+
+        selection = await bandit.select_arm_with_scores(test_features)
+
+        scores = selection.scores
+        assert selection.arm.model_id == max(scores, key=lambda k: scores[k]["total"])
+        for arm_scores in scores.values():
+            assert arm_scores["total"] == arm_scores["sample"]
+            assert arm_scores["mean"] == 0.5  # uniform prior
+        assert selection.arm_pulls == 0
+        assert bandit.total_queries == 1
+
+    @pytest.mark.asyncio
+    async def test_get_arm_pulls(self, test_arms, test_features):
+        """Test per-arm pull counts are readable without a selection."""
+        bandit = ThompsonSamplingBandit(test_arms)
+        model_id = test_arms[0].model_id
+        feedback = BanditFeedback(
+            model_id=model_id, cost=0.001, quality_score=0.9, latency=1.0
+        )
+
+        await bandit.update(feedback, test_features)
+
+        assert bandit.get_arm_pulls(model_id) == 1
+        assert bandit.get_arm_pulls(test_arms[1].model_id) == 0
+        assert bandit.get_arm_pulls("unknown") == 0
+
     @pytest.mark.asyncio
     async def test_update_with_success(self, test_arms, test_features):
         """Test update with high-quality feedback increases alpha."""
@@ -0,0 +1,181 @@
+"""Tests for batched feedback application (update_batch).
+
+Uses shared fixtures from tests/conftest.py: test_arms
+"""
+
+import numpy as np
+import pytest
+
+from conduit.core.models import QueryFeatures
+from conduit.engines.bandits import (
+    ContextualThompsonSamplingBandit,
+    EpsilonGreedyBandit,
+    LinUCBBandit,
+    ThompsonSamplingBandit,
+    UCB1Bandit,
+)
+from conduit.engines.bandits.base import BanditFeedback
+from conduit.engines.router import Router
+
+
+def _batch(arms, n: int, seed: int = 0) -> list[tuple[BanditFeedback, QueryFeatures]]:
+    """Create n random (feedback, features) pairs spread over the arms."""
+    rng = np.random.default_rng(seed)
+    return [
+        (
+            BanditFeedback(
+                model_id=arms[int(rng.integers(len(arms)))].model_id,
+                cost=float(rng.random() * 0.01),
+                quality_score=float(rng.random()),
+                latency=float(rng.random() * 2),
+                confidence=float(rng.uniform(0.5, 1.0)),
+            ),
+            QueryFeatures(
+                embedding=(rng.standard_normal(384) * 0.1).tolist(),
+                token_count=int(rng.integers(10, 500)),
+                complexity_score=float(rng.random()),
+            ),
+        )
+        for _ in range(n)
+    ]
+
+
+BANDIT_FACTORIES = {
+    "linucb": lambda arms: LinUCBBandit(arms, feature_dim=386),
+    "linucb_window": lambda arms: LinUCBBandit(
+        arms, feature_dim=386, window_size=5
+    ),
+    "contextual_thompson": lambda arms: ContextualThompsonSamplingBandit(
+        arms, feature_dim=386
+    ),
+    "contextual_thompson_window": lambda arms: ContextualThompsonSamplingBandit(
+        arms, feature_dim=386, window_size=5
+    ),
+    "thompson": lambda arms: ThompsonSamplingBandit(arms),
+    "thompson_window": lambda arms: ThompsonSamplingBandit(arms, window_size=5),
+    "ucb1": lambda arms: UCB1Bandit(arms),
+    "ucb1_window": lambda arms: UCB1Bandit(arms, window_size=5),
+    "epsilon_greedy": lambda arms: EpsilonGreedyBandit(arms),
+}
+
+STATE_ATTRIBUTES = [
+    "A_inv",
+    "b",
+    "mu",
+    "Sigma",
+    "alpha",
+    "beta",
+    "mean_reward",
+    "sum_reward",
+    "arm_pulls",
+    "arm_successes",
+]
+
+
+class TestUpdateBatch:
+    """update_batch() must leave the same state as sequential update()."""
+
+    @pytest.mark.parametrize("algorithm", list(BANDIT_FACTORIES))
+    async def test_batch_matches_sequential(self, test_arms, algorithm):
+        """Test batched and one-at-a-time updates agree for every algorithm."""
+        sequential = BANDIT_FACTORIES[algorithm](test_arms)
+        batched = BANDIT_FACTORIES[algorithm](test_arms)
+        batch = _batch(test_arms, 40)
+
+        for feedback, features in batch:
+            await sequential.update(feedback, features)
+        await batched.update_batch(batch[:25])
+        await batched.update_batch(batch[25:])
+
+        compared = 0
+        for attribute in STATE_ATTRIBUTES:
+            # Per-arm state only (LinUCB's alpha is the exploration scalar)
+            if not isinstance(getattr(sequential, attribute, None), dict):
+                continue
+            compared += 1
+            for arm in test_arms:
+                np.testing.assert_allclose(
+                    getattr(batched, attribute)[arm.model_id],
+                    getattr(sequential, attribute)[arm.model_id],
+                    rtol=1e-7,
+                    atol=1e-9,
+                    err_msg=f"{algorithm}.{attribute}[{arm.model_id}]",
+                )
+        assert compared >= 3
+
+    async def test_linucb_theta_refreshed_after_batch(self, test_arms):
+        """Test the cached theta is recomputed from the rank-k A_inv update."""
+        bandit = LinUCBBandit(test_arms, feature_dim=386)
+        batch = _batch(test_arms, 30)
+        await bandit.update_batch(batch)
+
+        for arm in test_arms:
+            A, b = bandit.A[arm.model_id], bandit.b[arm.model_id]
+            np.testing.assert_allclose(
+                bandit.A_inv[arm.model_id] @ b, np.linalg.solve(A, b), atol=1e-8
+            )
+        scores = bandit.compute_scores(batch[0][1])
+        assert set(scores) == {arm.model_id for arm in test_arms}
+
+    async def test_contextual_thompson_cholesky_tracks_sigma(self, test_arms):
+        """Test the cached factor matches Sigma after a block update."""
+        bandit = ContextualThompsonSamplingBandit(test_arms, feature_dim=386)
+        await bandit.update_batch(_batch(test_arms, 30))
+
+        for arm in test_arms:
+            U = bandit.Sigma_chol[arm.model_id]
+            np.testing.assert_allclose(
+                U.T @ U, bandit.Sigma[arm.model_id], atol=1e-8
+            )
+
+    @pytest.mark.parametrize("algorithm", ["linucb", "thompson", "epsilon_greedy"])
+    async def test_unknown_arm_rejects_whole_batch(self, test_arms, algorithm):
+        """Test an unknown model_id fails the batch before any state changes."""
+        bandit = BANDIT_FACTORIES[algorithm](test_arms)
+        batch = _batch(test_arms, 5)
+        bad = BanditFeedback(
+            model_id="missing", cost=0.0, quality_score=0.5, latency=0.1
+        )
+        batch.append((bad, batch[0][1]))
+
+        with pytest.raises(ValueError, match="not in arms"):
+            await bandit.update_batch(batch)
+        assert sum(bandit.arm_pulls.values()) == 0
+
+
+class TestRouterUpdateBatch:
+    """Tests for HybridRouter.update_batch() and Router.update_batch()."""
+
+    async def test_router_applies_batch_and_persists_once(self, mocker):
+        """Test one actor submission and one state save for the whole batch."""
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"], cache_enabled=False, auto_persist=False
+        )
+        arms = router.hybrid_router.arms
+        save_state = mocker.patch.object(router, "_save_state")
+        router.auto_persist = True
+
+        await router.update_batch(_batch(arms, 20))
+
+        stats = router.hybrid_router.phase1_bandit.get_stats()
+        assert sum(stats["arm_pulls"].values()) == 20
+        assert router.get_update_stats()["batches"] == 1
+        save_state.assert_awaited_once()
+        router.auto_persist = False
+        await router.close()
+
+    async def test_phase2_requires_features(self, test_arms):
+        """Test a phase2 batch with missing features is rejected whole."""
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"], cache_enabled=False, auto_persist=False
+        )
+        hybrid = router.hybrid_router
+        hybrid.query_count = hybrid.switch_threshold
+        await hybrid._transition_to_phase2()
+        batch = _batch(hybrid.arms, 3)
+        batch.append((batch[0][0], None))
+
+        with pytest.raises(ValueError, match="Features required"):
+            await hybrid.update_batch(batch)
+        await hybrid.update_batch(batch[:3])
+        await router.close()
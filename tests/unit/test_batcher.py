@@ -0,0 +1,135 @@
+"""Tests for the shared bounded background batcher."""
+
+import asyncio
+
+import pytest
+
+from conduit.core.batcher import BackgroundBatcher
+
+
+class RecordingHandler:
+    """Batch handler that records batches and can stall or fail."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batches: list[list[int]] = []
+
+    async def __call__(self, items: list[int]) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("sink down")
+        self.batches.append(items)
+
+
+class TestBackgroundBatcher:
+    """Tests for BackgroundBatcher."""
+
+    async def test_batches_on_size_then_interval(self):
+        """Test a full batch is handled early and the rest on interval."""
+        handler = RecordingHandler()
+        batcher = BackgroundBatcher(
+            handler, queue_size=100, batch_size=4, flush_interval=0.05
+        )
+
+        for i in range(6):
+            assert await batcher.submit(i) is True
+        assert handler.batches == []
+
+        await asyncio.sleep(0.1)
+
+        assert handler.batches == [[0, 1, 2, 3], [4, 5]]
+        stats = batcher.get_stats()
+        assert stats["handled"] == 6
+        assert stats["batches"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 6
+        assert 0 < stats["avg_lag_ms"] <= stats["max_lag_ms"]
+        await batcher.close()
+
+    async def test_hooks_called(self):
+        """Test queue-depth, drop and lag hooks see every item."""
+        depth: list[int] = []
+        drops: list[str] = []
+        lags: list[float] = []
+        batcher = BackgroundBatcher(
+            RecordingHandler(),
+            queue_size=2,
+            batch_size=10,
+            flush_interval=1.0,
+            on_queue_depth=depth.append,
+            on_drop=drops.append,
+            on_lag=lags.append,
+        )
+
+        results = [batcher.submit_nowait(i) for i in range(3)]
+        await batcher.close()
+
+        assert results == [True, True, False]
+        assert sum(depth) == 0 and depth[:2] == [1, 1]
+        assert drops == ["queue_full"]
+        assert len(lags) == 2
+        assert await batcher.submit(3) is False
+        assert drops == ["queue_full", "closed"]
+
+    async def test_block_waits_for_space(self):
+        """Test overflow="block" keeps every item."""
+        handler = RecordingHandler(delay=0.01)
+        batcher = BackgroundBatcher(
+            handler, queue_size=2, batch_size=2, flush_interval=0.01, overflow="block"
+        )
+
+        for i in range(10):
+            assert await batcher.submit(i) is True
+        await batcher.close()
+
+        assert [i for batch in handler.batches for i in batch] == list(range(10))
+        assert batcher.get_stats()["dropped"] == 0
+
+    async def test_flush_waits_for_in_flight_batch(self):
+        """Test flush() returns only once earlier items have been handled."""
+        handler = RecordingHandler(delay=0.02)
+        batcher = BackgroundBatcher(
+            handler, queue_size=100, batch_size=1, flush_interval=1.0
+        )
+
+        await batcher.submit(0)
+        await asyncio.sleep(0)  # background task takes the item
+        await batcher.submit(1)
+        await batcher.flush()
+
+        assert handler.batches == [[0], [1]]
+        await batcher.close()
+
+    async def test_failed_batch_counted_not_raised(self):
+        """Test a raising handler loses the batch without stopping the batcher."""
+        handler = RecordingHandler(fail=True)
+        batcher = BackgroundBatcher(
+            handler, queue_size=100, batch_size=10, flush_interval=1.0
+        )
+
+        await batcher.submit(0)
+        await batcher.submit(1)
+        assert await batcher.flush() == 0
+
+        stats = batcher.get_stats()
+        assert stats["failed"] == 2
+        assert stats["handled"] == 0
+        assert stats["queue_depth"] == 0
+        await batcher.close()
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"queue_size": 0}, "queue_size"),
+            ({"batch_size": 0}, "batch_size"),
+            ({"flush_interval": 0}, "flush_interval"),
+            ({"overflow": "spill"}, "overflow"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, match):
+        """Test constructor validation."""
+        params = {"queue_size": 10, "batch_size": 5, "flush_interval": 1.0}
+        params.update(kwargs)
+        with pytest.raises(ValueError, match=match):
+            BackgroundBatcher(RecordingHandler(), **params)
@@ -0,0 +1,84 @@
+"""Unit tests for the compact binary feature cache encoding."""
+
+import struct
+
+import msgpack
+import numpy as np
+import pytest
+
+from conduit.cache.codec import MAGIC, decode_features, encode_features
+from conduit.core.models import QueryFeatures
+
+
+@pytest.fixture
+def features():
+    """Create 1536-dim features with metadata set."""
+    rng = np.random.default_rng(0)
+    return QueryFeatures(
+        embedding=rng.standard_normal(1536) * 0.05,
+        token_count=123,
+        complexity_score=0.42,
+        query_text="What is photosynthesis?",
+        embedding_failed=False,
+    )
+
+
+class TestFeatureCodec:
+    """Tests for encode_features / decode_features."""
+
+    def test_float32_roundtrip(self, features):
+        """Test float32 encoding preserves values to float32 precision."""
+        data = encode_features(features, "float32")
+        decoded = decode_features(data)
+
+        assert data[:2] == MAGIC
+        assert decoded.embedding_array.dtype == np.float32
+        assert not decoded.embedding_array.flags.writeable
+        assert np.allclose(decoded.embedding_array, features.embedding_array, atol=1e-7)
+        assert decoded.token_count == 123
+        assert decoded.complexity_score == 0.42
+        assert decoded.query_text == "What is photosynthesis?"
+        assert decoded.embedding_failed is False
+
+    @pytest.mark.parametrize("encoding,atol", [("float16", 1e-3), ("int8", 2e-3)])
+    def test_quantized_roundtrip(self, features, encoding, atol):
+        """Test quantized encodings stay within quantization error."""
+        decoded = decode_features(encode_features(features, encoding))
+        assert np.allclose(decoded.embedding_array, features.embedding_array, atol=atol)
+
+    def test_size_reduction(self, features):
+        """Test binary encodings are several times smaller than msgpack."""
+        legacy = len(encode_features(features, "msgpack"))
+
+        assert legacy / len(encode_features(features, "float32")) > 2
+        assert legacy / len(encode_features(features, "float16")) > 4
+        assert legacy / len(encode_features(features, "int8")) > 8
+
+    def test_legacy_msgpack_readable(self, features):
+        """Test entries written in the old msgpack format still decode."""
+        legacy = msgpack.packb(features.model_dump(), use_bin_type=True)
+        assert decode_features(legacy) == features
+
+    def test_flags_and_missing_text(self):
+        """Test embedding_failed flag and absent query_text roundtrip."""
+        original = QueryFeatures(
+            embedding=np.zeros(8),
+            token_count=0,
+            complexity_score=0.0,
+            embedding_failed=True,
+        )
+        decoded = decode_features(encode_features(original, "int8"))
+
+        assert decoded.embedding_failed is True
+        assert decoded.query_text is None
+        assert np.array_equal(decoded.embedding_array, np.zeros(8))
+
+    def test_invalid_entries_rejected(self, features):
+        """Test truncated data and unknown versions raise ValueError."""
+        data = encode_features(features, "float32")
+        with pytest.raises(ValueError, match="size mismatch"):
+            decode_features(data[:-10])
+        with pytest.raises(ValueError, match="version"):
+            decode_features(MAGIC + struct.pack("<B", 99) + data[3:])
+        with pytest.raises(ValueError, match="Unknown feature encoding"):
+            encode_features(features, "bfloat16")  # type: ignore[arg-type]
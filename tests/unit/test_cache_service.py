@@ -1,10 +1,13 @@
 """Unit tests for cache service with mocked Redis."""
 
+import time
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from redis.exceptions import ConnectionError, TimeoutError
 
-from conduit.cache import CacheConfig, CacheService
+from conduit.cache import CacheConfig, CacheService, LRUFeatureCache
+from conduit.cache.memory import ENTRY_OVERHEAD_BYTES
 from conduit.core.models import QueryFeatures
 
 
@@ -91,6 +94,9 @@ class TestCacheService:
         # Verify TTL was set
         assert call_args[1]["ex"] == 86400
 
+        # Stored in the compact binary format by default
+        assert call_args[0][1][:2] == b"CF"
+
     async def test_cache_key_normalization(self, cache_service):
         """Test cache key normalization for consistent hits."""
         key1 = cache_service._generate_key("What is 2+2?")
@@ -272,9 +278,12 @@ class TestCacheIntegration:
         result = await cache_service.get("query1")
         assert result is not None
 
-        # Error doesn't break system
+        # Error doesn't break system: hot key still served from L1,
+        # cold key degrades to a miss
         cache_service.redis.get = AsyncMock(side_effect=ConnectionError())
         result = await cache_service.get("query1")
+        assert result is not None
+        result = await cache_service.get("query2")
         assert result is None  # Graceful degradation
         assert cache_service.stats.errors == 1
 
@@ -295,3 +304,184 @@ class TestCacheIntegration:
 
         assert result is None
         cache_service.redis.get.assert_not_called()
+
+
+class TestL1Cache:
+    """Tests for the in-process LRU tier in front of Redis."""
+
+    async def test_l1_hit_skips_redis(self, cache_service, sample_features):
+        """Test repeated lookups are served from L1 without Redis."""
+        cache_service.redis.set = AsyncMock()
+        cache_service.redis.get = AsyncMock()
+        await cache_service.set("hot query", sample_features)
+
+        result = await cache_service.get("HOT   query")
+
+        assert result is sample_features
+        cache_service.redis.get.assert_not_called()
+        stats = cache_service.get_stats()
+        assert stats.hits == 1
+        assert stats.l1_hits == 1
+        assert stats.l1_size == 1
+
+    async def test_redis_hit_promoted_to_l1(self, cache_service, sample_features):
+        """Test L2 hits populate L1 so the next lookup avoids Redis."""
+        import msgpack
+
+        serialized = msgpack.packb(sample_features.model_dump(), use_bin_type=True)
+        cache_service.redis.get = AsyncMock(return_value=serialized)
+
+        first = await cache_service.get("query")
+        second = await cache_service.get("query")
+
+        assert first is second
+        assert cache_service.redis.get.call_count == 1
+        stats = cache_service.get_stats()
+        assert stats.hits == 2
+        assert stats.l1_hits == 1
+        assert stats.l1_misses == 1
+        assert stats.l1_hit_rate == 50.0
+
+    async def test_l1_serves_while_circuit_open(self, cache_service, sample_features):
+        """Test hot keys keep hitting when the circuit breaker is open."""
+        cache_service.redis.set = AsyncMock()
+        await cache_service.set("hot", sample_features)
+
+        cache_service.circuit_breaker.state = "open"
+        cache_service.circuit_breaker.last_failure_time = time.time()
+        cache_service.redis.get = AsyncMock()
+
+        assert await cache_service.get("hot") is sample_features
+        assert await cache_service.get("cold") is None
+        cache_service.redis.get.assert_not_called()
+
+    async def test_l1_disabled(self, cache_config, sample_features):
+        """Test l1_enabled=False keeps the Redis-only behavior."""
+        with patch("conduit.cache.service.Redis") as mock_redis:
+            mock_redis.from_url.return_value = AsyncMock()
+            service = CacheService(cache_config.model_copy(update={"l1_enabled": False}))
+
+        assert service.l1 is None
+        service.redis.get = AsyncMock(return_value=None)
+        await service.set("query", sample_features)
+        assert await service.get("query") is None
+
+    async def test_clear_empties_l1(self, cache_service, sample_features):
+        """Test clear() also drops in-process entries."""
+        cache_service.redis.set = AsyncMock()
+        cache_service.redis.scan = AsyncMock(return_value=(0, []))
+        cache_service.redis.get = AsyncMock(return_value=None)
+        await cache_service.set("query", sample_features)
+
+        await cache_service.clear()
+
+        assert await cache_service.get("query") is None
+        assert cache_service.get_stats().l1_size == 0
+
+
+class TestLRUFeatureCache:
+    """Tests for LRUFeatureCache bounds and expiry."""
+
+    def test_evicts_least_recently_used(self, sample_features):
+        """Test entry bound evicts the least recently used key."""
+        cache = LRUFeatureCache(max_entries=2, max_bytes=10**9, ttl=60)
+        cache.set("a", sample_features)
+        cache.set("b", sample_features)
+        cache.get("a")  # a becomes most recent
+        cache.set("c", sample_features)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is sample_features
+        assert cache.get("c") is sample_features
+        assert cache.evictions == 1
+
+    def test_memory_bound(self, sample_features):
+        """Test byte bound limits the number of retained entries."""
+        entry_size = sample_features.embedding_array.nbytes + ENTRY_OVERHEAD_BYTES
+        cache = LRUFeatureCache(max_entries=100, max_bytes=entry_size * 3, ttl=60)
+        for i in range(5):
+            cache.set(f"k{i}", sample_features)
+
+        assert cache.size == 3
+        assert cache.memory_bytes <= entry_size * 3
+
+    def test_ttl_expiry(self, sample_features):
+        """Test expired entries are treated as misses."""
+        cache = LRUFeatureCache(max_entries=10, max_bytes=10**9, ttl=60)
+        cache.set("a", sample_features)
+
+        with patch("conduit.cache.memory.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get("a") is None
+
+        assert cache.size == 0
+        assert cache.misses == 1
+
+    def test_pop_consumes_entry(self, sample_features):
+        """Test pop returns an entry once and releases its memory."""
+        cache = LRUFeatureCache(max_entries=10, max_bytes=10**9, ttl=60)
+        cache.set("a", sample_features)
+
+        assert cache.pop("a") is sample_features
+        assert cache.pop("a") is None
+        assert cache.memory_bytes == 0
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestBatchOperations:
+    """Tests for pipelined get_many / set_many."""
+
+    async def test_get_many_single_mget(self, cache_service, sample_features):
+        """Test misses in L1 are fetched with one MGET, results aligned."""
+        from conduit.cache import encode_features
+
+        encoded = encode_features(sample_features)
+        cache_service.redis.mget = AsyncMock(return_value=[encoded, None])
+
+        results = await cache_service.get_many(["q1", "q2", "Q1"])
+
+        cache_service.redis.mget.assert_awaited_once()
+        (keys,) = cache_service.redis.mget.await_args.args
+        assert len(keys) == 2  # normalized duplicates looked up once
+        assert results[0].token_count == sample_features.token_count
+        assert results[1] is None
+        assert results[2] is results[0]
+        stats = cache_service.get_stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+
+    async def test_get_many_serves_l1_without_redis(self, cache_service, sample_features):
+        """Test fully L1-resident batches skip Redis."""
+        cache_service.redis.set = AsyncMock()
+        cache_service.redis.mget = AsyncMock()
+        await cache_service.set("q1", sample_features)
+
+        results = await cache_service.get_many(["q1"])
+
+        assert results == [sample_features]
+        cache_service.redis.mget.assert_not_called()
+
+    async def test_get_many_connection_error(self, cache_service):
+        """Test MGET failures degrade to misses and count toward the breaker."""
+        cache_service.redis.mget = AsyncMock(side_effect=ConnectionError())
+
+        results = await cache_service.get_many(["q1", "q2"])
+
+        assert results == [None, None]
+        assert cache_service.stats.errors == 1
+        assert cache_service.circuit_breaker.failure_count == 1
+
+    async def test_set_many_pipelines_with_ttl(self, cache_service, sample_features):
+        """Test set_many issues SET-with-TTL in one pipeline execution."""
+        pipe = Mock()
+        pipe.execute = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        cache_service.redis.pipeline = Mock(return_value=pipe)
+
+        await cache_service.set_many([("q1", sample_features), ("q2", sample_features)])
+
+        cache_service.redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 2
+        assert all(call.kwargs["ex"] == 86400 for call in pipe.set.call_args_list)
+        pipe.execute.assert_awaited_once()
+        assert cache_service.get_stats().l1_size == 2
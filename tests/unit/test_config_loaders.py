@@ -406,3 +406,73 @@ class TestErrorHandling:
 
         config = load_algorithm_config("linucb")
         assert config["alpha"] == 1.0  # Falls back to defaults
+
+
+class TestConfigSnapshot:
+    """Test memoization and invalidation of hot-path config loaders."""
+
+    def test_repeated_calls_do_not_reparse(self, tmp_path, monkeypatch):
+        """Test YAML is parsed once and then served from the snapshot."""
+        monkeypatch.chdir(tmp_path)
+        with open(tmp_path / "conduit.yaml", "w") as f:
+            yaml.dump({"features": {"embedding_dim": 128, "full_dim": 130}}, f)
+
+        with patch("conduit.core.config.loaders.yaml.safe_load", wraps=yaml.safe_load) as spy:
+            for _ in range(5):
+                assert load_feature_dimensions()["full_dim"] == 130
+
+        assert spy.call_count == 1
+
+    def test_returned_values_are_isolated(self, tmp_path, monkeypatch):
+        """Test mutating a returned dict does not corrupt the snapshot."""
+        monkeypatch.chdir(tmp_path)
+
+        config = load_routing_config()
+        config["presets"]["balanced"]["quality"] = 0.0
+
+        assert load_routing_config()["presets"]["balanced"]["quality"] == 0.7
+
+    def test_invalidates_on_file_change(self, tmp_path, monkeypatch):
+        """Test snapshot picks up conduit.yaml edits once the mtime check runs."""
+        from conduit.core.config import config_snapshot
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(config_snapshot, "check_interval", 0.0)
+        yaml_path = tmp_path / "conduit.yaml"
+
+        with open(yaml_path, "w") as f:
+            yaml.dump({"algorithms": {"linucb": {"alpha": 2.0}}}, f)
+        assert load_algorithm_config("linucb")["alpha"] == 2.0
+
+        with open(yaml_path, "w") as f:
+            yaml.dump({"algorithms": {"linucb": {"alpha": 3.25}}}, f)
+        stat = yaml_path.stat()
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_algorithm_config("linucb")["alpha"] == 3.25
+
+    def test_reload_hook_picks_up_env_changes(self, tmp_path, monkeypatch):
+        """Test reload_config() is required (and sufficient) for env changes."""
+        from conduit.core.config import reload_config
+
+        monkeypatch.chdir(tmp_path)
+        assert load_algorithm_config("linucb")["alpha"] == 1.0
+
+        monkeypatch.setenv("ALGORITHM_LINUCB_ALPHA", "4.0")
+        assert load_algorithm_config("linucb")["alpha"] == 1.0  # Snapshot
+
+        reload_config()
+        assert load_algorithm_config("linucb")["alpha"] == 4.0
+
+    def test_auto_detection_runs_once(self, tmp_path, monkeypatch):
+        """Test embedding provider auto-detection is not repeated per call."""
+        monkeypatch.chdir(tmp_path)
+
+        with patch(
+            "conduit.engines.embeddings.factory.create_embedding_provider"
+        ) as mock_create:
+            mock_create.return_value.dimension = 256
+            for _ in range(3):
+                assert load_feature_dimensions()["embedding_dim"] == 256
+
+        assert mock_create.call_count == 1
@@ -0,0 +1,164 @@
+"""Tests for the micro-batching embedding coalescer."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from conduit.engines.analyzer import QueryAnalyzer
+from conduit.engines.embeddings.base import EmbeddingProvider
+from conduit.engines.embeddings.batching import BatchingEmbeddingProvider
+
+
+class RecordingProvider(EmbeddingProvider):
+    """Fake provider that records calls and embeds text as [len(text), index]."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.embed_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+
+    async def embed(self, text: str) -> list[float]:
+        self.embed_calls.append(text)
+        return (await self._compute([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batch_calls.append(list(texts))
+        return await self._compute(texts)
+
+    async def _compute(self, texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [[float(len(text)), float(i)] for i, text in enumerate(texts)]
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    @property
+    def provider_name(self) -> str:
+        return "recording"
+
+
+class TestBatchingEmbeddingProvider:
+    """Tests for BatchingEmbeddingProvider."""
+
+    async def test_concurrent_calls_share_one_batch(self):
+        """Test concurrent embed() calls become one embed_batch() call."""
+        inner = RecordingProvider()
+        provider = BatchingEmbeddingProvider(inner, max_wait_ms=5)
+        texts = [f"query {i}" * (i + 1) for i in range(20)]
+
+        results = await asyncio.gather(*(provider.embed(t) for t in texts))
+
+        assert inner.batch_calls == [texts]
+        assert inner.embed_calls == []
+        for text, result in zip(texts, results):
+            assert result[0] == float(len(text))
+        assert provider.get_stats()["provider_calls"] == 1
+        assert provider.get_stats()["avg_batch_size"] == 20
+
+    async def test_duplicate_texts_embedded_once(self):
+        """Test identical texts within a batch are deduplicated."""
+        inner = RecordingProvider()
+        provider = BatchingEmbeddingProvider(inner, max_wait_ms=5)
+
+        results = await asyncio.gather(
+            provider.embed("same"), provider.embed("other"), provider.embed("same")
+        )
+
+        assert inner.batch_calls == [["same", "other"]]
+        assert results[0] == results[2]
+        assert provider.get_stats()["deduplicated"] == 1
+
+    async def test_single_text_uses_embed(self):
+        """Test a batch with one distinct text calls provider.embed()."""
+        inner = RecordingProvider()
+        provider = BatchingEmbeddingProvider(inner, max_wait_ms=1)
+
+        assert await provider.embed("solo") == [4.0, 0.0]
+        assert inner.embed_calls == ["solo"]
+        assert inner.batch_calls == []
+
+    async def test_flushes_at_max_batch_size(self):
+        """Test batches are split at max_batch_size distinct texts."""
+        inner = RecordingProvider()
+        provider = BatchingEmbeddingProvider(inner, max_batch_size=4, max_wait_ms=1000)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(provider.embed(f"t{i}") for i in range(8))), timeout=1.0
+        )
+
+        assert [len(batch) for batch in inner.batch_calls] == [4, 4]
+
+    async def test_failure_propagates_to_all_callers(self):
+        """Test provider errors reach every caller in the batch."""
+        provider = BatchingEmbeddingProvider(RecordingProvider(fail=True), max_wait_ms=1)
+
+        results = await asyncio.gather(
+            provider.embed("a"), provider.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_batch(self):
+        """Test cancelling one waiter leaves the others' results intact."""
+        inner = RecordingProvider(delay=0.02)
+        provider = BatchingEmbeddingProvider(inner, max_wait_ms=1)
+
+        cancelled = asyncio.create_task(provider.embed("a"))
+        kept = asyncio.create_task(provider.embed("bb"))
+        await asyncio.sleep(0.005)
+        cancelled.cancel()
+
+        assert (await kept)[0] == 2.0
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    async def test_embed_batch_passes_through(self):
+        """Test explicit batches are forwarded unchanged."""
+        inner = RecordingProvider()
+        provider = BatchingEmbeddingProvider(inner)
+
+        await provider.embed_batch(["x", "y"])
+
+        assert inner.batch_calls == [["x", "y"]]
+        assert provider.dimension == 2
+        assert provider.provider_name == "recording"
+
+    def test_invalid_settings_rejected(self):
+        """Test batch size and wait bounds are validated."""
+        with pytest.raises(ValueError):
+            BatchingEmbeddingProvider(RecordingProvider(), max_batch_size=0)
+        with pytest.raises(ValueError):
+            BatchingEmbeddingProvider(RecordingProvider(), max_wait_ms=-1)
+
+
+class TestAnalyzerBatching:
+    """Tests for analyzer integration."""
+
+    @patch("conduit.engines.analyzer.create_embedding_provider")
+    async def test_analyzer_wraps_created_provider(self, mock_create_provider):
+        """Test analyzer coalesces concurrent cache-miss embeddings."""
+        inner = RecordingProvider()
+        mock_create_provider.return_value = inner
+
+        analyzer = QueryAnalyzer()
+        assert isinstance(analyzer.embedding_provider, BatchingEmbeddingProvider)
+
+        await asyncio.gather(*(analyzer.analyze(f"question {i}") for i in range(10)))
+
+        assert len(inner.batch_calls) == 1
+        assert len(inner.batch_calls[0]) == 10
+
+    def test_injected_provider_used_as_is(self):
+        """Test explicitly provided providers are not wrapped."""
+        provider = Mock()
+        provider.embed = AsyncMock(return_value=[0.1] * 384)
+        provider.dimension = 384
+
+        analyzer = QueryAnalyzer(embedding_provider=provider)
+
+        assert analyzer.embedding_provider is provider
@@ -0,0 +1,184 @@
+"""Tests for the bounded local embedding executor."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from conduit.core.config import load_embeddings_config
+from conduit.core.exceptions import EmbeddingBackpressureError
+from conduit.engines.embeddings import sentence_transformers as st_module
+from conduit.engines.embeddings.executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+    shutdown_embedding_executor,
+)
+
+
+@pytest.fixture
+def executor():
+    """Small executor with short backpressure timeout."""
+    executor = EmbeddingExecutor(max_workers=1, max_queue_size=1, queue_timeout=0.05)
+    yield executor
+    executor.shutdown()
+
+
+class TestEmbeddingExecutor:
+    """Tests for EmbeddingExecutor."""
+
+    async def test_run_returns_result_off_event_loop(self, executor):
+        """Test jobs run on a worker thread, not the event loop thread."""
+        loop_thread = threading.get_ident()
+        result = await executor.run(lambda x: (x * 2, threading.get_ident()), 21)
+        assert result[0] == 42
+        assert result[1] != loop_thread
+
+    async def test_slow_job_does_not_block_event_loop(self, executor):
+        """Test event loop keeps serving other tasks during slow compute."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.1)
+        ticker_task.cancel()
+
+        assert ticks >= 5
+
+    async def test_backpressure_rejects_when_full(self, executor):
+        """Test callers are rejected once queue bound is reached."""
+        release = threading.Event()
+        blocked = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(EmbeddingBackpressureError):
+            await executor.run(lambda: None)
+
+        release.set()
+        await blocked
+        assert executor.get_stats()["rejected"] == 1
+
+    async def test_waiter_admitted_when_slot_frees(self):
+        """Test a waiting caller proceeds once a running job completes."""
+        executor = EmbeddingExecutor(max_workers=1, max_queue_size=1, queue_timeout=1.0)
+        try:
+            first = asyncio.create_task(executor.run(time.sleep, 0.05))
+            await asyncio.sleep(0.01)
+            assert await executor.run(lambda: "second") == "second"
+            await first
+            assert executor.get_stats()["rejected"] == 0
+        finally:
+            executor.shutdown()
+
+    async def test_stats_track_queue_depth_and_compute_time(self, executor):
+        """Test stats report compute time and return to zero queue depth."""
+        await executor.run(time.sleep, 0.02)
+
+        with pytest.raises(ValueError):
+            await executor.run(lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+        stats = executor.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["running"] == 0
+        assert stats["submitted"] == 2
+        assert stats["completed"] == 1
+        assert stats["failed"] == 1
+        assert stats["max_compute_ms"] >= 20
+
+    def test_invalid_bounds_rejected(self):
+        """Test queue bound must cover worker count."""
+        with pytest.raises(ValueError, match="max_queue_size"):
+            EmbeddingExecutor(max_workers=4, max_queue_size=2)
+        with pytest.raises(ValueError, match="queue_timeout"):
+            EmbeddingExecutor(max_workers=1, queue_timeout=-1)
+
+
+class TestSharedExecutor:
+    """Tests for the process-wide executor and its configuration."""
+
+    def test_config_defaults(self):
+        """Test executor settings are exposed by load_embeddings_config."""
+        config = load_embeddings_config()
+        assert "executor_max_workers" in config
+        assert "executor_max_queue_size" in config
+        assert config["executor_queue_timeout"] > 0
+
+    def test_shared_executor_from_config(self, monkeypatch):
+        """Test shared executor is built from config and recreated on shutdown."""
+        from conduit.engines.embeddings import executor as executor_module
+
+        monkeypatch.setattr(
+            executor_module,
+            "load_embeddings_config",
+            lambda: {
+                "executor_max_workers": 3,
+                "executor_max_queue_size": 9,
+                "executor_queue_timeout": 0.5,
+            },
+        )
+        shutdown_embedding_executor()
+        try:
+            shared = get_embedding_executor()
+            assert shared is get_embedding_executor()
+            assert shared.max_workers == 3
+            assert shared.max_queue_size == 9
+            assert shared.queue_timeout == 0.5
+        finally:
+            shutdown_embedding_executor()
+        assert get_embedding_executor() is not shared
+        shutdown_embedding_executor()
+
+
+class TestLocalProviderUsesExecutor:
+    """Tests that local providers route inference through the executor."""
+
+    async def test_sentence_transformers_runs_on_executor(self, executor, monkeypatch):
+        """Test sentence-transformers encode runs on the provided executor."""
+
+        class FakeSentenceTransformer:
+            def __init__(self, model):
+                self.calls = 0
+
+            def encode(self, texts, convert_to_numpy=True):
+                self.calls += 1
+                return np.ones((len(texts), 384), dtype=np.float32)
+
+        monkeypatch.setattr(st_module, "SentenceTransformer", FakeSentenceTransformer)
+        provider = st_module.SentenceTransformersEmbeddingProvider(executor=executor)
+
+        embeddings = await provider.embed_batch(["a", "b"])
+
+        assert len(embeddings) == 2
+        assert len(embeddings[0]) == 384
+        assert executor.get_stats()["completed"] == 1
+
+    async def test_backpressure_error_not_wrapped(self, executor, monkeypatch):
+        """Test saturation surfaces as EmbeddingBackpressureError."""
+        release = threading.Event()
+
+        class BlockingSentenceTransformer:
+            def __init__(self, model):
+                pass
+
+            def encode(self, texts, convert_to_numpy=True):
+                release.wait()
+                return np.zeros((len(texts), 384))
+
+        monkeypatch.setattr(
+            st_module, "SentenceTransformer", BlockingSentenceTransformer
+        )
+        provider = st_module.SentenceTransformersEmbeddingProvider(executor=executor)
+
+        blocked = asyncio.create_task(provider.embed("slow"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(EmbeddingBackpressureError):
+            await provider.embed("rejected")
+
+        release.set()
+        assert len(await blocked) == 384
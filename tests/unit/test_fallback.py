@@ -431,7 +431,9 @@ class TestFeedbackAttribution:
 
             update_calls = []
 
-            async def mock_update(model_id, cost, quality_score, latency, features):
+            async def mock_update(
+                model_id, cost, quality_score, latency, features, reward_weights=None
+            ):
                 update_calls.append(
                     {
                         "model_id": model_id,
@@ -488,7 +490,9 @@ class TestFeedbackAttribution:
 
             update_calls = []
 
-            async def mock_update(model_id, cost, quality_score, latency, features):
+            async def mock_update(
+                model_id, cost, quality_score, latency, features, reward_weights=None
+            ):
                 update_calls.append(
                     {
                         "model_id": model_id,
@@ -556,7 +560,9 @@ class TestFeedbackAttribution:
 
             update_calls = []
 
-            async def mock_update(model_id, cost, quality_score, latency, features):
+            async def mock_update(
+                model_id, cost, quality_score, latency, features, reward_weights=None
+            ):
                 update_calls.append(
                     {
                         "model_id": model_id,
@@ -22,6 +22,7 @@ def mock_router():
     """Create a mock Router."""
     router = MagicMock()
     router.update = AsyncMock()
+    router.update_batch = AsyncMock()
     return router
 
 
@@ -178,6 +179,26 @@ class TestFeedbackCollector:
         assert call_kwargs["cost"] == 0.001
         assert call_kwargs["latency"] == 0.5
 
+    @pytest.mark.asyncio
+    async def test_record_uses_decision_reward_weights(
+        self, mock_router, mock_decision
+    ):
+        """Should update with the preference weights recorded at routing time."""
+        collector = FeedbackCollector(mock_router)
+        weights = {"quality": 0.4, "cost": 0.5, "latency": 0.1}
+        mock_decision.metadata["reward_weights"] = weights
+
+        await collector.track(mock_decision)
+        await collector.record(
+            FeedbackEvent(
+                query_id=mock_decision.query_id,
+                signal_type="thumbs",
+                payload={"value": "up"},
+            )
+        )
+
+        assert mock_router.update.call_args[1]["reward_weights"] == weights
+
     @pytest.mark.asyncio
     async def test_record_feedback_unknown_query(self, mock_router):
         """Should return False for unknown query_id."""
@@ -259,7 +280,84 @@ class TestFeedbackCollector:
         assert results["q0"] is True
         assert results["q1"] is True
         assert results["q2"] is True
-        assert mock_router.update.call_count == 3
+        # One batched router update for all three events
+        mock_router.update_batch.assert_called_once()
+        batch = mock_router.update_batch.call_args[0][0]
+        assert [feedback.model_id for feedback, _ in batch] == ["gpt-4o-mini"] * 3
+        mock_router.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_record_batch_skips_invalid_and_falls_back(
+        self, mock_router, mock_decision
+    ):
+        """Should skip unknown queries and retry singly if the batch fails."""
+        collector = FeedbackCollector(mock_router)
+        for query_id, model in [("q0", "gpt-4o-mini"), ("q1", "unknown-model")]:
+            await collector.track(
+                RoutingDecision(
+                    query_id=query_id,
+                    selected_model=model,
+                    confidence=0.85,
+                    features=mock_decision.features,
+                    reasoning="Test",
+                )
+            )
+
+        async def update_batch(batch):
+            if any(feedback.model_id == "unknown-model" for feedback, _ in batch):
+                raise ValueError("Model ID 'unknown-model' not in arms")
+
+        mock_router.update_batch = AsyncMock(side_effect=update_batch)
+        thumbs_up = {"value": "up"}
+        events = [
+            FeedbackEvent(query_id="q0", signal_type="thumbs", payload=thumbs_up),
+            FeedbackEvent(query_id="q0", signal_type="thumbs", payload=thumbs_up),
+            FeedbackEvent(query_id="q1", signal_type="thumbs", payload=thumbs_up),
+            FeedbackEvent(query_id="missing", signal_type="thumbs", payload=thumbs_up),
+        ]
+        results = await collector.record_batch(events)
+
+        assert results == {"q0": True, "q1": False, "missing": False}
+        # Whole batch rejected once, then each entry applied on its own
+        assert mock_router.update_batch.call_count == 3
+        assert await collector.store.was_processed("q0:thumbs")
+        assert not await collector.store.was_processed("q1:thumbs")
+
+    @pytest.mark.asyncio
+    async def test_record_claims_in_one_store_call(self, mock_router, mock_decision):
+        """Should resolve a duplicate from the store's claim, not a separate check."""
+        collector = FeedbackCollector(mock_router)
+        await collector.track(mock_decision)
+        collector.store.was_processed = AsyncMock()
+        event = FeedbackEvent(
+            query_id=mock_decision.query_id,
+            signal_type="thumbs",
+            payload={"value": "up"},
+        )
+
+        assert await collector.record(event) is True
+        assert await collector.record(event) is True  # Duplicate
+
+        mock_router.update.assert_called_once()
+        collector.store.was_processed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_record_failed_update_releases_claim(
+        self, mock_router, mock_decision
+    ):
+        """Should not report a retry of failed feedback as a duplicate."""
+        collector = FeedbackCollector(mock_router)
+        await collector.track(mock_decision)
+        mock_router.update.side_effect = RuntimeError("boom")
+        event = FeedbackEvent(
+            query_id=mock_decision.query_id,
+            signal_type="thumbs",
+            payload={"value": "up"},
+        )
+
+        assert await collector.record(event) is False
+        assert not await collector.store.was_processed(event.get_idempotency_key())
+        assert await collector.record(event) is False  # Pending already consumed
 
     @pytest.mark.asyncio
     async def test_pending_cleaned_after_record(self, mock_router, mock_decision):
@@ -657,7 +755,7 @@ class TestIdempotencyCollector:
         )
         assert len(first_result) == 1
         assert first_result["q1"] is True
-        assert mock_router.update.call_count == 1
+        assert mock_router.update_batch.call_count == 1
 
         # Track again for second attempt
         await collector.track(decision1, session_id=session_id)
@@ -669,4 +767,4 @@ class TestIdempotencyCollector:
             payload={"rating": 5},
         )
         assert len(second_result) == 0  # Empty - already processed
-        assert mock_router.update.call_count == 1  # NOT called again
+        assert mock_router.update_batch.call_count == 1  # NOT called again
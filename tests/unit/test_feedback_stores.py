@@ -4,6 +4,7 @@ Tests the RedisFeedbackStore and PostgresFeedbackStore implementations
 using mocked backends.
 """
 
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -46,6 +47,7 @@ class TestRedisFeedbackStore:
         redis.ttl = AsyncMock(return_value=3600)
         redis.set = AsyncMock()
         redis.scan = AsyncMock(return_value=(0, []))
+        redis.eval = AsyncMock(return_value=None)
         return redis
 
     @pytest.fixture
@@ -57,20 +59,44 @@ class TestRedisFeedbackStore:
 
     @pytest.mark.asyncio
     async def test_save_pending(self, store, mock_redis, sample_pending_query):
-        """Test saving a pending query to Redis."""
+        """Test saving a pending query without a session uses SETEX."""
+        sample_pending_query.session_id = None
+
         await store.save_pending(sample_pending_query)
 
         mock_redis.setex.assert_called_once()
+        mock_redis.eval.assert_not_called()
         call_args = mock_redis.setex.call_args
         assert call_args[0][0] == "test:feedback:query-123"
         assert call_args[0][1] == 3600  # TTL
 
+    @pytest.mark.asyncio
+    async def test_save_pending_indexes_session(
+        self, store, mock_redis, sample_pending_query
+    ):
+        """Test a session query is written and indexed in one script call."""
+        await store.save_pending(sample_pending_query)
+
+        mock_redis.setex.assert_not_called()
+        mock_redis.eval.assert_called_once()
+        _, numkeys, key, session_key, payload, ttl, expires_at, member = (
+            mock_redis.eval.call_args[0]
+        )
+        assert numkeys == 2
+        assert key == "test:feedback:query-123"
+        assert session_key == "conduit:feedback:session:session-456"
+        assert payload == sample_pending_query.model_dump_json()
+        assert ttl == 3600
+        assert expires_at > 3600
+        assert member == "query-123"
+
     @pytest.mark.asyncio
     async def test_save_pending_uses_query_ttl(
         self, store, mock_redis, sample_pending_query
     ):
         """Test that save_pending uses query's TTL if provided."""
         sample_pending_query.ttl_seconds = 1800
+        sample_pending_query.session_id = None
 
         await store.save_pending(sample_pending_query)
 
@@ -108,37 +134,27 @@ class TestRedisFeedbackStore:
         assert result is None  # Should return None, not raise
 
     @pytest.mark.asyncio
-    async def test_get_and_delete_pending_uses_getdel(
+    async def test_get_and_delete_pending_uses_script(
         self, store, mock_redis, sample_pending_query
     ):
-        """Test atomic get and delete using GETDEL command."""
-        mock_redis.getdel.return_value = sample_pending_query.model_dump_json().encode()
+        """Test atomic get and delete (with session unindexing) in one script."""
+        mock_redis.eval.return_value = sample_pending_query.model_dump_json().encode()
 
         result = await store.get_and_delete_pending("query-123")
 
-        mock_redis.getdel.assert_called_once_with("test:feedback:query-123")
+        mock_redis.eval.assert_called_once()
+        assert mock_redis.eval.call_args[0][1:] == (
+            1,
+            "test:feedback:query-123",
+            "conduit:feedback:session",
+        )
         assert result is not None
         assert result.query_id == "query-123"
 
-    @pytest.mark.asyncio
-    async def test_get_and_delete_pending_fallback(
-        self, store, mock_redis, sample_pending_query
-    ):
-        """Test fallback when GETDEL is not available."""
-        # Simulate older Redis without getdel
-        mock_redis.getdel.side_effect = AttributeError("no getdel")
-        mock_redis.get.return_value = sample_pending_query.model_dump_json().encode()
-
-        result = await store.get_and_delete_pending("query-123")
-
-        mock_redis.get.assert_called_once()
-        mock_redis.delete.assert_called_once()
-        assert result is not None
-
     @pytest.mark.asyncio
     async def test_get_and_delete_pending_not_found(self, store, mock_redis):
         """Test atomic get and delete when query doesn't exist."""
-        mock_redis.getdel.return_value = None
+        mock_redis.eval.return_value = None
 
         result = await store.get_and_delete_pending("nonexistent")
 
@@ -182,10 +198,86 @@ class TestRedisFeedbackStore:
 
     @pytest.mark.asyncio
     async def test_delete_pending(self, store, mock_redis):
-        """Test deleting a pending query."""
+        """Test deleting a pending query also unindexes it from its session."""
         await store.delete_pending("query-123")
 
-        mock_redis.delete.assert_called_once_with("test:feedback:query-123")
+        mock_redis.eval.assert_called_once()
+        assert mock_redis.eval.call_args[0][2] == "test:feedback:query-123"
+
+    @pytest.mark.asyncio
+    async def test_get_session_queries_uses_index(
+        self, store, mock_redis, sample_pending_query
+    ):
+        """Test session lookup reads the index in one call, without SCAN."""
+        mock_redis.eval.return_value = [
+            sample_pending_query.model_dump_json().encode(),
+            b"invalid json",
+        ]
+
+        result = await store.get_session_queries("session-456")
+
+        assert [pending.query_id for pending in result] == ["query-123"]
+        mock_redis.scan.assert_not_called()
+        args = mock_redis.eval.call_args[0]
+        assert args[1:3] == (1, "conduit:feedback:session:session-456")
+        assert args[3] == "test:feedback"
+        assert args[5] == "0"  # Non-destructive
+
+    @pytest.mark.asyncio
+    async def test_get_and_delete_session_single_call(
+        self, store, mock_redis, sample_pending_query
+    ):
+        """Test session fetch-and-delete is one atomic script call."""
+        mock_redis.eval.return_value = [sample_pending_query.model_dump_json()]
+
+        result = await store.get_and_delete_session("session-456")
+
+        assert [pending.query_id for pending in result] == ["query-123"]
+        mock_redis.eval.assert_called_once()
+        assert mock_redis.eval.call_args[0][5] == "1"
+        mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claim_pending_single_script(
+        self, store, mock_redis, sample_pending_query
+    ):
+        """Test idempotency check, get-and-delete and marker in one call."""
+        mock_redis.eval.return_value = sample_pending_query.model_dump_json().encode()
+
+        duplicate, pending = await store.claim_pending(
+            "query-123", "query-123:thumbs", ttl_seconds=600
+        )
+
+        assert duplicate is False
+        assert pending is not None and pending.query_id == "query-123"
+        mock_redis.eval.assert_called_once()
+        assert mock_redis.eval.call_args[0][1:] == (
+            2,
+            "test:feedback:processed:query-123:thumbs",
+            "test:feedback:query-123",
+            "conduit:feedback:session",
+            600,
+        )
+        mock_redis.exists.assert_not_called()
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claim_pending_duplicate_and_missing(self, store, mock_redis):
+        """Test the script's duplicate (1) and unknown query (nil) replies."""
+        mock_redis.eval.return_value = 1
+        assert await store.claim_pending("query-123", "k") == (True, None)
+
+        mock_redis.eval.return_value = None
+        assert await store.claim_pending("query-123", "k") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_release_claim(self, store, mock_redis):
+        """Test releasing a claim deletes the processed marker."""
+        await store.release_claim("query-123:thumbs")
+
+        mock_redis.delete.assert_called_once_with(
+            "test:feedback:processed:query-123:thumbs"
+        )
 
     @pytest.mark.asyncio
     async def test_key_generation(self, store):
@@ -203,6 +295,7 @@ class TestPostgresFeedbackStore:
         conn.execute = AsyncMock(return_value="INSERT 0 1")
         conn.fetchrow = AsyncMock(return_value=None)
         conn.fetch = AsyncMock(return_value=[])
+        conn.fetchval = AsyncMock(return_value=None)
         return conn
 
     @pytest.fixture
@@ -238,6 +331,20 @@ class TestPostgresFeedbackStore:
         # Verify the SQL contains INSERT
         assert "INSERT INTO" in call_args[0][0]
         assert "test_pending_queries" in call_args[0][0]
+        assert call_args[0][-1] is None  # no reward_weights
+
+    @pytest.mark.asyncio
+    async def test_save_pending_reward_weights(
+        self, store, mock_connection, sample_pending_query
+    ):
+        """Test reward weights are written as JSONB."""
+        sample_pending_query.reward_weights = {"quality": 0.8, "cost": 0.2}
+
+        await store.save_pending(sample_pending_query)
+
+        sql, *params = mock_connection.execute.call_args[0]
+        assert "reward_weights = EXCLUDED.reward_weights" in sql
+        assert json.loads(params[-1]) == {"quality": 0.8, "cost": 0.2}
 
     @pytest.mark.asyncio
     async def test_get_pending_found(
@@ -254,6 +361,7 @@ class TestPostgresFeedbackStore:
             "ttl_seconds": 3600,
             "created_at": datetime.now(timezone.utc),
             "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+            "reward_weights": None,
         }
 
         result = await store.get_pending("query-123")
@@ -286,6 +394,7 @@ class TestPostgresFeedbackStore:
             "ttl_seconds": 3600,
             "created_at": datetime.now(timezone.utc),
             "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+            "reward_weights": {"quality": 1.0},
         }
 
         result = await store.get_and_delete_pending("query-123")
@@ -294,7 +403,9 @@ class TestPostgresFeedbackStore:
         # Verify DELETE ... RETURNING is used
         assert "DELETE" in call_args[0][0]
         assert "RETURNING" in call_args[0][0]
+        assert "reward_weights" in call_args[0][0]
         assert result is not None
+        assert result.reward_weights == {"quality": 1.0}
 
     @pytest.mark.asyncio
     async def test_update_pending_success(
@@ -354,6 +465,7 @@ class TestPostgresFeedbackStore:
                 "ttl_seconds": 3600,
                 "created_at": datetime.now(timezone.utc),
                 "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+                "reward_weights": None,
             },
             {
                 "query_id": "query-2",
@@ -365,6 +477,7 @@ class TestPostgresFeedbackStore:
                 "ttl_seconds": 3600,
                 "created_at": datetime.now(timezone.utc),
                 "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+                "reward_weights": None,
             },
         ]
 
@@ -375,6 +488,64 @@ class TestPostgresFeedbackStore:
         assert results[1].query_id == "query-2"
 
 
+    @pytest.mark.asyncio
+    async def test_claim_pending_single_statement(self, store, mock_connection):
+        """Test the claim is one CTE that deletes and marks processed."""
+        mock_connection.fetchrow.return_value = {
+            "duplicate": False,
+            "query_id": "query-123",
+            "model_id": "gpt-4o-mini",
+            "features": '{"token_count": 50}',
+            "cost": 0.001,
+            "latency": 0.5,
+            "created_at": datetime.now(timezone.utc),
+            "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+            "reward_weights": '{"quality": 0.8, "cost": 0.2}',
+        }
+
+        duplicate, pending = await store.claim_pending("query-123", "query-123:thumbs")
+
+        assert duplicate is False
+        assert pending is not None and pending.features == {"token_count": 50}
+        assert pending.reward_weights == {"quality": 0.8, "cost": 0.2}
+        mock_connection.fetchrow.assert_called_once()
+        sql = mock_connection.fetchrow.call_args[0][0]
+        assert "DELETE FROM test_pending_queries" in sql
+        assert "INSERT INTO processed_feedback" in sql
+        mock_connection.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claim_pending_duplicate_and_missing(self, store, mock_connection):
+        """Test duplicate and unknown query rows."""
+        mock_connection.fetchrow.return_value = {"duplicate": True, "query_id": None}
+        assert await store.claim_pending("query-123", "k") == (True, None)
+        mock_connection.fetchval.assert_not_called()
+
+        mock_connection.fetchrow.return_value = {"duplicate": False, "query_id": None}
+        mock_connection.fetchval.return_value = False
+        assert await store.claim_pending("query-123", "k") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_claim_pending_same_key_race_is_duplicate(
+        self, store, mock_connection
+    ):
+        """Test losing a same-key race reports a duplicate, not a missing query.
+
+        The loser's DELETE waits on the winner's row lock and then finds the
+        row gone, but its CTE snapshot predates the winner's processed marker.
+        """
+        mock_connection.fetchrow.return_value = {"duplicate": False, "query_id": None}
+        mock_connection.fetchval.return_value = True
+
+        assert await store.claim_pending("query-123", "query-123:thumbs") == (
+            True,
+            None,
+        )
+        sql, key = mock_connection.fetchval.call_args[0]
+        assert "processed_feedback" in sql
+        assert key == "query-123:thumbs"
+
+
 class TestInMemoryFeedbackStoreEdgeCases:
     """Additional edge case tests for InMemoryFeedbackStore."""
 
@@ -396,6 +567,30 @@ class TestInMemoryFeedbackStoreEdgeCases:
         successful = [r for r in results if r is not None]
         assert len(successful) == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_claim_pending(self, sample_pending_query):
+        """Test concurrent claims of one event: one claims, one is a duplicate."""
+        store = InMemoryFeedbackStore()
+        await store.save_pending(sample_pending_query)
+
+        import asyncio
+
+        results = await asyncio.gather(
+            store.claim_pending("query-123", "query-123:thumbs"),
+            store.claim_pending("query-123", "query-123:thumbs"),
+        )
+
+        assert sorted(duplicate for duplicate, _ in results) == [False, True]
+        assert sum(pending is not None for _, pending in results) == 1
+        assert await store.was_processed("query-123:thumbs")
+
+        await store.release_claim("query-123:thumbs")
+        assert not await store.was_processed("query-123:thumbs")
+        assert await store.claim_pending("query-123", "query-123:thumbs") == (
+            False,
+            None,
+        )
+
     @pytest.mark.asyncio
     async def test_cleanup_expired_removes_old_queries(self):
         """Test that cleanup_expired removes old queries."""
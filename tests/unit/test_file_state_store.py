@@ -0,0 +1,177 @@
+"""Unit tests for FileStateStore."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from conduit.core.file_state_store import FILE_MAGIC, FileStateStore
+from conduit.core.models import QueryFeatures
+from conduit.core.postgres_state_store import MAX_RETRIES, StateVersionConflictError
+from conduit.core.state_store import (
+    BanditState,
+    HybridRouterState,
+    RouterPhase,
+    StateStoreError,
+)
+from conduit.engines.bandits.base import BanditFeedback, ModelArm
+from conduit.engines.bandits.linucb import LinUCBBandit
+from conduit.engines.router import Router
+
+FEATURE_DIM = 10
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a file store in a temporary directory."""
+    return FileStateStore(tmp_path / "state", fsync=False)
+
+
+async def _linucb_state() -> BanditState:
+    """Return the state of a LinUCB bandit trained on a few observations."""
+    arms = [
+        ModelArm(
+            model_id=f"model-{i}",
+            provider="openai",
+            model_name=f"model-{i}",
+            cost_per_input_token=0.001,
+            cost_per_output_token=0.002,
+        )
+        for i in range(2)
+    ]
+    bandit = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+    rng = np.random.default_rng(1)
+    for i in range(10):
+        await bandit.update(
+            BanditFeedback(
+                model_id=f"model-{i % 2}",
+                cost=0.001,
+                quality_score=float(rng.uniform()),
+                latency=0.5,
+            ),
+            QueryFeatures(
+                embedding=rng.standard_normal(FEATURE_DIM - 2) * 0.1,
+                token_count=20,
+                complexity_score=0.5,
+            ),
+        )
+    return bandit.to_state()
+
+
+class TestFileStateStore:
+    """Tests for atomic writes, mmap loads and optimistic versioning."""
+
+    async def test_hybrid_router_roundtrip(self, store):
+        """Test router state with cached factors restores exactly."""
+        phase2 = await _linucb_state()
+        state = HybridRouterState(
+            query_count=10,
+            current_phase=RouterPhase.LINUCB,
+            phase2_state=phase2,
+        )
+
+        await store.save_hybrid_router_state("router/a.b", state)
+        loaded = await store.load_hybrid_router_state("router/a.b")
+
+        assert loaded.query_count == 10
+        assert loaded.current_phase == RouterPhase.LINUCB
+        for arm_id, A_inv in phase2.A_inv_matrices.items():
+            assert np.array_equal(loaded.phase2_state.A_inv_matrices[arm_id], A_inv)
+        assert store.bytes_written > 0
+        assert await store.list_router_ids() == ["router/a.b"]
+        assert await store.load_hybrid_router_state("missing") is None
+
+    async def test_versions_and_atomic_replace(self, store):
+        """Test each save bumps the header version and leaves no temp files."""
+        state = await _linucb_state()
+
+        await store.save_bandit_state("r1", "linucb", state)
+        await store.save_bandit_state("r1", "linucb", state)
+
+        path = store._state_path("r1", "linucb")
+        assert path.read_bytes()[:4] == FILE_MAGIC
+        assert store._read_version(path) == 2
+        assert sorted(os.listdir(path.parent)) == [".lock", path.name]
+        loaded = await store.load_bandit_state("r1", "linucb")
+        assert loaded.arm_pulls == state.arm_pulls
+
+    async def test_conflict_retries_then_raises(self, store):
+        """Test a concurrent writer forces a retry; persistent ones raise."""
+        state = BanditState(algorithm="ucb1", arm_ids=["a"])
+        await store.save_bandit_state("r1", "ucb1", state)
+        path = store._state_path("r1", "ucb1")
+        write_temp = store._write_temp
+        races = {"left": 1}
+
+        def racing_write_temp(target, version, payload):
+            # Another writer replaces the file between our read and commit
+            if races["left"] > 0:
+                races["left"] -= 1
+                os.replace(write_temp(target, version + 5, payload), target)
+            return write_temp(target, version, payload)
+
+        with (
+            patch.object(store, "_write_temp", side_effect=racing_write_temp),
+            patch.object(store, "_calculate_backoff_delay", return_value=0),
+        ):
+            await store.save_bandit_state("r1", "ucb1", state)
+            assert store.conflict_count == 1
+            assert store._read_version(path) == 8
+
+            races["left"] = MAX_RETRIES + 1
+            with pytest.raises(StateVersionConflictError):
+                await store.save_bandit_state("r1", "ucb1", state)
+
+        assert store.conflict_count == MAX_RETRIES + 2
+        assert not [name for name in os.listdir(path.parent) if ".tmp" in name]
+
+    async def test_corrupt_file_raises(self, store):
+        """Test unreadable files raise StateStoreError instead of returning None."""
+        state = BanditState(algorithm="ucb1", arm_ids=["a"])
+        await store.save_bandit_state("r1", "ucb1", state)
+        store._state_path("r1", "ucb1").write_bytes(b'{"algorithm": "ucb1"}')
+
+        with pytest.raises(StateStoreError, match="magic"):
+            await store.load_bandit_state("r1", "ucb1")
+
+        await store.delete_state("r1")
+        await store.delete_state("r1")
+        assert await store.list_router_ids() == []
+
+    async def test_merge_sync_routers_share_directory(self, tmp_path):
+        """Test replicas on separate store instances pool their updates."""
+        directory = tmp_path / "shared"
+        replicas = [
+            Router(
+                models=["gpt-4o-mini", "gpt-4o"],
+                state_store=FileStateStore(directory, fsync=False),
+                router_id="shared",
+                write_behind=False,
+                sync_mode="merge",
+            )
+            for _ in range(3)
+        ]
+        rng = np.random.default_rng(2)
+
+        async def feed(router: Router) -> None:
+            for i in range(4):
+                await router.update(
+                    model_id="gpt-4o" if i % 2 else "gpt-4o-mini",
+                    cost=0.001,
+                    quality_score=float(rng.uniform()),
+                    latency=0.5,
+                    features=QueryFeatures(
+                        embedding=rng.standard_normal(384) * 0.1,
+                        token_count=10,
+                        complexity_score=0.5,
+                    ),
+                )
+
+        await asyncio.gather(*(feed(router) for router in replicas))
+        for router in replicas:
+            await router.flush_state()
+
+        shared = await FileStateStore(directory).load_hybrid_router_state("shared")
+        assert sum(shared.phase1_state.arm_pulls.values()) == 12
@@ -91,6 +91,21 @@ async def test_linucb_phase_routing(hybrid_router):
         assert "queries_since_transition" in decision.metadata
 
 
+@pytest.mark.asyncio
+async def test_route_records_selection_scores(hybrid_router):
+    """Test both phases put the selection-time scores in decision metadata."""
+    query = Query(text="What is 2+2?")
+
+    for _ in range(10):
+        decision = await hybrid_router.route(query)
+    assert hybrid_router.current_phase == "linucb"
+
+    scores = decision.metadata["arm_scores"]
+    assert set(scores) == set(hybrid_router.models)
+    assert decision.selected_model == max(scores, key=lambda k: scores[k]["total"])
+    assert scores == hybrid_router.phase2_bandit.compute_scores(decision.features)
+
+
 @pytest.mark.asyncio
 async def test_knowledge_transfer_at_transition(hybrid_router):
     """Test UCB1 knowledge transfers to LinUCB at transition."""
@@ -0,0 +1,209 @@
+"""Tests for the background implicit feedback pipeline."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from conduit.core.models import QueryFeatures
+from conduit.engines.router import Router
+from conduit.feedback.detector import ImplicitFeedbackDetector
+from conduit.feedback.history import QueryHistoryTracker
+from conduit.feedback.implicit_pipeline import (
+    ImplicitFeedbackPipeline,
+    ImplicitSignalEvent,
+)
+
+
+@pytest.fixture
+def features():
+    """Create sample QueryFeatures."""
+    return QueryFeatures(
+        embedding=[0.1] * 384, token_count=50, complexity_score=0.5
+    )
+
+
+@pytest.fixture
+def detector():
+    """Create a detector without retry history (no Redis)."""
+    return ImplicitFeedbackDetector(QueryHistoryTracker(redis=None))
+
+
+@pytest.fixture
+def router():
+    """Create a mock router recording batched updates."""
+    router = MagicMock()
+    router.update_batch = AsyncMock()
+    return router
+
+
+def _event(i: int, features: QueryFeatures, **kwargs) -> ImplicitSignalEvent:
+    """Create a completion event that finished one second after it started."""
+    now = time.time()
+    fields = {
+        "query_id": f"q{i}",
+        "query_text": f"Query {i}",
+        "features": features,
+        "model_id": "gpt-4o-mini",
+        "user_id": "user_abc",
+        "request_start_time": now - 1.0,
+        "response_complete_time": now,
+        "response_text": "A complete and helpful response.",
+        "cost": 0.001,
+    }
+    fields.update(kwargs)
+    return ImplicitSignalEvent(**fields)
+
+
+def _applied(router) -> list:
+    """All (feedback, features) pairs passed to update_batch, in order."""
+    return [item for call in router.update_batch.call_args_list for item in call[0][0]]
+
+
+class TestImplicitFeedbackPipeline:
+    """Tests for ImplicitFeedbackPipeline."""
+
+    async def test_submit_only_enqueues(self, detector, router, features):
+        """Test submit does no detection or update work inline."""
+        detector.detect = AsyncMock(wraps=detector.detect)
+        pipeline = ImplicitFeedbackPipeline(detector, router, flush_interval=0.05)
+
+        assert await pipeline.submit(_event(0, features)) is True
+
+        detector.detect.assert_not_called()
+        router.update_batch.assert_not_called()
+        assert pipeline.get_stats()["queue_depth"] == 1
+        await pipeline.close()
+
+    async def test_rewards_applied_in_batches(self, detector, router, features):
+        """Test a full batch is applied early and the rest on interval."""
+        pipeline = ImplicitFeedbackPipeline(
+            detector, router, batch_size=3, flush_interval=0.05
+        )
+
+        for i in range(7):
+            await pipeline.submit(_event(i, features))
+        await asyncio.sleep(0.1)
+
+        sizes = [len(call[0][0]) for call in router.update_batch.call_args_list]
+        assert sizes == [3, 3, 1]
+        stats = pipeline.get_stats()
+        assert stats["processed"] == stats["applied"] == 7
+        assert stats["batches"] == 3
+        assert stats["queue_depth"] == 0
+        await pipeline.close()
+
+    async def test_blended_rewards(self, detector, router, features):
+        """Test implicit scores are blended with an explicit score if given."""
+        pipeline = ImplicitFeedbackPipeline(detector, router)
+        await pipeline.submit(_event(0, features))
+        await pipeline.submit(
+            _event(1, features, execution_status="error", execution_error="timeout")
+        )
+        await pipeline.submit(
+            _event(2, features, explicit_score=0.0, explicit_confidence=1.0)
+        )
+        await pipeline.close()
+
+        (ok, ok_features), (error, _), (blended, _) = _applied(router)
+        assert ok.quality_score == pytest.approx(1.0)
+        assert ok.latency == pytest.approx(1.0)
+        assert ok.cost == 0.001
+        assert ok_features is features
+        # Hard error: implicit score 0.5, confidence boosted for failures
+        assert error.quality_score == pytest.approx(0.5)
+        # 70% explicit (0.0) + 30% implicit (1.0)
+        assert blended.quality_score == pytest.approx(0.3)
+        assert blended.confidence == 1.0
+
+    async def test_workers_bounded(self, router, features):
+        """Test at most `workers` detections run at once and lag is reported."""
+        running = 0
+        peak = 0
+        detector = ImplicitFeedbackDetector(QueryHistoryTracker(redis=None))
+        detect = detector.detect
+
+        async def slow_detect(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await detect(**kwargs)
+
+        detector.detect = slow_detect
+        pipeline = ImplicitFeedbackPipeline(detector, router, workers=2)
+        for i in range(8):
+            await pipeline.submit(_event(i, features))
+        await pipeline.close()
+
+        assert peak == 2
+        stats = pipeline.get_stats()
+        assert stats["processed"] == 8
+        assert stats["max_lag_ms"] >= 20
+        assert 0 < stats["avg_lag_ms"] <= stats["max_lag_ms"]
+        assert stats["active_workers"] == 0
+
+    async def test_queue_full_drops(self, detector, router, features):
+        """Test overflow="drop" discards events once the queue is full."""
+        pipeline = ImplicitFeedbackPipeline(detector, router, queue_size=2)
+
+        results = [await pipeline.submit(_event(i, features)) for i in range(3)]
+
+        assert results == [True, True, False]
+        assert pipeline.get_stats()["dropped"] == 1
+        await pipeline.close()
+        assert len(_applied(router)) == 2
+        assert await pipeline.submit(_event(3, features)) is False
+
+    async def test_failures_counted_not_raised(self, detector, router, features):
+        """Test failed detections and updates are counted and discarded."""
+        detect = detector.detect
+
+        async def flaky_detect(**kwargs):
+            if kwargs["query_id"] == "q0":
+                raise ConnectionError("redis down")
+            return await detect(**kwargs)
+
+        detector.detect = flaky_detect
+        router.update_batch.side_effect = RuntimeError("router down")
+        pipeline = ImplicitFeedbackPipeline(detector, router)
+        for i in range(3):
+            await pipeline.submit(_event(i, features))
+        await pipeline.close()
+
+        stats = pipeline.get_stats()
+        assert stats["failed_events"] == 1
+        assert stats["failed_updates"] == 2
+        assert stats["applied"] == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"workers": 0},
+            {"queue_size": 0},
+            {"batch_size": 0},
+            {"flush_interval": 0},
+            {"overflow": "spill"},
+        ],
+    )
+    def test_invalid_arguments(self, detector, router, kwargs):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            ImplicitFeedbackPipeline(detector, router, **kwargs)
+
+    async def test_updates_real_router(self, detector, features):
+        """Test rewards reach the router's bandit through update_batch."""
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"], cache_enabled=False, auto_persist=False
+        )
+        pipeline = ImplicitFeedbackPipeline(detector, router)
+        for i in range(5):
+            await pipeline.submit(_event(i, features))
+        await pipeline.close()
+
+        stats = router.hybrid_router.phase1_bandit.get_stats()
+        assert stats["arm_pulls"]["gpt-4o-mini"] == 5
+        assert router.get_update_stats()["batches"] == 1
+        await router.close()
@@ -262,8 +262,9 @@ class TestPersistState:
 
     @pytest.mark.asyncio
     async def test_persist_state_calls_router_close(self):
-        """Test persist_state calls router.close()."""
+        """Test persist_state flushes state, then calls router.close()."""
         mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock()
         mock_router.close = AsyncMock()
 
         manager = LifecycleManager(router=mock_router)
@@ -271,12 +272,29 @@ class TestPersistState:
         result = await manager.persist_state()
 
         assert result is True
+        mock_router.flush_state.assert_called_once()
+        mock_router.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_persist_state_flush_error_still_closes(self):
+        """Test a failed final flush is reported and the router still closes."""
+        mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock(side_effect=Exception("DB down"))
+        mock_router.close = AsyncMock()
+
+        manager = LifecycleManager(router=mock_router)
+
+        result = await manager.persist_state()
+
+        assert result is False
+        assert "DB down" in manager.state.errors[0]
         mock_router.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_persist_state_handles_error(self):
         """Test persist_state handles errors gracefully."""
         mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock()
         mock_router.close = AsyncMock(side_effect=Exception("Save failed"))
 
         manager = LifecycleManager(router=mock_router)
@@ -347,6 +365,7 @@ class TestShutdown:
     async def test_shutdown_full_sequence(self):
         """Test shutdown executes full sequence."""
         mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock()
         mock_router.close = AsyncMock()
 
         mock_database = MagicMock()
@@ -383,6 +402,7 @@ class TestShutdown:
     async def test_shutdown_idempotent(self):
         """Test shutdown is idempotent."""
         mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock()
         mock_router.close = AsyncMock()
 
         manager = LifecycleManager(router=mock_router)
@@ -402,6 +422,7 @@ class TestShutdown:
     async def test_shutdown_with_errors_marks_failed(self):
         """Test shutdown marks phase as FAILED when errors occur."""
         mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock()
         mock_router.close = AsyncMock(side_effect=Exception("State save failed"))
 
         mock_database = MagicMock()
@@ -560,6 +581,7 @@ class TestConcurrentShutdown:
     async def test_concurrent_shutdown_calls(self):
         """Test concurrent shutdown calls are handled safely."""
         mock_router = MagicMock()
+        mock_router.flush_state = AsyncMock()
         mock_router.close = AsyncMock()
 
         manager = LifecycleManager(router=mock_router)
@@ -110,6 +110,7 @@ class TestArbiterIntegration:
             start_time=1.0,
             end_time=2.5)
 
+        await logger.flush()
         # Give async task time to start
         await asyncio.sleep(0.1)
 
@@ -157,6 +158,7 @@ class TestArbiterIntegration:
             response_obj=litellm_response,
             start_time=1.0,
             end_time=2.5)
+        await logger.flush()
 
         # Verify bandit update was still called
         assert mock_router.hybrid_router.update.called
@@ -209,6 +211,7 @@ class TestArbiterIntegration:
             start_time=1.0,
             end_time=3.0)
 
+        await logger.flush()
         await asyncio.sleep(0.1)
 
         # Verify token count was extracted
@@ -249,6 +252,7 @@ class TestArbiterIntegration:
             start_time=1.0,
             end_time=2.0)
 
+        await logger.flush()
         await asyncio.sleep(0.1)
 
         # Verify evaluator was called with tokens=0
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from conduit.cache.memory import LRUFeatureCache
 from conduit.core.models import QueryFeatures
 from conduit.engines.bandits.base import BanditFeedback
 
@@ -159,6 +160,7 @@ class TestConduitFeedbackLogger:
         await feedback_logger.async_log_success_event(
             litellm_kwargs, litellm_response, start_time, end_time
         )
+        await feedback_logger.flush()
 
         # Verify analyzer was called to extract features
         mock_router.analyzer.analyze.assert_called_once_with("What is 2+2?")
@@ -197,6 +199,7 @@ class TestConduitFeedbackLogger:
         await feedback_logger.async_log_failure_event(
             litellm_kwargs, litellm_response, start_time, end_time
         )
+        await feedback_logger.flush()
 
         # Verify bandit update was called
         mock_router.bandit.update.assert_called_once()
@@ -225,11 +228,38 @@ class TestConduitFeedbackLogger:
         await logger.async_log_success_event(
             litellm_kwargs, litellm_response, 1000.0, 1001.0
         )
+        await logger.flush()
 
         # Verify hybrid_router.update was called (not bandit.update)
         mock_hybrid_router.hybrid_router.update.assert_called_once()
         assert mock_hybrid_router.bandit is None  # Not used in hybrid mode
 
+    @pytest.mark.asyncio
+    async def test_concurrent_callbacks_update_hybrid_router_in_one_batch(
+        self, mock_hybrid_router, litellm_kwargs, litellm_response, litellm_to_conduit_map
+    ):
+        """Test callbacks completing together are applied with update_batch()."""
+        mock_hybrid_router.hybrid_router.update_batch = AsyncMock()
+        logger = ConduitFeedbackLogger(
+            mock_hybrid_router,
+            litellm_to_conduit_map=litellm_to_conduit_map,
+        )
+
+        await asyncio.gather(
+            *(
+                logger.async_log_success_event(
+                    litellm_kwargs, litellm_response, 1000.0, 1001.0
+                )
+                for _ in range(5)
+            )
+        )
+        await logger.flush()
+
+        mock_hybrid_router.hybrid_router.update_batch.assert_called_once()
+        batch = mock_hybrid_router.hybrid_router.update_batch.call_args[0][0]
+        assert len(batch) == 5
+        mock_hybrid_router.hybrid_router.update.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_cost_unavailable_skips_feedback(
         self, feedback_logger, mock_router, litellm_kwargs
@@ -244,10 +274,11 @@ class TestConduitFeedbackLogger:
         await feedback_logger.async_log_success_event(
             litellm_kwargs, response, 1000.0, 1001.0
         )
+        await feedback_logger.flush()
 
-        # Analyzer should still be called
-        mock_router.analyzer.analyze.assert_called_once()
-        # But bandit update should NOT be called
+        # Skipped in the callback: nothing queued, no analysis or update
+        assert feedback_logger.get_stats()["submitted"] == 0
+        mock_router.analyzer.analyze.assert_not_called()
         mock_router.bandit.update.assert_not_called()
 
     @pytest.mark.asyncio
@@ -263,9 +294,10 @@ class TestConduitFeedbackLogger:
         await feedback_logger.async_log_success_event(
             kwargs, litellm_response, 1000.0, 1001.0
         )
+        await feedback_logger.flush()
 
-        # Analyzer called but bandit not updated
-        mock_router.analyzer.analyze.assert_called_once()
+        # Model resolved before analysis: no analysis, no update
+        mock_router.analyzer.analyze.assert_not_called()
         mock_router.bandit.update.assert_not_called()
 
     @pytest.mark.asyncio
@@ -281,9 +313,10 @@ class TestConduitFeedbackLogger:
         await feedback_logger.async_log_success_event(
             kwargs, litellm_response, 1000.0, 1001.0
         )
+        await feedback_logger.flush()
 
-        # Analyzer called but bandit not updated
-        mock_router.analyzer.analyze.assert_called_once()
+        # Model resolved before analysis: no analysis, no update
+        mock_router.analyzer.analyze.assert_not_called()
         mock_router.bandit.update.assert_not_called()
 
     def test_extract_query_text_messages(self):
@@ -385,6 +418,7 @@ class TestConduitFeedbackLogger:
         await logger.async_log_success_event(
             litellm_kwargs, litellm_response, 1000.0, 1001.0
         )
+        await logger.flush()
 
     @pytest.mark.asyncio
     async def test_empty_query_text_skips_feedback(
@@ -396,6 +430,7 @@ class TestConduitFeedbackLogger:
         await feedback_logger.async_log_success_event(
             kwargs, litellm_response, 1000.0, 1001.0
         )
+        await feedback_logger.flush()
 
         # Analyzer should not be called
         mock_router.analyzer.analyze.assert_not_called()
@@ -431,6 +466,184 @@ class TestConduitFeedbackLogger:
             mock_loop.create_task.assert_called_once()
 
 
+class TestBackgroundFeedback:
+    """Tests for off-path processing of LiteLLM callbacks."""
+
+    @pytest.mark.asyncio
+    async def test_callback_only_enqueues(
+        self, feedback_logger, mock_router, litellm_kwargs, litellm_response
+    ):
+        """Test the callback does no analysis or bandit update inline."""
+        await feedback_logger.async_log_success_event(
+            litellm_kwargs, litellm_response, 1000.0, 1001.0
+        )
+
+        mock_router.analyzer.analyze.assert_not_called()
+        mock_router.bandit.update.assert_not_called()
+        assert feedback_logger.get_stats()["queue_depth"] == 1
+
+        await feedback_logger.flush()
+        mock_router.bandit.update.assert_called_once()
+        stats = feedback_logger.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["applied"] == 1
+        assert stats["analyzed_features"] == 1
+
+    @pytest.mark.asyncio
+    async def test_routed_features_reused(
+        self, mock_router, litellm_kwargs, litellm_response, litellm_to_conduit_map
+    ):
+        """Test features stashed at routing time replace re-analysis."""
+        routed = LRUFeatureCache(max_entries=10, max_bytes=10**9, ttl=60)
+        features = QueryFeatures(
+            embedding=[0.2] * 384, token_count=7, complexity_score=0.1
+        )
+        routed.set("call-1", features)
+        logger = ConduitFeedbackLogger(
+            mock_router,
+            litellm_to_conduit_map=litellm_to_conduit_map,
+            routed_features=routed,
+        )
+
+        for call_id in ("call-1", "call-2"):
+            await logger.async_log_success_event(
+                {**litellm_kwargs, "litellm_call_id": call_id},
+                litellm_response,
+                1000.0,
+                1001.0,
+            )
+        await logger.flush()
+
+        # call-1 reuses routing features, call-2 (never routed) is analyzed
+        first, second = mock_router.bandit.update.call_args_list
+        assert first[0][1] is features
+        assert second[0][1].token_count == 50
+        mock_router.analyzer.analyze.assert_called_once_with("What is 2+2?")
+        assert routed.size == 0
+        stats = logger.get_stats()
+        assert (stats["reused_features"], stats["analyzed_features"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_queue_full_drops(
+        self, mock_router, litellm_kwargs, litellm_response, litellm_to_conduit_map
+    ):
+        """Test completions beyond queue_size are dropped, not awaited."""
+        logger = ConduitFeedbackLogger(
+            mock_router,
+            litellm_to_conduit_map=litellm_to_conduit_map,
+            queue_size=2,
+        )
+
+        for _ in range(3):
+            await logger.async_log_success_event(
+                litellm_kwargs, litellm_response, 1000.0, 1001.0
+            )
+        await logger.flush()
+
+        assert mock_router.bandit.update.call_count == 2
+        stats = logger.get_stats()
+        assert (stats["submitted"], stats["dropped"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_batches_bounded_by_batch_size(
+        self, mock_hybrid_router, litellm_kwargs, litellm_response, litellm_to_conduit_map
+    ):
+        """Test queued completions are applied at most batch_size at a time."""
+        mock_hybrid_router.hybrid_router.update_batch = AsyncMock()
+        logger = ConduitFeedbackLogger(
+            mock_hybrid_router,
+            litellm_to_conduit_map=litellm_to_conduit_map,
+            batch_size=2,
+        )
+
+        for _ in range(5):
+            await logger.async_log_success_event(
+                litellm_kwargs, litellm_response, 1000.0, 1001.0
+            )
+        await logger.flush()
+
+        sizes = [
+            len(call[0][0])
+            for call in mock_hybrid_router.hybrid_router.update_batch.call_args_list
+        ]
+        assert sizes == [2, 2]
+        mock_hybrid_router.hybrid_router.update.assert_called_once()
+        assert logger.get_stats()["batches"] == 3
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queue(
+        self, mock_router, litellm_kwargs, litellm_response, litellm_to_conduit_map
+    ):
+        """Test close() applies queued completions and drops later ones."""
+        logger = ConduitFeedbackLogger(
+            mock_router,
+            litellm_to_conduit_map=litellm_to_conduit_map,
+            flush_interval=10.0,
+        )
+
+        for _ in range(2):
+            await logger.async_log_success_event(
+                litellm_kwargs, litellm_response, 1000.0, 1001.0
+            )
+        await logger.close()
+        assert mock_router.bandit.update.call_count == 2
+
+        await logger.async_log_success_event(
+            litellm_kwargs, litellm_response, 1000.0, 1001.0
+        )
+        assert logger.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_router_updated_through_update_batch(
+        self, litellm_kwargs, litellm_response, litellm_to_conduit_map
+    ):
+        """Test a Conduit Router is updated via Router.update_batch()."""
+        from conduit.engines.router import Router
+
+        router = Router(
+            models=["o4-mini", "claude-3-haiku"],
+            cache_enabled=False,
+            auto_persist=False,
+        )
+        routed = LRUFeatureCache(max_entries=10, max_bytes=10**9, ttl=60)
+        logger = ConduitFeedbackLogger(
+            router,
+            litellm_to_conduit_map=litellm_to_conduit_map,
+            routed_features=routed,
+        )
+        router.hybrid_router.update_batch = AsyncMock()
+        router.hybrid_router.update = AsyncMock()
+
+        with patch.object(router, "update_batch", wraps=router.update_batch) as spy:
+            for i in range(3):
+                routed.set(
+                    f"call-{i}",
+                    QueryFeatures(
+                        embedding=[0.1] * 384, token_count=50, complexity_score=0.5
+                    ),
+                )
+                await logger.async_log_success_event(
+                    {**litellm_kwargs, "litellm_call_id": f"call-{i}"},
+                    litellm_response,
+                    1000.0,
+                    1001.0,
+                )
+            await logger.flush()
+
+        spy.assert_awaited_once()
+        assert [fb.model_id for fb, _ in spy.call_args[0][0]] == ["o4-mini"] * 3
+        # Applied by the router's update actor, not by the logger directly
+        router.hybrid_router.update_batch.assert_awaited_once()
+        assert router.get_update_stats()["batches"] == 1
+        await router.close()
+
+    @pytest.mark.parametrize("kwargs", [{"queue_size": 0}, {"batch_size": 0}])
+    def test_invalid_arguments(self, mock_router, kwargs):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            ConduitFeedbackLogger(mock_router, **kwargs)
+
+
 class TestFeedbackIntegration:
     """Integration tests for complete feedback loop."""
 
@@ -450,6 +663,7 @@ class TestFeedbackIntegration:
             await logger.async_log_success_event(
                 litellm_kwargs, litellm_response, 1000.0 + i, 1001.0 + i
             )
+        await logger.flush()
 
         # Verify bandit.update was called 3 times
         assert mock_router.bandit.update.call_count == 3
@@ -484,6 +698,7 @@ class TestFeedbackIntegration:
             await logger.async_log_success_event(
                 kwargs, litellm_response, 1000.0, 1001.0
             )
+        await logger.flush()
 
         # Verify 3 updates
         assert mock_router.bandit.update.call_count == 3
@@ -177,6 +177,62 @@ async def test_fallback_to_model_group(mock_litellm_router, mock_conduit_router)
     assert deployment["model_name"] == "gpt-4"
 
 
+@pytest.mark.asyncio
+async def test_routing_features_stashed_by_call_id(mock_litellm_router, mock_conduit_router):
+    """Test routing-time features are kept for the feedback logger."""
+    strategy = ConduitRoutingStrategy(conduit_router=mock_conduit_router)
+    strategy._router = mock_litellm_router
+    strategy._initialized = True
+    messages = [{"role": "user", "content": "Hello world"}]
+
+    request_kwargs = {}
+    await strategy.async_get_available_deployment(
+        model="gpt-4", messages=messages, request_kwargs=request_kwargs
+    )
+    await strategy.async_get_available_deployment(
+        model="gpt-4", messages=messages, request_kwargs={"litellm_call_id": "given"}
+    )
+
+    # A call id is assigned so LiteLLM reports the same id to the callback
+    call_id = request_kwargs["litellm_call_id"]
+    features = mock_conduit_router.route.return_value.features
+    assert strategy._routed_features.pop(call_id) is features
+    assert strategy._routed_features.pop("given") is features
+
+
+@pytest.mark.asyncio
+async def test_acleanup_drains_feedback_before_unregistering(mock_conduit_router):
+    """Test queued feedback is applied before the logger is unregistered."""
+    strategy = ConduitRoutingStrategy(conduit_router=mock_conduit_router)
+    calls = []
+    strategy.feedback_logger = Mock()
+    strategy.feedback_logger.close = AsyncMock(
+        side_effect=lambda: calls.append("close")
+    )
+    strategy.feedback_logger.get_stats = Mock(return_value={"queue_depth": 0})
+    strategy._unregister_feedback_logger = Mock(
+        side_effect=lambda: calls.append("unregister")
+    )
+
+    await strategy.acleanup()
+
+    assert calls == ["close", "unregister"]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_schedules_feedback_drain(mock_conduit_router):
+    """Test sync cleanup() inside a running loop still drains queued feedback."""
+    strategy = ConduitRoutingStrategy(conduit_router=mock_conduit_router)
+    strategy.feedback_logger = Mock()
+    strategy.feedback_logger.close = AsyncMock()
+    strategy.feedback_logger.get_stats = Mock(return_value={"queue_depth": 2})
+
+    strategy.cleanup()
+    await strategy._feedback_close_task
+
+    strategy.feedback_logger.close.assert_awaited_once()
+
+
 def test_setup_strategy_helper(mock_litellm_router):
     """Test setup_strategy helper method."""
     strategy = ConduitRoutingStrategy()  # Hybrid routing always enabled
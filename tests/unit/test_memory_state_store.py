@@ -0,0 +1,119 @@
+"""Unit tests for InMemoryStateStore."""
+
+import numpy as np
+
+from conduit.core.memory_state_store import InMemoryStateStore
+from conduit.core.models import QueryFeatures
+from conduit.core.state_store import (
+    BanditState,
+    HybridRouterState,
+    RouterPhase,
+    StateDelta,
+)
+from conduit.engines.router import Router
+
+
+class TestInMemoryStateStore:
+    """Tests for save/load isolation, versioning and the delta log."""
+
+    async def test_saved_state_is_isolated_copy(self):
+        """Test mutating saved or loaded state never changes the store."""
+        store = InMemoryStateStore()
+        state = BanditState(
+            algorithm="linucb",
+            arm_ids=["a"],
+            A_matrices={"a": np.eye(3)},
+            arm_pulls={"a": 1},
+        )
+
+        await store.save_bandit_state("r1", "linucb", state)
+        state.A_matrices["a"][0, 0] = 99.0
+        loaded = await store.load_bandit_state("r1", "linucb")
+        loaded.arm_pulls["a"] = 50
+
+        reloaded = await store.load_bandit_state("r1", "linucb")
+        assert reloaded.A_matrices["a"][0, 0] == 1.0
+        assert reloaded.arm_pulls == {"a": 1}
+        assert reloaded.updated_at is not None
+
+    async def test_versions_and_router_listing(self):
+        """Test versions increment per record and delete clears a router."""
+        store = InMemoryStateStore()
+        state = HybridRouterState(query_count=3, current_phase=RouterPhase.UCB1)
+
+        await store.save_hybrid_router_state("r1", state)
+        await store.save_hybrid_router_state("r1", state)
+        await store.save_bandit_state(
+            "r2", "ucb1", BanditState(algorithm="ucb1", arm_ids=["a"])
+        )
+
+        assert store._get_current_version("r1", "hybrid_router") == 2
+        assert store._get_current_version("r2", "ucb1") == 1
+        assert await store.load_bandit_state("r1", "hybrid_router") is None
+        assert await store.list_router_ids() == ["r1", "r2"]
+
+        await store.delete_state("r1")
+        assert await store.load_hybrid_router_state("r1") is None
+        assert await store.list_router_ids() == ["r2"]
+
+    async def test_delta_log(self):
+        """Test deltas get increasing seqs, filter by after_seq and compact."""
+        store = InMemoryStateStore()
+        deltas = [
+            StateDelta(
+                phase=RouterPhase.UCB1,
+                query_count=i,
+                model_id="a",
+                cost=0.0,
+                quality_score=1.0,
+                latency=0.1,
+            )
+            for i in range(1, 4)
+        ]
+
+        assert await store.append_state_deltas("r1", deltas) == 3
+        assert deltas[0].seq == 0  # caller's objects are not modified
+        loaded = await store.load_state_deltas("r1", after_seq=1)
+        assert [delta.seq for delta in loaded] == [2, 3]
+
+        assert await store.compact_state_deltas("r1", through_seq=2) == 2
+        assert [d.seq for d in await store.load_state_deltas("r1")] == [3]
+
+    async def test_router_incremental_checkpoints(self):
+        """Test Router incremental mode restores through snapshot plus deltas."""
+        rng = np.random.default_rng(0)
+        store = InMemoryStateStore()
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="r1",
+            write_behind=False,
+            checkpoint_mode="incremental",
+            compact_every=2,
+        )
+        for i in range(3):
+            await router.update(
+                model_id="gpt-4o" if i % 2 else "gpt-4o-mini",
+                cost=0.001,
+                quality_score=0.8,
+                latency=0.5,
+                features=QueryFeatures(
+                    embedding=rng.standard_normal(384) * 0.1,
+                    token_count=10,
+                    complexity_score=0.5,
+                ),
+            )
+
+        restored = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="r1",
+            checkpoint_mode="incremental",
+        )
+        await restored._load_initial_state()
+
+        assert len(await store.load_state_deltas("r1")) == 1
+        assert (
+            restored.hybrid_router.phase1_bandit.get_stats()["arm_pulls"]
+            == router.hybrid_router.phase1_bandit.get_stats()["arm_pulls"]
+        )
@@ -3,6 +3,7 @@
 import json
 from datetime import datetime
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -172,6 +173,47 @@ class TestQueryFeatures:
                 complexity_score=1.5,  # Out of range
             )
 
+    def test_ndarray_embedding_not_copied(self):
+        """Test float arrays are wrapped as read-only views, not copied."""
+        embedding = np.linspace(0.0, 1.0, 384, dtype=np.float32)
+        features = QueryFeatures(
+            embedding=embedding, token_count=10, complexity_score=0.5
+        )
+        assert np.shares_memory(features.embedding_array, embedding)
+        assert not features.embedding_array.flags.writeable
+        assert features.embedding_array.dtype == np.float32
+
+    def test_non_vector_embedding_rejected(self):
+        """Test embeddings must be 1-D numeric vectors."""
+        with pytest.raises(ValidationError):
+            QueryFeatures(
+                embedding=[[0.1, 0.2]], token_count=10, complexity_score=0.5
+            )
+        with pytest.raises(ValidationError):
+            QueryFeatures(embedding=["a", "b"], token_count=10, complexity_score=0.5)
+
+    def test_feature_vector_layout_and_caching(self):
+        """Test feature_vector appends normalized metadata and is computed once."""
+        features = QueryFeatures(
+            embedding=[0.1, 0.2, 0.3], token_count=500, complexity_score=0.25
+        )
+        vector = features.feature_vector
+        assert vector.dtype == np.float64
+        assert np.allclose(vector, [0.1, 0.2, 0.3, 0.5, 0.25])
+        assert not vector.flags.writeable
+        assert features.feature_vector is vector
+
+    def test_serialization_emits_embedding_list(self):
+        """Test model_dump/JSON keep the 'embedding' list format."""
+        features = QueryFeatures(
+            embedding=np.array([0.5, 0.25]), token_count=10, complexity_score=0.5
+        )
+        dumped = features.model_dump()
+        assert dumped["embedding"] == [0.5, 0.25]
+        assert "embedding_array" not in dumped
+        assert json.loads(features.model_dump_json())["embedding"] == [0.5, 0.25]
+        assert QueryFeatures(**dumped) == features
+
 
 class TestRoutingDecision:
     """Tests for RoutingDecision model."""
@@ -11,6 +11,7 @@ import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from conduit.core.postgres_state_store import (
@@ -19,7 +20,14 @@ from conduit.core.postgres_state_store import (
     PostgresStateStore,
     StateVersionConflictError,
 )
-from conduit.core.state_store import BanditState, HybridRouterState, StateStoreError
+from conduit.core.state_codec import encode_router_state, is_binary_state
+from conduit.core.state_store import (
+    BanditState,
+    HybridRouterState,
+    RouterPhase,
+    StateDelta,
+    StateStoreError,
+)
 
 
 @pytest.fixture
@@ -137,6 +145,19 @@ class TestEnsureTableExists:
         mock_conn.execute.assert_called_once()
         call_args = mock_conn.execute.call_args[0][0]
         assert "CREATE TABLE IF NOT EXISTS bandit_state" in call_args
+        # Schema upgrades belong to migrations (ALTER TABLE locks the table)
+        assert "ALTER TABLE" not in call_args
+
+    @pytest.mark.asyncio
+    async def test_ensure_table_runs_once(self, mock_pool, mock_conn):
+        """Test later reads/writes skip the DDL round trip."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+
+        store = PostgresStateStore(pool=mock_pool)
+        await store._ensure_table_exists()
+        await store._ensure_table_exists()
+
+        mock_conn.execute.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_ensure_table_raises_on_error(self, mock_pool):
@@ -149,6 +170,8 @@ class TestEnsureTableExists:
 
         with pytest.raises(StateStoreError, match="Failed to create table"):
             await store._ensure_table_exists()
+        # Not marked ready: the next call retries
+        assert store._schema_ready is False
 
 
 class TestGetCurrentVersion:
@@ -431,6 +454,206 @@ class TestLoadHybridRouterState:
         assert state is None
 
 
+class TestStorageFormats:
+    """Tests for binary (BYTEA) and JSON (JSONB) storage formats."""
+
+    @pytest.mark.asyncio
+    async def test_binary_format_writes_bytes(
+        self, mock_pool, mock_conn, sample_hybrid_state
+    ):
+        """Test the default binary format writes state_bytes and no JSON."""
+        mock_conn.fetchrow.side_effect = [None, {"version": 1}]
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+
+        store = PostgresStateStore(pool=mock_pool)
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            await store.save_hybrid_router_state("router-1", sample_hybrid_state)
+
+        _, _, state_json, state_bytes = mock_conn.fetchrow.call_args_list[1][0]
+        assert state_json is None
+        assert is_binary_state(state_bytes)
+        assert store.bytes_written == len(state_bytes)
+
+    @pytest.mark.asyncio
+    async def test_json_format_writes_json(
+        self, mock_pool, mock_conn, sample_bandit_state
+    ):
+        """Test storage_format="json" keeps writing JSONB."""
+        mock_conn.fetchrow.side_effect = [{"version": 2}, {"version": 3}]
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+
+        store = PostgresStateStore(pool=mock_pool, storage_format="json")
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            await store.save_bandit_state("router-1", "ucb1", sample_bandit_state)
+
+        args = mock_conn.fetchrow.call_args_list[1][0]
+        assert json.loads(args[3])["algorithm"] == "ucb1"
+        assert args[4] is None
+
+    @pytest.mark.asyncio
+    async def test_load_prefers_binary_column(
+        self, mock_pool, mock_conn, sample_hybrid_state
+    ):
+        """Test loads decode state_bytes when present, JSON otherwise."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        store = PostgresStateStore(pool=mock_pool)
+        sample_hybrid_state.query_count = 42
+
+        mock_conn.fetchrow.return_value = {
+            "state_json": None,
+            "state_bytes": encode_router_state(sample_hybrid_state),
+        }
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            binary = await store.load_hybrid_router_state("router-1")
+
+        mock_conn.fetchrow.return_value = {
+            "state_json": sample_hybrid_state.model_dump_json(),
+            "state_bytes": None,
+        }
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            legacy = await store.load_hybrid_router_state("router-1")
+
+        assert binary.query_count == 42
+        assert legacy.query_count == 42
+
+
+class TestStateDeltas:
+    """Tests for the incremental checkpoint delta log."""
+
+    @pytest.mark.asyncio
+    async def test_append_assigns_seq_and_stores_raw_features(
+        self, mock_pool, mock_conn
+    ):
+        """Test one INSERT writes all deltas with float64 feature bytes."""
+        mock_conn.fetch.return_value = [{"seq": 8}, {"seq": 7}]
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        store = PostgresStateStore(pool=mock_pool)
+        deltas = [
+            StateDelta(
+                phase=RouterPhase.UCB1,
+                query_count=1,
+                model_id="model-a",
+                cost=0.0,
+                quality_score=1.0,
+                latency=0.1,
+            ),
+            StateDelta(
+                phase=RouterPhase.LINUCB,
+                query_count=2,
+                model_id="model-b",
+                cost=0.0,
+                quality_score=0.5,
+                latency=0.1,
+                embedding=np.arange(4.0),
+            ),
+        ]
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            last_seq = await store.append_state_deltas("router-1", deltas)
+
+        assert last_seq == 8
+        assert [delta.seq for delta in deltas] == [7, 8]
+        sql, router_id, delta_json, features = mock_conn.fetch.call_args[0]
+        assert "bandit_state_delta" in sql
+        assert router_id == "router-1"
+        assert json.loads(delta_json[1])["model_id"] == "model-b"
+        assert features[0] is None
+        assert np.array_equal(np.frombuffer(features[1]), np.arange(4.0))
+        assert store.bytes_written > 0
+
+    @pytest.mark.asyncio
+    async def test_load_decodes_deltas_after_seq(self, mock_pool, mock_conn):
+        """Test load passes after_seq and restores embeddings."""
+        delta = StateDelta(
+            phase=RouterPhase.LINUCB,
+            query_count=5,
+            model_id="model-a",
+            cost=0.01,
+            quality_score=0.9,
+            latency=0.2,
+        )
+        mock_conn.fetch.return_value = [
+            {
+                "seq": 12,
+                "delta_json": delta.model_dump_json(exclude={"seq", "embedding"}),
+                "features": np.array([0.5, -1.0]).tobytes(),
+            }
+        ]
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        store = PostgresStateStore(pool=mock_pool)
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            loaded = await store.load_state_deltas("router-1", after_seq=11)
+
+        assert mock_conn.fetch.call_args[0][1:] == ("router-1", 11)
+        assert loaded[0].seq == 12
+        assert loaded[0].query_count == 5
+        assert np.array_equal(loaded[0].embedding, [0.5, -1.0])
+
+    @pytest.mark.asyncio
+    async def test_compact_returns_deleted_count(self, mock_pool, mock_conn):
+        """Test compaction deletes through_seq and parses the command tag."""
+        mock_conn.execute.return_value = "DELETE 3"
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        store = PostgresStateStore(pool=mock_pool)
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            deleted = await store.compact_state_deltas("router-1", through_seq=40)
+
+        assert deleted == 3
+        assert mock_conn.execute.call_args[0][1:] == ("router-1", 40)
+
+    @pytest.mark.asyncio
+    async def test_append_raises_state_store_error(self, mock_pool):
+        """Test append failures are wrapped in StateStoreError."""
+        store = PostgresStateStore(pool=mock_pool)
+        mock_pool.acquire.return_value.__aenter__.side_effect = Exception("DB error")
+        delta = StateDelta(
+            phase=RouterPhase.UCB1,
+            query_count=1,
+            model_id="model-a",
+            cost=0.0,
+            quality_score=1.0,
+            latency=0.1,
+        )
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            with pytest.raises(StateStoreError, match="append state deltas"):
+                await store.append_state_deltas("router-1", [delta])
+
+
+class TestMergeHybridRouterState:
+    """Tests for merge-based multi-replica sync."""
+
+    @pytest.mark.asyncio
+    async def test_merge_adds_delta_under_row_lock(
+        self, mock_pool, mock_conn, sample_hybrid_state
+    ):
+        """Test the shared row is locked, merged and written back."""
+        mock_conn.transaction = MagicMock()
+        mock_conn.fetchrow.return_value = {
+            "state_json": None,
+            "state_bytes": encode_router_state(sample_hybrid_state),
+        }
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        store = PostgresStateStore(pool=mock_pool)
+        delta = sample_hybrid_state.model_copy(update={"query_count": 4})
+
+        with patch.object(store, "_ensure_table_exists", new_callable=AsyncMock):
+            merged = await store.merge_hybrid_router_state(
+                "router-1", delta, sample_hybrid_state
+            )
+
+        assert "FOR UPDATE" in mock_conn.fetchrow.call_args[0][0]
+        update_sql, router_id, _, state_bytes = mock_conn.execute.call_args[0]
+        assert "UPDATE bandit_state" in update_sql
+        assert merged.query_count == sample_hybrid_state.query_count + 4
+        assert merged.phase1_state.arm_pulls == {"model-a": 2}
+        assert is_binary_state(state_bytes)
+
+
 class TestDeleteState:
     """Tests for deleting state."""
 
@@ -5,7 +5,12 @@ from unittest.mock import AsyncMock, MagicMock
 from redis.exceptions import ConnectionError, TimeoutError
 
 from conduit.core.models import QueryFeatures
-from conduit.feedback.history import QueryHistoryEntry, QueryHistoryTracker
+from conduit.feedback.history import (
+    QueryHistoryEntry,
+    QueryHistoryTracker,
+    decode_entry,
+    encode_entry,
+)
 
 
 @pytest.fixture
@@ -19,9 +24,20 @@ def sample_features():
 
 
 @pytest.fixture
-def mock_redis():
+def mock_pipeline():
+    """Create mock Redis pipeline (async context manager)."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    return pipe
+
+
+@pytest.fixture
+def mock_redis(mock_pipeline):
     """Create mock Redis client."""
     redis = AsyncMock()
+    redis.pipeline = MagicMock(return_value=mock_pipeline)
     return redis
 
 
@@ -87,7 +103,9 @@ class TestQueryHistoryTrackerInit:
 class TestQueryHistoryTrackerAddQuery:
     """Test QueryHistoryTracker.add_query method."""
 
-    async def test_add_query_success(self, history_tracker, mock_redis, sample_features):
+    async def test_add_query_success(
+        self, history_tracker, mock_redis, mock_pipeline, sample_features
+    ):
         """Test successfully adding query to history."""
         result = await history_tracker.add_query(
             query_id="q123",
@@ -97,10 +115,13 @@ class TestQueryHistoryTrackerAddQuery:
             model_used="gpt-4o-mini")
 
         assert result is True
-        # Verify Redis setex was called
-        mock_redis.setex.assert_called_once()
-        # Verify Redis zadd was called for index
-        mock_redis.zadd.assert_called_once()
+        # Entry, index and index TTL go out in one pipelined round trip
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_pipeline.setex.assert_called_once()
+        mock_pipeline.zadd.assert_called_once()
+        mock_pipeline.expire.assert_called_once()
+        mock_pipeline.execute.assert_awaited_once()
+        mock_redis.setex.assert_not_called()
 
     async def test_add_query_disabled(self, sample_features):
         """Test add_query when tracking is disabled."""
@@ -114,10 +135,10 @@ class TestQueryHistoryTrackerAddQuery:
         assert result is False
 
     async def test_add_query_connection_error(
-        self, history_tracker, mock_redis, sample_features
+        self, history_tracker, mock_pipeline, sample_features
     ):
         """Test add_query handles Redis connection error gracefully."""
-        mock_redis.setex.side_effect = ConnectionError("Connection failed")
+        mock_pipeline.execute.side_effect = ConnectionError("Connection failed")
 
         result = await history_tracker.add_query(
             query_id="q123",
@@ -128,10 +149,10 @@ class TestQueryHistoryTrackerAddQuery:
         assert result is False
 
     async def test_add_query_timeout_error(
-        self, history_tracker, mock_redis, sample_features
+        self, history_tracker, mock_pipeline, sample_features
     ):
         """Test add_query handles Redis timeout gracefully."""
-        mock_redis.setex.side_effect = TimeoutError("Operation timed out")
+        mock_pipeline.execute.side_effect = TimeoutError("Operation timed out")
 
         result = await history_tracker.add_query(
             query_id="q123",
@@ -179,20 +200,38 @@ class TestQueryHistoryTrackerGetRecent:
             timestamp=200.0,
             user_id="user_abc")
 
-        mock_redis.get.side_effect = [
-            entry2.model_dump_json(),
-            entry1.model_dump_json(),
-        ]
+        mock_redis.mget.return_value = [encode_entry(entry2), encode_entry(entry1)]
 
         result = await history_tracker.get_recent_queries("user_abc", limit=10)
 
         assert len(result) == 2
         assert result[0].query_id == "q456"  # Most recent first
         assert result[1].query_id == "q123"
+        # One MGET for all entries, no per-entry GET
+        mock_redis.mget.assert_called_once_with(
+            ["conduit:history:user_abc:q456", "conduit:history:user_abc:q123"]
+        )
+        mock_redis.get.assert_not_called()
+
+    async def test_get_recent_reads_legacy_json(self, history_tracker, mock_redis):
+        """Test entries written in the legacy JSON format stay readable."""
+        mock_redis.zrange.return_value = [b"q123", b"q456"]
+        legacy = QueryHistoryEntry(
+            query_id="q123",
+            query_text="Query 1",
+            embedding=[0.1, 0.2],
+            timestamp=100.0,
+            user_id="user_abc")
+        mock_redis.mget.return_value = [None, legacy.model_dump_json().encode()]
+
+        result = await history_tracker.get_recent_queries("user_abc")
+
+        assert [entry.query_id for entry in result] == ["q123"]
+        assert result[0].embedding == [0.1, 0.2]
 
     async def test_get_recent_with_limit(self, history_tracker, mock_redis):
-        """Test get_recent_queries respects limit."""
-        mock_redis.zrange.return_value = [b"q1", b"q2", b"q3"]
+        """Test get_recent_queries respects limit and skips expired entries."""
+        mock_redis.zrangebyscore.return_value = [b"q1", b"q2", b"q3"]
 
         entry = QueryHistoryEntry(
             query_id="q1",
@@ -200,11 +239,45 @@ class TestQueryHistoryTrackerGetRecent:
             embedding=[0.1],
             timestamp=100.0,
             user_id="user_abc")
-        mock_redis.get.return_value = entry.model_dump_json()
+        # Newest entry (q3) expired before its index member
+        mock_redis.mget.return_value = [None, encode_entry(entry), encode_entry(entry)]
 
-        result = await history_tracker.get_recent_queries("user_abc", limit=2)
+        result = await history_tracker.get_recent_queries(
+            "user_abc", limit=2, time_window_seconds=300)
 
         assert len(result) == 2
+        # Over-fetched in one MGET, newest first
+        mock_redis.mget.assert_called_once_with(
+            [
+                "conduit:history:user_abc:q3",
+                "conduit:history:user_abc:q2",
+                "conduit:history:user_abc:q1",
+            ]
+        )
+
+    async def test_get_recent_tops_up_after_expired_entries(
+        self, history_tracker, mock_redis
+    ):
+        """Test further MGETs fill the window when many entries expired."""
+        mock_redis.zrangebyscore.return_value = [f"q{i}".encode() for i in range(6)]
+        entry = QueryHistoryEntry(
+            query_id="q0",
+            query_text="Test",
+            embedding=[0.1],
+            timestamp=100.0,
+            user_id="user_abc")
+        mock_redis.mget.side_effect = [
+            [None, None],  # q5, q4 expired
+            [None, encode_entry(entry)],  # q3 expired, q2 live
+            [encode_entry(entry), encode_entry(entry)],
+        ]
+
+        result = await history_tracker.get_recent_queries(
+            "user_abc", limit=1, time_window_seconds=300)
+
+        assert len(result) == 1
+        # Stops as soon as the window is full (q1, q0 never fetched)
+        assert mock_redis.mget.call_count == 2
 
     async def test_get_recent_connection_error(self, history_tracker, mock_redis):
         """Test get_recent_queries handles Redis error gracefully."""
@@ -247,7 +320,7 @@ class TestQueryHistoryTrackerFindSimilar:
             user_id="user_abc")
 
         mock_redis.zrangebyscore.return_value = [b"q123"]
-        mock_redis.get.return_value = entry.model_dump_json()
+        mock_redis.mget.return_value = [encode_entry(entry)]
 
         result = await history_tracker.find_similar_query(
             current_embedding=[0.0, 1.0, 0.0],  # Different direction
@@ -267,7 +340,7 @@ class TestQueryHistoryTrackerFindSimilar:
             user_id="user_abc")
 
         mock_redis.zrangebyscore.return_value = [b"q123"]
-        mock_redis.get.return_value = entry.model_dump_json()
+        mock_redis.mget.return_value = [encode_entry(entry)]
 
         result = await history_tracker.find_similar_query(
             current_embedding=[0.95, 0.05, 0.0],  # Very similar
@@ -293,10 +366,7 @@ class TestQueryHistoryTrackerFindSimilar:
             user_id="user_abc")
 
         mock_redis.zrangebyscore.return_value = [b"q123", b"q456"]
-        mock_redis.get.side_effect = [
-            entry2.model_dump_json(),
-            entry1.model_dump_json(),
-        ]
+        mock_redis.mget.return_value = [encode_entry(entry2), encode_entry(entry1)]
 
         result = await history_tracker.find_similar_query(
             current_embedding=[1.0, 0.0, 0.0],
@@ -307,6 +377,73 @@ class TestQueryHistoryTrackerFindSimilar:
         assert result.query_id == "q456"  # Better match
 
 
+    async def test_find_similar_skips_mismatched_dimensions(
+        self, history_tracker, mock_redis
+    ):
+        """Test entries from a different embedding model are not scored."""
+        other_model = QueryHistoryEntry(
+            query_id="q123",
+            query_text="Other model",
+            embedding=[1.0, 0.0],
+            timestamp=100.0,
+            user_id="user_abc")
+        same_model = QueryHistoryEntry(
+            query_id="q456",
+            query_text="Same model",
+            embedding=[0.9, 0.1, 0.0],
+            timestamp=200.0,
+            user_id="user_abc")
+
+        mock_redis.zrangebyscore.return_value = [b"q456", b"q123"]
+        mock_redis.mget.return_value = [
+            encode_entry(other_model),
+            encode_entry(same_model),
+        ]
+
+        result = await history_tracker.find_similar_query(
+            current_embedding=[1.0, 0.0, 0.0],
+            user_id="user_abc",
+            similarity_threshold=0.85)
+
+        assert result is not None
+        assert result.query_id == "q456"
+
+
+class TestHistoryEntryEncoding:
+    """Test the binary history entry format."""
+
+    def test_round_trip(self):
+        """Test encode/decode preserves fields with a float32 embedding view."""
+        entry = QueryHistoryEntry(
+            query_id="q123",
+            query_text="What is Python? \u00e9",
+            embedding=[0.25, -0.5, 1.0],
+            timestamp=1700000000.5,
+            user_id="user_abc",
+            model_used="gpt-4o-mini")
+
+        data = encode_entry(entry)
+        decoded = decode_entry(data)
+
+        assert data[:2] == b"QH"
+        assert len(data) < len(entry.model_dump_json())
+        assert decoded.embedding_array.dtype == "float32"
+        assert decoded.embedding == [0.25, -0.5, 1.0]
+        assert decoded.model_dump() == entry.model_dump()
+
+    def test_truncated_entry(self):
+        """Test a truncated binary entry is rejected."""
+        entry = QueryHistoryEntry(
+            query_id="q123",
+            query_text="Test",
+            embedding=[0.1] * 8,
+            timestamp=100.0,
+            user_id="user_abc")
+
+        with pytest.raises(ValueError, match="size mismatch"):
+            decode_entry(encode_entry(entry)[:-3])
+
+
 class TestQueryHistoryTrackerClear:
     """Test QueryHistoryTracker.clear_user_history method."""
 
@@ -677,9 +677,9 @@ class TestRouterUpdate:
 
     @pytest.mark.asyncio
     async def test_update_with_auto_persist_saves_state(self, sample_features):
-        """Test that update saves state when auto_persist is enabled."""
+        """Test that update saves state inline when write-behind is disabled."""
         mock_state_store = MagicMock()
-        router = Router(state_store=mock_state_store)
+        router = Router(state_store=mock_state_store, write_behind=False)
         router.hybrid_router.update = AsyncMock()
         router._save_state = AsyncMock()
 
@@ -693,6 +693,31 @@ class TestRouterUpdate:
 
         router._save_state.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_with_write_behind_defers_save(self, sample_features):
+        """Test that write-behind update only marks state dirty."""
+        mock_state_store = MagicMock()
+        router = Router(state_store=mock_state_store, flush_interval=60)
+        router.hybrid_router.update = AsyncMock()
+        router.hybrid_router.save_state = AsyncMock()
+
+        for _ in range(3):
+            await router.update(
+                model_id="gpt-4o-mini",
+                cost=0.001,
+                quality_score=0.95,
+                latency=0.5,
+                features=sample_features,
+            )
+
+        router.hybrid_router.save_state.assert_not_called()
+        assert router.get_persistence_stats()["pending_updates"] == 3
+
+        await router.close()
+
+        router.hybrid_router.save_state.assert_called_once()
+        assert router.get_persistence_stats()["pending_updates"] == 0
+
 
 class TestRouterStatePersistence:
     """Tests for Router state persistence methods."""
@@ -790,7 +815,7 @@ class TestRouterClose:
     async def test_close_saves_final_state(self):
         """Test that close saves final state when auto_persist enabled."""
         mock_state_store = MagicMock()
-        router = Router(state_store=mock_state_store)
+        router = Router(state_store=mock_state_store, write_behind=False)
         router._save_state = AsyncMock()
 
         await router.close()
@@ -232,6 +232,50 @@ class TestFeedbackEndpoint:
         assert response.status_code == 404
 
 
+class TestFeedbackBatchEndpoint:
+    """Tests for POST /v1/feedback/batch."""
+
+    def test_feedback_batch_success(self, client, mock_service):
+        """Test batch submission reports saved and missing entries."""
+        saved = Feedback(
+            response_id="response-123", quality_score=0.9, met_expectations=True
+        )
+        mock_service.submit_feedback_batch = AsyncMock(
+            return_value=([saved], ["missing"])
+        )
+
+        response = client.post(
+            "/v1/feedback/batch",
+            json={
+                "items": [
+                    {
+                        "response_id": "response-123",
+                        "quality_score": 0.9,
+                        "met_expectations": True,
+                    },
+                    {
+                        "response_id": "missing",
+                        "quality_score": 0.2,
+                        "met_expectations": False,
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["feedback_ids"] == [saved.id]
+        assert data["missing_response_ids"] == ["missing"]
+        items = mock_service.submit_feedback_batch.call_args[0][0]
+        assert [item["response_id"] for item in items] == ["response-123", "missing"]
+
+    def test_feedback_batch_empty(self, client):
+        """Test an empty batch is a validation error."""
+        response = client.post("/v1/feedback/batch", json={"items": []})
+
+        assert response.status_code == 422
+
+
 class TestStatsEndpoint:
     """Tests for GET /v1/stats."""
 
@@ -133,7 +133,10 @@ class TestComplete:
         mock_router.route.assert_called_once()
         mock_executor.execute.assert_called_once()
         mock_database.save_complete_interaction.assert_called_once()
-        # Note: update_model_state no longer called - HybridRouter manages state internally
+        # Bandit learns through Router.update(), not HybridRouter directly
+        mock_router.update.assert_called_once()
+        assert mock_router.update.call_args.kwargs["model_id"] == "gpt-4o-mini"
+        mock_router.hybrid_router.update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_complete_with_constraints(
@@ -276,9 +279,8 @@ class TestSubmitFeedback:
             )
         )
 
-        # Mock hybrid_router.update for bandit feedback
-        mock_router.hybrid_router = AsyncMock()
-        mock_router.hybrid_router.update = AsyncMock()
+        # Mock router.update_batch for bandit feedback
+        mock_router.update_batch = AsyncMock()
 
         # Submit feedback
         feedback = await service.submit_feedback(
@@ -299,8 +301,12 @@ class TestSubmitFeedback:
         # Verify interactions
         mock_database.get_response_by_id.assert_called_once_with("response-123")
         mock_database.save_complete_interaction.assert_called_once()
-        # Note: Bandit updated via router.hybrid_router.update() with BanditFeedback
-        mock_router.hybrid_router.update.assert_called_once()
+        # Bandit updated via Router.update_batch() (actor + persistence)
+        mock_router.update_batch.assert_called_once()
+        ((bandit_feedback, _),) = mock_router.update_batch.call_args[0][0]
+        assert bandit_feedback.quality_score == 0.9
+        assert bandit_feedback.success is True
+        mock_router.hybrid_router.update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_submit_feedback_response_not_found(self, service, mock_database):
@@ -339,6 +345,65 @@ class TestSubmitFeedback:
         assert feedback.quality_score == 0.75
 
 
+class TestSubmitFeedbackBatch:
+    """Tests for RoutingService.submit_feedback_batch()."""
+
+    @pytest.mark.asyncio
+    async def test_submit_feedback_batch(self, service, mock_database, mock_router):
+        """Test one router batch update for all found responses."""
+        response = Response(
+            id="response-1",
+            query_id="query-1",
+            model="gpt-4o-mini",
+            text='{"answer": "test"}',
+            cost=0.001,
+            latency=0.5,
+            tokens=20,
+        )
+        mock_database.get_response_by_id = AsyncMock(
+            side_effect=lambda response_id: (
+                response if response_id == "response-1" else None
+            )
+        )
+        mock_database.get_query_by_id = AsyncMock(
+            return_value=Query(id="query-1", text="test query")
+        )
+        mock_router.analyzer = AsyncMock()
+        mock_router.analyzer.analyze = AsyncMock(
+            return_value=QueryFeatures(
+                embedding=[0.1] * 384, token_count=2, complexity_score=0.3
+            )
+        )
+        mock_router.update_batch = AsyncMock()
+
+        saved, missing = await service.submit_feedback_batch(
+            [
+                {
+                    "response_id": "response-1",
+                    "quality_score": 0.9,
+                    "met_expectations": True,
+                },
+                {
+                    "response_id": "response-1",
+                    "quality_score": 0.4,
+                    "met_expectations": False,
+                },
+                {
+                    "response_id": "missing",
+                    "quality_score": 0.5,
+                    "met_expectations": True,
+                },
+            ]
+        )
+
+        assert [feedback.quality_score for feedback in saved] == [0.9, 0.4]
+        assert missing == ["missing"]
+        mock_router.update_batch.assert_called_once()
+        batch = mock_router.update_batch.call_args[0][0]
+        assert [feedback.quality_score for feedback, _ in batch] == [0.9, 0.4]
+        mock_router.hybrid_router.update.assert_not_called()
+
+
 class TestGetStats:
     """Tests for RoutingService.get_stats()."""
 
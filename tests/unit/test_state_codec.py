@@ -0,0 +1,212 @@
+"""Unit tests for the binary bandit state codec."""
+
+import struct
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from conduit.core.models import QueryFeatures
+from conduit.core.state_codec import (
+    MAGIC,
+    decode_bandit_state,
+    decode_router_state,
+    encode_bandit_state,
+    encode_router_state,
+    is_binary_state,
+)
+from conduit.core.state_store import BanditState, HybridRouterState, RouterPhase
+from conduit.engines.bandits.base import BanditFeedback, ModelArm
+from conduit.engines.bandits.contextual_thompson_sampling import (
+    ContextualThompsonSamplingBandit,
+)
+from conduit.engines.bandits.linucb import LinUCBBandit
+
+FEATURE_DIM = 12
+
+
+@pytest.fixture
+def arms():
+    """Create three test arms."""
+    return [
+        ModelArm(
+            model_id=f"model-{i}",
+            provider="openai",
+            model_name=f"model-{i}",
+            cost_per_input_token=0.001,
+            cost_per_output_token=0.002,
+            expected_quality=0.8,
+        )
+        for i in range(3)
+    ]
+
+
+async def _train(bandit, n: int = 30) -> None:
+    """Apply n deterministic updates spread across arms."""
+    rng = np.random.default_rng(7)
+    arm_ids = list(bandit.arms)
+    for i in range(n):
+        features = QueryFeatures(
+            embedding=rng.standard_normal(FEATURE_DIM - 2) * 0.1,
+            token_count=10 + i,
+            complexity_score=0.5,
+        )
+        feedback = BanditFeedback(
+            model_id=arm_ids[i % len(arm_ids)],
+            cost=0.001,
+            quality_score=0.6 + 0.01 * i,
+            latency=1.0,
+        )
+        await bandit.update(feedback, features)
+
+
+class TestBanditStateCodec:
+    """Tests for encode_bandit_state / decode_bandit_state."""
+
+    async def test_linucb_roundtrip_is_exact(self, arms):
+        """Test float64 encoding restores matrices, factors and history exactly."""
+        bandit = LinUCBBandit(arms, feature_dim=FEATURE_DIM, window_size=20)
+        await _train(bandit)
+        state = bandit.to_state()
+
+        data = encode_bandit_state(state)
+        decoded = decode_bandit_state(data)
+
+        assert is_binary_state(data)
+        for arm_id in bandit.arms:
+            assert np.array_equal(decoded.A_matrices[arm_id], bandit.A[arm_id])
+            assert np.array_equal(decoded.b_vectors[arm_id], state.b_vectors[arm_id])
+            assert np.array_equal(decoded.A_inv_matrices[arm_id], bandit.A_inv[arm_id])
+        assert decoded.observation_history == state.observation_history
+        assert decoded.arm_pulls == state.arm_pulls
+        assert decoded.alpha == state.alpha
+
+    async def test_restore_skips_inversion(self, arms):
+        """Test LinUCB and CTS restore from binary state without O(d³) work."""
+        linucb = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+        cts = ContextualThompsonSamplingBandit(arms, feature_dim=FEATURE_DIM)
+        await _train(linucb)
+        await _train(cts)
+
+        linucb_state = decode_bandit_state(encode_bandit_state(linucb.to_state()))
+        cts_state = decode_bandit_state(encode_bandit_state(cts.to_state()))
+
+        restored_linucb = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+        restored_cts = ContextualThompsonSamplingBandit(arms, feature_dim=FEATURE_DIM)
+        with (
+            patch("numpy.linalg.inv") as mock_inv,
+            patch("numpy.linalg.cholesky") as mock_cholesky,
+        ):
+            restored_linucb.from_state(linucb_state)
+            restored_cts.from_state(cts_state)
+
+        mock_inv.assert_not_called()
+        mock_cholesky.assert_not_called()
+        for arm_id in linucb.arms:
+            assert np.array_equal(
+                restored_linucb.A_inv[arm_id], linucb.A_inv[arm_id]
+            )
+            assert np.array_equal(
+                restored_cts.Sigma_chol[arm_id], cts.Sigma_chol[arm_id]
+            )
+
+    async def test_json_state_still_recomputes_factors(self, arms):
+        """Test JSON states (no persisted factors) restore via inversion."""
+        bandit = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+        await _train(bandit)
+        json_data = bandit.to_state().model_dump_json()
+        json_state = BanditState.model_validate_json(json_data)
+
+        assert json_state.A_inv_matrices == {}
+        restored = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+        restored.from_state(json_state)
+
+        for arm_id in bandit.arms:
+            assert np.allclose(restored.A_inv[arm_id], bandit.A_inv[arm_id])
+
+    async def test_float32_and_compression(self, arms):
+        """Test float32 halves array bytes and zlib output decodes."""
+        bandit = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+        await _train(bandit)
+        state = bandit.to_state()
+
+        full = encode_bandit_state(state)
+        half = encode_bandit_state(state, dtype="float32")
+        compressed = encode_bandit_state(state, compression="zlib")
+
+        assert len(half) < 0.6 * len(full)
+        for arm_id in bandit.arms:
+            assert np.allclose(
+                decode_bandit_state(half).A_matrices[arm_id],
+                state.A_matrices[arm_id],
+                rtol=1e-6,
+            )
+            assert np.array_equal(
+                decode_bandit_state(compressed).A_matrices[arm_id],
+                state.A_matrices[arm_id],
+            )
+
+    def test_invalid_payloads_rejected(self):
+        """Test non-binary data, unknown versions and compressions raise."""
+        data = encode_bandit_state(BanditState(algorithm="ucb1", arm_ids=["a"]))
+
+        with pytest.raises(ValueError, match="magic"):
+            decode_bandit_state(b'{"algorithm": "ucb1"}')
+        with pytest.raises(ValueError, match="version"):
+            decode_bandit_state(MAGIC + struct.pack("<B", 99) + data[3:])
+        with pytest.raises(ValueError, match="compression"):
+            encode_bandit_state(
+                BanditState(algorithm="ucb1", arm_ids=["a"]),
+                compression="lz4",  # type: ignore[arg-type]
+            )
+
+
+class TestRouterStateCodec:
+    """Tests for encode_router_state / decode_router_state."""
+
+    async def test_hybrid_router_roundtrip(self, arms):
+        """Test embedded bandit states and router metadata roundtrip."""
+        linucb = LinUCBBandit(arms, feature_dim=FEATURE_DIM)
+        await _train(linucb)
+        state = HybridRouterState(
+            query_count=30,
+            current_phase=RouterPhase.LINUCB,
+            transition_threshold=float("inf"),
+            phase1_algorithm="thompson_sampling",
+            phase2_algorithm="linucb",
+            phase1_state=BanditState(
+                algorithm="thompson_sampling",
+                arm_ids=list(linucb.arms),
+                alpha_params={"model-0": 3.0},
+            ),
+            phase2_state=linucb.to_state(),
+        )
+
+        decoded = decode_router_state(encode_router_state(state))
+
+        assert decoded.query_count == 30
+        assert decoded.current_phase == RouterPhase.LINUCB
+        assert decoded.transition_threshold == float("inf")
+        assert decoded.phase1_state.alpha_params == {"model-0": 3.0}
+        assert decoded.ucb1_state is None
+        for arm_id in linucb.arms:
+            assert np.array_equal(
+                decoded.phase2_state.A_inv_matrices[arm_id], linucb.A_inv[arm_id]
+            )
+
+    def test_binary_smaller_than_json(self):
+        """Test binary payload (including A_inv) is smaller than JSON (without)."""
+        rng = np.random.default_rng(0)
+        arm_ids = [f"model-{i}" for i in range(3)]
+        matrices = {arm_id: rng.standard_normal((64, 64)) for arm_id in arm_ids}
+        state = HybridRouterState(
+            phase2_state=BanditState(
+                algorithm="linucb",
+                arm_ids=arm_ids,
+                A_matrices=matrices,
+                A_inv_matrices=matrices,
+                b_vectors={arm_id: rng.standard_normal(64) for arm_id in arm_ids},
+            ),
+        )
+
+        assert len(encode_router_state(state)) < len(state.model_dump_json())
@@ -0,0 +1,307 @@
+"""Tests for the multi-replica state merge protocol."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from conduit.core.memory_state_store import InMemoryStateStore
+from conduit.core.models import Query, QueryFeatures
+from conduit.core.state_merge import (
+    _warm_start,
+    apply_bandit_delta,
+    apply_router_delta,
+    diff_bandit_state,
+    diff_router_state,
+)
+from conduit.core.state_store import RouterPhase
+from conduit.engines.bandits import (
+    ContextualThompsonSamplingBandit,
+    LinUCBBandit,
+    ThompsonSamplingBandit,
+    UCB1Bandit,
+)
+from conduit.engines.bandits.base import BanditFeedback, ModelArm
+from conduit.engines.hybrid_router import HybridRouter
+from conduit.engines.router import Router
+
+FEATURE_DIM = 8
+
+
+@pytest.fixture
+def arms():
+    """Create two test arms."""
+    return [
+        ModelArm(
+            model_id=f"model-{i}",
+            provider="openai",
+            model_name=f"model-{i}",
+            cost_per_input_token=0.001,
+            cost_per_output_token=0.002,
+            expected_quality=0.8,
+        )
+        for i in range(2)
+    ]
+
+
+def _observations(seed: int, n: int):
+    """Deterministic (feedback, features) pairs across both arms."""
+    rng = np.random.default_rng(seed)
+    return [
+        (
+            BanditFeedback(
+                model_id=f"model-{i % 2}",
+                cost=0.001,
+                quality_score=float(rng.uniform()),
+                latency=0.5,
+            ),
+            QueryFeatures(
+                embedding=rng.standard_normal(FEATURE_DIM - 2) * 0.3,
+                token_count=int(rng.integers(5, 100)),
+                complexity_score=float(rng.uniform()),
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+class TestBanditMerge:
+    """Tests for diff_bandit_state / apply_bandit_delta."""
+
+    @pytest.mark.parametrize(
+        "bandit_cls",
+        [LinUCBBandit, ContextualThompsonSamplingBandit],
+    )
+    async def test_merged_replicas_match_single_bandit(self, arms, bandit_cls):
+        """Test summing two replicas' deltas equals training on all data."""
+        replica_a = bandit_cls(arms, feature_dim=FEATURE_DIM)
+        replica_b = bandit_cls(arms, feature_dim=FEATURE_DIM)
+        combined = bandit_cls(arms, feature_dim=FEATURE_DIM)
+        base = replica_a.to_state()
+        data_a, data_b = _observations(1, 15), _observations(2, 15)
+
+        for feedback, features in data_a:
+            await replica_a.update(feedback, features)
+        for feedback, features in data_b:
+            await replica_b.update(feedback, features)
+        for feedback, features in data_a + data_b:
+            await combined.update(feedback, features)
+
+        shared = base
+        for replica in (replica_a, replica_b):
+            shared = apply_bandit_delta(
+                shared, diff_bandit_state(replica.to_state(), base)
+            )
+        restored = bandit_cls(arms, feature_dim=FEATURE_DIM)
+        restored.from_state(shared)
+
+        expected = combined.to_state()
+        assert shared.arm_pulls == expected.arm_pulls
+        assert shared.total_queries == expected.total_queries
+        if bandit_cls is LinUCBBandit:
+            for arm_id in combined.arms:
+                assert np.allclose(restored.A[arm_id], combined.A[arm_id])
+                assert np.allclose(restored.b[arm_id], combined.b[arm_id])
+        else:
+            for arm_id in combined.arms:
+                assert np.allclose(restored.mu[arm_id], combined.mu[arm_id])
+                assert np.allclose(restored.Sigma[arm_id], combined.Sigma[arm_id])
+
+    @pytest.mark.parametrize(
+        "bandit_cls",
+        [LinUCBBandit, ContextualThompsonSamplingBandit],
+    )
+    async def test_merge_refreshes_cached_factors(self, arms, bandit_cls):
+        """Test merged states carry A_inv / Cholesky factors for from_state()."""
+        replica = bandit_cls(arms, feature_dim=FEATURE_DIM)
+        base = replica.to_state()
+        for feedback, features in _observations(5, 10):
+            await replica.update(feedback, features)
+
+        shared = apply_bandit_delta(base, diff_bandit_state(replica.to_state(), base))
+
+        for arm_id in replica.arms:
+            if bandit_cls is LinUCBBandit:
+                A_inv = shared.A_inv_matrices[arm_id]
+                identity = A_inv @ shared.A_matrices[arm_id]
+                assert np.allclose(identity, np.eye(FEATURE_DIM))
+            else:
+                U = shared.sigma_cholesky[arm_id]
+                assert np.allclose(U.T @ U, shared.sigma_matrices[arm_id])
+
+    async def test_counting_bandits_sum_statistics(self, arms):
+        """Test Thompson alpha/beta and UCB1 sums and means merge exactly."""
+        for bandit_cls in (ThompsonSamplingBandit, UCB1Bandit):
+            replica_a, replica_b = bandit_cls(arms), bandit_cls(arms)
+            combined = bandit_cls(arms)
+            base = replica_a.to_state()
+            data_a, data_b = _observations(3, 10), _observations(4, 7)
+            for feedback, features in data_a:
+                await replica_a.update(feedback, features)
+                await combined.update(feedback, features)
+            for feedback, features in data_b:
+                await replica_b.update(feedback, features)
+                await combined.update(feedback, features)
+
+            shared = base
+            for replica in (replica_a, replica_b):
+                delta = diff_bandit_state(replica.to_state(), base)
+                shared = apply_bandit_delta(shared, delta)
+
+            expected = combined.to_state()
+            assert shared.arm_pulls == expected.arm_pulls
+            for name in ("alpha_params", "beta_params", "mean_reward"):
+                for arm_id, value in getattr(expected, name).items():
+                    assert getattr(shared, name)[arm_id] == pytest.approx(value)
+
+    def test_incompatible_states_rejected(self, arms):
+        """Test merging different algorithms or arm sets raises ValueError."""
+        linucb = LinUCBBandit(arms, feature_dim=FEATURE_DIM).to_state()
+        thompson = ThompsonSamplingBandit(arms).to_state()
+        other_arms = ThompsonSamplingBandit(arms[:1]).to_state()
+
+        with pytest.raises(ValueError, match="Cannot merge"):
+            diff_bandit_state(linucb, thompson)
+        with pytest.raises(ValueError, match="different arms"):
+            apply_bandit_delta(thompson, other_arms)
+
+
+class TestRouterMerge:
+    """Tests for HybridRouterState merging and Router(sync_mode="merge")."""
+
+    @staticmethod
+    def _hybrid(threshold: int) -> HybridRouter:
+        analyzer = MagicMock()
+        analyzer.analyze = AsyncMock(return_value=_observations(0, 1)[0][1])
+        return HybridRouter(
+            models=["model-0", "model-1"],
+            switch_threshold=threshold,
+            analyzer=analyzer,
+            feature_dim=FEATURE_DIM,
+        )
+
+    async def test_shared_state_transitions_on_merged_query_count(self):
+        """Test replicas below the threshold still transition the shared state."""
+        replica_a, replica_b = self._hybrid(6), self._hybrid(6)
+        base = replica_a.to_state()
+        for replica in (replica_a, replica_b):
+            for i in range(4):
+                await replica.route(Query(text=f"query {i}"))
+
+        shared = base
+        for replica in (replica_a, replica_b):
+            delta = diff_router_state(replica.to_state(), base)
+            shared = apply_router_delta(shared, delta)
+
+        assert replica_a.current_phase == "thompson_sampling"
+        assert shared.query_count == 8
+        assert shared.current_phase == RouterPhase.LINUCB
+        replica_a.from_state(shared)
+        assert replica_a.current_phase == "linucb"
+
+    async def test_local_transition_publishes_only_post_transition_learning(self):
+        """Test a replica's own warm start is not added to the shared phase2."""
+        replica = self._hybrid(2)
+        base = replica.to_state()
+        for i in range(2):
+            await replica.route(Query(text=f"query {i}"))
+        assert replica.current_phase == "linucb"
+
+        delta = diff_router_state(replica.to_state(), base)
+        shared = apply_router_delta(base, delta)
+
+        # No phase2 updates happened after the transition
+        for arm_id in ("model-0", "model-1"):
+            assert np.allclose(delta.phase2_state.A_matrices[arm_id], 0.0)
+            assert np.allclose(
+                shared.phase2_state.A_matrices[arm_id],
+                replica.phase2_bandit.A[arm_id],
+            )
+
+    def test_warm_start_requires_both_phases(self):
+        """Test converting a state without phase2 raises ValueError."""
+        state = self._hybrid(6).to_state().model_copy(update={"phase2_state": None})
+
+        with pytest.raises(ValueError, match="phase1/phase2"):
+            _warm_start(state)
+
+    async def test_merge_keeps_updates_applied_in_flight(self):
+        """Test updates applied while a merge awaits the store are replayed."""
+        store = InMemoryStateStore()
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="shared",
+            auto_persist=False,
+            write_behind=False,
+            sync_mode="merge",
+        )
+        first, second = (
+            feedback.model_copy(update={"model_id": "gpt-4o"})
+            for feedback, _ in _observations(6, 2)
+        )
+        features = _observations(6, 1)[0][1]
+        await router._update_actor.submit_batch([(first, features)])
+        merge = store.merge_hybrid_router_state
+
+        async def merge_with_update(*args):
+            await router._update_actor.submit_batch([(second, features)])
+            return await merge(*args)
+
+        store.merge_hybrid_router_state = merge_with_update
+        await router.flush_state()
+
+        shared = await store.load_hybrid_router_state("shared")
+        local = router.hybrid_router.phase1_bandit.to_state()
+        assert shared.phase1_state.arm_pulls["gpt-4o"] == 1
+        assert local.arm_pulls["gpt-4o"] == 2
+
+        store.merge_hybrid_router_state = merge
+        await router.flush_state()
+        shared = await store.load_hybrid_router_state("shared")
+        assert shared.phase1_state.arm_pulls["gpt-4o"] == 2
+
+    async def test_concurrent_routers_pool_feedback(self):
+        """Test replicas sharing a router_id keep each other's updates."""
+        store = InMemoryStateStore()
+        replicas = [
+            Router(
+                models=["gpt-4o-mini", "gpt-4o"],
+                state_store=store,
+                router_id="shared",
+                write_behind=False,
+                sync_mode="merge",
+            )
+            for _ in range(3)
+        ]
+
+        async def feed(router: Router, seed: int) -> None:
+            for i, (feedback, features) in enumerate(_observations(seed, 5)):
+                await router.update(
+                    model_id="gpt-4o" if i % 2 else "gpt-4o-mini",
+                    cost=feedback.cost,
+                    quality_score=feedback.quality_score,
+                    latency=feedback.latency,
+                    features=features,
+                )
+
+        await asyncio.gather(*(feed(r, seed) for seed, r in enumerate(replicas)))
+        for router in replicas:
+            await router.flush_state()
+
+        shared = await store.load_hybrid_router_state("shared")
+        assert sum(shared.phase1_state.arm_pulls.values()) == 15
+        final = replicas[-1].hybrid_router.phase1_bandit.to_state()
+        assert final.arm_pulls == shared.phase1_state.arm_pulls
+
+    def test_merge_rejects_incremental_checkpoints(self):
+        """Test merge sync and incremental checkpoints are exclusive."""
+        store = InMemoryStateStore()
+
+        with pytest.raises(ValueError, match="merge"):
+            Router(
+                state_store=store,
+                sync_mode="merge",
+                checkpoint_mode="incremental",
+            )
@@ -9,10 +9,19 @@ Tests serialization (to_state) and deserialization (from_state) for:
 - HybridRouter
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import numpy as np
 import pytest
 
-from conduit.core.state_store import BanditState, HybridRouterState, RouterPhase
+from conduit.core.memory_state_store import InMemoryStateStore
+from conduit.core.models import Query, QueryFeatures
+from conduit.core.state_store import (
+    BanditState,
+    HybridRouterState,
+    RouterPhase,
+    StateStoreError,
+)
 from conduit.engines.bandits import (
     ContextualThompsonSamplingBandit,
     EpsilonGreedyBandit,
@@ -20,8 +29,9 @@ from conduit.engines.bandits import (
     ThompsonSamplingBandit,
     UCB1Bandit,
 )
-from conduit.engines.bandits.base import ModelArm
+from conduit.engines.bandits.base import BanditFeedback, ModelArm
 from conduit.engines.hybrid_router import HybridRouter
+from conduit.engines.router import Router
 
 
 @pytest.fixture
@@ -154,12 +164,13 @@ class TestLinUCBStatePersistence:
         assert bandit2.arm_pulls["test-model-1"] == 50
 
     def test_a_inv_recomputed_on_restore(self, test_arms):
-        """Test that A_inv is recomputed from A on restore."""
+        """Test that A_inv is recomputed from A when restoring JSON state."""
         bandit1 = LinUCBBandit(test_arms, feature_dim=10)
         # Modify A
         bandit1.A["test-model-1"][0, 0] = 2.0
 
-        state = bandit1.to_state()
+        # JSON omits A_inv (only the binary codec persists it)
+        state = BanditState.model_validate_json(bandit1.to_state().model_dump_json())
         bandit2 = LinUCBBandit(test_arms, feature_dim=10)
         bandit2.from_state(state)
 
@@ -363,6 +374,186 @@ class TestHybridRouterStatePersistence:
         assert router2.ucb1.mean_reward["gpt-4o"] == 0.92
 
 
+class TestIncrementalCheckpoints:
+    """Tests for snapshot + delta log persistence."""
+
+    @staticmethod
+    def _features(rng):
+        return QueryFeatures(
+            embedding=rng.standard_normal(384) * 0.1,
+            token_count=int(rng.integers(5, 200)),
+            complexity_score=float(rng.uniform()),
+        )
+
+    async def test_snapshot_plus_deltas_matches_live_router(self):
+        """Test replaying deltas (across the phase transition) is exact."""
+        rng = np.random.default_rng(3)
+        analyzer = MagicMock()
+        models = ["test-model-1", "test-model-2"]
+        live = HybridRouter(
+            models=models, switch_threshold=5, analyzer=analyzer, feature_dim=386
+        )
+        store = InMemoryStateStore()
+
+        for i in range(12):
+            features = self._features(rng)
+            analyzer.analyze = AsyncMock(return_value=features)
+            decision = await live.route(Query(text=f"query {i}"))
+            feedback = BanditFeedback(
+                model_id=decision.selected_model,
+                cost=0.001,
+                quality_score=float(rng.uniform()),
+                latency=0.5,
+            )
+            await live.update(feedback, features)
+            seq = await store.append_state_deltas(
+                "r1", [live.to_state_delta(feedback, features)]
+            )
+            if i == 2:
+                live.delta_seq = seq
+                await live.save_state(store, "r1")
+
+        restored = HybridRouter(
+            models=models, switch_threshold=5, analyzer=analyzer, feature_dim=386
+        )
+        assert await restored.load_state(store, "r1") is True
+
+        assert restored.current_phase == live.current_phase == "linucb"
+        assert restored.query_count == live.query_count
+        assert restored.delta_seq == 12
+        for arm_id in models:
+            assert np.array_equal(
+                restored.phase2_bandit.A[arm_id], live.phase2_bandit.A[arm_id]
+            )
+            assert np.array_equal(
+                restored.phase2_bandit.b[arm_id], live.phase2_bandit.b[arm_id]
+            )
+
+    def test_phase1_delta_omits_embedding(self):
+        """Test non-contextual deltas are O(1) (no embedding stored)."""
+        router = HybridRouter(models=["test-model-1"], switch_threshold=100)
+        feedback = BanditFeedback(
+            model_id="test-model-1", cost=0.0, quality_score=1.0, latency=0.1
+        )
+
+        delta = router.to_state_delta(
+            feedback, self._features(np.random.default_rng(0))
+        )
+
+        assert delta.phase == RouterPhase.UCB1
+        assert delta.embedding is None
+
+    async def test_router_appends_deltas_and_compacts(self):
+        """Test Router logs deltas and snapshots every compact_every updates."""
+        rng = np.random.default_rng(5)
+        store = InMemoryStateStore()
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="r1",
+            write_behind=False,
+            checkpoint_mode="incremental",
+            compact_every=3,
+        )
+
+        for i in range(4):
+            await router.update(
+                model_id="gpt-4o-mini" if i % 2 else "gpt-4o",
+                cost=0.001,
+                quality_score=0.9,
+                latency=0.5,
+                features=self._features(rng),
+            )
+
+        # Updates 1-2 logged, update 3 folded into a snapshot, update 4 logged
+        assert (await store.load_hybrid_router_state("r1")).delta_seq == 2
+        assert [d.seq for d in await store.load_state_deltas("r1")] == [3]
+
+        restored = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="r1",
+            checkpoint_mode="incremental",
+        )
+        await restored._load_initial_state()
+        assert (
+            restored.hybrid_router.phase1_bandit.get_stats()["arm_pulls"]
+            == router.hybrid_router.phase1_bandit.get_stats()["arm_pulls"]
+        )
+
+        await router.close()
+        assert await store.load_state_deltas("r1") == []
+        assert (await store.load_hybrid_router_state("r1")).delta_seq == 3
+
+    async def test_close_snapshots_without_pending_deltas(self):
+        """Test close() writes the final snapshot even when nothing is pending."""
+        store = InMemoryStateStore()
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="r1",
+            checkpoint_mode="incremental",
+        )
+        await router.update(
+            model_id="gpt-4o",
+            cost=0.001,
+            quality_score=0.9,
+            latency=0.5,
+            features=self._features(np.random.default_rng(6)),
+        )
+        await router.flush_state()  # delta logged, nothing left pending
+        assert len(await store.load_state_deltas("r1")) == 1
+
+        await router.close()
+
+        assert await store.load_state_deltas("r1") == []
+        assert (await store.load_hybrid_router_state("r1")).delta_seq == 1
+
+    def test_incremental_requires_delta_support(self):
+        """Test incremental mode is rejected for stores without a delta log."""
+        store = InMemoryStateStore()
+        store.supports_state_deltas = False
+
+        with pytest.raises(ValueError, match="incremental"):
+            Router(state_store=store, checkpoint_mode="incremental")
+
+    async def test_write_without_store_raises(self):
+        """Test writing state without a store fails loudly (not via assert)."""
+        router = Router(models=["gpt-4o-mini"], cache_enabled=False)
+
+        with pytest.raises(StateStoreError, match="no state store"):
+            await router._write_state()
+        await router.close()
+
+
+class TestWriteBehindRouting:
+    """Tests for routing with write-behind persistence."""
+
+    async def test_route_defers_to_background_flush(self):
+        """Test routes neither save inline nor count toward an early flush."""
+        store = InMemoryStateStore()
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"],
+            state_store=store,
+            router_id="r1",
+            cache_enabled=False,
+            checkpoint_interval=1,
+            max_dirty_updates=1,
+        )
+        router._save_state = AsyncMock()
+
+        for i in range(3):
+            await router.route(Query(text=f"query {i}"))
+
+        router._save_state.assert_not_awaited()
+        assert router.get_persistence_stats()["pending_updates"] == 0
+        assert store.save_count == 0
+
+        await router.close()
+        state = await store.load_hybrid_router_state("r1")
+        assert state is not None and state.query_count == 3
+
+
 class TestStateStoreModels:
     """Tests for state store data models."""
 
@@ -0,0 +1,135 @@
+"""Tests for write-behind router state persistence."""
+
+import asyncio
+
+import pytest
+
+from conduit.core.state_persister import WriteBehindPersister
+
+
+class RecordingSave:
+    """Fake save function that records calls and reports a fixed size."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False, size: int = 100):
+        self.delay = delay
+        self.fail = fail
+        self.size = size
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("database down")
+        return self.size
+
+
+class TestWriteBehindPersister:
+    """Tests for WriteBehindPersister."""
+
+    async def test_notifications_coalesce_into_one_flush(self):
+        """Test many dirty notifications within an interval become one write."""
+        save = RecordingSave()
+        persister = WriteBehindPersister(save, flush_interval=0.02)
+
+        for _ in range(50):
+            persister.mark_dirty()
+        assert save.calls == 0
+
+        await asyncio.sleep(0.05)
+
+        stats = persister.get_stats()
+        assert save.calls == 1
+        assert stats["notifications"] == 50
+        assert stats["pending_updates"] == 0
+        assert stats["bytes_written"] == 100
+        assert stats["last_flush_lag_ms"] >= 20
+
+    async def test_max_dirty_updates_flushes_early(self):
+        """Test reaching max_dirty_updates triggers a flush before the interval."""
+        save = RecordingSave()
+        persister = WriteBehindPersister(save, flush_interval=60, max_dirty_updates=5)
+
+        for _ in range(5):
+            persister.mark_dirty()
+        await asyncio.sleep(0.01)
+
+        assert save.calls == 1
+        await persister.close()
+
+    async def test_stale_state_flushes_on_interval_only(self):
+        """Test mark_stale() never triggers an early flush but is written."""
+        save = RecordingSave()
+        persister = WriteBehindPersister(save, flush_interval=0.03, max_dirty_updates=1)
+
+        for _ in range(10):
+            persister.mark_stale()
+        await asyncio.sleep(0.01)
+        assert save.calls == 0
+        assert persister.get_stats()["pending_updates"] == 0
+
+        await asyncio.sleep(0.04)
+        assert save.calls == 1
+        await persister.close()
+        assert save.calls == 1
+
+    async def test_updates_during_flush_are_kept(self):
+        """Test notifications arriving mid-write are flushed next time."""
+        save = RecordingSave(delay=0.02)
+        persister = WriteBehindPersister(save, flush_interval=60, max_dirty_updates=1)
+
+        persister.mark_dirty()
+        await asyncio.sleep(0.005)  # first write in flight
+        persister.mark_dirty()
+        persister.mark_dirty()
+
+        assert persister.get_stats()["pending_updates"] == 2
+        await persister.close()
+        assert save.calls == 2
+        assert persister.get_stats()["pending_updates"] == 0
+
+    async def test_failed_flush_keeps_pending_updates(self):
+        """Test a failed write is counted and its updates stay pending."""
+        save = RecordingSave(fail=True)
+        persister = WriteBehindPersister(save, flush_interval=60)
+
+        persister.mark_dirty()
+        persister.mark_dirty()
+        with pytest.raises(RuntimeError):
+            await persister.flush()
+
+        stats = persister.get_stats()
+        assert stats["failures"] == 1
+        assert stats["pending_updates"] == 2
+        assert stats["dirty_age_ms"] > 0
+
+        save.fail = False
+        assert await persister.flush() is True
+        assert persister.get_stats()["pending_updates"] == 0
+
+    async def test_close_flushes_pending_and_stops_task(self):
+        """Test close() writes pending state and stops the background task."""
+        save = RecordingSave()
+        persister = WriteBehindPersister(save, flush_interval=60)
+
+        persister.mark_dirty()
+        await persister.close()
+
+        assert save.calls == 1
+        assert persister._task is None
+
+    async def test_flush_without_pending_is_noop_unless_forced(self):
+        """Test flush() skips clean state but force=True always writes."""
+        save = RecordingSave()
+        persister = WriteBehindPersister(save)
+
+        assert await persister.flush() is False
+        assert await persister.flush(force=True) is True
+        assert save.calls == 1
+
+    def test_invalid_settings_rejected(self):
+        """Test flush interval and dirty threshold are validated."""
+        with pytest.raises(ValueError):
+            WriteBehindPersister(RecordingSave(), flush_interval=0)
+        with pytest.raises(ValueError):
+            WriteBehindPersister(RecordingSave(), max_dirty_updates=0)
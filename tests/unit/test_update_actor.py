@@ -0,0 +1,164 @@
+"""Tests for the single-writer bandit update actor."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from conduit.core.models import Query, QueryFeatures
+from conduit.engines.bandits.base import BanditFeedback
+from conduit.engines.router import Router
+from conduit.engines.update_actor import BanditUpdateActor
+
+
+def _feedback(i: int) -> BanditFeedback:
+    """Create feedback tagged with its submission index."""
+    return BanditFeedback(
+        model_id="gpt-4o-mini",
+        cost=0.001,
+        quality_score=0.8,
+        latency=0.5,
+        metadata={"i": i},
+    )
+
+
+def _features() -> QueryFeatures:
+    """Create small random query features."""
+    return QueryFeatures(
+        embedding=np.random.default_rng(0).standard_normal(384) * 0.1,
+        token_count=10,
+        complexity_score=0.5,
+    )
+
+
+class TestBanditUpdateActor:
+    """Tests for BanditUpdateActor."""
+
+    async def test_updates_applied_in_order_with_yields(self):
+        """Test FIFO application and that selection runs during a burst."""
+        applied: list[int] = []
+        seen_by_selection: list[int] = []
+
+        async def apply(batch):
+            applied.extend(feedback.metadata["i"] for feedback, _ in batch)
+
+        async def selection():
+            await asyncio.sleep(0)
+            seen_by_selection.append(len(applied))
+
+        actor = BanditUpdateActor(apply, time_slice_ms=0)
+        burst = [
+            asyncio.create_task(actor.submit(_feedback(i), None)) for i in range(50)
+        ]
+        await asyncio.gather(*burst, selection())
+
+        assert applied == list(range(50))
+        assert 0 < seen_by_selection[0] < 50
+        stats = actor.get_stats()
+        assert stats["applied"] == 50
+        assert stats["queue_depth"] == 0
+
+    async def test_error_propagates_to_submitter(self):
+        """Test a failing update raises in its caller and later ones still apply."""
+        applied: list[int] = []
+
+        async def apply(batch):
+            [(feedback, _)] = batch
+            if feedback.metadata["i"] == 1:
+                raise ValueError("unknown model")
+            applied.append(feedback.metadata["i"])
+
+        actor = BanditUpdateActor(apply)
+        results = await asyncio.gather(
+            *(actor.submit(_feedback(i), None) for i in range(3)),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], ValueError)
+        assert applied == [0, 2]
+        assert actor.get_stats()["failed"] == 1
+
+    async def test_batch_applied_in_one_call(self):
+        """Test submit_batch() hands the whole batch to apply_fn at once."""
+        calls: list[int] = []
+
+        async def apply(batch):
+            calls.append(len(batch))
+
+        actor = BanditUpdateActor(apply)
+        await actor.submit_batch([(_feedback(i), None) for i in range(25)])
+        await actor.submit_batch([])
+
+        assert calls == [25]
+        stats = actor.get_stats()
+        assert stats["applied"] == 25
+        assert stats["batches"] == 1
+
+    async def test_submit_from_other_thread_applies_on_owning_loop(self):
+        """Test cross-thread feedback is marshalled to the routing loop."""
+        threads: list[int] = []
+
+        async def apply(batch):
+            threads.append(threading.get_ident())
+
+        actor = BanditUpdateActor(apply)
+        await actor.submit(_feedback(0), None)
+        await asyncio.to_thread(asyncio.run, actor.submit(_feedback(1), None))
+
+        assert threads == [threading.get_ident()] * 2
+        assert actor.get_stats()["marshalled"] == 1
+
+    async def test_close_rejects_new_updates(self):
+        """Test closed actors refuse submissions."""
+
+        async def apply(batch):
+            pass
+
+        actor = BanditUpdateActor(apply)
+        await actor.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            await actor.submit(_feedback(0), None)
+        with pytest.raises(ValueError, match="max_pending"):
+            BanditUpdateActor(apply, max_pending=0)
+        with pytest.raises(ValueError, match="time_slice_ms"):
+            BanditUpdateActor(apply, time_slice_ms=-1)
+
+
+class TestRouterUpdateActor:
+    """Tests for Router.update() through the update actor."""
+
+    async def test_concurrent_route_and_update(self):
+        """Test interleaved route/update mixes count every update exactly once."""
+        router = Router(
+            models=["gpt-4o-mini", "gpt-4o"], cache_enabled=False, auto_persist=False
+        )
+        features = _features()
+
+        async def update():
+            await router.update(
+                model_id="gpt-4o-mini",
+                cost=0.001,
+                quality_score=0.8,
+                latency=0.5,
+                features=features,
+            )
+
+        await asyncio.gather(
+            *(update() for _ in range(100)),
+            *(router.route(Query(text=f"q{i}")) for i in range(20)),
+        )
+
+        stats = router.hybrid_router.phase1_bandit.get_stats()
+        assert stats["arm_pulls"]["gpt-4o-mini"] == 100
+        assert router.get_update_stats()["applied"] == 100
+
+        with pytest.raises(ValueError, match="not in arms"):
+            await router.update(
+                model_id="missing",
+                cost=0.0,
+                quality_score=0.5,
+                latency=0.1,
+                features=features,
+            )
+        await router.close()
@@ -141,11 +141,12 @@ routing:
 
 @pytest.mark.asyncio
 async def test_router_uses_query_preferences():
-    """Test Router applies query preferences to reward weights."""
+    """Test Router records query preferences without touching shared weights."""
     from conduit.engines.router import Router
 
     # Create router
     router = Router(models=["gpt-4o-mini", "gpt-4o"], cache_enabled=False)
+    shared_weights = dict(router.hybrid_router.ucb1.reward_weights)
 
     # Create query with cost optimization
     query = Query(
@@ -156,11 +157,12 @@ async def test_router_uses_query_preferences():
     # Route query
     decision = await router.route(query)
 
-    # Verify bandit has cost weights applied
-    assert router.hybrid_router.ucb1.reward_weights["cost"] == 0.5
-    assert router.hybrid_router.ucb1.reward_weights["quality"] == 0.4
-    assert router.hybrid_router.linucb.reward_weights["cost"] == 0.5
-    assert router.hybrid_router.linucb.reward_weights["quality"] == 0.4
+    # Verify decision carries cost weights; bandits keep their own
+    assert decision.metadata["preference"] == "cost"
+    assert decision.metadata["reward_weights"]["cost"] == 0.5
+    assert decision.metadata["reward_weights"]["quality"] == 0.4
+    assert router.hybrid_router.ucb1.reward_weights == shared_weights
+    assert router.hybrid_router.linucb.reward_weights == shared_weights
 
     # Cleanup
     await router.close()
@@ -168,7 +170,7 @@ async def test_router_uses_query_preferences():
 
 @pytest.mark.asyncio
 async def test_router_default_preferences_when_none():
-    """Test Router uses default weights when query has default preferences."""
+    """Test Router records balanced weights when query has default preferences."""
     from conduit.engines.router import Router
 
     # Create router
@@ -180,11 +182,69 @@ async def test_router_default_preferences_when_none():
     # Route query
     decision = await router.route(query)
 
-    # Verify bandit has balanced weights applied
-    assert router.hybrid_router.ucb1.reward_weights["quality"] == 0.7
-    assert router.hybrid_router.ucb1.reward_weights["cost"] == 0.2
-    assert router.hybrid_router.linucb.reward_weights["quality"] == 0.7
-    assert router.hybrid_router.linucb.reward_weights["cost"] == 0.2
+    # Verify decision has balanced weights
+    assert decision.metadata["preference"] == "balanced"
+    assert decision.metadata["reward_weights"]["quality"] == 0.7
+    assert decision.metadata["reward_weights"]["cost"] == 0.2
 
     # Cleanup
     await router.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_preferences_no_cross_talk():
+    """Test concurrent route/update pairs each learn with their own weights."""
+    import asyncio
+    import random
+
+    from conduit.engines.bandits.base import BanditFeedback
+    from conduit.engines.bandits.thompson_sampling import ThompsonSamplingBandit
+    from conduit.engines.router import Router
+
+    router = Router(
+        models=["gpt-4o-mini", "gpt-4o"], cache_enabled=False, auto_persist=False
+    )
+    shared_weights = dict(router.hybrid_router.phase1_bandit.reward_weights)
+    presets = ["balanced", "quality", "cost", "speed"]
+    rng = random.Random(0)
+    observed: list[BanditFeedback] = []
+
+    async def request(i: int) -> None:
+        query = Query(
+            text=f"query {i}",
+            preferences=UserPreferences(optimize_for=presets[i % 4]),  # type: ignore[arg-type]
+        )
+        decision = await router.route(query)
+        # Interleave other requests between route and feedback
+        await asyncio.sleep(rng.random() / 100)
+        feedback = BanditFeedback(
+            model_id=decision.selected_model,
+            cost=0.002,
+            quality_score=0.9,
+            latency=3.0,
+            reward_weights=decision.metadata["reward_weights"],
+        )
+        observed.append(feedback)
+        await router.update(
+            model_id=feedback.model_id,
+            cost=feedback.cost,
+            quality_score=feedback.quality_score,
+            latency=feedback.latency,
+            features=decision.features,
+            reward_weights=decision.metadata["reward_weights"],
+        )
+
+    await asyncio.gather(*(request(i) for i in range(200)))
+
+    # Sequential replay with each request's own weights gives the same state
+    reference = ThompsonSamplingBandit(router.hybrid_router.arms)
+    for feedback in observed:
+        await reference.update(feedback, None)  # type: ignore[arg-type]
+
+    bandit = router.hybrid_router.phase1_bandit
+    assert bandit.reward_weights == shared_weights
+    for model_id in bandit.arms:
+        assert bandit.alpha[model_id] == pytest.approx(reference.alpha[model_id])
+        assert bandit.beta[model_id] == pytest.approx(reference.beta[model_id])
+
+    await router.close()